@@ -0,0 +1,52 @@
+"""create_operation_metrics_table
+
+Revision ID: c7d8e9f0a1b2
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 12:00:00.000000
+
+Creates the operation_metrics table. Operation metrics (training epochs,
+backtest bars, data-load segments) are stored one row per entry and written
+in batches, independently of the operations record.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the operation_metrics table."""
+    op.create_table(
+        "operation_metrics",
+        sa.Column("operation_id", sa.String(length=255), nullable=False),
+        sa.Column("series", sa.String(length=50), nullable=False),
+        sa.Column("seq", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "data",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        # Cursor reads scan (operation_id, series, seq >= cursor) on the key
+        sa.PrimaryKeyConstraint("operation_id", "series", "seq"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the operation_metrics table."""
+    op.drop_table("operation_metrics")
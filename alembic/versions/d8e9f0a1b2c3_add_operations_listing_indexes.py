@@ -0,0 +1,54 @@
+"""add_operations_listing_indexes
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-18 14:00:00.000000
+
+Adds parent_operation_id to operations, and composite indexes for listing
+operations newest first with keyset pagination on (created_at, operation_id),
+filtered by status or operation type, and for child lookups by parent.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: Union[str, Sequence[str], None] = "c7d8e9f0a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add parent_operation_id and the listing indexes."""
+    op.add_column(
+        "operations",
+        sa.Column("parent_operation_id", sa.String(length=255), nullable=True),
+    )
+    op.create_index(
+        "ix_operations_status_created_at",
+        "operations",
+        ["status", sa.text("created_at DESC"), sa.text("operation_id DESC")],
+    )
+    op.create_index(
+        "ix_operations_type_created_at",
+        "operations",
+        ["operation_type", sa.text("created_at DESC"), sa.text("operation_id DESC")],
+    )
+    op.create_index(
+        "ix_operations_parent_created_at",
+        "operations",
+        ["parent_operation_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the listing indexes and parent_operation_id."""
+    op.drop_index("ix_operations_parent_created_at", table_name="operations")
+    op.drop_index("ix_operations_type_created_at", table_name="operations")
+    op.drop_index("ix_operations_status_created_at", table_name="operations")
+    op.drop_column("operations", "parent_operation_id")
@@ -8,13 +8,14 @@ seamless integration with the existing backend.
 from datetime import datetime
 from typing import Any, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Response
 
 # Import local IB modules
 from ib.data_fetcher import IbDataFetcher
 from ib.symbol_validator import IbSymbolValidator
 from pydantic import BaseModel, Field
 
+from ktrdr.data.bar_codec import BAR_CONTENT_TYPE, encode_bars
 from ktrdr.logging import get_logger
 
 logger = get_logger(__name__)
@@ -101,12 +102,18 @@ class HeadTimestampResponse(BaseModel):
 
 
 @router.post("/historical", response_model=HistoricalDataResponse)
-async def get_historical_data(request: HistoricalDataRequest):
+async def get_historical_data(
+    request: HistoricalDataRequest, accept: Optional[str] = Header(None)
+):
     """
     Fetch historical OHLCV data for a symbol.
 
     This endpoint uses the existing IbDataFetcher to get data directly
     from IB Gateway, bypassing Docker networking issues.
+
+    Clients that accept BAR_CONTENT_TYPE receive the bars in the binary
+    columnar format (see ktrdr.data.bar_codec); others, and all errors,
+    get the JSON response.
     """
     try:
         # Ensure timezone-aware datetimes for consistent processing
@@ -188,6 +195,13 @@ async def get_historical_data(request: HistoricalDataRequest):
             instrument_type=instrument_type,
         )
 
+        if accept and BAR_CONTENT_TYPE in accept:
+            return Response(
+                content=encode_bars(data),
+                media_type=BAR_CONTENT_TYPE,
+                headers={"X-Rows": str(len(data))},
+            )
+
         if data.empty:
             return HistoricalDataResponse(
                 success=True,
@@ -205,6 +219,15 @@ async def get_historical_data(request: HistoricalDataRequest):
         return HistoricalDataResponse(success=False, error=str(e))
 
 
+@router.get("/stats")
+async def get_data_stats() -> dict[str, Any]:
+    """
+    Get data fetcher statistics, including response cache and pacing.
+    """
+    fetcher = await get_data_fetcher()
+    return fetcher.get_stats()
+
+
 @router.post("/validate", response_model=ValidationResponse)
 async def validate_symbol(request: ValidationRequest):
     """
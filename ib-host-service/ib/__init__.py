@@ -14,6 +14,7 @@ Package structure:
 - trading_hours_parser.py: Trading hours parsing
 - pace_manager.py: Rate limiting for IB API
 - error_classifier.py: IB error classification and handling
+- response_cache.py: Replayable cache of historical data responses
 
 Import pattern:
     from ib import IbDataFetcher  # Local import within host service
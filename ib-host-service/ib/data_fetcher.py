@@ -9,18 +9,24 @@ Key Features:
 - Uses shared connection pool for connection management
 - Thread-safe execution using execute_with_connection_sync()
 - Simple historical data fetching
-- No validation, no caching, no metadata - just data fetching
+- Replayable response cache for identical requests (see response_cache.py)
+- No validation, no metadata - just data fetching
 - Proper error handling and timeout management
 """
 
 import time
 from datetime import datetime
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 from ib_async import Contract, Forex, Stock
 from opentelemetry import trace
 
+from ib.pace_manager import IbPaceManager
 from ib.pool_manager import get_shared_ib_pool
+from ib.response_cache import IbResponseCache, get_response_cache
+from ktrdr.data.timeframe_constants import TimeframeConstants
 from ktrdr.logging import get_logger
 
 logger = get_logger(__name__)
@@ -32,18 +38,31 @@ class IbDataFetcher:
     Simple data fetcher for historical data from Interactive Brokers.
 
     This component is focused solely on fetching historical OHLCV data
-    using the connection pool. It doesn't do validation, caching, or
-    metadata handling - that's handled by other components.
+    using the connection pool. It doesn't do validation or metadata
+    handling - that's handled by other components. Identical requests are
+    answered from the response cache without touching IB or its pacing
+    budget.
     """
 
-    def __init__(self):
-        """Initialize the data fetcher with connection pool."""
+    def __init__(self, response_cache: Optional[IbResponseCache] = None):
+        """
+        Initialize the data fetcher with connection pool.
+
+        Args:
+            response_cache: Cache for IB responses (defaults to the shared
+                cache configured from IB settings)
+        """
         self.connection_pool = get_shared_ib_pool()
+        self.pace_manager = IbPaceManager()
+        self.response_cache = (
+            response_cache if response_cache is not None else get_response_cache()
+        )
 
         # Statistics
         self.requests_made = 0
         self.successful_requests = 0
         self.failed_requests = 0
+        self.cache_hits = 0
 
         logger.info("IbDataFetcher initialized")
 
@@ -84,14 +103,17 @@ class IbDataFetcher:
             fetch_start_time = time.time()
 
             try:
-                # Use connection pool with synchronous execution to avoid async issues
-                result = await self.connection_pool.execute_with_connection_sync(
-                    self._fetch_historical_data_impl,
-                    symbol,
-                    timeframe,
-                    start,
-                    end,
-                    instrument_type,
+                bars = await self._fetch_bars(
+                    symbol, timeframe, start, end, instrument_type, span
+                )
+
+                # Filter by date range
+                # Convert Python datetime objects to pandas Timestamps for proper comparison
+                start_pd = pd.Timestamp(start)
+                end_pd = pd.Timestamp(end)
+                result = bars[(bars.index >= start_pd) & (bars.index <= end_pd)]
+                logger.info(
+                    f"Successfully processed {len(result)} bars for {symbol} {timeframe}"
                 )
 
                 # Calculate latency
@@ -116,25 +138,21 @@ class IbDataFetcher:
                 )
                 raise
 
-    def _fetch_historical_data_impl(
+    async def _fetch_bars(
         self,
-        ib,
         symbol: str,
         timeframe: str,
         start: datetime,
         end: datetime,
         instrument_type: str,
+        span: trace.Span,
     ) -> pd.DataFrame:
         """
-        Implementation of historical data fetching using IB connection.
+        Get the bars IB returns for a request, from the cache when possible.
 
-        This method runs in the connection's dedicated thread to avoid async conflicts.
+        Returns:
+            Unfiltered bars for the IB request (duration may exceed start..end)
         """
-        logger.debug(f"Starting data fetch for {symbol} ({timeframe})")
-
-        # Give IB a moment to settle before making requests
-        time.sleep(0.5)
-
         # Create contract based on instrument type
         try:
             contract = self._create_contract(symbol, instrument_type)
@@ -155,10 +173,87 @@ class IbDataFetcher:
         # Determine what data to show based on instrument type
         what_to_show = self._get_what_to_show(instrument_type, symbol)
 
+        cache_key = self.response_cache.make_key(
+            contract, what_to_show, ib_bar_size, end, duration, use_rth=True
+        )
+        bars = self.response_cache.get(cache_key)
+        span.set_attribute("ib.cache_hit", bars is not None)
+        if bars is not None:
+            self.cache_hits += 1
+            self.pace_manager.record_cache_hit()
+            logger.info(
+                f"📦 IB CACHE HIT: {symbol} {timeframe} {duration} ending {end}"
+            )
+            return bars
+
+        if self.response_cache.replay:
+            raise Exception(
+                f"No recorded IB response for {symbol} {timeframe} {duration} "
+                f"ending {end} (response cache is in replay mode)"
+            )
+
+        await self.pace_manager.wait_if_needed(
+            is_historical=True,
+            contract_key=cache_key,
+            is_bid_ask=what_to_show == "BID_ASK",
+        )
+
+        # Use connection pool with synchronous execution to avoid async issues
+        bars = await self.connection_pool.execute_with_connection_sync(
+            self._fetch_historical_data_impl,
+            contract,
+            ib_bar_size,
+            duration,
+            what_to_show,
+            end,
+        )
+
+        self.response_cache.put(
+            cache_key,
+            bars,
+            window_end=end,
+            bar_duration=TimeframeConstants.TIMEFRAME_DELTAS.get(
+                timeframe, pd.Timedelta(days=1)
+            ),
+            request={
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "instrument_type": instrument_type,
+                "what_to_show": what_to_show,
+                "bar_size": ib_bar_size,
+                "duration": duration,
+                "end": end.isoformat(),
+            },
+        )
+        return bars
+
+    def _fetch_historical_data_impl(
+        self,
+        ib,
+        contract: Contract,
+        ib_bar_size: str,
+        duration: str,
+        what_to_show: str,
+        end: datetime,
+    ) -> pd.DataFrame:
+        """
+        Implementation of historical data fetching using IB connection.
+
+        This method runs in the connection's dedicated thread to avoid async conflicts.
+
+        Returns:
+            All bars IB returned, with a UTC index (not yet filtered to the
+            requested range)
+        """
+        logger.debug(f"Starting data fetch for {contract.symbol} ({ib_bar_size})")
+
+        # Give IB a moment to settle before making requests
+        time.sleep(0.5)
+
         # Request historical data (synchronous call)
         try:
             logger.info(
-                f"🔍 IB REQUEST: {contract.symbol} ({contract.secType}) {start.date()} to {end.date()}"
+                f"🔍 IB REQUEST: {contract.symbol} ({contract.secType}) {duration} ending {end.date()}"
             )
             logger.info(f"   ├─ Contract: {contract}")
             logger.info(f"   ├─ Duration: {duration}, Bar Size: {ib_bar_size}")
@@ -202,41 +297,30 @@ class IbDataFetcher:
             raise
 
         if not bars:
-            logger.warning(f"No data returned for {symbol} {timeframe}")
-            raise Exception(f"No data returned for {symbol} {timeframe}")
+            logger.warning(f"No data returned for {contract.symbol} {ib_bar_size}")
+            raise Exception(f"No data returned for {contract.symbol} {ib_bar_size}")
 
         # Convert to DataFrame
         try:
             logger.debug(f"Converting {len(bars)} bars to DataFrame")
 
-            # Create DataFrame
+            # Build the columns as one float64 block in a single pass over bars
+            values = np.array(
+                [(bar.open, bar.high, bar.low, bar.close, bar.volume) for bar in bars],
+                dtype=np.float64,
+            )
             df = pd.DataFrame(
-                {
-                    "open": [bar.open for bar in bars],
-                    "high": [bar.high for bar in bars],
-                    "low": [bar.low for bar in bars],
-                    "close": [bar.close for bar in bars],
-                    "volume": [bar.volume for bar in bars],
-                }
+                values,
+                index=pd.to_datetime([bar.date for bar in bars]),
+                columns=["open", "high", "low", "close", "volume"],
             )
 
-            # Set datetime index
-            df.index = pd.to_datetime([bar.date for bar in bars])
+            # Normalize datetime index to UTC
             df.index = (
                 df.index.tz_localize("UTC")
                 if df.index.tz is None
                 else df.index.tz_convert("UTC")
             )
-
-            # Filter by date range
-            # Convert Python datetime objects to pandas Timestamps for proper comparison
-            start_pd = pd.Timestamp(start)
-            end_pd = pd.Timestamp(end)
-            df = df[(df.index >= start_pd) & (df.index <= end_pd)]
-
-            logger.info(
-                f"Successfully processed {len(df)} bars for {symbol} {timeframe}"
-            )
             return df
 
         except Exception as e:
@@ -368,9 +452,12 @@ class IbDataFetcher:
             "requests_made": self.requests_made,
             "successful_requests": self.successful_requests,
             "failed_requests": self.failed_requests,
+            "cache_hits": self.cache_hits,
             "success_rate": (
                 self.successful_requests / self.requests_made
                 if self.requests_made > 0
                 else 0.0
             ),
+            "response_cache": self.response_cache.stats(),
+            "pacing": self.pace_manager.get_stats(),
         }
@@ -66,6 +66,9 @@ class IbPaceManager:
         # Identical request tracking (15 second minimum)
         self.identical_requests = {}  # contract_key -> timestamp
 
+        # Requests answered from the response cache (never sent to IB)
+        self.cache_hits = 0
+
         logger.info("IB Pace Manager initialized with official pacing rules")
 
     async def wait_if_needed(
@@ -217,6 +220,16 @@ class IbPaceManager:
                 # Record for identical request tracking
                 self.identical_requests[contract_key] = now
 
+    def record_cache_hit(self) -> None:
+        """
+        Record a request answered from the local response cache.
+
+        Cache hits never reach IB, so they are counted for statistics only
+        and do not consume any pacing budget.
+        """
+        with self.lock:
+            self.cache_hits += 1
+
     def can_make_request(
         self,
         is_historical: bool = False,
@@ -303,6 +316,7 @@ class IbPaceManager:
                 "seconds_since_last_historical": now - self.last_historical_time,
                 "tracked_contracts": len(self.contract_requests),
                 "identical_request_cache_size": len(self.identical_requests),
+                "cache_hits": self.cache_hits,
             }
 
     def reset_stats(self):
@@ -313,4 +327,5 @@ class IbPaceManager:
             self.contract_requests.clear()
             self.identical_requests.clear()
             self.last_historical_time = 0.0
+            self.cache_hits = 0
             logger.info("Pace manager statistics reset")
@@ -0,0 +1,303 @@
+"""
+IB Historical Response Cache
+
+Content-addressed cache of reqHistoricalData responses. Repeated downloads,
+gap re-fills and segment retries issue identical requests; answering them
+locally saves seconds per request and keeps them out of the IB pacing budget.
+
+Keys are a hash of everything that determines IB's answer: the contract,
+whatToShow, bar size, end datetime, duration and useRTH. Entries for windows
+that closed at least one bar before they were stored never change and are
+kept indefinitely; windows that touch "now" expire after a short TTL.
+
+Responses are kept in a small in-memory LRU and persisted to disk in the
+binary bar format (ktrdr.data.bar_codec) with a JSON metadata sidecar, so
+they survive restarts.
+
+Modes:
+- off: no caching
+- read_write: serve fresh entries, store new responses (default)
+- replay: fake IB for offline benchmarking; serve any recorded response
+  regardless of age and never contact IB (misses are errors)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from ktrdr.data.bar_codec import decode_bars, encode_bars
+from ktrdr.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_MODES = ("off", "read_write", "replay")
+
+# Contract attributes that identify the instrument in a request
+_CONTRACT_FIELDS = (
+    "conId",
+    "symbol",
+    "secType",
+    "exchange",
+    "currency",
+    "lastTradeDateOrContractMonth",
+)
+
+
+class IbResponseCache:
+    """Memory + disk cache of historical bar responses."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        mode: str = "read_write",
+        open_ttl: float = 60.0,
+        max_memory_entries: int = 128,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted responses
+            mode: One of "off", "read_write", "replay"
+            open_ttl: Seconds to keep responses for windows that touch now
+            max_memory_entries: Responses kept in memory (LRU)
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Cache mode must be one of {CACHE_MODES}, got '{mode}'")
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.open_ttl = open_ttl
+        self.max_memory_entries = max_memory_entries
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[pd.DataFrame, Optional[float]]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._stores = 0
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"IB response cache: mode={mode}, dir={self.cache_dir}")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached at all."""
+        return self.mode != "off"
+
+    @property
+    def replay(self) -> bool:
+        """Whether the cache stands in for IB (no live requests)."""
+        return self.mode == "replay"
+
+    @staticmethod
+    def make_key(
+        contract: Any,
+        what_to_show: str,
+        bar_size: str,
+        end: datetime,
+        duration: str,
+        use_rth: bool,
+    ) -> str:
+        """
+        Build the content address of a reqHistoricalData call.
+
+        Args:
+            contract: IB contract (any object with the usual contract fields)
+            what_to_show: IB whatToShow value
+            bar_size: IB bar size setting
+            end: Request end datetime
+            duration: IB duration string
+            use_rth: Regular trading hours flag
+
+        Returns:
+            Hex digest identifying the request
+        """
+        request = {
+            "contract": {
+                field: getattr(contract, field, "") for field in _CONTRACT_FIELDS
+            },
+            "what_to_show": what_to_show,
+            "bar_size": bar_size,
+            "end": pd.Timestamp(end).isoformat(),
+            "duration": duration,
+            "use_rth": use_rth,
+        }
+        encoded = json.dumps(request, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Return a cached response, or None on a miss.
+
+        Expired entries are misses (and are removed) except in replay mode.
+        The returned frame is a copy and may be modified by the caller.
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                data, expires_at = entry
+                if self._is_fresh(expires_at, now):
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    return data.copy()
+                del self._memory[key]
+
+        data, expires_at = self._load(key)
+        with self._lock:
+            if data is None:
+                self._misses += 1
+                return None
+            if not self._is_fresh(expires_at, now):
+                self._expired += 1
+                self._misses += 1
+                self._remove(key)
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+            self._remember(key, data, expires_at)
+        return data.copy()
+
+    def put(
+        self,
+        key: str,
+        data: pd.DataFrame,
+        window_end: datetime,
+        bar_duration: pd.Timedelta,
+        request: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_key()
+            data: Bars returned by IB (DatetimeIndex, numeric columns)
+            window_end: End of the requested window
+            bar_duration: Length of one bar; the window is closed (and the
+                entry immutable) once window_end + bar_duration has passed
+            request: Request description stored alongside for inspection
+        """
+        if not self.enabled or self.replay:
+            return
+
+        now = time.time()
+        closed = pd.Timestamp(window_end) + bar_duration <= pd.Timestamp.now(tz="UTC")
+        if not closed and self.open_ttl <= 0:
+            return
+        expires_at = None if closed else now + self.open_ttl
+
+        meta = {
+            "stored_at": now,
+            "expires_at": expires_at,
+            "rows": len(data),
+            "request": request or {},
+        }
+        try:
+            self._write(self._path(key, ".bars"), encode_bars(data))
+            self._write(
+                self._path(key, ".json"),
+                json.dumps(meta, default=str).encode("utf-8"),
+            )
+        except OSError as e:
+            logger.warning(f"Failed to persist IB response {key[:12]}: {e}")
+
+        with self._lock:
+            self._stores += 1
+            self._remember(key, data.copy(), expires_at)
+
+    def clear(self) -> None:
+        """Remove all cached responses (memory and disk)."""
+        with self._lock:
+            self._memory.clear()
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob("*/*"):
+                    path.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "mode": self.mode,
+                "memory_entries": len(self._memory),
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "stores": self._stores,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _is_fresh(self, expires_at: Optional[float], now: float) -> bool:
+        return self.replay or expires_at is None or expires_at > now
+
+    def _remember(
+        self, key: str, data: pd.DataFrame, expires_at: Optional[float]
+    ) -> None:
+        self._memory[key] = (data, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def _load(self, key: str) -> tuple[Optional[pd.DataFrame], Optional[float]]:
+        meta_path = self._path(key, ".json")
+        bars_path = self._path(key, ".bars")
+        try:
+            meta = json.loads(meta_path.read_bytes())
+            data = decode_bars(bars_path.read_bytes())
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable IB response {key[:12]}: {e}")
+            self._remove(key)
+            return None, None
+        return data, meta.get("expires_at")
+
+    def _remove(self, key: str) -> None:
+        self._memory.pop(key, None)
+        for suffix in (".json", ".bars"):
+            self._path(key, suffix).unlink(missing_ok=True)
+
+    @staticmethod
+    def _write(path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+
+
+_response_cache: Optional[IbResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> IbResponseCache:
+    """Return the shared response cache, configured from IB settings."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            from ktrdr.config.settings import get_ib_settings
+
+            settings = get_ib_settings()
+            _response_cache = IbResponseCache(
+                cache_dir=settings.response_cache_dir,
+                mode=settings.response_cache_mode,
+                open_ttl=settings.response_cache_open_ttl,
+            )
+        return _response_cache
@@ -0,0 +1,121 @@
+"""Tests for the IB historical response cache."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from ib.pace_manager import IbPaceManager
+from ib.response_cache import IbResponseCache
+
+HOUR = pd.Timedelta(hours=1)
+
+
+@pytest.fixture
+def contract():
+    return SimpleNamespace(
+        conId=0, symbol="AAPL", secType="STK", exchange="SMART", currency="USD"
+    )
+
+
+def _bars(end: datetime, count: int = 24) -> pd.DataFrame:
+    index = pd.date_range(end=end, periods=count, freq="1h")
+    return pd.DataFrame(
+        {
+            "open": range(count),
+            "high": range(count),
+            "low": range(count),
+            "close": range(count),
+            "volume": range(count),
+        },
+        index=index,
+        dtype=float,
+    )
+
+
+def _key(contract, end, duration="1 D"):
+    return IbResponseCache.make_key(contract, "TRADES", "1 hour", end, duration, True)
+
+
+class TestIbResponseCache:
+    def test_key_covers_every_request_parameter(self, contract):
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        base = _key(contract, end)
+
+        assert base == _key(contract, end)
+        assert base != _key(contract, end, duration="2 D")
+        assert base != _key(contract, end + timedelta(hours=1))
+        assert base != IbResponseCache.make_key(
+            contract, "BID", "1 hour", end, "1 D", True
+        )
+        assert base != IbResponseCache.make_key(
+            contract, "TRADES", "1 hour", end, "1 D", False
+        )
+
+    def test_closed_windows_persist_across_instances(self, tmp_path, contract):
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        key = _key(contract, end)
+        bars = _bars(end)
+
+        IbResponseCache(tmp_path).put(key, bars, end, HOUR)
+        reopened = IbResponseCache(tmp_path)
+
+        pd.testing.assert_frame_equal(reopened.get(key), bars, check_freq=False)
+        assert reopened.stats()["disk_hits"] == 1
+
+    def test_open_windows_expire(self, tmp_path, contract):
+        end = datetime.now(timezone.utc)
+        key = _key(contract, end)
+        cache = IbResponseCache(tmp_path, open_ttl=0.05)
+
+        cache.put(key, _bars(end), end, HOUR)
+        assert cache.get(key) is not None
+        time.sleep(0.1)
+
+        assert cache.get(key) is None
+        assert IbResponseCache(tmp_path).get(key) is None
+
+    def test_replay_serves_expired_entries_and_never_stores(self, tmp_path, contract):
+        end = datetime.now(timezone.utc)
+        key = _key(contract, end)
+        IbResponseCache(tmp_path, open_ttl=0.01).put(key, _bars(end), end, HOUR)
+        time.sleep(0.05)
+
+        replay = IbResponseCache(tmp_path, mode="replay")
+        assert replay.get(key) is not None
+
+        other = _key(contract, end, duration="2 D")
+        replay.put(other, _bars(end), end, HOUR)
+        assert replay.get(other) is None
+
+    def test_off_mode_caches_nothing(self, tmp_path, contract):
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        key = _key(contract, end)
+        cache = IbResponseCache(tmp_path / "cache", mode="off")
+
+        cache.put(key, _bars(end), end, HOUR)
+
+        assert cache.get(key) is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_returned_frames_are_copies(self, tmp_path, contract):
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        key = _key(contract, end)
+        cache = IbResponseCache(tmp_path)
+        cache.put(key, _bars(end), end, HOUR)
+
+        cache.get(key)["close"] = -1.0
+
+        assert (cache.get(key)["close"] >= 0).all()
+
+
+def test_cache_hits_do_not_consume_pacing_budget():
+    pace_manager = IbPaceManager()
+
+    pace_manager.record_cache_hit()
+    stats = pace_manager.get_stats()
+
+    assert stats["cache_hits"] == 1
+    assert stats["historical_requests_last_10min"] == 0
+    assert pace_manager.can_make_request(is_historical=True) == (True, 0.0)
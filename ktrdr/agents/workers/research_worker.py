@@ -7,10 +7,12 @@ Uses a polling loop pattern (per ARCHITECTURE.md) to monitor child operation
 status rather than directly awaiting workers. This supports distributed workers.
 
 Training and Backtest phases call services directly rather than using adapters.
-The orchestrator tracks real operation IDs and polls their status.
+The orchestrator tracks real operation IDs and polls their status. Between
+polls it waits on the operations event bus, so a child reaching a terminal
+state advances its research immediately instead of after a full interval.
 
 Environment Variables:
-    AGENT_POLL_INTERVAL: Seconds between status checks (default: 5 for stubs)
+    AGENT_POLL_INTERVAL: Maximum seconds between status checks (default: 5 for stubs)
 """
 
 import asyncio
@@ -134,7 +136,7 @@ class AgentResearchWorker:
 
     Attributes:
         PHASES: List of phase names in execution order.
-        POLL_INTERVAL: Seconds between status checks (read from env).
+        POLL_INTERVAL: Maximum seconds between status checks (read from env).
     """
 
     PHASES = ["designing", "training", "backtesting", "assessing"]
@@ -227,7 +229,8 @@ class AgentResearchWorker:
         Queries all active AGENT_RESEARCH operations and advances each one step.
         Exits when no active operations remain.
 
-        Uses a polling pattern: query active ops, advance each, sleep, repeat.
+        Uses a polling pattern: query active ops, advance each, wait, repeat.
+        The wait ends early when any operation reaches a terminal state.
         This supports multiple concurrent researches running independently.
 
         Raises:
@@ -242,6 +245,7 @@ class AgentResearchWorker:
 
             # Initialize before loop to handle early cancellation
             active_ops: list = []
+            subscription = self._subscribe_to_operations()
 
             try:
                 while True:
@@ -269,8 +273,10 @@ class AgentResearchWorker:
                             )
                             await self._handle_research_failed(op, e)
 
-                    # Poll interval
-                    await self._cancellable_sleep(self.POLL_INTERVAL)
+                    # Poll interval (cut short by terminal operation events)
+                    await self._wait_for_operation_events(
+                        subscription, self.POLL_INTERVAL
+                    )
 
             except asyncio.CancelledError:
                 logger.info("Coordinator cancelled")
@@ -287,6 +293,9 @@ class AgentResearchWorker:
                 span.record_exception(e)
                 logger.error(f"Coordinator error: {e}")
                 raise
+            finally:
+                if subscription is not None:
+                    subscription.close()
 
         logger.info("Coordinator completed")
 
@@ -1457,6 +1466,40 @@ class AgentResearchWorker:
                     )
             del self._child_tasks[op_id]
 
+    def _subscribe_to_operations(self) -> Any:
+        """Subscribe to operation events, if the operations service has them.
+
+        Returns:
+            OperationSubscription for all operations, or None for services
+            without an event bus (e.g. test doubles).
+        """
+        from ktrdr.api.services.operations_service import OperationsService
+
+        if not isinstance(self.ops, OperationsService):
+            return None
+        return self.ops.subscribe()
+
+    async def _wait_for_operation_events(
+        self, subscription: Any, seconds: float
+    ) -> None:
+        """Wait up to ``seconds``, returning early on a terminal operation event.
+
+        Args:
+            subscription: Subscription from _subscribe_to_operations(), or None
+                to simply sleep.
+            seconds: Maximum time to wait.
+        """
+        if subscription is None or seconds <= 0:
+            await self._cancellable_sleep(seconds)
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + seconds
+        while (remaining := deadline - loop.time()) > 0:
+            event = await subscription.get(timeout=remaining)
+            if event is None or event.is_terminal:
+                return
+
     async def _cancellable_sleep(self, seconds: float) -> None:
         """Sleep in small intervals for cancellation responsiveness.
 
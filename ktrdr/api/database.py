@@ -41,6 +41,12 @@ def get_engine():
             settings.url,
             echo=settings.echo,
             pool_pre_ping=True,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            connect_args={
+                "prepared_statement_cache_size": settings.statement_cache_size
+            },
         )
         # Log connection info without sensitive data (host/port/db only)
         logger.info(
@@ -136,6 +136,17 @@ async def start_backtest(
             commission=request.commission,
             slippage=request.slippage,
             timeframes=all_timeframes,
+            slices=(
+                [
+                    (
+                        datetime.fromisoformat(s.start_date),
+                        datetime.fromisoformat(s.end_date),
+                    )
+                    for s in request.slices
+                ]
+                if request.slices
+                else None
+            ),
         )
 
         return BacktestStartResponse(
@@ -26,7 +26,9 @@ from ktrdr.api.models.data import (
     TimeframesResponse,
 )
 from ktrdr.api.services.data_service import DataService
+from ktrdr.async_infrastructure.compute_executor import get_compute_executor
 from ktrdr.errors import DataError, DataNotFoundError
+from ktrdr.errors.exceptions import ApiTimeoutError, ServiceUnavailableError
 
 # Setup module-level logger
 logger = get_logger(__name__)
@@ -345,8 +347,11 @@ async def get_cached_data(
                     details={"end_date": end_date},
                 ) from err
 
-        # Load cached data using consistent DataService delegation
-        df = data_service.load_cached_data(
+        # Load cached data using consistent DataService delegation; CSV parsing
+        # and validation run on the compute executor, off the event loop
+        executor = get_compute_executor()
+        df = await executor.run_io(
+            data_service.load_cached_data,
             symbol=clean_symbol,
             timeframe=timeframe,
             start_date=start_dt,
@@ -404,8 +409,12 @@ async def get_cached_data(
             )
         else:
             # Convert DataFrame to API format
-            api_data = data_service._convert_df_to_api_format(
-                df, clean_symbol, timeframe, include_metadata=True
+            api_data = await executor.run_io(
+                data_service._convert_df_to_api_format,
+                df,
+                clean_symbol,
+                timeframe,
+                include_metadata=True,
             )
             data = OHLCVData(**api_data)
 
@@ -451,6 +460,8 @@ async def get_cached_data(
     except DataError as e:
         logger.error(f"Data error getting cached data for {clean_symbol}: {str(e)}")
         raise
+    except (ApiTimeoutError, ServiceUnavailableError):
+        raise
     except Exception as e:
         logger.error(
             f"Unexpected error getting cached data for {clean_symbol}: {str(e)}"
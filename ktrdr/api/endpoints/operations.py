@@ -6,11 +6,15 @@ This module provides endpoints for managing long-running operations:
 - Get operation status
 - Cancel operations
 - Monitor progress
+- Stream progress events (SSE) and accept worker pushes
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
 
 from ktrdr import get_logger
 from ktrdr.api.dependencies import get_operations_service
@@ -20,6 +24,7 @@ from ktrdr.api.models.operations import (
     OperationCancelResponse,
     OperationListResponse,
     OperationMetricsResponse,
+    OperationPushUpdate,
     OperationStatus,
     OperationStatusResponse,
     OperationSummary,
@@ -30,6 +35,7 @@ from ktrdr.api.models.operations import (
     StatusUpdateRequest,
     StatusUpdateResponse,
 )
+from ktrdr.api.services.operation_events import EVENT_SNAPSHOT, OperationEvent
 from ktrdr.api.services.operations_service import OperationsService
 from ktrdr.errors import DataError
 from ktrdr.logging.config import should_rate_limit_log
@@ -40,6 +46,13 @@ logger = get_logger(__name__)
 # Create router for operations endpoints
 router = APIRouter()
 
+# How often /operations/stream refreshes pull-based operations when idle
+_STREAM_REFRESH_INTERVAL = 1.0
+
+_TERMINAL_STATUSES = frozenset(
+    {OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED}
+)
+
 
 @router.get(
     "/operations",
@@ -52,8 +65,9 @@ router = APIRouter()
     **Features:**
     - Filter by status (running, completed, failed, etc.)
     - Filter by operation type (data_load, training, etc.)
-    - Pagination support
-    - Sort by creation date or status
+    - Pagination support (offset, or `cursor` from the previous page's
+      `next_cursor` for deep pages)
+    - Newest operations first
 
     **Perfect for:** CLI status commands, dashboards, monitoring
     """,
@@ -72,6 +86,9 @@ async def list_operations(
     active_only: bool = Query(
         False, description="Show only active (running/pending) operations"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor (next_cursor of the previous page)"
+    ),
     operations_service: OperationsService = Depends(get_operations_service),
 ) -> OperationListResponse:
     """
@@ -86,6 +103,7 @@ async def list_operations(
         limit: Maximum number of operations to return
         offset: Number of operations to skip (for pagination)
         active_only: If True, only return running/pending operations
+        cursor: Return the page after this cursor (ignores offset)
 
     Returns:
         OperationListResponse: Paginated list of operations
@@ -100,17 +118,21 @@ async def list_operations(
         )
 
         # Get operations from service
-        (
-            operations,
-            total_count,
-            active_count,
-        ) = await operations_service.list_operations(
-            status=status,
-            operation_type=operation_type,
-            limit=limit,
-            offset=offset,
-            active_only=active_only,
-        )
+        try:
+            (
+                operations,
+                total_count,
+                active_count,
+            ) = await operations_service.list_operations(
+                status=status,
+                operation_type=operation_type,
+                limit=limit,
+                offset=offset,
+                active_only=active_only,
+                cursor=cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
 
         # Convert to summary format
         operation_summaries = [
@@ -135,8 +157,15 @@ async def list_operations(
             data=operation_summaries,
             total_count=total_count,
             active_count=active_count,
+            next_cursor=(
+                operations_service.list_cursor(operations[-1])
+                if len(operations) == limit
+                else None
+            ),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing operations: {str(e)}")
         raise DataError(
@@ -146,6 +175,101 @@ async def list_operations(
         ) from e
 
 
+@router.get(
+    "/operations/stream",
+    tags=["Operations"],
+    summary="Stream operation events (SSE)",
+    response_class=StreamingResponse,
+    description="""
+    Server-Sent Events stream of operation progress, metrics deltas and
+    terminal events, pushed as they happen instead of polled.
+
+    **Features:**
+    - Watch many operations over one connection (repeat `operation_id`)
+    - Omit `operation_id` to watch every operation
+    - One `snapshot` event per watched operation on connect, then
+      `progress`, `metrics` and `terminal` events
+    - Stream ends once every watched operation is terminal
+
+    **Perfect for:** CLI follow mode, dashboards, evolution harness
+    """,
+)
+async def stream_operation_events(
+    request: Request,
+    operation_id: Optional[list[str]] = Query(
+        None, description="Operation to watch (repeatable); omit to watch all"
+    ),
+    heartbeat: float = Query(
+        15.0, gt=0, le=300, description="Seconds between keep-alive comments"
+    ),
+    operations_service: OperationsService = Depends(get_operations_service),
+) -> StreamingResponse:
+    """
+    Stream operation events as Server-Sent Events.
+
+    Operations whose state is still pulled (local bridges, workers that don't
+    push) are refreshed by the stream itself at most once per second, so a
+    single stream replaces per-client polling.
+
+    Args:
+        operation_id: Operation IDs to watch, or None for all
+        heartbeat: Keep-alive comment interval in seconds
+
+    Returns:
+        StreamingResponse: text/event-stream
+
+    Example:
+        GET /api/v1/operations/stream?operation_id=op_a&operation_id=op_b
+    """
+    watched = list(dict.fromkeys(operation_id)) if operation_id else None
+
+    async def event_stream() -> AsyncIterator[str]:
+        async with operations_service.subscribe(watched) as subscription:
+            pending = set(watched or [])
+
+            # Snapshot first so clients never miss state from before connecting
+            for op_id in watched or []:
+                operation = await operations_service.get_operation(op_id)
+                if operation is None:
+                    pending.discard(op_id)
+                    yield OperationEvent(
+                        op_id, "error", {"error": f"Operation not found: {op_id}"}
+                    ).to_sse()
+                    continue
+                yield OperationEvent(
+                    op_id, EVENT_SNAPSHOT, operations_service.event_data(operation)
+                ).to_sse()
+                if operation.status in _TERMINAL_STATUSES:
+                    pending.discard(op_id)
+
+            loop = asyncio.get_running_loop()
+            last_sent = loop.time()
+            while not watched or pending:
+                if await request.is_disconnected():
+                    return
+                event = await subscription.get(timeout=_STREAM_REFRESH_INTERVAL)
+                if event is None:
+                    # Nothing pushed: refresh pull-based sources, which publish
+                    # into this subscription if anything changed
+                    for op_id in list(pending):
+                        await operations_service.get_operation(op_id)
+                    if loop.time() - last_sent >= heartbeat:
+                        last_sent = loop.time()
+                        yield ": keepalive\n\n"
+                    continue
+
+                last_sent = loop.time()
+                yield event.to_sse()
+                if event.is_terminal:
+                    pending.discard(event.operation_id)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/operations/{operation_id}",
     response_model=OperationStatusResponse,
@@ -907,20 +1031,34 @@ async def get_operation_results(
     - Data operations: segment stats, cache info
     - Backtesting: trade stats, performance metrics
 
+    **Incremental reads:** pass `cursor` (the `cursor` returned by the previous
+    call) to receive only entries added since then. Pass `max_points` to also
+    receive the whole retained history downsampled to at most that many points.
+
     **Perfect for:** Agent monitoring, trend analysis, decision making
     """,
 )
 async def get_operation_metrics(
     operation_id: str = Path(..., description="Unique operation identifier"),
+    cursor: Optional[int] = Query(
+        None, ge=0, description="Return series entries from this cursor on"
+    ),
+    max_points: Optional[int] = Query(
+        None, ge=2, description="Include history downsampled to this many points"
+    ),
     operations_service: OperationsService = Depends(get_operations_service),
 ) -> OperationMetricsResponse:
     """
     Get domain-specific metrics for an operation.
 
-    In M1, returns empty structure. In M2, will return populated metrics.
+    Without a cursor, returns the operation's metrics (summary fields and the
+    most recent series entries). With a cursor, the series holds only entries
+    since the cursor, and the next cursor is returned.
 
     Args:
         operation_id: Unique identifier for the operation
+        cursor: Incremental read position (None = latest snapshot)
+        max_points: Downsample the full history to this many points
 
     Returns:
         OperationMetricsResponse: Operation metrics data
@@ -944,18 +1082,26 @@ async def get_operation_metrics(
                 detail=f"Operation not found: {operation_id}",
             )
 
-        # Get metrics (empty in M1)
-        metrics = await operations_service.get_operation_metrics(operation_id)
+        metrics = dict(operation.metrics or {})
+        data = {
+            "operation_id": operation_id,
+            "operation_type": operation.operation_type.value,
+        }
+        if cursor is not None:
+            series = operations_service.get_metrics_series_name(operation)
+            entries, next_cursor = await operations_service.get_operation_metrics(
+                operation_id, cursor=cursor
+            )
+            metrics[series] = entries
+            data["cursor"] = next_cursor
+        if max_points is not None:
+            data["history"] = operations_service.get_metrics_history(
+                operation_id, max_points=max_points
+            )
+        data["metrics"] = metrics
 
         logger.info(f"Retrieved metrics for operation: {operation_id}")
-        return OperationMetricsResponse(
-            success=True,
-            data={
-                "operation_id": operation_id,
-                "operation_type": operation.operation_type.value,
-                "metrics": metrics or {},
-            },
-        )
+        return OperationMetricsResponse(success=True, data=data)
 
     except HTTPException:
         raise
@@ -1067,6 +1213,48 @@ async def add_operation_metrics(
         ) from e
 
 
+@router.post(
+    "/operations/{operation_id}/events",
+    tags=["Operations"],
+    summary="Push operation state from a worker",
+    description="""
+    Workers push progress, status, metrics deltas and results here as they
+    happen, so the backend doesn't poll them.
+
+    The operation may be addressed by its backend ID or by the worker's own
+    operation ID. Pushed state is fanned out to `/operations/stream`
+    subscribers immediately.
+
+    **Perfect for:** Worker progress reporting
+    """,
+)
+async def push_operation_update(
+    update: OperationPushUpdate,
+    operation_id: str = Path(..., description="Backend or worker operation ID"),
+    operations_service: OperationsService = Depends(get_operations_service),
+) -> dict:
+    """
+    Apply a worker-pushed state update.
+
+    Args:
+        operation_id: Backend or worker operation identifier
+        update: Pushed fields (all optional)
+
+    Returns:
+        dict: Success response
+
+    Raises:
+        404: Operation not found
+    """
+    applied = await operations_service.apply_pushed_update(operation_id, update)
+    if not applied:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Operation not found: {operation_id}",
+        )
+    return {"success": True, "operation_id": operation_id}
+
+
 @router.patch(
     "/operations/{operation_id}/status",
     response_model=StatusUpdateResponse,
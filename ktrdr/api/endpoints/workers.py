@@ -61,6 +61,10 @@ class WorkerRegistrationRequest(BaseModel):
         default_factory=list,
         description="Operations that completed while backend was unavailable",
     )
+    warm_keys: Optional[list[str]] = Field(
+        default=None,
+        description="Locality keys of the worker's caches (e.g. 'symbol:EURUSD')",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -138,6 +142,7 @@ async def register_worker(
         capabilities=request.capabilities,
         current_operation_id=request.current_operation_id,
         completed_operations=request.completed_operations,
+        warm_keys=request.warm_keys,
     )
 
     logger.info(f"Worker registered successfully: {request.worker_id}")
@@ -226,3 +231,63 @@ async def get_worker(
             detail=f"Worker not found: {worker_id}",
         )
     return worker.to_dict()
+
+
+class WorkerHeartbeatRequest(BaseModel):
+    """Heartbeat pushed by a worker (same fields as its /health response)."""
+
+    worker_status: str = Field(
+        default="idle", description="Worker status: 'busy' or 'idle'"
+    )
+    current_operation: Optional[str] = Field(
+        default=None, description="Operation currently being executed, if busy"
+    )
+    active_operations: Optional[int] = Field(
+        default=None, ge=0, description="Operations running on the worker"
+    )
+    warm_keys: Optional[list[str]] = Field(
+        default=None, description="Locality keys of the worker's caches"
+    )
+
+
+@router.post(
+    "/workers/{worker_id}/heartbeat",
+    tags=["Workers"],
+    summary="Worker heartbeat",
+    description="Report worker liveness and busy/idle status",
+)
+async def worker_heartbeat(
+    worker_id: str,
+    request: WorkerHeartbeatRequest,
+    registry: WorkerRegistry = Depends(get_worker_registry),
+) -> dict:
+    """
+    Record a heartbeat pushed by a worker.
+
+    While its heartbeats are fresh, the backend does not probe the worker's
+    /health endpoint. Returns 404 if the worker is not registered, which
+    tells the worker to re-register.
+
+    Args:
+        worker_id: The worker's unique identifier
+        request: Worker status
+        registry: The worker registry (injected dependency)
+
+    Returns:
+        dict: Acknowledgement
+
+    Raises:
+        HTTPException: 404 if worker not found
+    """
+    if not registry.record_heartbeat(
+        worker_id,
+        request.worker_status,
+        request.current_operation,
+        request.active_operations,
+        request.warm_keys,
+    ):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Worker not found: {worker_id}",
+        )
+    return {"success": True}
@@ -8,7 +8,40 @@ following the async operations architecture pattern.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, field_validator, model_validator
+
+
+def _validate_iso_date(v: str) -> str:
+    """Validate that a date string can be parsed."""
+    try:
+        datetime.fromisoformat(v)
+        return v
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {v}") from e
+
+
+class BacktestSlice(BaseModel):
+    """A date range backtested independently within a multi-slice request."""
+
+    start_date: str  # ISO format: "YYYY-MM-DD"
+    end_date: str  # ISO format: "YYYY-MM-DD"
+
+    @field_validator("start_date", "end_date")
+    @classmethod
+    def validate_date_format(cls, v: str) -> str:
+        """Validate that date strings can be parsed."""
+        return _validate_iso_date(v)
+
+    @model_validator(mode="after")
+    def validate_order(self) -> "BacktestSlice":
+        """Validate that the slice does not end before it starts."""
+        if datetime.fromisoformat(self.start_date) > datetime.fromisoformat(
+            self.end_date
+        ):
+            raise ValueError(
+                f"Slice start_date {self.start_date} is after end_date {self.end_date}"
+            )
+        return self
 
 
 class BacktestStartRequest(BaseModel):
@@ -20,6 +53,9 @@ class BacktestStartRequest(BaseModel):
     - Uses strategy_name (auto-discovers paths internally)
     - Supports commission and slippage parameters
     - Symbol/timeframe are optional - if not provided, read from strategy config
+    - Optional slices: date ranges within start_date..end_date that are each
+      backtested with independent portfolio state over one data load, with
+      per-slice results returned in one operation
     """
 
     strategy_name: str
@@ -35,6 +71,7 @@ class BacktestStartRequest(BaseModel):
     commission: float = 0.001
     slippage: float = 0.0005  # 0.05%
     model_path: Optional[str] = None  # Explicit model path (for v3 models)
+    slices: Optional[list[BacktestSlice]] = None
 
     @field_validator("strategy_name")
     @classmethod
@@ -56,12 +93,7 @@ class BacktestStartRequest(BaseModel):
     @classmethod
     def validate_date_format(cls, v: str) -> str:
         """Validate that date strings can be parsed."""
-        try:
-            # Validate date format by attempting to parse
-            datetime.fromisoformat(v)
-            return v
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {v}") from e
+        return _validate_iso_date(v)
 
     @field_validator("initial_capital")
     @classmethod
@@ -71,6 +103,25 @@ class BacktestStartRequest(BaseModel):
             raise ValueError("Initial capital must be positive")
         return v
 
+    @model_validator(mode="after")
+    def validate_slices_within_range(self) -> "BacktestStartRequest":
+        """Validate that slices are non-empty and lie within start..end."""
+        if self.slices is None:
+            return self
+        if not self.slices:
+            raise ValueError("slices must not be empty if provided")
+        start = datetime.fromisoformat(self.start_date)
+        end = datetime.fromisoformat(self.end_date)
+        for s in self.slices:
+            if datetime.fromisoformat(s.start_date) < start or (
+                datetime.fromisoformat(s.end_date) > end
+            ):
+                raise ValueError(
+                    f"Slice {s.start_date} to {s.end_date} is outside "
+                    f"{self.start_date} to {self.end_date}"
+                )
+        return self
+
 
 class BacktestStartResponse(BaseModel):
     """
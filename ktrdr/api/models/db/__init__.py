@@ -5,6 +5,6 @@ This module contains SQLAlchemy ORM models for persistent storage.
 
 from ktrdr.api.models.db.base import Base
 from ktrdr.api.models.db.checkpoints import CheckpointRecord
-from ktrdr.api.models.db.operations import OperationRecord
+from ktrdr.api.models.db.operations import OperationMetricRecord, OperationRecord
 
-__all__ = ["Base", "CheckpointRecord", "OperationRecord"]
+__all__ = ["Base", "CheckpointRecord", "OperationMetricRecord", "OperationRecord"]
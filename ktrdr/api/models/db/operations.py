@@ -13,6 +13,7 @@ Operations are persisted to survive backend restarts. The model includes:
 """
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -36,6 +37,7 @@ class OperationRecord(Base):
 
     Attributes:
         operation_id: Unique identifier for the operation (primary key).
+        parent_operation_id: ID of the parent operation, for child operations.
         operation_type: Type of operation (e.g., 'training', 'backtesting').
         status: Current status (PENDING, RUNNING, COMPLETED, FAILED, CANCELLED).
         worker_id: ID of the worker executing this operation (nullable).
@@ -60,6 +62,7 @@ class OperationRecord(Base):
     # Core fields
     operation_type = Column(String(50), nullable=False)
     status = Column(String(50), nullable=False)
+    parent_operation_id = Column(String(255), nullable=True)
 
     # Worker association
     worker_id = Column(String(255), nullable=True)
@@ -88,12 +91,31 @@ class OperationRecord(Base):
     last_heartbeat_at = Column(DateTime(timezone=True), nullable=True)
     reconciliation_status = Column(String(50), nullable=True)
 
-    # Indexes for common queries
+    # Indexes for common queries. Listings are newest first with keyset
+    # pagination on (created_at, operation_id), so the composite indexes end
+    # in that order and serve filter + sort + page without a sort step.
     __table_args__ = (
         Index("ix_operations_status", "status"),
         Index("ix_operations_worker_id", "worker_id"),
         Index("ix_operations_operation_type", "operation_type"),
         Index("ix_operations_created_at", "created_at"),
+        Index(
+            "ix_operations_status_created_at",
+            status,
+            created_at.desc(),
+            operation_id.desc(),
+        ),
+        Index(
+            "ix_operations_type_created_at",
+            operation_type,
+            created_at.desc(),
+            operation_id.desc(),
+        ),
+        Index(
+            "ix_operations_parent_created_at",
+            parent_operation_id,
+            created_at,
+        ),
     )
 
     def __repr__(self) -> str:
@@ -105,3 +127,42 @@ class OperationRecord(Base):
             f"status='{self.status}'"
             f")>"
         )
+
+
+class OperationMetricRecord(Base):
+    """Database model for operation metrics entries.
+
+    Metrics are stored one row per entry, separately from the operation
+    record, and written in batches by OperationsService. There is no foreign
+    key to operations: metrics may arrive for operations that are proxied from
+    a worker and never written to the operations table.
+
+    Attributes:
+        operation_id: Operation the entry belongs to.
+        series: Metrics series ("epochs", "bars", "segments", ...).
+        seq: Position of the entry in its series (0-based, gap-free).
+        data: JSONB metrics entry.
+        created_at: When the entry was written.
+    """
+
+    __tablename__ = "operation_metrics"
+
+    operation_id = Column(String(255), primary_key=True)
+    series = Column(String(50), primary_key=True)
+    seq = Column(BigInteger, primary_key=True)
+    data = Column(JSONB, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of the metrics record."""
+        return (
+            f"<OperationMetricRecord("
+            f"operation_id='{self.operation_id}', "
+            f"series='{self.series}', "
+            f"seq={self.seq}"
+            f")>"
+        )
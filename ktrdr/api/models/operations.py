@@ -289,6 +289,40 @@ class StatusUpdateResponse(BaseModel):
     )
 
 
+class OperationPushUpdate(BaseModel):
+    """State pushed by a worker so the backend doesn't have to poll it.
+
+    All fields are optional; only the ones present are applied. ``metrics``
+    is a delta (entries since the last push) and ``metrics_cursor`` is the
+    worker-side cursor after it, so a later pull doesn't re-fetch them.
+    """
+
+    status: Optional[OperationStatus] = Field(None, description="Current status")
+    progress: Optional[OperationProgress] = Field(None, description="Progress")
+    metrics: Optional[list[dict[str, Any]]] = Field(
+        None, description="New metrics entries since the previous push"
+    )
+    metrics_cursor: Optional[int] = Field(
+        None, ge=0, description="Worker metrics cursor after this delta"
+    )
+    result_summary: Optional[dict[str, Any]] = Field(
+        None, description="Result summary (terminal updates)"
+    )
+    error_message: Optional[str] = Field(None, description="Error message")
+    completed_at: Optional[datetime] = Field(None, description="Completion time")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "status": "running",
+                "progress": {"percentage": 42.0, "current_step": "Epoch 21/50"},
+                "metrics": [{"epoch": 20, "train_loss": 0.41, "val_loss": 0.45}],
+                "metrics_cursor": 21,
+            }
+        }
+    )
+
+
 # Response models
 class OperationListResponse(BaseModel):
     """Response containing list of operations."""
@@ -297,6 +331,9 @@ class OperationListResponse(BaseModel):
     data: list[OperationSummary] = Field(..., description="List of operations")
     total_count: int = Field(..., ge=0, description="Total number of operations")
     active_count: int = Field(..., ge=0, description="Number of active operations")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (None on the last page)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -9,10 +9,12 @@ from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any, Optional, cast
 
-from sqlalchemy import select, update
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from ktrdr.api.models.db.operations import OperationRecord
+from ktrdr.api.models.db.operations import OperationMetricRecord, OperationRecord
 from ktrdr.api.models.operations import (
     OperationInfo,
     OperationMetadata,
@@ -53,6 +55,11 @@ def _sanitize_for_json(obj: Any) -> Any:
 # JSONB fields that need sanitization before saving
 _JSONB_FIELDS = {"result", "metadata_"}
 
+# Metrics rows: (series, seq, entry) to write, (seq, entry) read back.
+# Module-level aliases: inside the class body, "list" is the list() method.
+MetricsBatch = list[tuple[str, int, dict[str, Any]]]
+MetricsEntries = list[tuple[int, dict[str, Any]]]
+
 
 class OperationsRepository:
     """Repository for operations CRUD operations.
@@ -168,31 +175,93 @@ class OperationsRepository:
         self,
         status: Optional[str] = None,
         worker_id: Optional[str] = None,
+        operation_type: Optional[str] = None,
+        parent_operation_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None,
     ) -> list[OperationInfo]:
-        """List operations with optional filters.
+        """List operations with optional filters, newest first.
+
+        Results are ordered by (created_at, operation_id) descending, which
+        the composite listing indexes serve directly. For deep pages pass
+        ``after`` (keyset pagination) rather than a large ``offset``.
 
         Args:
             status: Filter by operation status.
             worker_id: Filter by worker ID.
+            operation_type: Filter by operation type.
+            parent_operation_id: Filter by parent operation ID.
+            limit: Maximum number of operations to return.
+            offset: Number of operations to skip.
+            after: (created_at, operation_id) of the last operation of the
+                previous page; only older operations are returned.
 
         Returns:
             List of matching OperationInfo objects.
         """
         async with self._get_session() as session:
-            stmt = select(OperationRecord)
-
-            if status is not None:
-                stmt = stmt.where(OperationRecord.status == status)
-            if worker_id is not None:
-                stmt = stmt.where(OperationRecord.worker_id == worker_id)
+            stmt = self._filtered(
+                select(OperationRecord),
+                status=status,
+                worker_id=worker_id,
+                operation_type=operation_type,
+                parent_operation_id=parent_operation_id,
+            )
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(OperationRecord.created_at, OperationRecord.operation_id)
+                    < tuple_(literal(after[0]), literal(after[1]))
+                )
+            stmt = stmt.order_by(
+                OperationRecord.created_at.desc(), OperationRecord.operation_id.desc()
+            )
+            if offset:
+                stmt = stmt.offset(offset)
+            if limit is not None:
+                stmt = stmt.limit(limit)
 
             result = await session.execute(stmt)
             records = result.scalars().all()
 
             return [self._record_to_info(record) for record in records]
 
+    async def count(
+        self,
+        status: Optional[str] = None,
+        operation_type: Optional[str] = None,
+    ) -> int:
+        """Count operations matching the filters (index-only where possible).
+
+        Args:
+            status: Filter by operation status.
+            operation_type: Filter by operation type.
+
+        Returns:
+            Number of matching operations.
+        """
+        async with self._get_session() as session:
+            stmt = self._filtered(
+                select(func.count()).select_from(OperationRecord),
+                status=status,
+                operation_type=operation_type,
+            )
+            result = await session.execute(stmt)
+            return int(result.scalar_one())
+
+    @staticmethod
+    def _filtered(stmt, **filters: Optional[str]):
+        """Apply equality filters (None = no filter) on OperationRecord columns."""
+        for column, value in filters.items():
+            if value is not None:
+                stmt = stmt.where(getattr(OperationRecord, column) == value)
+        return stmt
+
     async def delete(self, operation_id: str) -> bool:
-        """Delete an operation by ID.
+        """Delete an operation by ID, along with its metric series.
+
+        operation_metrics has no foreign key to operations, so its rows are
+        deleted in the same transaction.
 
         Args:
             operation_id: The operation's unique identifier.
@@ -211,6 +280,11 @@ class OperationsRepository:
                 return False
 
             await session.delete(record)
+            await session.execute(
+                sql_delete(OperationMetricRecord).where(
+                    OperationMetricRecord.operation_id == operation_id
+                )
+            )
             await session.commit()
 
             logger.debug(f"Deleted operation record: {operation_id}")
@@ -265,6 +339,88 @@ class OperationsRepository:
                 )
                 return False
 
+    async def close(self) -> None:
+        """Release resources before shutdown (no-op: writes are synchronous)."""
+
+    async def add_metrics(
+        self,
+        operation_id: str,
+        entries: MetricsBatch,
+    ) -> int:
+        """Insert a batch of metrics entries.
+
+        Entries already stored (same operation, series and seq) are skipped,
+        so a batch that is retried after a partial failure is harmless.
+
+        Args:
+            operation_id: The operation's unique identifier.
+            entries: (series, seq, entry) tuples.
+
+        Returns:
+            Number of entries submitted.
+        """
+        if not entries:
+            return 0
+
+        async with self._get_session() as session:
+            stmt = (
+                pg_insert(OperationMetricRecord)
+                .values(
+                    [
+                        {
+                            "operation_id": operation_id,
+                            "series": series,
+                            "seq": seq,
+                            "data": _sanitize_for_json(entry),
+                        }
+                        for series, seq, entry in entries
+                    ]
+                )
+                .on_conflict_do_nothing(
+                    index_elements=["operation_id", "series", "seq"]
+                )
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+            logger.debug(
+                f"Stored {len(entries)} metrics entries for operation: {operation_id}"
+            )
+            return len(entries)
+
+    async def get_metrics(
+        self,
+        operation_id: str,
+        series: str,
+        cursor: int = 0,
+        limit: Optional[int] = None,
+    ) -> MetricsEntries:
+        """Get stored metrics entries of one series from a cursor.
+
+        Args:
+            operation_id: The operation's unique identifier.
+            series: Metrics series name ("epochs", "bars", ...).
+            cursor: First sequence number to return.
+            limit: Maximum number of entries.
+
+        Returns:
+            (seq, entry) tuples in sequence order.
+        """
+        async with self._get_session() as session:
+            stmt = (
+                select(OperationMetricRecord.seq, OperationMetricRecord.data)
+                .where(
+                    OperationMetricRecord.operation_id == operation_id,
+                    OperationMetricRecord.series == series,
+                    OperationMetricRecord.seq >= cursor,
+                )
+                .order_by(OperationMetricRecord.seq)
+            )
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            result = await session.execute(stmt)
+            return [(int(seq), data) for seq, data in result.all()]
+
     @staticmethod
     def _record_to_info(record: OperationRecord) -> OperationInfo:
         """Convert OperationRecord (DB model) to OperationInfo (domain model).
@@ -317,7 +473,7 @@ class OperationsRepository:
 
         return OperationInfo(
             operation_id=cast(str, record.operation_id),
-            parent_operation_id=None,  # Not stored in DB (yet)
+            parent_operation_id=cast(Optional[str], record.parent_operation_id),
             operation_type=operation_type,
             status=status,
             created_at=cast(datetime, record.created_at),
@@ -359,6 +515,7 @@ class OperationsRepository:
 
         return OperationRecord(
             operation_id=info.operation_id,
+            parent_operation_id=info.parent_operation_id,
             operation_type=info.operation_type.value,
             status=info.status.value,
             created_at=info.created_at,
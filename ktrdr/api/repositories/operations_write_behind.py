@@ -0,0 +1,446 @@
+"""Write-behind persistence for the operations table.
+
+OperationsRepository writes synchronously: every create opens a session and
+every update does SELECT, mutate, COMMIT and REFRESH. During evolution bursts
+hundreds of operations are created, started and completed within seconds, so
+these round trips dominate.
+
+WriteBehindOperationsRepository queues creates and non-terminal updates,
+coalesces the queued updates per operation (later values win), and writes
+the queue on a short interval in one transaction:
+
+- Queued creates (with any updates made since) as one bulk INSERT.
+- Queued updates as one executemany UPDATE per set of updated columns,
+  keyed by operation_id.
+
+Terminal transitions (completed/failed/cancelled) flush the queue and are
+written synchronously, as are deletes and resumes. Reads of an operation with
+queued writes flush first, so callers always read their own writes.
+
+If a batch fails, its operations are retried one transaction each, so one
+bad row cannot roll back or drop unrelated writes. An operation whose writes
+keep failing is dropped after MAX_FLUSH_ATTEMPTS flushes, unless it carries a
+terminal transition: those stay queued (and a synchronous terminal update
+that cannot be written raises) rather than being discarded.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import bindparam, insert, inspect
+from sqlalchemy import update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ktrdr.api.models.db.operations import OperationRecord
+from ktrdr.api.models.operations import OperationInfo
+from ktrdr.api.repositories.operations_repository import (
+    _JSONB_FIELDS,
+    OperationsRepository,
+    _sanitize_for_json,
+)
+from ktrdr.logging import get_logger
+from ktrdr.monitoring.metrics import (
+    record_operations_write_flush,
+    update_operations_write_queue_depth,
+)
+
+logger = get_logger(__name__)
+
+# Consecutive failed flushes after which an operation's non-terminal writes
+# are dropped
+MAX_FLUSH_ATTEMPTS = 3
+
+# Attribute name → column of OperationRecord (metadata_ maps to "metadata")
+_COLUMNS = {attr.key: attr.columns[0] for attr in inspect(OperationRecord).column_attrs}
+
+
+class WriteBehindOperationsRepository(OperationsRepository):
+    """OperationsRepository that batches and coalesces writes.
+
+    Args:
+        session_factory: Async session factory for creating database sessions.
+        flush_interval: Seconds writes are held before a batched flush.
+        max_batch: Queued operations that trigger an immediate flush.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval: float = 0.1,
+        max_batch: int = 500,
+    ):
+        """Initialize the repository with an empty write queue.
+
+        Args:
+            session_factory: Factory for creating async database sessions.
+            flush_interval: Seconds writes are held before a batched flush.
+            max_batch: Queued operations that trigger an immediate flush.
+        """
+        super().__init__(session_factory)
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        # operation_id → full row to insert / changed fields to update
+        self._creates: dict[str, dict[str, Any]] = {}
+        self._updates: dict[str, dict[str, Any]] = {}
+
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+        # operation_id → consecutive failed writes of its queued row
+        self._failed_attempts: dict[str, int] = {}
+
+        # Statistics
+        self._flushes = 0
+        self._rows_written = 0
+        self._updates_coalesced = 0
+        self._flush_failures = 0
+        self._rows_dropped = 0
+        self._last_flush_seconds = 0.0
+        self._max_flush_seconds = 0.0
+        self._total_flush_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Operations with queued writes."""
+        return len(self._creates) + len(self._updates)
+
+    async def create(self, operation: OperationInfo) -> OperationInfo:
+        """Queue an operation insert.
+
+        Args:
+            operation: The OperationInfo to persist.
+
+        Returns:
+            The OperationInfo as given (written on the next flush).
+        """
+        record = self._info_to_record(operation)
+        row = {key: getattr(record, key) for key in _COLUMNS}
+        row["result"] = _sanitize_for_json(row["result"])
+        self._creates[operation.operation_id] = row
+        await self._enqueued()
+        return operation
+
+    async def update(self, operation_id: str, **fields) -> Optional[OperationInfo]:
+        """Queue an update, or write it now for terminal transitions.
+
+        Args:
+            operation_id: The operation's unique identifier.
+            **fields: Fields to update (e.g., status='running').
+
+        Returns:
+            Updated OperationInfo for synchronous (terminal) updates, None
+            when the update was queued.
+
+        Raises:
+            Exception: A terminal update could not be written. It stays
+                queued and is retried; it is never dropped.
+        """
+        terminal = fields.get("status") in self.TERMINAL_STATUSES
+        if terminal:
+            await self.flush()
+            if not self._is_pending(operation_id):
+                return await super().update(operation_id, **fields)
+            # The operation's earlier writes failed and were requeued: fold
+            # the transition into them rather than updating a row that may
+            # not exist yet, then write them now
+            fields.setdefault("completed_at", datetime.now(timezone.utc))
+
+        changes = {
+            name: (_sanitize_for_json(value) if name in _JSONB_FIELDS else value)
+            for name, value in fields.items()
+            if name in _COLUMNS
+        }
+        if not changes:
+            return None
+
+        if operation_id in self._creates:
+            self._creates[operation_id].update(changes)
+            self._updates_coalesced += 1
+        else:
+            pending = self._updates.get(operation_id)
+            if pending is None:
+                self._updates[operation_id] = changes
+            else:
+                pending.update(changes)
+                self._updates_coalesced += 1
+        if terminal:
+            try:
+                await self._flush_operation(operation_id)
+            except Exception:
+                await self._enqueued()  # Still queued: keep retrying it
+                raise
+            return await super().get(operation_id)
+        await self._enqueued()
+        return None
+
+    async def get(self, operation_id: str) -> Optional[OperationInfo]:
+        """Get an operation by ID, flushing its queued writes first."""
+        if self._is_pending(operation_id):
+            await self.flush()
+        return await super().get(operation_id)
+
+    async def list(self, **filters: Any) -> list[OperationInfo]:
+        """List operations (see OperationsRepository.list), flushing first."""
+        if self.queue_depth:
+            await self.flush()
+        return await super().list(**filters)
+
+    async def count(self, **filters: Any) -> int:
+        """Count operations (see OperationsRepository.count), flushing first."""
+        if self.queue_depth:
+            await self.flush()
+        return await super().count(**filters)
+
+    async def delete(self, operation_id: str) -> bool:
+        """Delete an operation by ID, flushing its queued writes first."""
+        if self._is_pending(operation_id):
+            await self.flush()
+        return await super().delete(operation_id)
+
+    async def try_resume(self, operation_id: str) -> bool:
+        """Atomically resume an operation, flushing its queued writes first."""
+        if self._is_pending(operation_id):
+            await self.flush()
+        return await super().try_resume(operation_id)
+
+    async def flush(self) -> int:
+        """Write all queued creates and updates in one transaction.
+
+        If the batch fails, each operation's writes are retried in their own
+        transaction. Operations that still fail are requeued (newer queued
+        values win); see _record_failures for when they are dropped.
+
+        Returns:
+            Number of rows written.
+        """
+        async with self._flush_lock:
+            if not self.queue_depth:
+                return 0
+            creates, self._creates = self._creates, {}
+            updates, self._updates = self._updates, {}
+
+            started = time.perf_counter()
+            try:
+                await self._write(creates, updates)
+            except Exception as e:
+                self._flush_failures += 1
+                record_operations_write_flush(
+                    time.perf_counter() - started, 0, ok=False
+                )
+                logger.warning(f"Operation write flush failed: {e}")
+                if len(creates) + len(updates) == 1:
+                    self._record_failures(creates, updates, e)
+                    update_operations_write_queue_depth(self.queue_depth)
+                    return 0
+                rows = await self._write_individually(creates, updates)
+                update_operations_write_queue_depth(self.queue_depth)
+                return rows
+
+            elapsed = time.perf_counter() - started
+            rows = len(creates) + len(updates)
+            for operation_id in (*creates, *updates):
+                self._failed_attempts.pop(operation_id, None)
+            self._flushes += 1
+            self._rows_written += rows
+            self._last_flush_seconds = elapsed
+            self._max_flush_seconds = max(self._max_flush_seconds, elapsed)
+            self._total_flush_seconds += elapsed
+            record_operations_write_flush(elapsed, rows, ok=True)
+            update_operations_write_queue_depth(self.queue_depth)
+            logger.debug(
+                f"Flushed {len(creates)} operation inserts and {len(updates)} "
+                f"updates in {elapsed * 1000:.1f}ms"
+            )
+            return rows
+
+    async def close(self) -> None:
+        """Stop the background flusher and write anything still queued."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        """Return write queue statistics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "flush_interval": self.flush_interval,
+            "flushes": self._flushes,
+            "rows_written": self._rows_written,
+            "updates_coalesced": self._updates_coalesced,
+            "flush_failures": self._flush_failures,
+            "rows_dropped": self._rows_dropped,
+            "last_flush_ms": round(self._last_flush_seconds * 1000, 3),
+            "max_flush_ms": round(self._max_flush_seconds * 1000, 3),
+            "avg_flush_ms": (
+                round(self._total_flush_seconds / self._flushes * 1000, 3)
+                if self._flushes
+                else 0.0
+            ),
+        }
+
+    async def _write(
+        self, creates: dict[str, dict[str, Any]], updates: dict[str, dict[str, Any]]
+    ) -> None:
+        """Write creates and updates in one transaction."""
+        async with self._get_session() as session:
+            if creates:
+                await session.execute(insert(OperationRecord), list(creates.values()))
+            for names, rows in _group_by_columns(updates).items():
+                await session.execute(_update_statement(names), rows)
+            await session.commit()
+
+    async def _write_individually(
+        self, creates: dict[str, dict[str, Any]], updates: dict[str, dict[str, Any]]
+    ) -> int:
+        """Write each operation's queued row in its own transaction.
+
+        Returns:
+            Number of rows written; failed rows go to _record_failures.
+        """
+        written = 0
+        for operation_id in (*creates, *updates):
+            create = (
+                {operation_id: creates[operation_id]} if operation_id in creates else {}
+            )
+            update = (
+                {operation_id: updates[operation_id]} if operation_id in updates else {}
+            )
+            try:
+                await self._write(create, update)
+            except Exception as e:
+                self._record_failures(create, update, e)
+                continue
+            self._failed_attempts.pop(operation_id, None)
+            written += 1
+        self._rows_written += written
+        logger.info(f"Wrote {written} operation rows individually after a failed flush")
+        return written
+
+    def _record_failures(
+        self,
+        creates: dict[str, dict[str, Any]],
+        updates: dict[str, dict[str, Any]],
+        error: Exception,
+    ) -> None:
+        """Requeue failed rows, dropping non-terminal ones that keep failing."""
+        for operation_id in (*creates, *updates):
+            attempts = self._failed_attempts.get(operation_id, 0) + 1
+            row = creates.get(operation_id) or updates[operation_id]
+            if attempts < MAX_FLUSH_ATTEMPTS:
+                self._failed_attempts[operation_id] = attempts
+            elif row.get("status") in self.TERMINAL_STATUSES:
+                # Never drop a terminal transition; keep retrying it
+                self._failed_attempts[operation_id] = attempts
+                logger.error(
+                    f"Terminal write for operation {operation_id} failed "
+                    f"{attempts} times, keeping it queued: {error}"
+                )
+            else:
+                self._failed_attempts.pop(operation_id, None)
+                self._rows_dropped += 1
+                creates.pop(operation_id, None)
+                updates.pop(operation_id, None)
+                logger.error(
+                    f"Dropping queued writes for operation {operation_id} after "
+                    f"{MAX_FLUSH_ATTEMPTS} failed flushes: {error}"
+                )
+        self._requeue(creates, updates)
+
+    async def _flush_operation(self, operation_id: str) -> None:
+        """Write one operation's queued row now.
+
+        Raises:
+            Exception: The write failed; the row stays queued for retry.
+        """
+        async with self._flush_lock:
+            create = {}
+            update = {}
+            if operation_id in self._creates:
+                create[operation_id] = self._creates.pop(operation_id)
+            if operation_id in self._updates:
+                update[operation_id] = self._updates.pop(operation_id)
+            if not (create or update):
+                return
+            try:
+                await self._write(create, update)
+            except Exception as e:
+                self._flush_failures += 1
+                self._record_failures(create, update, e)
+                update_operations_write_queue_depth(self.queue_depth)
+                raise
+            self._failed_attempts.pop(operation_id, None)
+            self._rows_written += 1
+            update_operations_write_queue_depth(self.queue_depth)
+
+    def _is_pending(self, operation_id: str) -> bool:
+        return operation_id in self._creates or operation_id in self._updates
+
+    def _requeue(
+        self, creates: dict[str, dict[str, Any]], updates: dict[str, dict[str, Any]]
+    ) -> None:
+        # Values queued while the failed flush ran are newer and win
+        for operation_id, row in creates.items():
+            row.update(self._updates.pop(operation_id, {}))
+            row.update(self._creates.get(operation_id, {}))
+            self._creates[operation_id] = row
+        for operation_id, changes in updates.items():
+            if operation_id in self._creates:
+                merged = {**changes, **self._creates[operation_id]}
+                self._creates[operation_id] = merged
+            else:
+                self._updates[operation_id] = {
+                    **changes,
+                    **self._updates.get(operation_id, {}),
+                }
+
+    async def _enqueued(self) -> None:
+        update_operations_write_queue_depth(self.queue_depth)
+        if self.queue_depth >= self.max_batch:
+            await self.flush()
+            return
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._run_flusher())
+        self._wakeup.set()
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # Hold writes for the interval so updates to the same operation
+            # (created → running → progress) coalesce into one row
+            await asyncio.sleep(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:  # Keep the flusher alive
+                logger.error(f"Operation write flusher error: {e}")
+
+
+def _group_by_columns(
+    updates: dict[str, dict[str, Any]],
+) -> dict[tuple[str, ...], list[dict[str, Any]]]:
+    """Group queued updates by the set of columns they change."""
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for operation_id, changes in updates.items():
+        names = tuple(sorted(changes))
+        row = {f"b_{name}": value for name, value in changes.items()}
+        row["b_operation_id"] = operation_id
+        groups.setdefault(names, []).append(row)
+    return groups
+
+
+def _update_statement(names: tuple[str, ...]):
+    """UPDATE operations SET <names> WHERE operation_id = :b_operation_id."""
+    table = OperationRecord.__table__
+    return (
+        sql_update(table)
+        .where(table.c.operation_id == bindparam("b_operation_id"))
+        .values({_COLUMNS[name].name: bindparam(f"b_{name}") for name in names})
+    )
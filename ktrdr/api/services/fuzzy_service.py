@@ -8,14 +8,29 @@ fuzzifying indicator values.
 NOTE: This service needs refactoring to work with v3 FuzzyEngine.
 V2 config classes have been removed. Some endpoints may not work until
 this service is updated to use v3 FuzzySetDefinition format.
+
+Data loading and fuzzification run on the compute executor's thread pool so
+they don't block the event loop. They stay in-process (rather than in the
+process pool) to keep the batch calculator's membership cache warm.
+Overlay responses are kept in the "fuzzy_overlays" response cache (see
+result_cache) and extended when only the range end moves forward.
 """
 
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from ktrdr import get_logger
 from ktrdr.api.services.base import BaseService
+from ktrdr.api.services.result_cache import (
+    VERIFY_BARS,
+    frame_fingerprint,
+    get_result_cache,
+    values_converged,
+    warmup_bars,
+)
+from ktrdr.async_infrastructure.compute_executor import get_compute_executor
 from ktrdr.config.models import FuzzySetDefinition
 from ktrdr.data.repository import DataRepository
 from ktrdr.errors import (
@@ -23,6 +38,7 @@ from ktrdr.errors import (
     DataError,
     ProcessingError,
 )
+from ktrdr.errors.exceptions import ApiTimeoutError, ServiceUnavailableError
 from ktrdr.fuzzy.batch_calculator import BatchFuzzyCalculator
 from ktrdr.fuzzy.engine import FuzzyEngine
 from ktrdr.indicators import IndicatorEngine
@@ -31,6 +47,15 @@ from ktrdr.monitoring.service_telemetry import trace_service_method
 # Create module-level logger
 logger = get_logger(__name__)
 
+# Overlays cover at most the most recent bars of the requested range
+_MAX_OVERLAY_BARS = 10000
+
+# Longest default lookback used by _get_indicator_values (MACD slow EMA)
+_LONGEST_INDICATOR_PERIOD = 26
+
+# Rough size of one {"timestamp", "value"} point for the cache's memory budget
+_BYTES_PER_POINT = 350
+
 
 class FuzzyService(BaseService):
     """
@@ -259,8 +284,10 @@ class FuzzyService(BaseService):
             else:
                 series = pd.Series(values)
 
-            # Fuzzify the values
-            result = self.fuzzy_engine.fuzzify(indicator, series)
+            # Fuzzify the values off the event loop
+            result = await get_compute_executor().run_io(
+                self.fuzzy_engine.fuzzify, indicator, series
+            )
 
             # Convert result to dictionary
             fuzzified_values: dict[str, Any] = {}
@@ -300,8 +327,8 @@ class FuzzyService(BaseService):
 
             return response
 
-        except ConfigurationError:
-            # Re-raise configuration errors
+        except (ConfigurationError, ApiTimeoutError, ServiceUnavailableError):
+            # Re-raise configuration and executor errors
             raise
         except Exception as e:
             self.logger.error(
@@ -362,12 +389,15 @@ class FuzzyService(BaseService):
             # Load data
             load_perf = self.track_performance("load_data")
             try:
-                df = self.repository.load_from_cache(
+                df = await get_compute_executor().run_io(
+                    self.repository.load_from_cache,
                     symbol=symbol,
                     timeframe=timeframe,
                     start_date=start_date,
                     end_date=end_date,
                 )
+            except (ApiTimeoutError, ServiceUnavailableError):
+                raise
             except Exception as e:
                 self.logger.error(f"Error loading data: {str(e)}")
                 raise DataError(
@@ -458,7 +488,12 @@ class FuzzyService(BaseService):
 
             return response
 
-        except (DataError, ConfigurationError):
+        except (
+            DataError,
+            ConfigurationError,
+            ApiTimeoutError,
+            ServiceUnavailableError,
+        ):
             # Re-raise known error types
             raise
         except Exception as e:
@@ -542,127 +577,123 @@ class FuzzyService(BaseService):
                 if not target_indicators:
                     self.logger.warning("No valid indicators found after filtering")
 
-            # Load OHLCV data
-            load_perf = self.track_performance("load_ohlcv_data")
-            try:
-                df = self.repository.load_from_cache(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
-            except Exception as e:
-                self.logger.error(f"Error loading OHLCV data: {str(e)}")
-                raise DataError(
-                    message=f"Failed to load data for {symbol} ({timeframe})",
-                    error_code="DATA-LoadFailed",
-                    details={
-                        "symbol": symbol,
-                        "timeframe": timeframe,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "error": str(e),
-                    },
-                ) from e
-
-            if df is None or df.empty:
-                raise DataError(
-                    message=f"No data available for {symbol} ({timeframe})",
-                    error_code="DATA-NoData",
-                    details={"symbol": symbol, "timeframe": timeframe},
-                )
-
-            load_perf["end_tracking"]()
-            self.logger.info(
-                f"Loaded {len(df)} OHLCV data points for {symbol} ({timeframe})"
+            # Serve repeated requests from the response cache
+            cache = get_result_cache("fuzzy_overlays")
+            series_key = (
+                symbol,
+                timeframe,
+                start_date,
+                tuple(target_indicators),
+                tuple(
+                    sorted(
+                        (name, definition.model_dump_json())
+                        for name, definition in self.config.items()
+                    )
+                ),
             )
-
-            # Apply default range logic (e.g., most recent 10000 bars)
-            max_bars = 10000
-            if len(df) > max_bars:
-                df = df.tail(max_bars)
-                self.logger.debug(f"Limited data to most recent {max_bars} bars")
-
-            # Calculate indicators and compute fuzzy memberships
-            fuzzy_overlay_data = {}
-            processing_warnings = []
-
-            for indicator_name in target_indicators:
+            version = self.repository.get_data_version(symbol, timeframe)
+            cache_key = (series_key, end_date, version)
+            cached = cache.get(cache_key) if version is not None else None
+            if cached is not None:
+                fuzzy_overlay_data, processing_warnings, bars = cached
+                self.logger.info(
+                    f"Serving cached fuzzy overlays for {symbol} ({timeframe})"
+                )
+            else:
+                # Load OHLCV data
+                load_perf = self.track_performance("load_ohlcv_data")
                 try:
-                    indicator_perf = self.track_performance(f"process_{indicator_name}")
-
-                    # Calculate or get indicator values
-                    indicator_series = await self._get_indicator_values(
-                        df, indicator_name
+                    df = await get_compute_executor().run_io(
+                        self.repository.load_from_cache,
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        start_date=start_date,
+                        end_date=end_date,
                     )
-
-                    if indicator_series is None:
-                        warning_msg = f"Failed to calculate indicator '{indicator_name}' - skipping"
-                        processing_warnings.append(warning_msg)
-                        self.logger.warning(warning_msg)
-                        continue
-
-                    # Compute fuzzy memberships using batch calculator
-                    membership_results = self.batch_calculator.calculate_memberships(
-                        indicator_name, indicator_series
+                except (ApiTimeoutError, ServiceUnavailableError):
+                    raise
+                except Exception as e:
+                    self.logger.error(f"Error loading OHLCV data: {str(e)}")
+                    raise DataError(
+                        message=f"Failed to load data for {symbol} ({timeframe})",
+                        error_code="DATA-LoadFailed",
+                        details={
+                            "symbol": symbol,
+                            "timeframe": timeframe,
+                            "start_date": start_date,
+                            "end_date": end_date,
+                            "error": str(e),
+                        },
+                    ) from e
+
+                if df is None or df.empty:
+                    raise DataError(
+                        message=f"No data available for {symbol} ({timeframe})",
+                        error_code="DATA-NoData",
+                        details={"symbol": symbol, "timeframe": timeframe},
                     )
 
-                    # Structure results for frontend consumption
-                    # V3: indicator_name is actually fuzzy_set_id
-                    indicator_fuzzy_sets = []
-                    fuzzy_sets = self.fuzzy_engine.get_membership_names(indicator_name)
-
-                    for set_name in fuzzy_sets:
-                        output_name = f"{indicator_name}_{set_name}"
-                        if output_name in membership_results:
-                            membership_series = membership_results[output_name]
-
-                            # Convert to list of timestamp/value pairs
-                            membership_points = []
-                            for timestamp, value in membership_series.items():
-                                membership_points.append(
-                                    {
-                                        "timestamp": (
-                                            timestamp.isoformat()
-                                            if hasattr(timestamp, "isoformat")
-                                            else str(timestamp)
-                                        ),
-                                        "value": (
-                                            float(value) if pd.notna(value) else None
-                                        ),
-                                    }
-                                )
-
-                            indicator_fuzzy_sets.append(
-                                {"set": set_name, "membership": membership_points}
-                            )
-
-                    fuzzy_overlay_data[indicator_name] = indicator_fuzzy_sets
+                load_perf["end_tracking"]()
+                self.logger.info(
+                    f"Loaded {len(df)} OHLCV data points for {symbol} ({timeframe})"
+                )
 
-                    indicator_perf["end_tracking"]()
+                # Apply default range logic (e.g., most recent 10000 bars)
+                if len(df) > _MAX_OVERLAY_BARS:
+                    df = df.tail(_MAX_OVERLAY_BARS)
                     self.logger.debug(
-                        f"Processed fuzzy memberships for {indicator_name}"
+                        f"Limited data to most recent {_MAX_OVERLAY_BARS} bars"
                     )
 
-                except Exception as e:
-                    warning_msg = (
-                        f"Error processing indicator '{indicator_name}': {str(e)}"
+                # Calculate indicators and compute fuzzy memberships off the loop,
+                # extending a cached shorter range of the same series when possible
+                executor = get_compute_executor()
+                extended = fingerprint = None
+                if version is not None:
+                    fingerprint = await executor.run_io(frame_fingerprint, df)
+                previous = (
+                    cache.get_latest(series_key, fingerprint)
+                    if version is not None
+                    else None
+                )
+                if previous is not None:
+                    extended = await executor.run_io(
+                        self._extend_overlays, previous, df, target_indicators
                     )
-                    processing_warnings.append(warning_msg)
-                    self.logger.warning(warning_msg)
-                    # Continue with other indicators
+                if extended is not None:
+                    cache.record_extension()
+                    fuzzy_overlay_data, processing_warnings = extended, []
+                else:
+                    fuzzy_overlay_data, processing_warnings = await executor.run_io(
+                        self._compute_overlays, df, target_indicators
+                    )
+                bars = len(df)
 
-            # Prepare response
+                if version is not None:
+                    size = (
+                        bars
+                        * _BYTES_PER_POINT
+                        * sum(len(sets) for sets in fuzzy_overlay_data.values())
+                    )
+                    cache.put(
+                        cache_key,
+                        series_key,
+                        (fuzzy_overlay_data, processing_warnings, bars),
+                        size,
+                        fingerprint=fingerprint,
+                    )
+
+            # Prepare response (copy so the cached overlays stay untouched)
             response = {
                 "symbol": symbol,
                 "timeframe": timeframe,
-                "data": fuzzy_overlay_data,
+                "data": dict(fuzzy_overlay_data),
             }
 
             # Add warnings if any occurred
-            all_warnings = (
-                warnings if "warnings" in locals() else []
-            ) + processing_warnings
+            all_warnings = (warnings if "warnings" in locals() else []) + list(
+                processing_warnings
+            )
             if all_warnings:
                 response["warnings"] = all_warnings
 
@@ -671,12 +702,17 @@ class FuzzyService(BaseService):
 
             self.logger.info(
                 f"Generated fuzzy overlays for {len(fuzzy_overlay_data)} indicators "
-                f"with {len(df)} data points in {performance_metrics.get('duration_ms', 0):.2f}ms"
+                f"with {bars} data points in {performance_metrics.get('duration_ms', 0):.2f}ms"
             )
 
             return response
 
-        except (DataError, ConfigurationError):
+        except (
+            DataError,
+            ConfigurationError,
+            ApiTimeoutError,
+            ServiceUnavailableError,
+        ):
             # Re-raise known error types
             raise
         except Exception as e:
@@ -687,7 +723,160 @@ class FuzzyService(BaseService):
                 details={"error": str(e)},
             ) from e
 
-    async def _get_indicator_values(
+    def _compute_overlays(
+        self, df: pd.DataFrame, target_indicators: list[str]
+    ) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
+        """
+        Compute fuzzy membership overlays for each indicator.
+
+        Blocking; get_fuzzy_overlays runs it on the compute executor.
+
+        Args:
+            df: OHLCV dataframe
+            target_indicators: Fuzzy set ids to compute
+
+        Returns:
+            Tuple of (overlay data by indicator, processing warnings)
+        """
+        fuzzy_overlay_data = {}
+        processing_warnings = []
+
+        for indicator_name in target_indicators:
+            try:
+                indicator_perf = self.track_performance(f"process_{indicator_name}")
+
+                # Calculate or get indicator values
+                indicator_series = self._get_indicator_values(df, indicator_name)
+
+                if indicator_series is None:
+                    warning_msg = (
+                        f"Failed to calculate indicator '{indicator_name}' - skipping"
+                    )
+                    processing_warnings.append(warning_msg)
+                    self.logger.warning(warning_msg)
+                    continue
+
+                # Compute fuzzy memberships using batch calculator
+                membership_results = self.batch_calculator.calculate_memberships(
+                    indicator_name, indicator_series
+                )
+
+                # Structure results for frontend consumption
+                # V3: indicator_name is actually fuzzy_set_id
+                indicator_fuzzy_sets = []
+                fuzzy_sets = self.fuzzy_engine.get_membership_names(indicator_name)
+
+                for set_name in fuzzy_sets:
+                    output_name = f"{indicator_name}_{set_name}"
+                    if output_name in membership_results:
+                        membership_series = membership_results[output_name]
+
+                        # Convert to list of timestamp/value pairs
+                        membership_points = []
+                        for timestamp, value in membership_series.items():
+                            membership_points.append(
+                                {
+                                    "timestamp": (
+                                        timestamp.isoformat()
+                                        if hasattr(timestamp, "isoformat")
+                                        else str(timestamp)
+                                    ),
+                                    "value": (
+                                        float(value) if pd.notna(value) else None
+                                    ),
+                                }
+                            )
+
+                        indicator_fuzzy_sets.append(
+                            {"set": set_name, "membership": membership_points}
+                        )
+
+                fuzzy_overlay_data[indicator_name] = indicator_fuzzy_sets
+
+                indicator_perf["end_tracking"]()
+                self.logger.debug(f"Processed fuzzy memberships for {indicator_name}")
+
+            except Exception as e:
+                warning_msg = f"Error processing indicator '{indicator_name}': {str(e)}"
+                processing_warnings.append(warning_msg)
+                self.logger.warning(warning_msg)
+                # Continue with other indicators
+
+        return fuzzy_overlay_data, processing_warnings
+
+    def _extend_overlays(
+        self,
+        previous: tuple[dict[str, list[dict[str, Any]]], list[str], int],
+        df: pd.DataFrame,
+        target_indicators: list[str],
+    ) -> Optional[dict[str, list[dict[str, Any]]]]:
+        """
+        Extend cached overlays to the bars appended after them.
+
+        Recomputes the new bars plus a warm-up window and accepts the result
+        only if the warm-up tail reproduces the cached memberships. Blocking;
+        get_fuzzy_overlays runs it on the compute executor.
+
+        Args:
+            previous: Cached (overlays, warnings, bars) for an earlier end
+            df: OHLCV dataframe for the requested range
+            target_indicators: Fuzzy set ids to compute
+
+        Returns:
+            Extended overlay data, or None to compute from scratch
+        """
+        prev_data, prev_warnings, _ = previous
+        if prev_warnings or not prev_data:
+            return None
+        first = next(iter(prev_data.values()))
+        if not first or not first[0]["membership"]:
+            return None
+        try:
+            known = df.index.get_loc(
+                pd.Timestamp(first[0]["membership"][-1]["timestamp"])
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not isinstance(known, (int, np.integer)):
+            return None  # Duplicate timestamps
+        known += 1
+        offset = known - warmup_bars([_LONGEST_INDICATOR_PERIOD])
+        if known >= len(df) or offset <= 0:
+            return None
+
+        data, warnings = self._compute_overlays(df.iloc[offset:], target_indicators)
+        if warnings or data.keys() != prev_data.keys():
+            return None
+
+        new_from = known - offset
+        extended: dict[str, list[dict[str, Any]]] = {}
+        for name, fuzzy_sets in data.items():
+            prev_sets = {entry["set"]: entry["membership"] for entry in prev_data[name]}
+            if [entry["set"] for entry in fuzzy_sets] != list(prev_sets):
+                return None
+            merged = []
+            for entry in fuzzy_sets:
+                points = entry["membership"]
+                prev_points = prev_sets[entry["set"]]
+                if not values_converged(
+                    [point["value"] for point in prev_points[-VERIFY_BARS:]],
+                    [
+                        point["value"]
+                        for point in points[new_from - VERIFY_BARS : new_from]
+                    ],
+                ):
+                    self.logger.debug(f"Overlay {name} did not converge; recomputing")
+                    return None
+                membership = prev_points + points[new_from:]
+                merged.append(
+                    {"set": entry["set"], "membership": membership[-_MAX_OVERLAY_BARS:]}
+                )
+            extended[name] = merged
+
+        self.logger.info(f"Extended cached fuzzy overlays by {len(df) - known} bars")
+        return extended
+
+    def _get_indicator_values(
         self, df: pd.DataFrame, indicator_name: str
     ) -> Optional[pd.Series]:
         """
@@ -834,6 +1023,7 @@ class FuzzyService(BaseService):
                 "available_indicators": len(available_indicators),
                 "indicator_names": available_indicators[:5],  # First 5 indicators
                 "sample_fuzzy_sets": sample_fuzzy_sets[:5],  # First 5 fuzzy sets
+                "result_cache": get_result_cache("fuzzy_overlays").stats(),
                 "message": message,
             }
         except Exception as e:
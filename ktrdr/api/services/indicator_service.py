@@ -4,10 +4,17 @@ Indicator service for the KTRDR API.
 This module provides services for accessing indicator functionality
 through the API, including listing available indicators and calculating
 indicator values for given data.
+
+Cache reads run on the compute executor's thread pool and indicator
+computation in its process pool, so a large calculation doesn't block the
+event loop. Results are kept in the "indicators" response cache (see
+result_cache); when only the range end moves forward, the cached series is
+extended rather than recomputed.
 """
 
+import math
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 
@@ -19,8 +26,17 @@ from ktrdr.api.models.indicators import (
     IndicatorType,
 )
 from ktrdr.api.services.base import BaseService
+from ktrdr.api.services.result_cache import (
+    VERIFY_BARS,
+    frame_fingerprint,
+    get_result_cache,
+    values_converged,
+    warmup_bars,
+)
+from ktrdr.async_infrastructure.compute_executor import get_compute_executor
 from ktrdr.data.repository import DataRepository
 from ktrdr.errors import ConfigurationError, DataError, ProcessingError
+from ktrdr.errors.exceptions import ApiTimeoutError, ServiceUnavailableError
 from ktrdr.indicators import INDICATOR_REGISTRY, ensure_all_registered
 from ktrdr.indicators.categories import get_indicator_category
 from ktrdr.indicators.indicator_engine import IndicatorEngine
@@ -29,6 +45,70 @@ from ktrdr.monitoring.service_telemetry import trace_service_method
 # Create module-level logger
 logger = get_logger(__name__)
 
+# Rough per-item sizes for the response cache's memory budget
+_BYTES_PER_DATE = 80
+_BYTES_PER_VALUE = 32
+
+
+def _freeze(indicator_dict: dict[str, dict]) -> tuple:
+    """Hashable, order-independent form of indicator definitions."""
+    return tuple(
+        sorted(
+            (name, tuple(sorted((k, repr(v)) for k, v in definition.items())))
+            for name, definition in indicator_dict.items()
+        )
+    )
+
+
+def _metadata(request: IndicatorCalculateRequest, dates: list[str]) -> dict[str, Any]:
+    """Response metadata for a calculation."""
+    return {
+        "symbol": request.symbol,
+        "timeframe": request.timeframe,
+        "start_date": dates[0] if dates else None,
+        "end_date": dates[-1] if dates else None,
+        "points": len(dates),
+    }
+
+
+def _compute_indicator_values(
+    df: pd.DataFrame, indicator_dict: dict[str, dict]
+) -> tuple[list[str], dict[str, list[float]]]:
+    """
+    Calculate indicators and convert them to JSON-ready lists.
+
+    Runs in the compute process pool, so it must stay a module-level function.
+
+    Args:
+        df: OHLCV data
+        indicator_dict: v3 indicator definitions keyed by indicator_id
+
+    Returns:
+        Tuple of (date strings, indicator values by column). NaN/Inf become 0.0.
+    """
+    result_df = IndicatorEngine(indicator_dict).apply(df)
+
+    # Extract dates and indicator values
+    dates = [
+        dt.strftime("%Y-%m-%d %H:%M:%S") if hasattr(dt, "strftime") else str(dt)
+        for dt in result_df.index
+    ]
+
+    # Determine which columns are indicators (not OHLCV)
+    # In v3, column names already use the indicator_id from indicator_dict
+    ohlcv_columns = ["open", "high", "low", "close", "volume"]
+    indicator_values: dict[str, list[float]] = {}
+    for col in result_df.columns:
+        if col.lower() in ohlcv_columns:
+            continue
+        # Replace NaN and Inf values for JSON serialization
+        indicator_values[col] = [
+            0.0 if pd.isna(val) or math.isinf(val) else float(val)
+            for val in result_df[col].tolist()
+        ]
+
+    return dates, indicator_values
+
 
 class IndicatorService(BaseService):
     """
@@ -203,6 +283,32 @@ class IndicatorService(BaseService):
             ProcessingError: If there is an error during indicator calculation.
         """
         try:
+            # Build v3 indicator config dict from request
+            indicator_dict: dict[str, dict] = {}
+            for indicator_config in request.indicators:
+                # Verify indicator type is known
+                if INDICATOR_REGISTRY.get(indicator_config.id) is None:
+                    raise ConfigurationError(
+                        message=f"Unknown indicator: {indicator_config.id}",
+                        error_code="CONFIG-UnknownIndicator",
+                        details={"indicator_id": indicator_config.id},
+                    )
+
+                # Generate indicator_id from type and key params
+                # e.g., rsi with period=14 -> rsi_14
+                params = indicator_config.parameters or {}
+                if indicator_config.output_name:
+                    indicator_id = indicator_config.output_name
+                elif "period" in params:
+                    indicator_id = f"{indicator_config.id}_{params['period']}"
+                else:
+                    # Use type as ID if no period
+                    indicator_id = indicator_config.id
+
+                # Build v3 definition: {"type": "rsi", "period": 14, ...}
+                definition = {"type": indicator_config.id, **params}
+                indicator_dict[indicator_id] = definition
+
             # Load data
             start_date = None
             end_date = None
@@ -212,19 +318,44 @@ class IndicatorService(BaseService):
             if request.end_date:
                 end_date = datetime.fromisoformat(request.end_date)
 
+            # Serve repeated requests from the response cache
+            cache = get_result_cache("indicators")
+            series_key = (
+                request.symbol,
+                request.timeframe,
+                start_date,
+                _freeze(indicator_dict),
+            )
+            version = self.repository.get_data_version(
+                request.symbol, request.timeframe
+            )
+            cache_key = (series_key, end_date, version)
+            cached = cache.get(cache_key) if version is not None else None
+            if cached is not None:
+                dates, indicator_values = cached
+                logger.info(
+                    f"Serving {len(indicator_dict)} cached indicators for "
+                    f"{request.symbol} ({request.timeframe})"
+                )
+                return dates, dict(indicator_values), _metadata(request, dates)
+
             logger.info(
                 f"Loading data for {request.symbol} ({request.timeframe}) "
                 f"from {start_date or 'beginning'} to {end_date or 'end'}"
             )
 
+            executor = get_compute_executor()
             try:
-                # Load data from cache using DataRepository
-                df = self.repository.load_from_cache(
+                # Load data from cache using DataRepository (off the event loop)
+                df = await executor.run_io(
+                    self.repository.load_from_cache,
                     symbol=request.symbol,
                     timeframe=request.timeframe,
                     start_date=start_date,
                     end_date=end_date,
                 )
+            except (ApiTimeoutError, ServiceUnavailableError):
+                raise
             except Exception as e:
                 logger.error(f"Error loading data: {str(e)}")
                 raise DataError(
@@ -248,39 +379,31 @@ class IndicatorService(BaseService):
 
             logger.info(f"Loaded {len(df)} data points")
 
-            # Build v3 indicator config dict from request
-            indicator_dict: dict[str, dict] = {}
-            for indicator_config in request.indicators:
-                # Verify indicator type is known
-                if INDICATOR_REGISTRY.get(indicator_config.id) is None:
-                    raise ConfigurationError(
-                        message=f"Unknown indicator: {indicator_config.id}",
-                        error_code="CONFIG-UnknownIndicator",
-                        details={"indicator_id": indicator_config.id},
+            # Calculate indicators in the compute process pool, extending a
+            # cached shorter range of the same series when possible
+            try:
+                extended = fingerprint = None
+                if version is not None:
+                    fingerprint = await executor.run_io(frame_fingerprint, df)
+                previous = (
+                    cache.get_latest(series_key, fingerprint)
+                    if version is not None
+                    else None
+                )
+                if previous is not None:
+                    extended = await self._extend_indicator_values(
+                        previous, df, indicator_dict
                     )
-
-                # Generate indicator_id from type and key params
-                # e.g., rsi with period=14 -> rsi_14
-                params = indicator_config.parameters or {}
-                if indicator_config.output_name:
-                    indicator_id = indicator_config.output_name
-                elif "period" in params:
-                    indicator_id = f"{indicator_config.id}_{params['period']}"
+                if extended is not None:
+                    cache.record_extension()
+                    dates, indicator_values = extended
                 else:
-                    # Use type as ID if no period
-                    indicator_id = indicator_config.id
-
-                # Build v3 definition: {"type": "rsi", "period": 14, ...}
-                definition = {"type": indicator_config.id, **params}
-                indicator_dict[indicator_id] = definition
-
-            # Initialize the indicator engine with v3 dict format
-            engine = IndicatorEngine(indicator_dict)
-
-            # Calculate indicators
-            try:
-                result_df = engine.apply(df)
+                    dates, indicator_values = await executor.run_cpu(
+                        _compute_indicator_values, df, indicator_dict
+                    )
                 logger.info(f"Successfully calculated {len(indicator_dict)} indicators")
+            except (ApiTimeoutError, ServiceUnavailableError):
+                raise
             except Exception as e:
                 logger.error(f"Error calculating indicators: {str(e)}")
                 raise ProcessingError(
@@ -289,56 +412,27 @@ class IndicatorService(BaseService):
                     details={"error": str(e)},
                 ) from e
 
-            # Extract dates and indicator values
-            dates = [
-                dt.strftime("%Y-%m-%d %H:%M:%S") if hasattr(dt, "strftime") else str(dt)
-                for dt in result_df.index
-            ]
-
-            # Determine which columns are indicators (not OHLCV)
-            ohlcv_columns = ["open", "high", "low", "close", "volume"]
-            indicator_columns = [
-                col for col in result_df.columns if col.lower() not in ohlcv_columns
-            ]
-
-            # Map indicator values by name
-            # In v3, column names already use the indicator_id from indicator_dict
-            import math
-
-            indicator_values = {}
-            for col in indicator_columns:
-                # Convert to list and handle NaN/Inf values for JSON compatibility
-                values = result_df[col].tolist()
-                # Replace NaN and Inf values with None for JSON serialization
-                clean_values: list[float | None] = []
-                for val in values:
-                    if pd.isna(val) or math.isinf(val):
-                        clean_values.append(None)
-                    else:
-                        clean_values.append(val)
-
-                indicator_values[col] = clean_values
-
-            # Create metadata
-            metadata = {
-                "symbol": request.symbol,
-                "timeframe": request.timeframe,
-                "start_date": dates[0] if dates else None,
-                "end_date": dates[-1] if dates else None,
-                "points": len(dates),
-            }
-
-            # Ensure proper types for return values
-            dates_list: list[str] = [str(d) for d in dates]
-            indicator_values_clean: dict[str, list[float]] = {
-                k: [float(val) if val is not None else 0.0 for val in v]
-                for k, v in indicator_values.items()
-            }
-            metadata_clean: dict[str, Any] = dict(metadata)
+            if version is not None:
+                size = len(dates) * (
+                    _BYTES_PER_DATE + _BYTES_PER_VALUE * len(indicator_values)
+                )
+                cache.put(
+                    cache_key,
+                    series_key,
+                    (dates, indicator_values),
+                    size,
+                    fingerprint=fingerprint,
+                )
 
-            return dates_list, indicator_values_clean, metadata_clean
+            return dates, dict(indicator_values), _metadata(request, dates)
 
-        except (DataError, ConfigurationError, ProcessingError):
+        except (
+            DataError,
+            ConfigurationError,
+            ProcessingError,
+            ApiTimeoutError,
+            ServiceUnavailableError,
+        ):
             # Re-raise known error types
             raise
         except Exception as e:
@@ -349,6 +443,67 @@ class IndicatorService(BaseService):
                 details={"error": str(e)},
             ) from e
 
+    async def _extend_indicator_values(
+        self,
+        previous: tuple[list[str], dict[str, list[float]]],
+        df: pd.DataFrame,
+        indicator_dict: dict[str, dict],
+    ) -> Optional[tuple[list[str], dict[str, list[float]]]]:
+        """
+        Extend a cached calculation to the bars appended after it.
+
+        Recomputes the new bars plus a warm-up window and accepts the result
+        only if the warm-up tail reproduces the cached values.
+
+        Args:
+            previous: Cached (dates, values) for an earlier end of the series
+            df: OHLCV data for the full requested range
+            indicator_dict: v3 indicator definitions keyed by indicator_id
+
+        Returns:
+            Extended (dates, values), or None to compute from scratch
+        """
+        prev_dates, prev_values = previous
+        known = len(prev_dates)
+        if not prev_dates or len(df) <= known:
+            return None
+        last = df.index[known - 1]
+        if not hasattr(last, "strftime"):
+            return None
+        if last.strftime("%Y-%m-%d %H:%M:%S") != prev_dates[-1]:
+            return None
+
+        periods = [
+            value
+            for definition in indicator_dict.values()
+            for value in definition.values()
+            if isinstance(value, int) and not isinstance(value, bool)
+        ]
+        offset = known - warmup_bars(periods)
+        if offset <= 0:
+            return None  # Warm-up covers the whole range; nothing to save
+
+        dates, values = await get_compute_executor().run_cpu(
+            _compute_indicator_values, df.iloc[offset:], indicator_dict
+        )
+        if values.keys() != prev_values.keys():
+            return None
+        verify_from = known - VERIFY_BARS - offset
+        for name, column in values.items():
+            if not values_converged(
+                prev_values[name][-VERIFY_BARS:],
+                column[verify_from : known - offset],
+            ):
+                logger.debug(f"Indicator {name} did not converge; recomputing")
+                return None
+
+        new_from = known - offset
+        logger.info(f"Extended cached indicators by {len(dates) - new_from} bars")
+        return prev_dates + dates[new_from:], {
+            name: prev_values[name] + column[new_from:]
+            for name, column in values.items()
+        }
+
     async def health_check(self) -> dict[str, Any]:
         """
         Perform a health check on the indicator service.
@@ -366,6 +521,7 @@ class IndicatorService(BaseService):
                 "status": "healthy",
                 "available_indicators": indicator_count,
                 "first_5_indicators": indicator_names[:5] if indicator_names else [],
+                "result_cache": get_result_cache("indicators").stats(),
                 "message": "Indicator service is functioning normally",
             }
         except Exception as e:
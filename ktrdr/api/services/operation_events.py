@@ -0,0 +1,159 @@
+"""
+In-process publish/subscribe for operation progress events.
+
+OperationsService publishes an event whenever an operation's progress, status
+or metrics change - whether the change came from a local bridge, a remote
+proxy refresh, a worker push or a direct service call. Subscribers (the SSE
+stream endpoint, the worker progress pusher) receive events through bounded
+per-subscriber queues instead of polling.
+
+Slow subscribers never block publishers: when a queue is full, queued
+progress events are shed first. Progress events are snapshots, so losing an
+intermediate one only skips a progress-bar tick; metrics deltas and terminal
+events are kept unless nothing else can be dropped.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from ktrdr.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Event types
+EVENT_SNAPSHOT = "snapshot"  # Full state, sent when a subscription starts
+EVENT_PROGRESS = "progress"  # Progress and/or status changed
+EVENT_METRICS = "metrics"  # New metrics (delta only)
+EVENT_TERMINAL = "terminal"  # Reached completed/failed/cancelled
+
+DEFAULT_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class OperationEvent:
+    """A single operation change notification."""
+
+    operation_id: str
+    event_type: str
+    data: dict[str, Any]
+    sequence: int = 0
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.event_type == EVENT_TERMINAL
+
+    def to_sse(self) -> str:
+        """Format as a Server-Sent Events message."""
+        payload = json.dumps(
+            {"operation_id": self.operation_id, **self.data}, default=str
+        )
+        return f"id: {self.sequence}\nevent: {self.event_type}\ndata: {payload}\n\n"
+
+
+class OperationSubscription:
+    """Bounded event queue for one subscriber.
+
+    Use as an async context manager so the subscription is always removed
+    from the bus, even when the consumer disconnects mid-stream.
+    """
+
+    def __init__(
+        self,
+        bus: "OperationEventBus",
+        operation_ids: Optional[frozenset[str]],
+        max_queue: int,
+    ):
+        self._bus = bus
+        self.operation_ids = operation_ids
+        self._queue: asyncio.Queue[OperationEvent] = asyncio.Queue(max_queue)
+        self.dropped = 0
+
+    def matches(self, operation_id: str) -> bool:
+        """Whether this subscription wants events for ``operation_id``."""
+        return self.operation_ids is None or operation_id in self.operation_ids
+
+    def offer(self, event: OperationEvent) -> None:
+        """Enqueue without blocking, shedding queued progress events if full."""
+        if self._queue.full():
+            pending = self._drain()
+            kept = [e for e in pending if e.event_type != EVENT_PROGRESS]
+            if len(kept) == len(pending):
+                kept = kept[1:]  # Nothing sheddable - drop the oldest event
+            self.dropped += len(pending) - len(kept)
+            for queued in kept:
+                self._queue.put_nowait(queued)
+        self._queue.put_nowait(event)
+
+    def _drain(self) -> list[OperationEvent]:
+        events = []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[OperationEvent]:
+        """Wait for the next event.
+
+        Returns:
+            The next event, or None if ``timeout`` elapsed first
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+    async def __aenter__(self) -> "OperationSubscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class OperationEventBus:
+    """Fan-out of operation events to subscribers (event-loop local)."""
+
+    def __init__(self) -> None:
+        self._subscriptions: list[OperationSubscription] = []
+        self._sequence = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        operation_ids: Optional[list[str]] = None,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+    ) -> OperationSubscription:
+        """Subscribe to events for the given operations (or all if None)."""
+        subscription = OperationSubscription(
+            self,
+            frozenset(operation_ids) if operation_ids is not None else None,
+            max_queue,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: OperationSubscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            if subscription.dropped:
+                logger.debug(
+                    f"Subscription closed after dropping {subscription.dropped} events"
+                )
+
+    def publish(self, operation_id: str, event_type: str, data: dict[str, Any]) -> None:
+        """Deliver an event to every matching subscriber (no-op without any)."""
+        if not self._subscriptions:
+            return
+        self._sequence += 1
+        event = OperationEvent(operation_id, event_type, data, self._sequence)
+        for subscription in list(self._subscriptions):
+            if subscription.matches(operation_id):
+                subscription.offer(event)
@@ -0,0 +1,341 @@
+"""
+Bounded per-operation metrics store.
+
+Operations report metrics as an append-only series of dicts: epochs for
+training, bars for backtests, segments for data loads. Long runs produce tens
+of thousands of entries, so OperationsService keeps them here instead of in
+unbounded lists on OperationInfo.
+
+Each (operation, series) pair is a MetricsSeries:
+
+- The most recent entries are kept at full resolution in a ring buffer
+  (``recent``, also exposed as ``operation.metrics[<series>]``).
+- Entries that fall out of the ring are downsampled into coarser tiers with
+  Largest-Triangle-Three-Buckets (LTTB), which keeps the visual shape of the
+  series (peaks, drops) with a fraction of the points. Each tier holds a
+  bounded number of entries; the oldest entries of the last tier are dropped.
+- Every entry has a sequence number. Clients read incrementally with a
+  cursor (the next sequence number they want), as with progress bridges.
+- Entries not yet persisted are handed out in batches, so the database sees
+  one insert per batch rather than a write per metric or per operation update.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+from ktrdr.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tier i holds entries at 1/DOWNSAMPLE_FACTOR**(i+1) of full resolution
+DOWNSAMPLE_FACTOR = 10
+DOWNSAMPLE_LEVELS = 2
+# Points LTTB keeps from each block of evicted entries
+_POINTS_PER_BLOCK = 8
+
+# Fields preferred as the LTTB value, per series
+_VALUE_FIELDS: dict[str, tuple[str, ...]] = {
+    "epochs": ("val_loss", "train_loss", "loss"),
+    "bars": ("portfolio_value", "equity", "pnl"),
+    "segments": ("bars_fetched", "bars"),
+}
+
+
+def lttb(values: Sequence[float], threshold: int) -> list[int]:
+    """
+    Select points with Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        values: Y values at x = 0, 1, 2, ...
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted indices of the selected points; always includes the first and
+        last point. All indices when threshold >= len(values).
+    """
+    n = len(values)
+    if threshold >= n or n <= 2:
+        return list(range(n))
+    if threshold <= 2:
+        return [0, n - 1]
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket (or the last point) is the third vertex
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        if next_start >= next_end:
+            avg_x, avg_y = float(n - 1), values[n - 1]
+        else:
+            avg_x = (next_start + next_end - 1) / 2.0
+            avg_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        ax, ay = float(a), values[a]
+        best, best_area = start, -1.0
+        for j in range(start, min(end, n - 1)):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+
+    selected.append(n - 1)
+    return selected
+
+
+class MetricsSeries:
+    """Ring buffer plus downsampled history for one metrics series."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 2000,
+        downsampled_entries: int = 1000,
+        track_unpersisted: bool = False,
+    ):
+        """
+        Initialize an empty series.
+
+        Args:
+            name: Series name ("epochs", "bars", "segments", ...)
+            max_entries: Entries kept at full resolution
+            downsampled_entries: Entries kept per downsampled tier (0 = none)
+            track_unpersisted: Whether to keep entries until take_unpersisted()
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.downsampled_entries = downsampled_entries
+        self.recent: list[dict[str, Any]] = []
+        self.next_seq = 0
+        self.dropped = 0
+        self._value_fields = _VALUE_FIELDS.get(name, ())
+        levels = DOWNSAMPLE_LEVELS if downsampled_entries > 0 else 0
+        self._tiers: list[list[tuple[int, dict[str, Any]]]] = [
+            [] for _ in range(levels)
+        ]
+        self._spill: list[list[tuple[int, dict[str, Any]]]] = [
+            [] for _ in range(levels)
+        ]
+        self._track_unpersisted = track_unpersisted
+        self._unpersisted: list[tuple[int, dict[str, Any]]] = []
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest full-resolution entry."""
+        return self.next_seq - len(self.recent)
+
+    def __len__(self) -> int:
+        return self.next_seq
+
+    def append(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Append entries, downsampling whatever falls out of the ring buffer."""
+        entries = list(entries)
+        if not entries:
+            return
+        if self._track_unpersisted:
+            self._unpersisted.extend(
+                (self.next_seq + i, entry) for i, entry in enumerate(entries)
+            )
+        self.recent.extend(entries)
+        self.next_seq += len(entries)
+
+        overflow = len(self.recent) - self.max_entries
+        if overflow > 0:
+            first = self.first_seq
+            evicted = [
+                (first + i, entry) for i, entry in enumerate(self.recent[:overflow])
+            ]
+            # Trim in place: operation.metrics[<series>] shares this list
+            del self.recent[:overflow]
+            self._demote(0, evicted)
+
+    def read(
+        self, cursor: int = 0, limit: Optional[int] = None
+    ) -> tuple[list[dict[str, Any]], int, int]:
+        """
+        Read full-resolution entries from a cursor.
+
+        Args:
+            cursor: Sequence number of the first entry wanted
+            limit: Maximum entries to return
+
+        Returns:
+            (entries, next_cursor, missed): missed counts requested entries
+            that are no longer held at full resolution
+        """
+        first = self.first_seq
+        missed = max(0, min(first, self.next_seq) - cursor)
+        start = max(cursor, first) - first
+        end = (
+            len(self.recent) if limit is None else min(len(self.recent), start + limit)
+        )
+        entries = self.recent[start:end] if start < end else []
+        return entries, first + end if entries else max(cursor, first), missed
+
+    def history(self, max_points: Optional[int] = None) -> list[dict[str, Any]]:
+        """
+        Whole retained history, oldest first, each entry tagged with its "seq".
+
+        Args:
+            max_points: Downsample the result to at most this many entries
+
+        Returns:
+            Downsampled tiers followed by the full-resolution entries
+        """
+        points: list[tuple[int, dict[str, Any]]] = []
+        for level in reversed(range(len(self._tiers))):
+            points.extend(self._tiers[level])
+            points.extend(self._spill[level])
+        first = self.first_seq
+        points.extend((first + i, entry) for i, entry in enumerate(self.recent))
+
+        if max_points is not None and len(points) > max_points:
+            keep = lttb([self._value(entry) for _, entry in points], max_points)
+            points = [points[i] for i in keep]
+        return [{"seq": seq, **entry} for seq, entry in points]
+
+    def take_unpersisted(self) -> list[tuple[int, dict[str, Any]]]:
+        """Return and clear the entries not yet persisted."""
+        batch, self._unpersisted = self._unpersisted, []
+        return batch
+
+    def requeue(self, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        """Put back a batch whose persistence failed (bounded by max_entries)."""
+        self._unpersisted = (batch + self._unpersisted)[-self.max_entries :]
+
+    @property
+    def unpersisted_count(self) -> int:
+        return len(self._unpersisted)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": self.next_seq,
+            "full_resolution": len(self.recent),
+            "downsampled": sum(
+                len(tier) + len(spill)
+                for tier, spill in zip(self._tiers, self._spill, strict=True)
+            ),
+            "dropped": self.dropped,
+            "unpersisted": len(self._unpersisted),
+        }
+
+    def _demote(self, level: int, pairs: list[tuple[int, dict[str, Any]]]) -> None:
+        if level >= len(self._tiers):
+            self.dropped += len(pairs)
+            return
+
+        spill = self._spill[level]
+        spill.extend(pairs)
+        block = DOWNSAMPLE_FACTOR * _POINTS_PER_BLOCK
+        tier = self._tiers[level]
+        while len(spill) >= block:
+            chunk = spill[:block]
+            del spill[:block]
+            keep = lttb([self._value(entry) for _, entry in chunk], _POINTS_PER_BLOCK)
+            tier.extend(chunk[i] for i in keep)
+
+        overflow = len(tier) - self.downsampled_entries
+        if overflow > 0:
+            evicted = tier[:overflow]
+            del tier[:overflow]
+            self._demote(level + 1, evicted)
+
+    def _value(self, entry: dict[str, Any]) -> float:
+        for name in self._value_fields:
+            value = entry.get(name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+        for value in entry.values():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+        return 0.0
+
+
+class OperationMetricsStore:
+    """Metrics series for every operation, with batched persistence."""
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        downsampled_entries: int = 1000,
+        persist_batch: int = 200,
+        persistent: bool = False,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Full-resolution entries per series
+            downsampled_entries: Entries per downsampled tier
+            persist_batch: Unpersisted entries that make a batch due
+            persistent: Track unpersisted entries for take_batch()
+        """
+        self.max_entries = max_entries
+        self.downsampled_entries = downsampled_entries
+        self.persist_batch = persist_batch
+        self.persistent = persistent
+        self._series: dict[str, dict[str, MetricsSeries]] = {}
+
+    def append(
+        self, operation_id: str, name: str, entries: Iterable[dict[str, Any]]
+    ) -> MetricsSeries:
+        """Append entries to a series, creating it on first use."""
+        series = self.get(operation_id, name)
+        if series is None:
+            series = MetricsSeries(
+                name,
+                max_entries=self.max_entries,
+                downsampled_entries=self.downsampled_entries,
+                track_unpersisted=self.persistent,
+            )
+            self._series.setdefault(operation_id, {})[name] = series
+        series.append(entries)
+        return series
+
+    def get(self, operation_id: str, name: str) -> Optional[MetricsSeries]:
+        """Return a series, or None if the operation never reported it."""
+        return self._series.get(operation_id, {}).get(name)
+
+    def batch_due(self, operation_id: str) -> bool:
+        """Whether an operation has a full batch of unpersisted entries."""
+        return (
+            sum(
+                s.unpersisted_count for s in self._series.get(operation_id, {}).values()
+            )
+            >= self.persist_batch
+        )
+
+    def take_batch(self, operation_id: str) -> list[tuple[str, int, dict[str, Any]]]:
+        """Return and clear an operation's unpersisted entries as (series, seq, entry)."""
+        batch: list[tuple[str, int, dict[str, Any]]] = []
+        for name, series in self._series.get(operation_id, {}).items():
+            batch.extend((name, seq, entry) for seq, entry in series.take_unpersisted())
+        return batch
+
+    def requeue(
+        self, operation_id: str, batch: list[tuple[str, int, dict[str, Any]]]
+    ) -> None:
+        """Put back a batch whose persistence failed."""
+        by_series: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+        for name, seq, entry in batch:
+            by_series.setdefault(name, []).append((seq, entry))
+        for name, pairs in by_series.items():
+            series = self.get(operation_id, name)
+            if series is not None:
+                series.requeue(pairs)
+
+    def remove(self, operation_id: str) -> None:
+        """Forget an operation's metrics (e.g. when it leaves the cache)."""
+        self._series.pop(operation_id, None)
+
+    def stats(self, operation_id: str) -> dict[str, Any]:
+        """Per-series statistics for an operation."""
+        return {
+            name: series.stats()
+            for name, series in self._series.get(operation_id, {}).items()
+        }
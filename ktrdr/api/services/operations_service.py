@@ -10,6 +10,7 @@ import math
 import os
 import time
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -19,14 +20,27 @@ from ktrdr.api.models.operations import (
     OperationInfo,
     OperationMetadata,
     OperationProgress,
+    OperationPushUpdate,
     OperationStatus,
     OperationType,
 )
 from ktrdr.api.repositories.operations_repository import OperationsRepository
+from ktrdr.api.repositories.operations_write_behind import (
+    WriteBehindOperationsRepository,
+)
+from ktrdr.api.services.operation_events import (
+    EVENT_METRICS,
+    EVENT_PROGRESS,
+    EVENT_TERMINAL,
+    OperationEventBus,
+    OperationSubscription,
+)
+from ktrdr.api.services.operation_metrics import MetricsSeries, OperationMetricsStore
 from ktrdr.async_infrastructure.cancellation import (
     AsyncCancellationToken,
     get_global_coordinator,
 )
+from ktrdr.config.settings import get_operations_settings
 from ktrdr.errors import DataError
 from ktrdr.logging import get_logger
 from ktrdr.monitoring.metrics import (
@@ -38,6 +52,24 @@ from ktrdr.monitoring.service_telemetry import create_service_span, trace_servic
 
 logger = get_logger(__name__)
 
+_TERMINAL_STATUSES = frozenset(
+    {OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED}
+)
+
+# Statuses tracked by the in-memory active index (served without the DB)
+_ACTIVE_STATUSES = frozenset(
+    {OperationStatus.PENDING, OperationStatus.RUNNING, OperationStatus.RESUMING}
+)
+# Statuses counted as active by list_operations(active_only=True)
+_LISTED_ACTIVE_STATUSES = frozenset({OperationStatus.PENDING, OperationStatus.RUNNING})
+
+# Metrics series name per operation type (other types use "history")
+_METRICS_SERIES = {
+    OperationType.TRAINING: "epochs",
+    OperationType.BACKTESTING: "bars",
+    OperationType.DATA_LOAD: "segments",
+}
+
 # Phase weight constants for parent operation progress aggregation (Task 1.15)
 # These determine how child operation progress maps to parent progress
 # Design: 0-5%, Training: 5-80%, Backtest: 80-100%
@@ -96,15 +128,40 @@ class OperationsService:
         # In-memory cache (read-through when repository is available)
         self._cache: dict[str, OperationInfo] = {}
 
+        # Indexes over the cache for hot queries, pruned lazily on read:
+        # operations last seen active, and child IDs per parent ID
+        self._active_ids: dict[str, None] = {}
+        self._children_ids: dict[str, dict[str, None]] = {}
+
         # Operation tasks registry (for cancellation)
         self._operation_tasks: dict[str, asyncio.Task] = {}
 
         # Use global unified cancellation coordinator instead of local events
         self._cancellation_coordinator = get_global_coordinator()
 
-        # Lock for thread-safe operations
+        # Lock for structural cache changes (create/complete/fail/cancel/...).
+        # Read paths (get_operation, list_operations) never hold it across
+        # repository or worker I/O.
         self._lock = asyncio.Lock()
 
+        # In-flight remote fetches/refreshes, keyed by "<kind>:<operation_id>".
+        # Concurrent pollers of the same operation await one shared task.
+        self._inflight_refreshes: dict[str, asyncio.Task] = {}
+
+        # Bounded per-operation metrics (ring buffer + downsampled history).
+        # operation.metrics[<series>] is a view of the full-resolution part.
+        ops_settings = get_operations_settings()
+        self._metrics_store = OperationMetricsStore(
+            max_entries=ops_settings.metrics_max_entries,
+            downsampled_entries=ops_settings.metrics_downsampled_entries,
+            persist_batch=ops_settings.metrics_persist_batch,
+            persistent=repository is not None,
+        )
+
+        # Push channel: progress/status/metrics events for streaming subscribers
+        self._events = OperationEventBus()
+        self._host_operation_ids: dict[str, str] = {}  # host_id → backend_id
+
         # TASK 1.3: Bridge registry for pull-based progress updates (M1)
         self._local_bridges: dict[str, Any] = {}  # operation_id → ProgressBridge
         self._metrics_cursors: dict[str, int] = (
@@ -122,6 +179,11 @@ class OperationsService:
 
         logger.info("Operations service initialized with unified cancellation system")
 
+    async def close(self) -> None:
+        """Write queued repository writes (call before the database closes)."""
+        if self._repository:
+            await self._repository.close()
+
     def generate_operation_id(
         self, operation_type: OperationType, prefix: Optional[str] = None
     ) -> str:
@@ -238,6 +300,7 @@ class OperationsService:
 
                 # Then add to cache
                 self._cache[operation_id] = operation
+                self._index_operation(operation)
 
                 # Update Prometheus metrics
                 operations_active.inc()
@@ -302,6 +365,7 @@ class OperationsService:
 
             # Add to local cache
             self._cache[operation_id] = operation
+            self._index_operation(operation)
             logger.info(f"Adopted operation {operation_id} from database for resume")
 
             return operation
@@ -340,6 +404,8 @@ class OperationsService:
                 operation.status = OperationStatus.RUNNING
                 operation.started_at = datetime.now(timezone.utc)
 
+            self._publish_state(operation)
+
             # Persist to repository (if available)
             if self._repository:
                 await self._repository.update(
@@ -390,6 +456,8 @@ class OperationsService:
         if errors:
             operation.errors = operation.errors + errors
 
+        self._publish_state(operation)
+
         # Update OpenTelemetry span attributes with progress
         try:
             span = trace.get_current_span()
@@ -473,6 +541,8 @@ class OperationsService:
                 operation.result_summary = result_summary
                 operation.progress.percentage = 100.0
 
+            self._publish_state(operation)
+
             # Persist to repository (if available)
             if self._repository:
                 # Sanitize result to handle NaN/Inf values that PostgreSQL JSONB rejects
@@ -484,6 +554,7 @@ class OperationsService:
                     result=sanitized_result,
                     progress_percent=100.0,
                 )
+                await self._persist_metrics(operation_id, force=True)
 
             # Clean up task reference
             if operation_id in self._operation_tasks:
@@ -541,6 +612,8 @@ class OperationsService:
                 operation.completed_at = datetime.now(timezone.utc)
                 operation.error_message = error_message
 
+            self._publish_state(operation)
+
             # Persist to repository (if available)
             if self._repository:
                 await self._repository.update(
@@ -549,6 +622,7 @@ class OperationsService:
                     completed_at=operation.completed_at,
                     error_message=error_message,
                 )
+                await self._persist_metrics(operation_id, force=True)
 
             # Clean up task reference
             if operation_id in self._operation_tasks:
@@ -583,6 +657,7 @@ class OperationsService:
                     parent.status = OperationStatus.FAILED
                     parent.completed_at = datetime.now(timezone.utc)
                     parent.error_message = f"Child operation failed: {error_message}"
+                    self._publish_state(parent)
 
                     # Persist parent failure to repository
                     if self._repository:
@@ -670,6 +745,7 @@ class OperationsService:
                     child.error_message = (
                         f"Parent operation cancelled: {reason or 'User cancelled'}"
                     )
+                    self._publish_state(child)
 
                     # Persist child cancellation to repository
                     if self._repository:
@@ -751,6 +827,8 @@ class OperationsService:
                 operation.completed_at = datetime.now(timezone.utc)
                 operation.error_message = reason or "Operation cancelled by user"
 
+            self._publish_state(operation)
+
             # Persist to repository (if available)
             if self._repository:
                 await self._repository.update(
@@ -759,6 +837,7 @@ class OperationsService:
                     completed_at=operation.completed_at,
                     error_message=operation.error_message,
                 )
+                await self._persist_metrics(operation_id, force=True)
 
             # Update Prometheus metrics
             operations_active.dec()
@@ -830,11 +909,15 @@ class OperationsService:
                     cached_op.started_at = datetime.now(timezone.utc)
                     cached_op.completed_at = None
                     cached_op.error_message = None
+                    self._index_operation(cached_op)
+                    self._publish_state(cached_op)
                 else:
                     # Load from DB to populate cache
                     db_op = await self._repository.get(operation_id)
                     if db_op is not None:
                         self._cache[operation_id] = db_op
+                        self._index_operation(db_op)
+                        self._publish_state(db_op)
                         # DB state is already RESUMING after try_resume
                         old_status = OperationStatus.CANCELLED  # Assume from context
 
@@ -880,6 +963,8 @@ class OperationsService:
             operation.started_at = datetime.now(timezone.utc)
             operation.completed_at = None
             operation.error_message = None
+            self._index_operation(operation)
+            self._publish_state(operation)
 
             # Tracing
             with create_service_span(
@@ -931,6 +1016,8 @@ class OperationsService:
             ]:
                 operation.completed_at = datetime.now(timezone.utc)
 
+            self._publish_state(operation)
+
             # Persist to repository
             if self._repository:
                 await self._repository.update(
@@ -960,86 +1047,93 @@ class OperationsService:
         Returns:
             Operation info or None if not found
         """
-        async with self._lock:
-            # Check cache first
-            operation = self._cache.get(operation_id)
+        # Check cache first. Nothing below holds self._lock: repository reads
+        # and worker HTTP calls must not stall unrelated operations.
+        operation = self._cache.get(operation_id)
 
-            # Cache miss - try repository (read-through cache)
-            if not operation and self._repository:
-                operation = await self._repository.get(operation_id)
+        # Cache miss - try repository (read-through cache)
+        if not operation and self._repository:
+            operation = await self._repository.get(operation_id)
+            if operation:
+                # Populate cache for future reads, keeping any entry another
+                # coroutine inserted while we were awaiting the repository
+                operation = self._cache.setdefault(operation_id, operation)
+                self._index_operation(operation)
+
+        if not operation:
+            # Check if there's a remote proxy for this operation (distributed worker case)
+            # The worker creates/owns the operation - backend just proxies
+            remote_proxy_info = self._get_remote_proxy(operation_id)
+            if remote_proxy_info:
+                # Query proxy to get operation from worker (shared by concurrent callers)
+                operation = await self._coalesce(
+                    f"fetch:{operation_id}",
+                    lambda: self._fetch_operation_from_proxy(
+                        operation_id, remote_proxy_info
+                    ),
+                )
                 if operation:
-                    # Populate cache for future reads
-                    self._cache[operation_id] = operation
+                    # Cache for future reads
+                    operation = self._cache.setdefault(operation_id, operation)
+                    self._index_operation(operation)
 
             if not operation:
-                # Check if there's a remote proxy for this operation (distributed worker case)
-                # The worker creates/owns the operation - backend just proxies
-                remote_proxy_info = self._get_remote_proxy(operation_id)
-                if remote_proxy_info:
-                    # Query proxy to get operation from worker
-                    operation = await self._fetch_operation_from_proxy(
-                        operation_id, remote_proxy_info
+                return None
+
+        # TASK 1.3/1.4: Pull from local bridge if registered and operation is active
+        # (RUNNING or RESUMING - need to sync status transitions)
+        if (
+            operation.status in (OperationStatus.RUNNING, OperationStatus.RESUMING)
+            and operation_id in self._local_bridges
+        ):
+            # TASK 1.4: Force refresh bypasses cache
+            if force_refresh:
+                # Invalidate cache to force refresh
+                self._last_refresh[operation_id] = 0
+                logger.debug(f"Force refresh requested for operation {operation_id}")
+
+            # Refresh from bridge (synchronous, fast, cache-aware)
+            self._refresh_from_bridge(operation_id)
+
+        # TASK 2.5: Pull from remote proxy if registered and:
+        # - Operation is pending/running/resuming (to get progress updates), OR
+        # - Operation completed but result_summary is missing (to sync final result)
+        # NOTE: PENDING operations with remote proxy need refresh because the backend
+        # creates a local PENDING entry, but the worker owns the real operation state.
+        # RESUMING operations need proxy refresh to sync status transitions
+        # (RESUMING → RUNNING → COMPLETED) from the worker.
+        needs_result_sync = (
+            operation.status == OperationStatus.COMPLETED
+            and operation.result_summary is None
+        )
+        is_active = operation.status in (
+            OperationStatus.PENDING,
+            OperationStatus.RUNNING,
+            OperationStatus.RESUMING,
+        )
+        if self._get_remote_proxy(operation_id) and (is_active or needs_result_sync):
+            # Force refresh bypasses cache
+            if force_refresh or needs_result_sync:
+                # Invalidate cache to force refresh (always refresh for result sync)
+                self._last_refresh[operation_id] = 0
+                if needs_result_sync:
+                    logger.info(
+                        f"Syncing result_summary for completed remote operation {operation_id}"
                     )
-                    if operation:
-                        # Cache for future reads
-                        self._cache[operation_id] = operation
-
-                if not operation:
-                    return None
-
-            # TASK 1.3/1.4: Pull from local bridge if registered and operation is active
-            # (RUNNING or RESUMING - need to sync status transitions)
-            if (
-                operation.status in (OperationStatus.RUNNING, OperationStatus.RESUMING)
-                and operation_id in self._local_bridges
-            ):
-                # TASK 1.4: Force refresh bypasses cache
-                if force_refresh:
-                    # Invalidate cache to force refresh
-                    self._last_refresh[operation_id] = 0
+                else:
                     logger.debug(
-                        f"Force refresh requested for operation {operation_id}"
+                        f"Force refresh requested for remote operation {operation_id}"
                     )
 
-                # Refresh from bridge (synchronous, fast, cache-aware)
-                self._refresh_from_bridge(operation_id)
-
-            # TASK 2.5: Pull from remote proxy if registered and:
-            # - Operation is pending/running/resuming (to get progress updates), OR
-            # - Operation completed but result_summary is missing (to sync final result)
-            # NOTE: PENDING operations with remote proxy need refresh because the backend
-            # creates a local PENDING entry, but the worker owns the real operation state.
-            # RESUMING operations need proxy refresh to sync status transitions
-            # (RESUMING → RUNNING → COMPLETED) from the worker.
-            needs_result_sync = (
-                operation.status == OperationStatus.COMPLETED
-                and operation.result_summary is None
+            # Refresh from remote host service (async, cache-aware, coalesced)
+            await self._coalesce(
+                f"refresh:{operation_id}",
+                lambda: self._refresh_from_remote_proxy(operation_id),
             )
-            is_active = operation.status in (
-                OperationStatus.PENDING,
-                OperationStatus.RUNNING,
-                OperationStatus.RESUMING,
-            )
-            if self._get_remote_proxy(operation_id) and (
-                is_active or needs_result_sync
-            ):
-                # Force refresh bypasses cache
-                if force_refresh or needs_result_sync:
-                    # Invalidate cache to force refresh (always refresh for result sync)
-                    self._last_refresh[operation_id] = 0
-                    if needs_result_sync:
-                        logger.info(
-                            f"Syncing result_summary for completed remote operation {operation_id}"
-                        )
-                    else:
-                        logger.debug(
-                            f"Force refresh requested for remote operation {operation_id}"
-                        )
 
-                # Refresh from remote host service (async, cache-aware)
-                await self._refresh_from_remote_proxy(operation_id)
+        await self._persist_metrics(operation_id)
 
-            return operation
+        return operation
 
     @trace_service_method("operations.list")
     async def list_operations(
@@ -1049,9 +1143,16 @@ class OperationsService:
         limit: int = 100,
         offset: int = 0,
         active_only: bool = False,
+        cursor: Optional[str] = None,
+        cached_only: bool = False,
     ) -> tuple[list[OperationInfo], int, int]:
         """
-        List operations with filtering.
+        List operations with filtering, newest first.
+
+        Active operations (active_only, or a pending/running/resuming status)
+        are served from the in-memory active index. Other listings (history)
+        are pushed down to the repository's indexed, paginated query when one
+        is configured, and fall back to the cache otherwise.
 
         Args:
             status: Filter by status
@@ -1059,53 +1160,96 @@ class OperationsService:
             limit: Maximum number of operations to return
             offset: Number of operations to skip
             active_only: Only return active operations
+            cursor: Keyset pagination cursor (see list_cursor()); returns the
+                operations after it and ignores offset
+            cached_only: Only list operations held by this process (workers
+                list their own operations, not the whole table)
 
         Returns:
             Tuple of (operations, total_count, active_count)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        async with self._lock:
-            # Get all operations
-            all_operations = list(self._cache.values())
-
-            # Apply filters
-            filtered_operations = all_operations
-
-            if active_only:
-                filtered_operations = [
-                    op
-                    for op in filtered_operations
-                    if op.status in [OperationStatus.PENDING, OperationStatus.RUNNING]
-                ]
-
-            if status:
-                filtered_operations = [
-                    op for op in filtered_operations if op.status == status
-                ]
-
-            if operation_type:
-                filtered_operations = [
-                    op
-                    for op in filtered_operations
-                    if op.operation_type == operation_type
-                ]
-
-            # Sort by creation date (newest first)
-            filtered_operations.sort(key=lambda op: op.created_at, reverse=True)
-
-            # Apply pagination
-            total_count = len(filtered_operations)
-            paginated_operations = filtered_operations[offset : offset + limit]
-
-            # Count active operations
-            active_count = len(
-                [
-                    op
-                    for op in all_operations
-                    if op.status in [OperationStatus.PENDING, OperationStatus.RUNNING]
-                ]
+        after = _parse_list_cursor(cursor) if cursor else None
+        if after is not None:
+            offset = 0
+
+        # Nothing below holds self._lock: the indexes are read without awaits,
+        # and repository queries must not stall writers.
+        active_operations = self._active_operations()
+        active_count = sum(
+            1 for op in active_operations if op.status in _LISTED_ACTIVE_STATUSES
+        )
+
+        serve_active = active_only or status in _ACTIVE_STATUSES
+        if self._repository and not (serve_active or cached_only):
+            return await self._list_from_repository(
+                status, operation_type, limit, offset, after, active_count
             )
 
-            return paginated_operations, total_count, active_count
+        candidates = active_operations if serve_active else list(self._cache.values())
+        operations = [
+            op
+            for op in candidates
+            if (not active_only or op.status in _LISTED_ACTIVE_STATUSES)
+            and (status is None or op.status == status)
+            and (operation_type is None or op.operation_type == operation_type)
+        ]
+        operations.sort(key=_list_sort_key, reverse=True)
+        total_count = len(operations)
+        if after is not None:
+            operations = [op for op in operations if _list_sort_key(op) < after]
+
+        return operations[offset : offset + limit], total_count, active_count
+
+    @staticmethod
+    def list_cursor(operation: OperationInfo) -> str:
+        """Keyset cursor for the page after this (last listed) operation."""
+        return f"{operation.created_at.isoformat()}|{operation.operation_id}"
+
+    async def _list_from_repository(
+        self,
+        status: Optional[OperationStatus],
+        operation_type: Optional[OperationType],
+        limit: int,
+        offset: int,
+        after: Optional[tuple[datetime, str]],
+        active_count: int,
+    ) -> tuple[list[OperationInfo], int, int]:
+        """History listing via the repository's indexed query."""
+        assert self._repository is not None
+        filters = {
+            "status": status.value if status else None,
+            "operation_type": operation_type.value if operation_type else None,
+        }
+        stored = await self._repository.list(
+            **filters, limit=limit, offset=offset, after=after
+        )
+        total_count = await self._repository.count(**filters)
+        # Cached instances carry live progress the stored rows don't
+        operations = [self._cache.get(op.operation_id, op) for op in stored]
+        return operations, total_count, active_count
+
+    def _index_operation(self, operation: OperationInfo) -> None:
+        """Add a cached operation to the active and parent indexes."""
+        if operation.status in _ACTIVE_STATUSES:
+            self._active_ids[operation.operation_id] = None
+        if operation.parent_operation_id:
+            self._children_ids.setdefault(operation.parent_operation_id, {})[
+                operation.operation_id
+            ] = None
+
+    def _active_operations(self) -> list[OperationInfo]:
+        """Cached operations in an active status, pruning stale index entries."""
+        active = []
+        for operation_id in list(self._active_ids):
+            operation = self._cache.get(operation_id)
+            if operation is None or operation.status not in _ACTIVE_STATUSES:
+                del self._active_ids[operation_id]
+            else:
+                active.append(operation)
+        return active
 
     async def retry_operation(self, operation_id: str) -> OperationInfo:
         """
@@ -1161,6 +1305,7 @@ class OperationsService:
 
             # Add to registry
             self._cache[new_operation_id] = new_operation
+            self._index_operation(new_operation)
 
             logger.info(
                 f"Created retry operation: {new_operation_id} (original: {operation_id})"
@@ -1179,15 +1324,23 @@ class OperationsService:
         Returns:
             List of child operations in creation order
         """
-        async with self._lock:
-            children = [
-                op
-                for op in self._cache.values()
-                if op.parent_operation_id == parent_operation_id
-            ]
-            # Sort by creation time (oldest first)
-            children.sort(key=lambda op: op.created_at)
-            return children
+        # Indexed lookup of cached children (lock-free: no awaits)
+        children = [
+            self._cache[child_id]
+            for child_id in self._children_ids.get(parent_operation_id, {})
+            if child_id in self._cache
+        ]
+        # Finished children may have left the cache: add them from the
+        # repository's parent index
+        if self._repository:
+            cached_ids = {op.operation_id for op in children}
+            stored = await self._repository.list(
+                parent_operation_id=parent_operation_id
+            )
+            children.extend(op for op in stored if op.operation_id not in cached_ids)
+        # Sort by creation time (oldest first)
+        children.sort(key=lambda op: op.created_at)
+        return children
 
     async def get_aggregated_progress(
         self, parent_operation_id: str
@@ -1342,8 +1495,15 @@ class OperationsService:
             logger.debug(f"Operation {operation_id} not in cache, nothing to remove")
             return False
 
-        # Remove from cache
-        del self._cache[operation_id]
+        # Remove from cache and its indexes
+        operation = self._cache.pop(operation_id)
+        self._active_ids.pop(operation_id, None)
+        if operation.parent_operation_id:
+            siblings = self._children_ids.get(operation.parent_operation_id)
+            if siblings is not None:
+                siblings.pop(operation_id, None)
+                if not siblings:
+                    del self._children_ids[operation.parent_operation_id]
 
         # Clean up any remaining references
         if operation_id in self._operation_tasks:
@@ -1361,6 +1521,8 @@ class OperationsService:
         if operation_id in self._last_refresh:
             del self._last_refresh[operation_id]
 
+        self._metrics_store.remove(operation_id)
+
         logger.debug(
             f"Removed operation {operation_id} from cache and cleaned up references"
         )
@@ -1420,12 +1582,196 @@ class OperationsService:
             host_operation_id: Operation ID on host service
         """
         self._remote_proxies[backend_operation_id] = (proxy, host_operation_id)
+        self._host_operation_ids[host_operation_id] = backend_operation_id
         self._metrics_cursors[backend_operation_id] = 0  # Start cursor at 0
         logger.info(
             f"Registered remote proxy for operation {backend_operation_id} → "
             f"host {host_operation_id}"
         )
 
+    def _append_metrics(
+        self, operation: OperationInfo, new_metrics: list[Any]
+    ) -> MetricsSeries:
+        """
+        Append a metrics delta to the operation's type-specific series.
+
+        Entries go to the bounded metrics store; operation.metrics[<series>]
+        holds the most recent entries at full resolution.
+
+        Returns:
+            The MetricsSeries the entries were appended to
+        """
+        if operation.metrics is None:
+            operation.metrics = {}
+
+        # Type-aware metrics storage (generic fallback: "history")
+        key = self.get_metrics_series_name(operation)
+        series = self._metrics_store.get(operation.operation_id, key)
+        if series is None:
+            # Adopt entries recorded before the store saw this operation
+            existing = operation.metrics.get(key) or []
+            new_metrics = [*existing, *new_metrics]
+        series = self._metrics_store.append(operation.operation_id, key, new_metrics)
+        operation.metrics[key] = series.recent
+        return series
+
+    async def _persist_metrics(self, operation_id: str, force: bool = False) -> None:
+        """
+        Write an operation's unpersisted metrics to the repository in one batch.
+
+        Runs when a full batch has accumulated, or unconditionally with force
+        (when the operation finishes). A failed write is requeued for the next
+        batch; it never fails the caller.
+
+        Args:
+            operation_id: Operation identifier
+            force: Write whatever is pending, even less than a batch
+        """
+        if not self._repository:
+            return
+        if not force and not self._metrics_store.batch_due(operation_id):
+            return
+
+        batch = self._metrics_store.take_batch(operation_id)
+        if not batch:
+            return
+        try:
+            await self._repository.add_metrics(operation_id, batch)
+        except Exception as e:
+            logger.warning(
+                f"Failed to persist {len(batch)} metrics for {operation_id}: {e}"
+            )
+            self._metrics_store.requeue(operation_id, batch)
+
+    def subscribe(
+        self, operation_ids: Optional[list[str]] = None
+    ) -> OperationSubscription:
+        """
+        Subscribe to pushed progress, metrics and terminal events.
+
+        Args:
+            operation_ids: Operations to watch, or None for all operations
+
+        Returns:
+            Subscription; use as ``async with`` so it is always released
+        """
+        return self._events.subscribe(operation_ids)
+
+    @staticmethod
+    def event_data(operation: OperationInfo) -> dict[str, Any]:
+        """Serializable state carried by snapshot/progress/terminal events."""
+        data: dict[str, Any] = {
+            "status": operation.status.value,
+            "progress": operation.progress.model_dump(mode="json"),
+        }
+        if operation.status in _TERMINAL_STATUSES:
+            data["completed_at"] = (
+                operation.completed_at.isoformat() if operation.completed_at else None
+            )
+            data["error_message"] = operation.error_message
+            data["result_summary"] = _sanitize_for_json(operation.result_summary)
+        return data
+
+    def _publish_state(self, operation: OperationInfo) -> None:
+        """Publish a progress or terminal event for the operation's current state."""
+        # Every state change passes through here: keep the active index current
+        if operation.status in _ACTIVE_STATUSES:
+            self._active_ids[operation.operation_id] = None
+        if not self._events.subscriber_count:
+            return
+        event_type = (
+            EVENT_TERMINAL if operation.status in _TERMINAL_STATUSES else EVENT_PROGRESS
+        )
+        self._events.publish(
+            operation.operation_id, event_type, self.event_data(operation)
+        )
+
+    def _publish_metrics(self, operation_id: str, new_metrics: list[Any]) -> None:
+        """Publish a metrics delta."""
+        if not self._events.subscriber_count:
+            return
+        self._events.publish(
+            operation_id,
+            EVENT_METRICS,
+            {
+                "metrics": _sanitize_for_json(new_metrics),
+                "cursor": self._metrics_cursors.get(operation_id),
+            },
+        )
+
+    def refresh_local_operations(self) -> None:
+        """
+        Pull every active operation that has a local bridge.
+
+        Bridges are pull-based; this lets a push loop (or anything else that
+        wants change events without a client polling) drive the refresh. The
+        usual cache TTL applies, and changes are published to subscribers.
+        """
+        for operation_id in list(self._local_bridges):
+            operation = self._cache.get(operation_id)
+            if operation and operation.status in (
+                OperationStatus.RUNNING,
+                OperationStatus.RESUMING,
+            ):
+                self._refresh_from_bridge(operation_id)
+
+    async def apply_pushed_update(
+        self, operation_id: str, update: OperationPushUpdate
+    ) -> bool:
+        """
+        Apply state pushed by the worker that runs an operation.
+
+        Pushed state replaces the pull refresh: the cache timestamp is bumped so
+        get_operation() doesn't query the worker again within the TTL, and the
+        metrics cursor advances so a later pull doesn't re-fetch pushed metrics.
+
+        Args:
+            operation_id: Backend operation ID, or the worker's (host) operation
+                ID of an operation registered with register_remote_proxy()
+            update: Pushed fields; absent fields are left unchanged
+
+        Returns:
+            True if applied, False if the operation is unknown
+        """
+        if operation_id not in self._cache:
+            operation_id = self._host_operation_ids.get(operation_id, operation_id)
+        operation = self._cache.get(operation_id)
+        if operation is None:
+            return False
+
+        if operation.status in _TERMINAL_STATUSES and (
+            operation.result_summary is not None
+            or update.status not in _TERMINAL_STATUSES
+        ):
+            # Already final locally (e.g. cancelled here); late pushes are stale.
+            # Only a terminal push may still fill in a missing result_summary.
+            return True
+
+        if update.status is not None:
+            operation.status = update.status
+        if update.progress is not None:
+            operation.progress = update.progress
+        if update.result_summary:
+            operation.result_summary = update.result_summary
+        if update.error_message:
+            operation.error_message = update.error_message
+        if update.completed_at is not None:
+            operation.completed_at = update.completed_at
+        elif operation.status in _TERMINAL_STATUSES and not operation.completed_at:
+            operation.completed_at = datetime.now(timezone.utc)
+        if update.metrics:
+            self._append_metrics(operation, update.metrics)
+        if update.metrics_cursor is not None:
+            self._metrics_cursors[operation_id] = update.metrics_cursor
+
+        self._last_refresh[operation_id] = time.time()
+
+        self._publish_state(operation)
+        if update.metrics:
+            self._publish_metrics(operation_id, update.metrics)
+            await self._persist_metrics(operation_id)
+        return True
+
     def _get_remote_proxy(self, operation_id: str) -> Optional[tuple[Any, str]]:
         """
         Get proxy and host operation ID for a remote operation.
@@ -1443,6 +1789,34 @@ class OperationsService:
             return None
         return self._remote_proxies[operation_id]
 
+    async def _coalesce(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fetch`` once for all concurrent callers with the same key.
+
+        The first caller starts the fetch as a task; callers arriving while it
+        is in flight await the same task. The task is shielded so a poller
+        that disconnects (and is cancelled) doesn't cancel the fetch for
+        everyone else.
+
+        Args:
+            key: Coalescing key, e.g. "refresh:<operation_id>"
+            fetch: Zero-argument coroutine factory
+
+        Returns:
+            The fetch result
+        """
+        task = self._inflight_refreshes.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight_refreshes[key] = task
+
+            def _done(finished: asyncio.Task, key: str = key) -> None:
+                if self._inflight_refreshes.get(key) is finished:
+                    del self._inflight_refreshes[key]
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
     def _refresh_from_bridge(self, operation_id: str) -> None:
         """
         Pull state and metrics from registered bridge with cache awareness (TASK 1.4).
@@ -1500,34 +1874,15 @@ class OperationsService:
 
             # Append new metrics to operation (if any) - TYPE-AWARE
             if new_metrics:
-                if operation.metrics is None:
-                    operation.metrics = {}
-
-                # Type-aware metrics storage
-                if operation.operation_type == OperationType.TRAINING:
-                    if "epochs" not in operation.metrics:
-                        operation.metrics["epochs"] = []
-                    operation.metrics["epochs"].extend(new_metrics)
-
-                elif operation.operation_type == OperationType.BACKTESTING:
-                    if "bars" not in operation.metrics:
-                        operation.metrics["bars"] = []
-                    operation.metrics["bars"].extend(new_metrics)
-
-                elif operation.operation_type == OperationType.DATA_LOAD:
-                    if "segments" not in operation.metrics:
-                        operation.metrics["segments"] = []
-                    operation.metrics["segments"].extend(new_metrics)
-
-                else:
-                    # Generic fallback for other operation types
-                    if "history" not in operation.metrics:
-                        operation.metrics["history"] = []
-                    operation.metrics["history"].extend(new_metrics)
+                self._append_metrics(operation, new_metrics)
 
             # Update cursor for next incremental read
             self._metrics_cursors[operation_id] = new_cursor
 
+            self._publish_state(operation)
+            if new_metrics:
+                self._publish_metrics(operation_id, new_metrics)
+
             # TASK 1.4: Update cache timestamp
             self._last_refresh[operation_id] = time.time()
 
@@ -1696,6 +2051,11 @@ class OperationsService:
         )
 
         try:
+            # Remember what we're refreshing: the proxy call runs without any
+            # lock, so a local transition (e.g. cancel) may land meanwhile.
+            operation = self._cache.get(operation_id)
+            status_before = operation.status if operation else None
+
             # (1) Query host service for operation state
             host_data = await proxy.get_operation(host_operation_id)
 
@@ -1706,6 +2066,12 @@ class OperationsService:
                     f"Operation {operation_id} not found in backend registry"
                 )
                 return
+            if status_before is not None and operation.status != status_before:
+                logger.debug(
+                    f"Discarding stale refresh for {operation_id}: status changed "
+                    f"locally ({status_before.value} -> {operation.status.value})"
+                )
+                return
 
             # Update status
             operation.status = OperationStatus(host_data["status"])
@@ -1751,20 +2117,17 @@ class OperationsService:
             metrics_data = await proxy.get_metrics(host_operation_id, cursor)
             new_metrics, new_cursor = metrics_data
 
-            # (4) Append new metrics to operation
+            # (4) Append new metrics to operation (type-aware)
             if new_metrics:
-                if operation.metrics is None:
-                    operation.metrics = {}
-
-                # For training operations, append to epochs list
-                if operation.operation_type == OperationType.TRAINING:
-                    if "epochs" not in operation.metrics:
-                        operation.metrics["epochs"] = []
-                    operation.metrics["epochs"].extend(new_metrics)
+                self._append_metrics(operation, new_metrics)
 
             # (5) Update cursor to new value (always update, even if no new metrics)
             self._metrics_cursors[operation_id] = new_cursor
 
+            self._publish_state(operation)
+            if new_metrics:
+                self._publish_metrics(operation_id, new_metrics)
+
             # (6) Update cache timestamp
             self._last_refresh[operation_id] = time.time()
 
@@ -1838,15 +2201,55 @@ class OperationsService:
             bridge = self._local_bridges[operation_id]
             return bridge.get_metrics(cursor)
 
-        # For operations without bridge (completed, or remote), return stored metrics
-        if operation.metrics and "epochs" in operation.metrics:
-            all_epochs = operation.metrics["epochs"]
-            new_epochs = all_epochs[cursor:]
-            new_cursor = len(all_epochs)
-            return new_epochs, new_cursor
+        # For operations without bridge (completed, or remote), read the
+        # type-specific series from the metrics store
+        key = self.get_metrics_series_name(operation)
+        series = self._metrics_store.get(operation_id, key)
+        if series is None:
+            # Not in memory (e.g. finished and evicted): read persisted entries
+            if self._repository:
+                stored = await self._repository.get_metrics(operation_id, key, cursor)
+                if stored:
+                    return [entry for _, entry in stored], stored[-1][0] + 1
+            return [], cursor
+
+        entries, new_cursor, missed = series.read(cursor)
+        if missed and self._repository:
+            # Entries older than the ring buffer are only in the database
+            stored = await self._repository.get_metrics(
+                operation_id, key, cursor, limit=missed
+            )
+            entries = [entry for _, entry in stored] + entries
+        return entries, new_cursor
 
-        # No metrics available
-        return [], cursor
+    @staticmethod
+    def get_metrics_series_name(operation: OperationInfo) -> str:
+        """Name of the type-specific metrics series ("epochs", "bars", ...)."""
+        return _METRICS_SERIES.get(operation.operation_type, "history")
+
+    def get_metrics_history(
+        self, operation_id: str, max_points: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Get an operation's retained metrics history, oldest first.
+
+        Includes downsampled entries that no longer fit the full-resolution
+        window. Each entry carries its "seq" (the cursor position).
+
+        Args:
+            operation_id: Operation identifier
+            max_points: Downsample the result (LTTB) to at most this many entries
+
+        Returns:
+            Metrics entries, or an empty list if none are held in memory
+        """
+        operation = self._cache.get(operation_id)
+        if operation is None:
+            return []
+        series = self._metrics_store.get(
+            operation_id, self.get_metrics_series_name(operation)
+        )
+        return series.history(max_points) if series is not None else []
 
     async def add_operation_metrics(
         self, operation_id: str, metrics_data: dict[str, Any]
@@ -1886,11 +2289,16 @@ class OperationsService:
                 # For other operation types, store as-is
                 operation.metrics.update(metrics_data)
 
+            self._publish_metrics(operation_id, [metrics_data])
+
             logger.debug(
                 f"Metrics added for operation {operation_id} "
                 f"(type={operation.operation_type}, total_fields={len(operation.metrics)})"
             )
 
+        # Batched write outside the lock: it must not stall other operations
+        await self._persist_metrics(operation_id)
+
     async def _add_training_epoch_metrics(
         self, operation: OperationInfo, epoch_metrics: dict[str, Any]
     ) -> None:
@@ -1910,14 +2318,18 @@ class OperationsService:
             operation.metrics["total_epochs_planned"] = 0
             operation.metrics["total_epochs_completed"] = 0
 
-        # Add epoch metrics
-        operation.metrics["epochs"].append(epoch_metrics)
-        operation.metrics["total_epochs_completed"] = len(operation.metrics["epochs"])
+        # Add epoch metrics (bounded: older epochs are downsampled)
+        series = self._append_metrics(operation, [epoch_metrics])
+        operation.metrics["total_epochs_completed"] = len(series)
 
         # Update trend analysis
-        self._update_training_metrics_analysis(operation.metrics)
+        self._update_training_metrics_analysis(
+            operation.metrics, first_epoch=series.first_seq
+        )
 
-    def _update_training_metrics_analysis(self, metrics: dict[str, Any]) -> None:
+    def _update_training_metrics_analysis(
+        self, metrics: dict[str, Any], first_epoch: int = 0
+    ) -> None:
         """
         Compute trend indicators from epoch history.
 
@@ -1930,6 +2342,9 @@ class OperationsService:
 
         Args:
             metrics: Training metrics dict to update
+            first_epoch: Index of metrics["epochs"][0]; older epochs are no
+                longer held at full resolution, so a best epoch among them is
+                carried over from the previous analysis
         """
         epochs = metrics.get("epochs", [])
         if not epochs:
@@ -1937,16 +2352,25 @@ class OperationsService:
 
         # Find best epoch (lowest validation loss)
         val_losses = [
-            (i, e["val_loss"])
+            (first_epoch + i, e["val_loss"])
             for i, e in enumerate(epochs)
             if e.get("val_loss") is not None
         ]
+        previous_best = metrics.get("best_epoch")
+        if (
+            previous_best is not None
+            and previous_best < first_epoch
+            and metrics.get("best_val_loss") is not None
+        ):
+            val_losses.append((previous_best, metrics["best_val_loss"]))
 
         if val_losses:
-            best_idx, best_loss = min(val_losses, key=lambda x: x[1])
+            best_idx, best_loss = min(val_losses, key=lambda x: (x[1], x[0]))
             metrics["best_epoch"] = best_idx
             metrics["best_val_loss"] = best_loss
-            metrics["epochs_since_improvement"] = len(epochs) - 1 - best_idx
+            metrics["epochs_since_improvement"] = (
+                first_epoch + len(epochs) - 1 - best_idx
+            )
         else:
             # No validation data available
             metrics["best_epoch"] = None
@@ -2011,6 +2435,21 @@ class OperationsService:
         await self.add_operation_metrics(operation_id, metrics_data)
 
 
+def _list_sort_key(operation: OperationInfo) -> tuple[datetime, str]:
+    return operation.created_at, operation.operation_id
+
+
+def _parse_list_cursor(cursor: str) -> tuple[datetime, str]:
+    """Parse a cursor produced by OperationsService.list_cursor()."""
+    created_at, sep, operation_id = cursor.partition("|")
+    if not sep or not operation_id:
+        raise ValueError(f"Invalid operations cursor: {cursor!r}")
+    try:
+        return datetime.fromisoformat(created_at), operation_id
+    except ValueError as e:
+        raise ValueError(f"Invalid operations cursor: {cursor!r}") from e
+
+
 # Global operations service instance
 _operations_service: Optional[OperationsService] = None
 
@@ -2030,7 +2469,16 @@ def get_operations_service() -> OperationsService:
         from ktrdr.api.database import get_session_factory
 
         session_factory = get_session_factory()
-        repository = OperationsRepository(session_factory)
+        ops_settings = get_operations_settings()
+        repository: OperationsRepository
+        if ops_settings.write_flush_interval > 0:
+            repository = WriteBehindOperationsRepository(
+                session_factory,
+                flush_interval=ops_settings.write_flush_interval,
+                max_batch=ops_settings.write_max_batch,
+            )
+        else:
+            repository = OperationsRepository(session_factory)
         _operations_service = OperationsService(repository=repository)
         logger.info("Operations service initialized with database persistence")
     return _operations_service
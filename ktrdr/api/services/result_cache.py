@@ -0,0 +1,246 @@
+"""
+Process-wide LRU caches for computed API responses.
+
+Dashboards re-request the same (symbol, timeframe, indicators, range)
+combination as users pan and zoom. IndicatorService and FuzzyService are
+created per request, so their results are cached here rather than on the
+service instance.
+
+Entries are keyed on the normalized request plus the data file's version
+(mtime + size), so rewriting the file changes the key. Memory is bounded by
+an estimated byte budget with least-recently-used eviction.
+
+Each entry also records its series key: the request without its end date.
+When the range end moves forward, a service can take the latest entry for the
+series and extend it. It recomputes only the new bars plus a warm-up window,
+and keeps the extension only if the recomputed warm-up tail matches the
+cached values (values_converged). Indicators that never converge, such as
+cumulative ones, fall back to a full computation.
+
+The latest entry may come from an older version of the data file, so entries
+also record a fingerprint of their input rows (frame_fingerprint). An entry is
+only offered for extension when those rows are unchanged in the new data; a
+corrected or backfilled bar anywhere in the cached range forces a full
+computation.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from ktrdr import get_logger
+
+logger = get_logger(__name__)
+
+# Warm-up for extensions: enough bars for exponential smoothing to converge
+WARMUP_FACTOR = 10
+MIN_WARMUP_BARS = 100
+
+# Cached bars compared against their recomputed values before extending
+VERIFY_BARS = 20
+
+
+class InputFingerprint(NamedTuple):
+    """Timestamps and per-row hashes of the data a cached value came from."""
+
+    index: pd.Index
+    row_hashes: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.index.nbytes + self.row_hashes.nbytes)
+
+    def unchanged_in(self, other: "InputFingerprint") -> bool:
+        """
+        Whether this input's rows that ``other`` still covers are intact.
+
+        Compares every row of ``other`` from its start (or this input's, if
+        later) up to this input's last timestamp, so edited, inserted and
+        deleted bars are all detected.
+        """
+        if len(self.index) == 0 or len(other.index) == 0:
+            return False
+        first, last = max(self.index[0], other.index[0]), self.index[-1]
+        if first > last:
+            return False
+        mine = self.row_hashes[self.index >= first]
+        theirs = other.row_hashes[(other.index >= first) & (other.index <= last)]
+        return len(mine) == len(theirs) and bool(np.array_equal(mine, theirs))
+
+
+def frame_fingerprint(data: pd.DataFrame) -> InputFingerprint:
+    """Fingerprint a time-sorted input frame (timestamps + row hashes)."""
+    return InputFingerprint(
+        data.index.copy(), pd.util.hash_pandas_object(data, index=True).to_numpy()
+    )
+
+
+class _Entry(NamedTuple):
+    value: Any
+    size: int
+    series_key: Hashable
+    fingerprint: Optional[InputFingerprint] = None
+
+
+class ResultCache:
+    """LRU cache of computed results with a memory budget."""
+
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Estimated memory budget; 0 disables caching
+        """
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._latest: dict[Hashable, Hashable] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._extended = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None (counted as a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def get_latest(
+        self, series_key: Hashable, fingerprint: Optional[InputFingerprint] = None
+    ) -> Optional[Any]:
+        """
+        Return the most recently stored value for a series, if cached.
+
+        Args:
+            series_key: Request key without its end date
+            fingerprint: frame_fingerprint() of the input the caller is about
+                to compute from. When given, the value is returned only if it
+                was stored with a fingerprint whose rows are unchanged in it.
+        """
+        with self._lock:
+            key = self._latest.get(series_key)
+            entry = self._entries.get(key) if key is not None else None
+        if entry is None:
+            return None
+        if fingerprint is not None and (
+            entry.fingerprint is None or not entry.fingerprint.unchanged_in(fingerprint)
+        ):
+            logger.debug("Cached input rows changed; not extending")
+            return None
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        series_key: Hashable,
+        value: Any,
+        size: int,
+        fingerprint: Optional[InputFingerprint] = None,
+    ) -> None:
+        """
+        Store a value, evicting least recently used entries to fit the budget.
+
+        Values larger than the whole budget are not stored.
+
+        Args:
+            key: Full key (normalized request + data version)
+            series_key: Request key without its end date
+            value: Result to cache; callers must treat it as read-only
+            size: Estimated size of value in bytes
+            fingerprint: frame_fingerprint() of the input, required for the
+                entry to be offered by get_latest(series_key, fingerprint)
+        """
+        if fingerprint is not None:
+            size += fingerprint.nbytes
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = _Entry(value, size, series_key, fingerprint)
+            self._latest[series_key] = key
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evictions += 1
+                if self._latest.get(evicted.series_key) == evicted_key:
+                    del self._latest[evicted.series_key]
+
+    def record_extension(self) -> None:
+        """Count a miss that was served by extending a cached series."""
+        with self._lock:
+            self._extended += 1
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._latest.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics for logging and health endpoints."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "extended": self._extended,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+def warmup_bars(periods: Sequence[int] = ()) -> int:
+    """Bars to recompute before the first new bar when extending a series."""
+    return max(MIN_WARMUP_BARS, WARMUP_FACTOR * max(periods, default=0))
+
+
+def values_converged(
+    cached: Sequence[Optional[float]], fresh: Sequence[Optional[float]]
+) -> bool:
+    """Whether recomputed values match the cached ones (None == NaN)."""
+    if len(cached) != len(fresh):
+        return False
+    return bool(
+        np.allclose(
+            np.array(cached, dtype=float),
+            np.array(fresh, dtype=float),
+            rtol=1e-6,
+            atol=1e-9,
+            equal_nan=True,
+        )
+    )
+
+
+_caches: dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(name: str) -> ResultCache:
+    """Return the process-wide cache with the given name, creating it on first use."""
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            from ktrdr.config.settings import get_api_settings
+
+            max_bytes = get_api_settings().result_cache_mb * 1024 * 1024
+            cache = _caches[name] = ResultCache(max_bytes=max_bytes)
+        return cache
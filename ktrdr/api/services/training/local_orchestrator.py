@@ -229,24 +229,6 @@ class LocalTrainingOrchestrator:
 
             context_data = asyncio.run(self._load_context_data(v3_config, all_data))
 
-        # Prepare features using v3 pipeline
-        logger.info("Preparing features with TrainingPipelineV3...")
-        features_df = pipeline.prepare_features(all_data, context_data=context_data)
-
-        # Convert to tensors and create labels using base pipeline methods
-        import numpy as np
-        import torch
-
-        # Handle NaN values before converting to tensor (fuzzy outputs can have NaN at edges)
-        features_array = features_df.values
-        nan_count = np.isnan(features_array).sum()
-        if nan_count > 0:
-            logger.warning(f"Replacing {nan_count} NaN values in features with 0.0")
-            features_array = np.nan_to_num(features_array, nan=0.0)
-
-        features = torch.FloatTensor(features_array)
-        feature_names = list(features_df.columns)
-
         # Generate labels from price data (use first symbol's base timeframe)
         base_symbol = self._context.symbols[0]
         price_data = all_data[base_symbol]
@@ -303,36 +285,80 @@ class LocalTrainingOrchestrator:
 
         labels = TrainingPipeline.create_labels(price_data, label_config)
 
-        # Align features and labels
-        if label_source == "regime" and len(labels) < len(features):
-            # Regime labels drop leading vol_lookback AND trailing horizon bars.
-            vol_lookback = labels_config.get("vol_lookback", 120)
-            truncated_from = len(features)
-            features = features[vol_lookback : vol_lookback + len(labels)]  # type: ignore[assignment]
-            logger.info(
-                f"Aligned features from {truncated_from} to {len(features)} "
-                f"for regime labels (vol_lookback={vol_lookback}, "
-                f"horizon={labels_config.get('horizon', 24)})"
+        # Uniqueness weights (triple_barrier with compute_weights) are per label
+        tb_weights = (
+            TrainingPipeline.get_sample_weights()
+            if label_source == "triple_barrier"
+            else None
+        )
+        if tb_weights is not None and len(tb_weights) != len(labels):
+            tb_weights = None
+
+        import numpy as np
+        import torch
+
+        out_of_core_config = training_section.get("out_of_core") or {}
+        out_of_core_store = None
+        aligned_weights = None
+        if out_of_core_config.get("enabled", False):
+            # Stream each symbol's features straight into a memory-mapped
+            # store, so neither the combined feature frame nor the training
+            # tensors ever live in private RAM.
+            feature_names = pipeline.feature_columns(all_data)
+            row_counts = {
+                symbol: pipeline.feature_row_count(tf_data)
+                for symbol, tf_data in all_data.items()
+            }
+            feature_range, label_range = self._aligned_sample_ranges(
+                num_feature_rows=sum(row_counts.values()),
+                num_labels=len(labels),
+                label_source=label_source,
+                labels_config=labels_config,
             )
-        elif label_source in ("forward_return", "context", "triple_barrier") and len(
-            labels
-        ) < len(features):
-            truncated_from = len(features)
-            features = features[: len(labels)]  # type: ignore[assignment]
-            logger.info(
-                f"Truncated features from {truncated_from} to {len(features)} "
-                f"to match {label_source} labels (horizon={label_config.get('horizon', 'N/A')})"
+            out_of_core_store = self._write_out_of_core_store(
+                pipeline,
+                all_data,
+                context_data,
+                row_counts,
+                feature_names,
+                feature_range,
+                labels[label_range[0] : label_range[1]],
+                (
+                    tb_weights[label_range[0] : label_range[1]]
+                    if tb_weights is not None
+                    else None
+                ),
+                out_of_core_config,
             )
-
-        min_len = min(len(features), len(labels))
-        if min_len == 0:
-            raise ValueError(
-                f"No aligned samples available: min_len={min_len}, "
-                f"features_len={len(features)}, labels_len={len(labels)}. "
-                "One or both of features/labels are empty after alignment."
+            features_aligned, labels_aligned = out_of_core_store.as_tensors()
+            if out_of_core_store.weights is not None:
+                aligned_weights = torch.from_numpy(out_of_core_store.weights)
+        else:
+            # Prepare features using v3 pipeline
+            logger.info("Preparing features with TrainingPipelineV3...")
+            features_df = pipeline.prepare_features(all_data, context_data=context_data)
+            feature_names = list(features_df.columns)
+
+            # Align features and labels
+            feature_range, label_range = self._aligned_sample_ranges(
+                num_feature_rows=len(features_df),
+                num_labels=len(labels),
+                label_source=label_source,
+                labels_config=labels_config,
             )
-        features_aligned = features[-min_len:]
-        labels_aligned = labels[-min_len:]
+
+            # Handle NaN values before converting to tensor (fuzzy outputs can have NaN at edges)
+            features_array = features_df.values[feature_range[0] : feature_range[1]]
+            nan_count = np.isnan(features_array).sum()
+            if nan_count > 0:
+                logger.warning(f"Replacing {nan_count} NaN values in features with 0.0")
+                features_array = np.nan_to_num(features_array, nan=0.0)
+
+            features_aligned = torch.FloatTensor(features_array)
+            labels_aligned = labels[label_range[0] : label_range[1]]
+            if tb_weights is not None:
+                aligned_weights = tb_weights[label_range[0] : label_range[1]]
+        features = features_aligned
 
         logger.info(
             f"V3 features: {features_aligned.shape}, labels: {labels_aligned.shape}"
@@ -343,6 +369,7 @@ class LocalTrainingOrchestrator:
         train_ratio = data_split.get("train", 0.7)
         val_ratio = data_split.get("validation", 0.15)
         sample_weights_for_training = None
+        train_indices = None
 
         total_samples = len(features_aligned)
 
@@ -385,24 +412,39 @@ class LocalTrainingOrchestrator:
                 val_idx = valtest_idx
                 test_idx = np.array([], dtype=np.intp)
 
-            X_train = features_aligned[train_idx]
-            y_train = labels_aligned[train_idx]
-            X_val = features_aligned[val_idx]
-            y_val = labels_aligned[val_idx]
-            X_test = features_aligned[test_idx] if len(test_idx) > 0 else None
-            y_test = labels_aligned[test_idx] if len(test_idx) > 0 else None
+            if out_of_core_store is not None:
+                # Keep the memmap-backed tensors whole: the trainer reads the
+                # train rows by index, and val/test stay views where contiguous.
+                X_train, y_train = features_aligned, labels_aligned
+                train_indices = train_idx
+            else:
+                X_train = features_aligned[train_idx]
+                y_train = labels_aligned[train_idx]
+            X_val = self._select_rows(features_aligned, val_idx)
+            y_val = self._select_rows(labels_aligned, val_idx)
+            X_test = (
+                self._select_rows(features_aligned, test_idx)
+                if len(test_idx) > 0
+                else None
+            )
+            y_test = (
+                self._select_rows(labels_aligned, test_idx)
+                if len(test_idx) > 0
+                else None
+            )
 
             # Get sample weights for weighted sampling (if computed)
-            tb_weights = TrainingPipeline.get_sample_weights()
-            if tb_weights is not None and len(tb_weights) == total_samples:
-                sample_weights_for_training = tb_weights[train_idx]
+            if aligned_weights is not None:
+                sample_weights_for_training = aligned_weights[
+                    torch.as_tensor(train_idx, dtype=torch.long)
+                ]
                 logger.info(
                     f"Using uniqueness weights for training "
                     f"(mean={sample_weights_for_training.mean():.3f})"
                 )
 
             logger.info(
-                f"V3 purged splits: train={len(X_train)} "
+                f"V3 purged splits: train={len(train_idx)} "
                 f"(purged from {int(total_samples * (1 - combined_val_test_ratio))}), "
                 f"val={len(X_val)}, test={len(test_idx)}, "
                 f"embargo={embargo_pct*100:.0f}%"
@@ -466,6 +508,8 @@ class LocalTrainingOrchestrator:
             training_config["loss"] = training_section["loss"]
         if "focal_gamma" in training_section:
             training_config["focal_gamma"] = training_section["focal_gamma"]
+        if out_of_core_store is not None:
+            training_config["out_of_core"] = out_of_core_config
 
         if output_format == "regression":
             training_config.setdefault("loss", "huber")
@@ -486,6 +530,7 @@ class LocalTrainingOrchestrator:
             checkpoint_callback=self._checkpoint_callback,
             resume_context=self._resume_context,
             sample_weights=sample_weights_for_training,
+            train_indices=train_indices,
         )
 
         # Evaluate model
@@ -534,6 +579,11 @@ class LocalTrainingOrchestrator:
             training_timeframes=training_timeframes,
         )
 
+        if out_of_core_store is not None and not out_of_core_config.get("keep", False):
+            import shutil
+
+            shutil.rmtree(out_of_core_store.directory, ignore_errors=True)
+
         return {
             "model_path": model_path,
             "training_metrics": training_results,
@@ -559,6 +609,156 @@ class LocalTrainingOrchestrator:
             },
         }
 
+    @staticmethod
+    def _aligned_sample_ranges(
+        num_feature_rows: int,
+        num_labels: int,
+        label_source: str,
+        labels_config: dict[str, Any],
+    ) -> tuple[tuple[int, int], tuple[int, int]]:
+        """
+        Compute the feature and label row ranges that align with each other.
+
+        Labelers drop bars at the edges (regime drops leading vol_lookback and
+        trailing horizon bars; forward-looking labelers drop trailing bars).
+        Working with ranges instead of sliced tensors lets the caller decide
+        whether to materialize features in memory or spill them to disk.
+
+        Returns:
+            ((feature_start, feature_stop), (label_start, label_stop))
+
+        Raises:
+            ValueError: If no aligned samples remain
+        """
+        start, stop = 0, num_feature_rows
+        if label_source == "regime" and num_labels < num_feature_rows:
+            # Regime labels drop leading vol_lookback AND trailing horizon bars.
+            vol_lookback = labels_config.get("vol_lookback", 120)
+            start = min(vol_lookback, num_feature_rows)
+            stop = min(vol_lookback + num_labels, num_feature_rows)
+            logger.info(
+                f"Aligned features from {num_feature_rows} to {stop - start} "
+                f"for regime labels (vol_lookback={vol_lookback}, "
+                f"horizon={labels_config.get('horizon', 24)})"
+            )
+        elif (
+            label_source in ("forward_return", "context", "triple_barrier")
+            and num_labels < num_feature_rows
+        ):
+            stop = num_labels
+            logger.info(
+                f"Truncated features from {num_feature_rows} to {stop} "
+                f"to match {label_source} labels "
+                f"(horizon={labels_config.get('horizon', 'N/A')})"
+            )
+
+        min_len = min(stop - start, num_labels)
+        if min_len <= 0:
+            raise ValueError(
+                f"No aligned samples available: min_len={max(min_len, 0)}, "
+                f"features_len={stop - start}, labels_len={num_labels}. "
+                "One or both of features/labels are empty after alignment."
+            )
+        return (stop - min_len, stop), (num_labels - min_len, num_labels)
+
+    @staticmethod
+    def _select_rows(values: Any, rows: Any) -> Any:
+        """Select ascending ``rows``, as a view when they are contiguous."""
+        if len(rows) > 0 and rows[-1] - rows[0] + 1 == len(rows):
+            return values[int(rows[0]) : int(rows[-1]) + 1]
+        return values[rows]
+
+    def _write_out_of_core_store(
+        self,
+        pipeline: Any,
+        all_data: dict[str, dict[str, Any]],
+        context_data: dict[str, Any] | None,
+        row_counts: dict[str, int],
+        feature_names: list[str],
+        feature_range: tuple[int, int],
+        labels: Any,
+        weights: Any,
+        out_of_core_config: dict[str, Any],
+    ):
+        """
+        Stream aligned features and labels into a memory-mapped training store.
+
+        Features are prepared one symbol at a time and only the rows inside
+        ``feature_range`` (in concatenated-symbol coordinates) are written, so
+        at most one symbol's feature frame is held in memory. Symbols entirely
+        outside the range are not computed at all.
+
+        Args:
+            pipeline: TrainingPipelineV3 used to prepare each symbol
+            all_data: {symbol: {timeframe: DataFrame}} market data
+            context_data: Optional external data sources
+            row_counts: Predicted feature rows per symbol
+            feature_names: Store columns, from ``pipeline.feature_columns()``
+            feature_range: (start, stop) of aligned rows across all symbols
+            labels: Aligned label tensor, one per row of ``feature_range``
+            weights: Optional aligned sample weights (same length as labels)
+            out_of_core_config: ``training.out_of_core`` section of the strategy
+
+        Returns:
+            Finalized MemmapTrainingStore
+
+        Raises:
+            TrainingDataError: If a symbol yields a different number of rows
+                than predicted
+        """
+        import tempfile
+
+        from ktrdr.training.exceptions import TrainingDataError
+        from ktrdr.training.memmap_dataset import write_frames_to_store
+
+        base_dir = out_of_core_config.get("directory") or (
+            Path(tempfile.gettempdir()) / "ktrdr_training_data"
+        )
+        store_dir = Path(base_dir) / (self._context.operation_id or "local")
+        labels_array = labels.cpu().numpy()
+        weights_array = weights.cpu().numpy() if weights is not None else None
+        feature_start, feature_stop = feature_range
+        logger.info(
+            f"Streaming out-of-core training store to {store_dir} "
+            f"({feature_stop - feature_start} rows x {len(feature_names)} features)"
+        )
+
+        def frames():
+            offset = 0
+            for symbol, tf_data in all_data.items():
+                num_rows = row_counts[symbol]
+                lo = max(feature_start, offset)
+                hi = min(feature_stop, offset + num_rows)
+                if lo < hi:
+                    symbol_features = pipeline.prepare_symbol_features(
+                        tf_data, context_data=context_data, columns=feature_names
+                    )
+                    actual = 0 if symbol_features is None else len(symbol_features)
+                    if actual != num_rows:
+                        raise TrainingDataError(
+                            f"{symbol} produced {actual} feature rows, "
+                            f"expected {num_rows}"
+                        )
+                    label_lo = lo - feature_start
+                    label_hi = hi - feature_start
+                    frame = (
+                        symbol_features.iloc[lo - offset : hi - offset],
+                        labels_array[label_lo:label_hi],
+                    )
+                    if weights_array is not None:
+                        frame += (weights_array[label_lo:label_hi],)
+                    yield frame
+                offset += num_rows
+
+        return write_frames_to_store(
+            store_dir,
+            frames(),
+            feature_names=feature_names,
+            label_dtype=labels_array.dtype,
+            chunk_rows=out_of_core_config.get("write_chunk_rows", 65536),
+            with_weights=weights_array is not None,
+        )
+
     def _load_strategy_config(self, config_path: Path) -> dict[str, Any]:
         """
         Load strategy configuration from YAML file.
@@ -2,12 +2,32 @@
 
 This module provides the WorkerRegistry class which manages the lifecycle of
 worker nodes in the distributed training and backtesting architecture.
+
+Health checking: each worker has its own probe schedule. Probes run as
+independent tasks, bounded by a semaphore and sharing one long-lived HTTP
+client, so a hung worker only delays its own next probe. Stable workers are
+probed up to twice as rarely (busy ones half as rarely again), with jitter to
+spread probes out. Workers that push heartbeats are not probed while their
+latest heartbeat is fresh.
+
+Scheduling: a worker declares how many operations it runs at once
+(capabilities["slots"], default 1) and reports how many are active in its
+health responses and heartbeats. select_worker() ranks workers with a free
+slot by cache locality (symbols/models the worker has already handled), then
+by free capacity, then least recently used. acquire_worker() additionally
+waits in a per-type priority queue when every slot is taken; queued requests
+are granted as slots free up, and each grant reserves its slot until the
+caller marks the worker busy.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
+import random
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -21,7 +41,13 @@ from ktrdr.api.models.workers import (
     WorkerType,
 )
 from ktrdr.config.settings import get_worker_settings
-from ktrdr.monitoring.metrics import update_worker_metrics
+from ktrdr.monitoring.metrics import (
+    record_dispatch_wait,
+    record_worker_probe,
+    remove_worker_probe_metrics,
+    update_dispatch_queue_depth,
+    update_worker_metrics,
+)
 from ktrdr.monitoring.service_telemetry import trace_service_method
 
 if TYPE_CHECKING:
@@ -29,6 +55,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Consecutive successful probes after which a worker is probed at the
+# slowest "stable" rate (2x the base interval)
+_STABLE_PROBE_STREAK = 4
+# Extra interval factor for busy workers (they rarely change state mid-run)
+_BUSY_PROBE_FACTOR = 1.5
+# +/- fraction of random jitter applied to each probe interval
+_PROBE_JITTER = 0.1
+# Seconds a granted slot stays reserved if the caller never marks it busy
+_RESERVATION_TTL = 60.0
+# Locality keys (recent symbols/models) remembered per worker
+_LOCALITY_HISTORY = 32
+
+
+def _locality_keys(symbol: str | None, model_path: str | None) -> tuple[str, ...]:
+    """Cache locality keys of an operation (matched against warm/cached keys)."""
+    keys = []
+    if symbol:
+        keys.append(f"symbol:{symbol}")
+    if model_path:
+        keys.append(f"model:{model_path}")
+    return tuple(keys)
+
+
+@dataclass(order=True)
+class _QueuedDispatch:
+    """An operation waiting for a worker slot (ordered by priority, then FIFO)."""
+
+    sort_priority: int
+    sequence: int
+    locality: tuple[str, ...] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    excluded: frozenset[str] = field(default=frozenset(), compare=False)
+
 
 @dataclass
 class RegistrationResult:
@@ -73,6 +132,26 @@ class WorkerRegistry:
         self._health_check_timeout: int = settings.health_check_timeout
         self._health_check_failures_threshold: int = settings.health_check_failures
         self._removal_threshold_seconds: int = settings.removal_threshold
+        # A heartbeat replaces probes until the next one is overdue
+        self._heartbeat_ttl: float = float(
+            settings.heartbeat_interval + settings.health_check_interval
+        )
+
+        # Probe scheduling state (monotonic seconds), keyed by worker_id
+        self._health_check_concurrency: int = settings.health_check_concurrency
+        self._probe_semaphore: asyncio.Semaphore | None = None
+        self._http_client: httpx.AsyncClient | None = None
+        self._next_probe_at: dict[str, float] = {}
+        self._probe_streaks: dict[str, int] = {}
+        self._probe_tasks: dict[str, asyncio.Task] = {}
+        self._last_heartbeat: dict[str, float] = {}
+
+        # Dispatch queues (heaps) per worker type, and slot reservations
+        # (monotonic expiry times) handed out by acquire_worker()
+        self._dispatch_queue_timeout: float = settings.dispatch_queue_timeout
+        self._dispatch_queues: dict[WorkerType, list[_QueuedDispatch]] = {}
+        self._dispatch_sequence = itertools.count()
+        self._reservations: dict[str, list[float]] = {}
 
     def set_operations_service(self, operations_service: OperationsService) -> None:
         """
@@ -114,6 +193,7 @@ class WorkerRegistry:
         capabilities: dict | None = None,
         current_operation_id: str | None = None,
         completed_operations: list[CompletedOperationReport] | None = None,
+        warm_keys: list[str] | None = None,
     ) -> RegistrationResult:
         """
         Register or update a worker with optional operation reconciliation.
@@ -134,6 +214,7 @@ class WorkerRegistry:
             capabilities: Optional dict of worker capabilities (cores, memory, etc.)
             current_operation_id: ID of operation worker is currently running (if any)
             completed_operations: Operations that completed while backend was unavailable
+            warm_keys: Locality keys of the worker's caches (e.g. "symbol:EURUSD")
 
         Returns:
             RegistrationResult containing the worker and any signals (e.g., stop_operations)
@@ -153,6 +234,7 @@ class WorkerRegistry:
             worker.endpoint_url = endpoint_url
             worker.capabilities = capabilities or {}
             worker.status = WorkerStatus.AVAILABLE
+            worker.metadata.pop("active_operations", None)
             worker.last_healthy_at = datetime.now(UTC)
             logger.info(f"Worker {worker_id} re-registered")
         else:
@@ -167,6 +249,7 @@ class WorkerRegistry:
                     f"Removing stale worker {stale_id} (same endpoint as {worker_id})"
                 )
                 del self._workers[stale_id]
+                self._forget_worker(stale_id)
 
             # Create new worker
             worker = WorkerEndpoint(
@@ -180,8 +263,12 @@ class WorkerRegistry:
             self._workers[worker_id] = worker
             logger.info(f"Worker {worker_id} registered ({worker_type})")
 
+        if warm_keys is not None:
+            worker.metadata["cached_keys"] = list(warm_keys)
+
         # Update Prometheus metrics
         update_worker_metrics(self._workers)
+        self._dispatch_queued(worker.worker_type)
 
         # Perform operation reconciliation if operations service is configured
         stop_operations: list[str] = []
@@ -288,15 +375,28 @@ class WorkerRegistry:
         return workers
 
     @trace_service_method("workers.select")
-    def select_worker(self, worker_type: WorkerType) -> WorkerEndpoint | None:
+    def select_worker(
+        self,
+        worker_type: WorkerType,
+        symbol: str | None = None,
+        model_path: str | None = None,
+    ) -> WorkerEndpoint | None:
         """
-        Select an available worker using round-robin (least recently used).
+        Select a worker with a free slot, preferring warm caches.
+
+        Workers are ranked by cache locality (how many of the operation's
+        symbol/model they have already handled, or report holding in their
+        caches), then by the fraction of their slots that are free, then least
+        recently used. With single-slot workers and no locality hints this is
+        plain round-robin.
 
-        This implements round-robin load balancing by selecting the worker
-        that was least recently used.
+        Returns None while operations of this type are queued in
+        acquire_worker(), so direct callers don't jump the queue.
 
         Args:
             worker_type: Type of worker to select
+            symbol: Symbol the operation works on (for cache locality)
+            model_path: Model the operation loads (for cache locality)
 
         Returns:
             Selected worker, or None if no workers available
@@ -321,8 +421,7 @@ class WorkerRegistry:
         capable_workers = [
             w for w in self._workers.values() if w.worker_type == worker_type
         ]
-        # Use get_available_workers to get properly sorted list (LRU first)
-        available_workers = self.get_available_workers(worker_type)
+        available_workers = [w for w in capable_workers if self._free_slots(w) > 0]
 
         # Add telemetry attributes to current span
         if span and span.is_recording():
@@ -331,16 +430,19 @@ class WorkerRegistry:
             span.set_attribute("worker.capable_workers", str(len(capable_workers)))
             span.set_attribute("worker.available_workers", str(len(available_workers)))
 
-        if not available_workers:
+        if self._has_queued(worker_type):
             if span and span.is_recording():
-                span.set_attribute("worker.selection_status", "no_workers_available")
+                span.set_attribute("worker.selection_status", "queued_operations")
             return None
 
-        # Select first worker (least recently used)
-        worker = available_workers[0]
+        locality = _locality_keys(symbol, model_path)
+        worker = self._pick_worker(worker_type, locality)
+        if worker is None:
+            if span and span.is_recording():
+                span.set_attribute("worker.selection_status", "no_workers_available")
+            return None
 
-        # Update selection timestamp
-        worker.metadata["last_selected"] = datetime.now(UTC).timestamp()
+        self._note_selected(worker, locality)
 
         # Add selection result to telemetry
         if span and span.is_recording():
@@ -350,9 +452,118 @@ class WorkerRegistry:
         logger.debug(f"Selected worker {worker.worker_id} for {worker_type}")
         return worker
 
+    async def acquire_worker(
+        self,
+        worker_type: WorkerType,
+        priority: int = 0,
+        symbol: str | None = None,
+        model_path: str | None = None,
+        timeout: float | None = None,
+        excluded_workers: list[str] | None = None,
+    ) -> WorkerEndpoint | None:
+        """
+        Reserve a worker slot, queueing until one frees up.
+
+        Requests are served by priority (higher first), FIFO within a
+        priority. The granted slot stays reserved until mark_busy() (or
+        release_worker() if the dispatch fails); unclaimed reservations
+        expire after a minute.
+
+        Args:
+            worker_type: Type of worker to acquire
+            priority: Queue priority (higher is served first)
+            symbol: Symbol the operation works on (for cache locality)
+            model_path: Model the operation loads (for cache locality)
+            timeout: Seconds to wait in the queue (defaults to
+                KTRDR_WORKER_DISPATCH_QUEUE_TIMEOUT; 0 means don't wait)
+            excluded_workers: Worker IDs never to grant (e.g. workers that
+                already rejected this dispatch)
+
+        Returns:
+            Worker with a reserved slot, or None if none freed up in time
+            (immediately None if every registered worker is excluded)
+
+        Example:
+            >>> worker = await registry.acquire_worker(
+            ...     WorkerType.BACKTESTING, symbol="EURUSD", timeout=30
+            ... )
+        """
+        if timeout is None:
+            timeout = self._dispatch_queue_timeout
+        locality = _locality_keys(symbol, model_path)
+        excluded = frozenset(excluded_workers or ())
+        started = time.monotonic()
+
+        if not self._has_queued(worker_type):
+            worker = self._pick_worker(worker_type, locality, excluded)
+            if worker is not None:
+                self._reserve(worker, locality)
+                record_dispatch_wait(worker_type.value, 0.0, True)
+                return worker
+        candidates = any(
+            w.worker_type == worker_type and w.worker_id not in excluded
+            for w in self._workers.values()
+        )
+        if timeout <= 0 or not candidates:
+            record_dispatch_wait(worker_type.value, 0.0, False)
+            return None
+
+        entry = _QueuedDispatch(
+            sort_priority=-priority,
+            sequence=next(self._dispatch_sequence),
+            locality=locality,
+            future=asyncio.get_running_loop().create_future(),
+            excluded=excluded,
+        )
+        queue = self._dispatch_queues.setdefault(worker_type, [])
+        heapq.heappush(queue, entry)
+        update_dispatch_queue_depth(worker_type.value, len(queue))
+        logger.info(
+            f"No free {worker_type.value} worker slot, queued "
+            f"(priority={priority}, depth={len(queue)})"
+        )
+
+        granted = False
+        try:
+            await asyncio.wait({entry.future}, timeout=timeout)
+            granted = entry.future.done() and not entry.future.cancelled()
+        finally:
+            if not granted:
+                if entry.future.done() and not entry.future.cancelled():
+                    # Granted just as we were cancelled - hand the slot back
+                    self.release_worker(entry.future.result().worker_id)
+                entry.future.cancel()
+                self._discard_queued(worker_type, entry)
+            record_dispatch_wait(worker_type.value, time.monotonic() - started, granted)
+
+        return entry.future.result() if granted else None
+
+    def release_worker(self, worker_id: str) -> None:
+        """
+        Give back a slot reserved by acquire_worker() without using it.
+
+        Args:
+            worker_id: ID of the worker whose reservation is released
+        """
+        reservations = self._reservations.get(worker_id)
+        if reservations:
+            reservations.pop(0)
+        worker = self._workers.get(worker_id)
+        if worker is not None:
+            self._dispatch_queued(worker.worker_type)
+
+    def queue_depth(self, worker_type: WorkerType) -> int:
+        """Number of operations waiting in acquire_worker() for a worker type."""
+        queue = self._dispatch_queues.get(worker_type, [])
+        return sum(1 for entry in queue if not entry.future.done())
+
     def mark_busy(self, worker_id: str, operation_id: str) -> None:
         """
-        Mark a worker as busy with the given operation.
+        Record that a worker started an operation.
+
+        Takes one of the worker's slots (consuming a reservation from
+        acquire_worker() if there is one). The worker is BUSY once all its
+        slots are taken.
 
         Args:
             worker_id: ID of the worker to mark busy
@@ -364,17 +575,23 @@ class WorkerRegistry:
         """
         if worker_id in self._workers:
             worker = self._workers[worker_id]
-            worker.status = WorkerStatus.BUSY
+            reservations = self._reservations.get(worker_id)
+            if reservations:
+                reservations.pop(0)
+            self._set_active_operations(worker, self._active_operations(worker) + 1)
             worker.current_operation_id = operation_id
             logger.info(
-                f"Worker {worker_id} marked as BUSY (operation: {operation_id})"
+                f"Worker {worker_id} marked as {worker.status.value.upper()} "
+                f"(operation: {operation_id})"
             )
             # Update Prometheus metrics
             update_worker_metrics(self._workers)
 
     def mark_available(self, worker_id: str) -> None:
         """
-        Mark a worker as available (operation completed).
+        Record that one of a worker's operations completed.
+
+        Frees one slot and dispatches queued operations onto it.
 
         Args:
             worker_id: ID of the worker to mark available
@@ -385,11 +602,127 @@ class WorkerRegistry:
         """
         if worker_id in self._workers:
             worker = self._workers[worker_id]
-            worker.status = WorkerStatus.AVAILABLE
-            worker.current_operation_id = None
+            active = max(self._active_operations(worker) - 1, 0)
+            self._set_active_operations(worker, active)
+            if active == 0:
+                worker.current_operation_id = None
             logger.info(f"Worker {worker_id} marked as AVAILABLE")
             # Update Prometheus metrics
             update_worker_metrics(self._workers)
+            self._dispatch_queued(worker.worker_type)
+
+    @staticmethod
+    def _slot_count(worker: WorkerEndpoint) -> int:
+        """Concurrent operations a worker accepts (capabilities["slots"])."""
+        try:
+            return max(int(worker.capabilities.get("slots", 1)), 1)
+        except (TypeError, ValueError):
+            return 1
+
+    def _active_operations(self, worker: WorkerEndpoint) -> int:
+        """Operations running on a worker (all slots if BUSY without a count)."""
+        active = worker.metadata.get("active_operations")
+        if active is None:
+            return self._slot_count(worker) if worker.status == WorkerStatus.BUSY else 0
+        return int(active)
+
+    def _set_active_operations(self, worker: WorkerEndpoint, active: int) -> None:
+        """Store a worker's active operation count and derive its status."""
+        worker.metadata["active_operations"] = active
+        worker.status = (
+            WorkerStatus.BUSY
+            if active >= self._slot_count(worker)
+            else WorkerStatus.AVAILABLE
+        )
+
+    def _free_slots(self, worker: WorkerEndpoint) -> int:
+        """Slots that are neither running an operation nor reserved."""
+        if worker.status != WorkerStatus.AVAILABLE:
+            return 0
+        reservations = self._reservations.get(worker.worker_id)
+        if reservations:
+            now = time.monotonic()
+            reservations[:] = [expiry for expiry in reservations if expiry > now]
+        used = self._active_operations(worker) + len(reservations or ())
+        return max(self._slot_count(worker) - used, 0)
+
+    def _pick_worker(
+        self,
+        worker_type: WorkerType,
+        locality: tuple[str, ...],
+        excluded: frozenset[str] = frozenset(),
+    ) -> WorkerEndpoint | None:
+        """Best worker with a free slot: warm cache, free capacity, then LRU."""
+        best: WorkerEndpoint | None = None
+        best_key: tuple = ()
+        for worker in self._workers.values():
+            if worker.worker_type != worker_type or worker.worker_id in excluded:
+                continue
+            free = self._free_slots(worker)
+            if free == 0:
+                continue
+            warm = worker.metadata.get("warm_keys", ())
+            cached = worker.metadata.get("cached_keys", ())
+            key = (
+                -sum(1 for k in locality if k in warm or k in cached),
+                -free / self._slot_count(worker),
+                -free,
+                worker.metadata.get("last_selected", 0.0),
+            )
+            if best is None or key < best_key:
+                best, best_key = worker, key
+        return best
+
+    def _note_selected(self, worker: WorkerEndpoint, locality: tuple[str, ...]) -> None:
+        """Update LRU order and remember the operation's locality keys."""
+        worker.metadata["last_selected"] = datetime.now(UTC).timestamp()
+        if locality:
+            warm = [
+                k for k in worker.metadata.get("warm_keys", []) if k not in locality
+            ]
+            warm.extend(locality)
+            worker.metadata["warm_keys"] = warm[-_LOCALITY_HISTORY:]
+
+    def _reserve(self, worker: WorkerEndpoint, locality: tuple[str, ...]) -> None:
+        """Hold one of a worker's slots for an acquire_worker() grant."""
+        self._reservations.setdefault(worker.worker_id, []).append(
+            time.monotonic() + _RESERVATION_TTL
+        )
+        self._note_selected(worker, locality)
+
+    def _has_queued(self, worker_type: WorkerType) -> bool:
+        """Whether operations of this type are waiting for a slot."""
+        return self.queue_depth(worker_type) > 0
+
+    def _dispatch_queued(self, worker_type: WorkerType) -> None:
+        """Grant free slots to queued operations, highest priority first."""
+        queue = self._dispatch_queues.get(worker_type)
+        if not queue:
+            return
+        for entry in sorted(queue):
+            if entry.future.done():
+                # Timed out or cancelled while queued
+                continue
+            worker = self._pick_worker(worker_type, entry.locality, entry.excluded)
+            if worker is None:
+                if not entry.excluded:
+                    break
+                # Only workers this entry excluded are free; serve the next
+                continue
+            self._reserve(worker, entry.locality)
+            entry.future.set_result(worker)
+            logger.info(f"Dispatched queued {worker_type.value} operation")
+        queue[:] = [entry for entry in queue if not entry.future.done()]
+        heapq.heapify(queue)
+        update_dispatch_queue_depth(worker_type.value, self.queue_depth(worker_type))
+
+    def _discard_queued(self, worker_type: WorkerType, entry: _QueuedDispatch) -> None:
+        """Remove an entry that left the queue without a grant."""
+        queue = self._dispatch_queues.get(worker_type, [])
+        if entry in queue:
+            queue.remove(entry)
+            heapq.heapify(queue)
+        update_dispatch_queue_depth(worker_type.value, self.queue_depth(worker_type))
 
     async def _reconcile_completed_operations(
         self, completed_operations: list[CompletedOperationReport]
@@ -536,7 +869,8 @@ class WorkerRegistry:
 
         This method calls the worker's /health endpoint and updates the worker's
         status based on the response. It tracks consecutive failures and marks
-        workers as temporarily unavailable after 3 failures.
+        workers as temporarily unavailable after 3 failures. Probe latency is
+        recorded in the worker's metadata and in Prometheus.
 
         Args:
             worker_id: ID of the worker to health check
@@ -554,40 +888,38 @@ class WorkerRegistry:
 
         worker = self._workers[worker_id]
 
+        started = time.perf_counter()
+        healthy = False
         try:
-            async with httpx.AsyncClient(timeout=self._health_check_timeout) as client:
-                response = await client.get(f"{worker.endpoint_url}/health")
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Update status from health response
-                    worker_status = data.get("worker_status", "idle")
-                    if worker_status == "busy":
-                        worker.status = WorkerStatus.BUSY
-                        worker.current_operation_id = data.get("current_operation")
-                    else:
-                        worker.status = WorkerStatus.AVAILABLE
-                        worker.current_operation_id = None
-
-                    # Reset failure counter and update timestamps
-                    worker.health_check_failures = 0
-                    worker.last_health_check = datetime.now(UTC)
-                    worker.last_healthy_at = datetime.now(UTC)
-
-                    # Update Prometheus metrics
-                    update_worker_metrics(self._workers)
-
-                    logger.debug(f"Health check passed for {worker_id}")
-                    return True
-                else:
-                    logger.warning(
-                        f"Health check failed for {worker_id}: HTTP {response.status_code}"
-                    )
+            response = await self._get_http_client().get(
+                f"{worker.endpoint_url}/health"
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                self._apply_health_report(
+                    worker,
+                    data.get("worker_status", "idle"),
+                    data.get("current_operation"),
+                    data.get("active_operations"),
+                    data.get("warm_keys"),
+                )
+                healthy = True
+                logger.debug(f"Health check passed for {worker_id}")
+            else:
+                logger.warning(
+                    f"Health check failed for {worker_id}: HTTP {response.status_code}"
+                )
 
         except Exception as e:
             logger.warning(f"Health check failed for {worker_id}: {e}")
 
+        latency = time.perf_counter() - started
+        worker.metadata["probe_latency_ms"] = round(latency * 1000, 3)
+        record_worker_probe(worker_id, worker.worker_type.value, latency, healthy)
+        if healthy:
+            return True
+
         # Health check failed - increment failure counter
         worker.health_check_failures += 1
         worker.last_health_check = datetime.now(UTC)
@@ -604,6 +936,86 @@ class WorkerRegistry:
 
         return False
 
+    def record_heartbeat(
+        self,
+        worker_id: str,
+        worker_status: str = "idle",
+        current_operation_id: str | None = None,
+        active_operations: int | None = None,
+        warm_keys: list[str] | None = None,
+    ) -> bool:
+        """
+        Apply a heartbeat pushed by a worker.
+
+        A heartbeat counts as a successful health check, and the worker is not
+        probed until the heartbeat goes stale.
+
+        Args:
+            worker_id: ID of the worker sending the heartbeat
+            worker_status: "busy" or "idle" (same values as the /health response)
+            current_operation_id: Operation the worker is running, if busy
+            active_operations: Number of operations running on the worker
+            warm_keys: Locality keys of the worker's caches, if reported
+
+        Returns:
+            True if the worker is registered, False otherwise (it should
+            re-register)
+        """
+        worker = self._workers.get(worker_id)
+        if worker is None:
+            return False
+        self._apply_health_report(
+            worker, worker_status, current_operation_id, active_operations, warm_keys
+        )
+        self._last_heartbeat[worker_id] = time.monotonic()
+        return True
+
+    def _apply_health_report(
+        self,
+        worker: WorkerEndpoint,
+        worker_status: str,
+        current_operation_id: str | None,
+        active_operations: int | None = None,
+        warm_keys: list[str] | None = None,
+    ) -> None:
+        """
+        Update a worker from a successful probe or heartbeat.
+
+        Workers that don't report active_operations are treated as
+        single-slot: "busy" takes every slot, "idle" frees them all.
+        Reported warm_keys replace the worker's advertised cache contents.
+        """
+        if warm_keys is not None:
+            worker.metadata["cached_keys"] = list(warm_keys)
+        if active_operations is None:
+            busy = worker_status == "busy"
+            active_operations = self._slot_count(worker) if busy else 0
+        self._set_active_operations(worker, active_operations)
+        worker.current_operation_id = (
+            current_operation_id if active_operations else None
+        )
+
+        # Reset failure counter and update timestamps
+        worker.health_check_failures = 0
+        worker.last_health_check = datetime.now(UTC)
+        worker.last_healthy_at = datetime.now(UTC)
+
+        # Update Prometheus metrics
+        update_worker_metrics(self._workers)
+        self._dispatch_queued(worker.worker_type)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Shared client for health probes (connections are kept alive)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=self._health_check_timeout,
+                limits=httpx.Limits(
+                    max_connections=self._health_check_concurrency,
+                    max_keepalive_connections=self._health_check_concurrency,
+                ),
+            )
+        return self._http_client
+
     def _cleanup_dead_workers(self) -> None:
         """
         Remove workers that have been unavailable for too long.
@@ -633,6 +1045,7 @@ class WorkerRegistry:
         # Remove dead workers
         for worker_id in to_remove:
             del self._workers[worker_id]
+            self._forget_worker(worker_id)
             logger.info(f"Removed dead worker: {worker_id}")
 
         # Update Prometheus metrics if any workers were removed
@@ -658,7 +1071,8 @@ class WorkerRegistry:
         """
         Stop background health check task.
 
-        Cancels the background task and waits for it to finish cleanup.
+        Cancels the background task and in-flight probes, waits for them to
+        finish cleanup and closes the shared HTTP client.
 
         Example:
             >>> registry = WorkerRegistry()
@@ -674,12 +1088,24 @@ class WorkerRegistry:
             self._health_check_task = None
             logger.info("Worker registry stopped - background health checks disabled")
 
+        probes = list(self._probe_tasks.values())
+        for task in probes:
+            task.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+        self._probe_tasks.clear()
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def _health_check_loop(self) -> None:
         """
         Background task to continuously health check all workers.
 
-        This loop runs indefinitely until cancelled. It health checks all
-        registered workers, then sleeps for the configured interval.
+        This loop runs indefinitely until cancelled. Each pass starts a probe
+        task for every worker whose probe is due (without waiting for it),
+        removes dead workers, then sleeps until the next probe is due (at most
+        the configured interval).
 
         The loop handles exceptions gracefully to ensure it continues running
         even if individual health checks fail.
@@ -690,15 +1116,14 @@ class WorkerRegistry:
 
         while True:
             try:
-                # Health check all workers
-                for worker_id in list(self._workers.keys()):
-                    await self.health_check_worker(worker_id)
+                # Start probes for every worker that is due
+                self._start_due_probes()
 
                 # Cleanup dead workers after health checks
                 self._cleanup_dead_workers()
 
-                # Wait before next round
-                await asyncio.sleep(self._health_check_interval)
+                # Wait until the next probe is due
+                await asyncio.sleep(self._seconds_until_next_probe())
 
             except asyncio.CancelledError:
                 logger.info("Background health check loop cancelled")
@@ -707,3 +1132,79 @@ class WorkerRegistry:
                 logger.error(f"Error in health check loop: {e}", exc_info=True)
                 # Continue after error
                 await asyncio.sleep(self._health_check_interval)
+
+    def _start_due_probes(self) -> None:
+        """Start a probe task for each due worker without a probe in flight."""
+        now = time.monotonic()
+        for worker_id in list(self._workers):
+            if worker_id in self._probe_tasks:
+                continue
+            heartbeat = self._last_heartbeat.get(worker_id)
+            if heartbeat is not None and now - heartbeat < self._heartbeat_ttl:
+                # Heartbeat is fresh; probe only once it goes stale
+                self._next_probe_at[worker_id] = heartbeat + self._heartbeat_ttl
+                continue
+            if self._next_probe_at.get(worker_id, 0.0) > now:
+                continue
+            task = asyncio.create_task(self._probe_worker(worker_id))
+            self._probe_tasks[worker_id] = task
+
+    async def _probe_worker(self, worker_id: str) -> None:
+        """Health check one worker (bounded concurrency) and schedule the next."""
+        if self._probe_semaphore is None:
+            self._probe_semaphore = asyncio.Semaphore(self._health_check_concurrency)
+        healthy = False
+        try:
+            async with self._probe_semaphore:
+                healthy = await self.health_check_worker(worker_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Health check errored for {worker_id}: {e}")
+        finally:
+            self._probe_tasks.pop(worker_id, None)
+
+        if worker_id not in self._workers:
+            return
+        streak = self._probe_streaks.get(worker_id, 0) + 1 if healthy else 0
+        self._probe_streaks[worker_id] = streak
+        self._next_probe_at[worker_id] = time.monotonic() + self._probe_interval(
+            self._workers[worker_id], streak
+        )
+
+    def _probe_interval(self, worker: WorkerEndpoint, streak: int) -> float:
+        """
+        Seconds until a worker's next probe.
+
+        Failing workers are re-probed at the base interval. Each consecutive
+        success stretches the interval, up to 2x after a short streak, and busy
+        workers wait a further 1.5x. Jitter spreads probes out over time.
+        """
+        factor = 1.0 + min(streak, _STABLE_PROBE_STREAK) / _STABLE_PROBE_STREAK
+        if worker.status == WorkerStatus.BUSY:
+            factor *= _BUSY_PROBE_FACTOR
+        jitter = random.uniform(1.0 - _PROBE_JITTER, 1.0 + _PROBE_JITTER)
+        return self._health_check_interval * factor * jitter
+
+    def _seconds_until_next_probe(self) -> float:
+        """Sleep time for the health check loop (capped at the base interval)."""
+        now = time.monotonic()
+        pending = [
+            self._next_probe_at.get(worker_id, now)
+            for worker_id in self._workers
+            if worker_id not in self._probe_tasks
+        ]
+        if not pending:
+            return float(self._health_check_interval)
+        return min(max(min(pending) - now, 0.01), self._health_check_interval)
+
+    def _forget_worker(self, worker_id: str) -> None:
+        """Drop probe scheduling state and metrics of a removed worker."""
+        self._next_probe_at.pop(worker_id, None)
+        self._probe_streaks.pop(worker_id, None)
+        self._last_heartbeat.pop(worker_id, None)
+        self._reservations.pop(worker_id, None)
+        task = self._probe_tasks.pop(worker_id, None)
+        if task is not None:
+            task.cancel()
+        remove_worker_probe_metrics(worker_id)
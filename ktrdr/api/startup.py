@@ -19,6 +19,7 @@ from fastapi import FastAPI
 
 from ktrdr.api.services.orphan_detector import OrphanOperationDetector
 from ktrdr.api.uptime import set_start_time
+from ktrdr.async_infrastructure.compute_executor import shutdown_compute_executor
 from ktrdr.checkpoint.cleanup_service import CheckpointCleanupService
 from ktrdr.config.settings import get_orphan_detector_settings
 from ktrdr.logging import get_logger
@@ -278,6 +279,17 @@ async def lifespan(app: FastAPI):
     await registry.stop()
     logger.info("Worker registry stopped")
 
+    # Stop compute pools (cancels queued jobs)
+    shutdown_compute_executor()
+
+    # Flush queued operation writes while the database is still open
+    try:
+        from ktrdr.api.services.operations_service import get_operations_service
+
+        await get_operations_service().close()
+    except Exception as e:
+        logger.warning(f"Error flushing operation writes: {e}")
+
     # Close database connections
     try:
         from ktrdr.api.database import close_database
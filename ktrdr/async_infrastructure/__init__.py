@@ -9,9 +9,18 @@ Components:
 - cancellation: Unified cancellation system with ServiceOrchestrator integration
 - service_orchestrator: Base ServiceOrchestrator class for async service management
 - async_host_service: AsyncHostService for external service communication
+- compute_executor: Bounded process/thread pools for CPU-bound work in handlers
+- sse: Client-side consumption of the operations event stream
 """
 
 from .async_host_service import AsyncHostService, HostServiceConfig
+from .compute_executor import ComputeExecutor, get_compute_executor
 from .service_orchestrator import ServiceOrchestrator
 
-__all__ = ["ServiceOrchestrator", "AsyncHostService", "HostServiceConfig"]
+__all__ = [
+    "ServiceOrchestrator",
+    "AsyncHostService",
+    "HostServiceConfig",
+    "ComputeExecutor",
+    "get_compute_executor",
+]
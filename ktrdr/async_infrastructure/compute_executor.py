@@ -0,0 +1,255 @@
+"""
+Managed executors for CPU-bound and blocking work in async handlers.
+
+API handlers are async, so pandas/numpy work done inline (CSV parsing,
+indicator computation, fuzzification) blocks the event loop and stalls every
+other request, including operations polling and worker registration.
+ComputeExecutor moves that work off the loop:
+
+- run_cpu(): a process pool for pure CPU work. The function and its arguments
+  must be picklable (module-level functions, DataFrames, plain configs). With
+  processes=0, CPU jobs run on the thread pool instead.
+- run_io(): a thread pool for blocking I/O and for work on objects that can't
+  be pickled.
+
+Each pool accepts a bounded number of jobs (running + queued); beyond that new
+jobs are rejected with ServiceUnavailableError (HTTP 503) instead of queueing
+without limit. Every job has a timeout. On timeout, or when the awaiting
+request is cancelled, a job that has not started is dropped; a job that has
+already started runs to completion and its result is discarded.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional, TypeVar
+
+from ktrdr.errors.exceptions import ApiTimeoutError, ServiceUnavailableError
+from ktrdr.logging import get_logger
+from ktrdr.monitoring.metrics import (
+    compute_jobs_in_flight,
+    compute_jobs_rejected,
+    compute_pool_capacity,
+    record_compute_job,
+)
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+POOL_PROCESS = "process"
+POOL_THREAD = "thread"
+
+
+def _timed_call(fn: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[float, T]:
+    """Run fn in the pool, returning its wall-clock start time with the result."""
+    return time.time(), fn(*args, **kwargs)
+
+
+class ComputeExecutor:
+    """Bounded process and thread pools for work that must not block the loop."""
+
+    def __init__(
+        self,
+        processes: int = 2,
+        threads: int = 8,
+        max_pending: int = 32,
+        timeout: float = 60.0,
+    ):
+        """
+        Initialize the executor. Pools are created on first use.
+
+        Args:
+            processes: Process pool size (0 runs CPU jobs on the thread pool)
+            threads: Thread pool size
+            max_pending: Jobs per pool (running + queued) before rejecting
+            timeout: Default per-job timeout in seconds
+        """
+        self.processes = processes
+        self.threads = threads
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._pools: dict[str, Executor] = {}
+        self._in_flight: dict[str, int] = {POOL_PROCESS: 0, POOL_THREAD: 0}
+        self._lock = threading.Lock()
+
+    async def run_cpu(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a CPU-bound function in the process pool.
+
+        Args:
+            fn: Picklable (module-level) function
+            *args: Picklable positional arguments
+            timeout: Seconds to wait for the result (default: executor timeout)
+            **kwargs: Picklable keyword arguments
+
+        Returns:
+            The function's return value
+
+        Raises:
+            ServiceUnavailableError: If the pool is saturated
+            ApiTimeoutError: If the job doesn't finish in time
+        """
+        pool = POOL_PROCESS if self.processes > 0 else POOL_THREAD
+        return await self._run(pool, fn, args, kwargs, timeout)
+
+    async def run_io(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking function in the thread pool.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments
+            timeout: Seconds to wait for the result (default: executor timeout)
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's return value
+
+        Raises:
+            ServiceUnavailableError: If the pool is saturated
+            ApiTimeoutError: If the job doesn't finish in time
+        """
+        return await self._run(POOL_THREAD, fn, args, kwargs, timeout)
+
+    def stats(self) -> dict[str, Any]:
+        """Current in-flight job counts and limits per pool."""
+        return {
+            "processes": self.processes,
+            "threads": self.threads,
+            "max_pending": self.max_pending,
+            "in_flight": dict(self._in_flight),
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut the pools down, cancelling queued jobs."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for executor in pools.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def _run(
+        self,
+        pool: str,
+        fn: Callable[..., T],
+        args: tuple,
+        kwargs: dict[str, Any],
+        timeout: Optional[float],
+    ) -> T:
+        timeout = self.timeout if timeout is None else timeout
+        name = getattr(fn, "__name__", repr(fn))
+        self._acquire(pool, name)
+        submitted = time.time()
+        outcome = "error"
+        started: Optional[float] = None
+        try:
+            future = self._get_pool(pool).submit(
+                partial(_timed_call, fn, *args, **kwargs)
+            )
+            try:
+                started, result = await asyncio.wait_for(
+                    asyncio.wrap_future(future), timeout
+                )
+            except asyncio.TimeoutError as e:
+                outcome = "timeout"
+                raise ApiTimeoutError(
+                    message=f"Computation {name} timed out after {timeout}s",
+                    error_code="COMPUTE-Timeout",
+                    details={"function": name, "pool": pool, "timeout": timeout},
+                ) from e
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                raise
+            outcome = "ok"
+            return result
+        finally:
+            self._release(pool)
+            wait = started - submitted if started is not None else None
+            record_compute_job(pool, time.time() - submitted, outcome, wait)
+
+    def _acquire(self, pool: str, name: str) -> None:
+        with self._lock:
+            if self._in_flight[pool] >= self.max_pending:
+                compute_jobs_rejected.labels(pool=pool).inc()
+                raise ServiceUnavailableError(
+                    message=f"Compute {pool} pool is saturated, retry shortly",
+                    error_code="COMPUTE-Saturated",
+                    details={
+                        "function": name,
+                        "pool": pool,
+                        "max_pending": self.max_pending,
+                    },
+                )
+            self._in_flight[pool] += 1
+            compute_jobs_in_flight.labels(pool=pool).set(self._in_flight[pool])
+
+    def _release(self, pool: str) -> None:
+        with self._lock:
+            self._in_flight[pool] -= 1
+            compute_jobs_in_flight.labels(pool=pool).set(self._in_flight[pool])
+
+    def _get_pool(self, pool: str) -> Executor:
+        with self._lock:
+            executor = self._pools.get(pool)
+            if executor is None:
+                if pool == POOL_PROCESS:
+                    # spawn: forking a process that runs an event loop and
+                    # threads can deadlock the child
+                    executor = ProcessPoolExecutor(
+                        max_workers=self.processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.threads, thread_name_prefix="ktrdr-compute"
+                    )
+                self._pools[pool] = executor
+                compute_pool_capacity.labels(pool=pool).set(self.max_pending)
+                logger.info(f"Started compute {pool} pool")
+            return executor
+
+
+_executor: Optional[ComputeExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """Get the process-wide ComputeExecutor (configured from APISettings)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from ktrdr.config.settings import get_api_settings
+
+            settings = get_api_settings()
+            _executor = ComputeExecutor(
+                processes=settings.compute_processes,
+                threads=settings.compute_threads,
+                max_pending=settings.compute_max_pending,
+                timeout=settings.compute_timeout,
+            )
+        return _executor
+
+
+def shutdown_compute_executor() -> None:
+    """Shut down the process-wide ComputeExecutor, if it was created."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
@@ -24,6 +24,7 @@ import asyncio
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -326,7 +327,9 @@ class AsyncServiceAdapter(ABC):
         endpoint: str,
         data: dict[str, Any],
         cancellation_token: Optional[CancellationToken] = None,
-    ) -> dict[str, Any]:
+        headers: Optional[dict[str, str]] = None,
+        response_parser: Optional[Callable[[httpx.Response], Any]] = None,
+    ) -> Any:
         """
         Standardized POST requests with retry logic and cancellation support.
 
@@ -334,9 +337,12 @@ class AsyncServiceAdapter(ABC):
             endpoint: API endpoint (e.g., "/data/fetch")
             data: JSON data to send in request body
             cancellation_token: Optional cancellation token for operation control
+            headers: Optional extra request headers (e.g., Accept)
+            response_parser: Optional callable that converts the successful
+                response; defaults to parsing the body as JSON
 
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary, or the response_parser result
 
         Raises:
             asyncio.CancelledError: If operation is cancelled
@@ -395,7 +401,7 @@ class AsyncServiceAdapter(ABC):
 
                 request_start_time = time.time()
                 response = await self._http_client.post(
-                    url, json=data, timeout=self.timeout
+                    url, json=data, headers=headers, timeout=self.timeout
                 )
 
                 # Handle HTTP errors
@@ -411,6 +417,8 @@ class AsyncServiceAdapter(ABC):
                     f"(status={response.status_code})"
                 )
 
+                if response_parser is not None:
+                    return response_parser(response)
                 return response.json()
 
             except httpx.TimeoutException as e:
@@ -0,0 +1,75 @@
+"""
+Client-side consumption of the operations Server-Sent Events stream.
+
+``GET /operations/stream`` pushes snapshot, progress, metrics and terminal
+events for the watched operations. Clients (CLI follow mode, the evolution
+harness, MCP tools) read it with iter_sse_events(), or with
+stream_until_terminal() when they only need to know that an operation has
+finished. Callers keep polling ``/operations/{id}`` as a fallback for when
+the stream is unavailable.
+"""
+
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, Optional
+
+import httpx
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+async def iter_sse_events(lines: AsyncIterable[str]) -> AsyncIterator[dict[str, Any]]:
+    """Parse Server-Sent Events lines into event dicts.
+
+    Yields ``{"event": type, "data": {...}}`` per server event. Keep-alive
+    comments yield ``{"event": "keepalive", "data": {}}`` so consumers get a
+    chance to react (e.g. to cancellation) between events.
+
+    Args:
+        lines: Response lines, e.g. ``response.aiter_lines()``
+    """
+    event_type, data_lines = "message", []
+    async for line in lines:
+        if line.startswith(":"):
+            yield {"event": "keepalive", "data": {}}
+        elif line.startswith("event:"):
+            event_type = line[6:].strip()
+        elif line.startswith("data:"):
+            data_lines.append(line[5:].strip())
+        elif not line and data_lines:
+            yield {"event": event_type, "data": json.loads("\n".join(data_lines))}
+            event_type, data_lines = "message", []
+
+
+async def stream_until_terminal(
+    client: httpx.AsyncClient,
+    url: str,
+    operation_id: str,
+    heartbeat: float = 15.0,
+) -> Optional[dict[str, Any]]:
+    """Wait on the operations event stream until an operation is terminal.
+
+    Args:
+        client: HTTP client to stream with
+        url: Full or client-relative URL of ``/operations/stream``
+        operation_id: Operation to watch
+        heartbeat: Seconds between server keep-alive comments
+
+    Returns:
+        Data of the event that reported the terminal status, or None if the
+        stream ended without one (e.g. the operation was not found)
+
+    Raises:
+        httpx.HTTPError: The stream could not be opened or was interrupted
+    """
+    params = {"operation_id": operation_id, "heartbeat": heartbeat}
+    async with client.stream(
+        "GET", url, params=params, timeout=httpx.Timeout(30.0, read=heartbeat * 4)
+    ) as response:
+        response.raise_for_status()
+        async for event in iter_sse_events(response.aiter_lines()):
+            if event["event"] == "error":
+                return None
+            if event["data"].get("status") in TERMINAL_STATUSES:
+                return event["data"]
+    return None
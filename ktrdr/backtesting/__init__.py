@@ -1,8 +1,10 @@
 """Backtesting system for strategy evaluation."""
 
+from .data_cache import DataCache, get_data_cache
 from .decision_function import DecisionFunction
 from .engine import BacktestConfig, BacktestingEngine, BacktestResults
 from .model_bundle import ModelBundle
+from .model_registry import ModelRegistry, get_model_registry
 from .performance import PerformanceMetrics, PerformanceTracker
 from .position_manager import Position, PositionManager, PositionStatus, Trade
 from .progress_bridge import BacktestProgressBridge
@@ -24,11 +26,15 @@ __all__ = [
     "DecisionFunction",
     "BacktestProgressBridge",
     "BacktestResults",
+    "DataCache",
     "ModelBundle",
+    "ModelRegistry",
     "PerformanceMetrics",
     "PerformanceTracker",
     "Position",
     "PositionManager",
     "PositionStatus",
     "Trade",
+    "get_data_cache",
+    "get_model_registry",
 ]
@@ -17,7 +17,13 @@ from pydantic import Field
 from ktrdr.api.models.operations import OperationMetadata, OperationType
 from ktrdr.api.models.workers import WorkerType
 from ktrdr.async_infrastructure.cancellation import CancellationError
-from ktrdr.backtesting.engine import BacktestConfig, BacktestingEngine
+from ktrdr.backtesting.data_cache import get_data_cache
+from ktrdr.backtesting.engine import (
+    BacktestConfig,
+    BacktestingEngine,
+    BacktestResults,
+    SliceBacktestResults,
+)
 from ktrdr.backtesting.progress_bridge import BacktestProgressBridge
 from ktrdr.config import validate_all, warn_deprecated_env_vars
 from ktrdr.config.settings import get_observability_settings, get_worker_settings
@@ -108,6 +114,8 @@ class BacktestStartRequest(WorkerOperationMixin):
     slippage: float = 0.0005  # 0.05%
     model_path: Optional[str] = None  # Explicit model path for v3 models
     timeframes: list[str] = Field(default_factory=list)
+    # Optional [{"start_date", "end_date"}] sub-ranges backtested in one pass
+    slices: list[dict[str, str]] = Field(default_factory=list)
 
 
 class BacktestResumeRequest(WorkerOperationMixin):
@@ -208,6 +216,18 @@ class BacktestWorker(WorkerAPIBase):
                     detail=f"No checkpoint available for operation {operation_id}",
                 ) from e
 
+    async def _worker_status(self) -> dict[str, Any]:
+        """Busy/idle status plus the symbols held in the worker's data cache."""
+        status = await super()._worker_status()
+        status["warm_keys"] = get_data_cache().warm_keys()
+        return status
+
+    async def _build_registration_payload(self) -> dict[str, Any]:
+        """Registration payload plus the symbols held in the data cache."""
+        payload = await super()._build_registration_payload()
+        payload["warm_keys"] = get_data_cache().warm_keys()
+        return payload
+
     def _get_checkpoint_service(self):
         """Lazily initialize and return checkpoint service.
 
@@ -275,6 +295,7 @@ class BacktestWorker(WorkerAPIBase):
             "slippage": request.slippage,
             "model_path": request.model_path,
             "timeframes": request.timeframes,
+            "slices": request.slices,
         }
 
         # 1. Create operation in worker's OperationsService
@@ -315,6 +336,7 @@ class BacktestWorker(WorkerAPIBase):
             commission=request.commission,
             slippage=request.slippage,
             timeframes=request.timeframes,
+            slices=[(s["start_date"], s["end_date"]) for s in request.slices],
         )
 
         # 4. Build progress bridge
@@ -416,17 +438,30 @@ class BacktestWorker(WorkerAPIBase):
         # 1. Setup checkpoint infrastructure
         checkpoint_service = self._get_checkpoint_service()
 
-        from ktrdr.backtesting.checkpoint_builder import build_backtest_checkpoint_state
+        from ktrdr.backtesting.checkpoint_builder import (
+            IncrementalBacktestCheckpointBuilder,
+            build_backtest_checkpoint_state,
+        )
+        from ktrdr.checkpoint import BackgroundCheckpointWriter
         from ktrdr.checkpoint.checkpoint_policy import CheckpointPolicy
+        from ktrdr.config.settings import get_checkpoint_settings
 
+        checkpoint_settings = get_checkpoint_settings()
         checkpoint_policy = CheckpointPolicy(
             unit_interval=self.checkpoint_bar_interval,
-            time_interval_seconds=300,
+            time_interval_seconds=checkpoint_settings.time_interval_seconds,
         )
 
         last_checkpoint_state: dict[str, Any] = {}
         main_loop = asyncio.get_running_loop()
 
+        # Periodic checkpoints: the simulation thread takes an O(1) snapshot,
+        # the writer thread converts new trades/equity samples and saves
+        writer: Optional[BackgroundCheckpointWriter] = None
+        if checkpoint_settings.background_writes:
+            writer = BackgroundCheckpointWriter(checkpoint_service, main_loop)
+        incremental_builder = IncrementalBacktestCheckpointBuilder(original_request)
+
         def backtest_state_builder(**kwargs):
             return build_backtest_checkpoint_state(
                 engine=kwargs["engine"],
@@ -435,14 +470,30 @@ class BacktestWorker(WorkerAPIBase):
                 original_request=original_request,
             )
 
+        def periodic_state_builder(**kwargs):
+            if writer is None:
+                return backtest_state_builder(**kwargs)
+            return incremental_builder.snapshot(
+                engine=kwargs["engine"],
+                bar_index=kwargs["bar_index"],
+                current_timestamp=kwargs["timestamp"],
+            )
+
+        async def stop_writer(discard_pending: bool) -> None:
+            # A queued periodic save must not land after the checkpoint is
+            # deleted or replaced by a cancellation checkpoint
+            if writer is not None:
+                await writer.aclose(discard_pending=discard_pending)
+
         checkpoint_callback = self.create_checkpoint_callback(
             operation_id=operation_id,
             checkpoint_service=checkpoint_service,
             checkpoint_policy=checkpoint_policy,
-            state_builder=backtest_state_builder,
+            state_builder=periodic_state_builder,
             main_loop=main_loop,
             last_checkpoint_state=last_checkpoint_state,
             artifacts_builder=None,
+            writer=writer,
         )
 
         # 2. Create engine and optionally resume
@@ -457,15 +508,27 @@ class BacktestWorker(WorkerAPIBase):
             )
 
             # Run engine in thread pool (blocking operation)
-            results = await asyncio.to_thread(
-                engine.run,
-                bridge=bridge,
-                cancellation_token=cancellation_token,
-                checkpoint_callback=checkpoint_callback,
-                resume_start_bar=(resume_context.start_bar if resume_context else None),
-            )
+            results: BacktestResults | SliceBacktestResults
+            if engine_config.slices:
+                # Multi-slice runs are short and not checkpointed
+                results = await asyncio.to_thread(
+                    engine.run_slices,
+                    bridge=bridge,
+                    cancellation_token=cancellation_token,
+                )
+            else:
+                results = await asyncio.to_thread(
+                    engine.run,
+                    bridge=bridge,
+                    cancellation_token=cancellation_token,
+                    checkpoint_callback=checkpoint_callback,
+                    resume_start_bar=(
+                        resume_context.start_bar if resume_context else None
+                    ),
+                )
 
             # 3. Complete operation — delete checkpoint on success
+            await stop_writer(discard_pending=True)
             results_dict = results.to_dict()
             await self._operations_service.complete_operation(
                 operation_id, results_dict
@@ -486,6 +549,7 @@ class BacktestWorker(WorkerAPIBase):
 
         except CancellationError:
             logger.info(f"Backtest operation {operation_id} cancelled")
+            await stop_writer(discard_pending=True)
             await self.save_cancellation_checkpoint(
                 operation_id=operation_id,
                 checkpoint_service=checkpoint_service,
@@ -498,6 +562,7 @@ class BacktestWorker(WorkerAPIBase):
 
         except asyncio.CancelledError:
             logger.info(f"Backtest operation {operation_id} cancelled (asyncio)")
+            await stop_writer(discard_pending=True)
             await self.save_cancellation_checkpoint(
                 operation_id=operation_id,
                 checkpoint_service=checkpoint_service,
@@ -509,6 +574,8 @@ class BacktestWorker(WorkerAPIBase):
             return {"status": "cancelled", "operation_id": operation_id}
 
         except Exception as e:
+            # Keep the latest periodic checkpoint for resume
+            await stop_writer(discard_pending=False)
             await self._operations_service.fail_operation(operation_id, str(e))
             raise
 
@@ -81,51 +81,68 @@ class BacktestingService(ServiceOrchestrator[None]):
         """Get environment variable prefix (not used in distributed-only mode)."""
         return ""
 
-    def _select_backtest_worker(
-        self, excluded_workers: Optional[list[str]] = None
+    def _worker_unavailable(
+        self, attempted_workers: Optional[list[str]] = None
+    ) -> WorkerUnavailableError:
+        """
+        Build the error raised when no backtest worker can take a dispatch.
+
+        Args:
+            attempted_workers: Worker IDs that already rejected this dispatch
+
+        Returns:
+            WorkerUnavailableError with registry context (HTTP 503)
+        """
+        return WorkerUnavailableError(
+            worker_type="backtesting",
+            registered_count=len(
+                self.worker_registry.list_workers(worker_type=WorkerType.BACKTESTING)
+            ),
+            backend_uptime_seconds=get_uptime_seconds(),
+            hint=(
+                f"All workers busy. Tried: {attempted_workers}"
+                if attempted_workers
+                else None
+            ),
+        )
+
+    async def _acquire_backtest_worker(
+        self,
+        symbol: str,
+        model_path: Optional[str],
+        excluded_workers: Optional[list[str]] = None,
     ) -> "WorkerEndpoint":
         """
-        Select an available backtest worker.
+        Reserve a backtest worker slot, waiting in the dispatch queue if all are busy.
 
-        Encapsulates worker selection logic and error handling, matching the
-        pattern used in TrainingService._select_training_worker().
+        Prefers a worker that already handled this symbol/model. When every
+        registered worker's slots are taken, the request queues in the
+        registry (up to KTRDR_WORKER_DISPATCH_QUEUE_TIMEOUT) instead of failing
+        straight away, so callers don't have to retry with backoff. The slot
+        stays reserved until mark_busy(); callers must release_worker() it if
+        the dispatch fails.
 
         Args:
-            excluded_workers: List of worker_ids to exclude from selection
-                (e.g., workers that have already been tried and returned 503)
+            symbol: Trading symbol (cache locality hint)
+            model_path: Model file path (cache locality hint)
+            excluded_workers: Worker IDs that already rejected this dispatch
 
         Returns:
             Selected WorkerEndpoint
 
         Raises:
-            WorkerUnavailableError: If no backtest workers are available (HTTP 503)
+            WorkerUnavailableError: If no worker slot frees up in time (HTTP 503)
         """
-        # Get registered worker count for error context
-        all_registered = self.worker_registry.list_workers(
-            worker_type=WorkerType.BACKTESTING
-        )
-        registered_count = len(all_registered)
-
-        # Select worker (registry handles load balancing)
-        worker = self.worker_registry.select_worker(WorkerType.BACKTESTING)
-
-        if not worker:
-            raise WorkerUnavailableError(
-                worker_type="backtesting",
-                registered_count=registered_count,
-                backend_uptime_seconds=get_uptime_seconds(),
-            )
-
-        # Check if this worker should be excluded
-        if excluded_workers and worker.worker_id in excluded_workers:
-            # All available workers have been tried
-            raise WorkerUnavailableError(
-                worker_type="backtesting",
-                registered_count=registered_count,
-                backend_uptime_seconds=get_uptime_seconds(),
-                hint=f"All workers busy. Tried: {excluded_workers}",
+        worker = None
+        if self.worker_registry.list_workers(worker_type=WorkerType.BACKTESTING):
+            worker = await self.worker_registry.acquire_worker(
+                WorkerType.BACKTESTING,
+                symbol=symbol,
+                model_path=model_path,
+                excluded_workers=excluded_workers,
             )
-
+        if worker is None:
+            raise self._worker_unavailable(excluded_workers)
         return worker
 
     async def health_check(self) -> dict[str, Any]:
@@ -183,6 +200,7 @@ class BacktestingService(ServiceOrchestrator[None]):
         commission: float = 0.001,
         slippage: float = 0.0005,
         timeframes: Optional[list[str]] = None,
+        slices: Optional[list[tuple[datetime, datetime]]] = None,
     ) -> dict[str, Any]:
         """
         Run backtest with async operations support.
@@ -204,6 +222,9 @@ class BacktestingService(ServiceOrchestrator[None]):
             initial_capital: Initial capital amount
             commission: Commission rate
             slippage: Slippage rate
+            timeframes: All timeframes of the strategy (multi-timeframe support)
+            slices: Optional (start, end) sub-ranges of [start_date, end_date],
+                each backtested independently over a single data load
 
         Returns:
             Dictionary with operation_id and status
@@ -233,6 +254,7 @@ class BacktestingService(ServiceOrchestrator[None]):
             commission=commission,
             slippage=slippage,
             timeframes=timeframes or [],
+            slices=slices,
         )
 
         # Return with the operation_id (backend_operation_id from worker)
@@ -297,6 +319,7 @@ class BacktestingService(ServiceOrchestrator[None]):
         commission: float = 0.001,
         slippage: float = 0.0005,
         timeframes: Optional[list[str]] = None,
+        slices: Optional[list[tuple[datetime, datetime]]] = None,
     ) -> dict[str, Any]:
         """
         Run backtest on worker using distributed execution pattern.
@@ -322,6 +345,8 @@ class BacktestingService(ServiceOrchestrator[None]):
             initial_capital: Initial capital
             commission: Commission rate
             slippage: Slippage rate
+            timeframes: All timeframes of the strategy
+            slices: Optional (start, end) sub-ranges backtested in one pass
 
         Returns:
             Dictionary with status="started" (worker operation continues independently)
@@ -333,7 +358,7 @@ class BacktestingService(ServiceOrchestrator[None]):
         max_retries = 3
         attempted_workers: list[str] = []
 
-        worker = self._select_backtest_worker()
+        worker = await self._acquire_backtest_worker(symbol, model_path)
         worker_id = worker.worker_id
         remote_url = worker.endpoint_url
         attempted_workers.append(worker_id)
@@ -359,6 +384,10 @@ class BacktestingService(ServiceOrchestrator[None]):
             "slippage": slippage,
             "model_path": model_path,  # Pass model_path to worker for v3 detection
             "timeframes": timeframes or [],
+            "slices": [
+                {"start_date": start.isoformat(), "end_date": end.isoformat()}
+                for start, end in slices or []
+            ],
         }
 
         remote_response = None
@@ -392,31 +421,33 @@ class BacktestingService(ServiceOrchestrator[None]):
                 break
 
             except httpx.HTTPStatusError as e:
-                if e.response.status_code == 503:
-                    # Worker is busy, try different worker
-                    logger.warning(
-                        f"Worker {worker_id} is busy (503), selecting different worker "
-                        f"(attempt {retry_attempt + 1}/{max_retries})"
-                    )
-
-                    if retry_attempt < max_retries - 1:
-                        # Select a different worker for next attempt
-                        # _select_backtest_worker raises WorkerUnavailableError if all tried
-                        worker = self._select_backtest_worker(
-                            excluded_workers=attempted_workers
-                        )
-                        worker_id = worker.worker_id
-                        remote_url = worker.endpoint_url
-                        attempted_workers.append(worker_id)
-                        logger.info(f"Retrying with worker {worker_id}")
-                        continue  # Retry with new worker
-                    else:
-                        # Last retry failed - let _select_backtest_worker raise the error
-                        self._select_backtest_worker(excluded_workers=attempted_workers)
-                else:
+                # The dispatch failed - give the reserved slot back
+                self.worker_registry.release_worker(worker_id)
+                if e.response.status_code != 503:
                     # Other HTTP error, don't retry
                     raise
 
+                # Worker is busy, try different worker
+                logger.warning(
+                    f"Worker {worker_id} is busy (503), selecting different worker "
+                    f"(attempt {retry_attempt + 1}/{max_retries})"
+                )
+                if retry_attempt == max_retries - 1:
+                    raise self._worker_unavailable(attempted_workers) from e
+                # Re-acquire through the registry so the retry waits its turn
+                # in the dispatch queue; raises WorkerUnavailableError when no
+                # untried worker frees up
+                worker = await self._acquire_backtest_worker(
+                    symbol, model_path, excluded_workers=attempted_workers
+                )
+                worker_id = worker.worker_id
+                remote_url = worker.endpoint_url
+                attempted_workers.append(worker_id)
+                logger.info(f"Retrying with worker {worker_id}")
+            except Exception:
+                self.worker_registry.release_worker(worker_id)
+                raise
+
         if not remote_operation_id:
             raise RuntimeError("Failed to start backtest on any worker")
 
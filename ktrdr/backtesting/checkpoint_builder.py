@@ -3,6 +3,8 @@
 Builds checkpoint state from a BacktestingEngine for save/resume functionality.
 """
 
+import threading
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, Optional
 
 import pandas as pd
@@ -100,28 +102,28 @@ def _extract_trades(engine: "BacktestingEngine") -> list[dict[str, Any]]:
     Returns:
         List of trade dictionaries.
     """
-    trades = []
-    for trade in engine.position_manager.trade_history:
-        trades.append(
-            {
-                "trade_id": trade.trade_id,
-                "symbol": trade.symbol,
-                "side": trade.side,
-                "entry_price": trade.entry_price,
-                "entry_time": trade.entry_time.isoformat(),
-                "exit_price": trade.exit_price,
-                "exit_time": trade.exit_time.isoformat(),
-                "quantity": trade.quantity,
-                "gross_pnl": trade.gross_pnl,
-                "commission": trade.commission,
-                "slippage": trade.slippage,
-                "net_pnl": trade.net_pnl,
-                "holding_period_hours": trade.holding_period_hours,
-                "max_favorable_excursion": trade.max_favorable_excursion,
-                "max_adverse_excursion": trade.max_adverse_excursion,
-            }
-        )
-    return trades
+    return [_trade_to_dict(trade) for trade in engine.position_manager.trade_history]
+
+
+def _trade_to_dict(trade: Any) -> dict[str, Any]:
+    """Convert a completed Trade to its checkpoint dictionary."""
+    return {
+        "trade_id": trade.trade_id,
+        "symbol": trade.symbol,
+        "side": trade.side,
+        "entry_price": trade.entry_price,
+        "entry_time": trade.entry_time.isoformat(),
+        "exit_price": trade.exit_price,
+        "exit_time": trade.exit_time.isoformat(),
+        "quantity": trade.quantity,
+        "gross_pnl": trade.gross_pnl,
+        "commission": trade.commission,
+        "slippage": trade.slippage,
+        "net_pnl": trade.net_pnl,
+        "holding_period_hours": trade.holding_period_hours,
+        "max_favorable_excursion": trade.max_favorable_excursion,
+        "max_adverse_excursion": trade.max_adverse_excursion,
+    }
 
 
 def _sample_equity_curve(
@@ -164,6 +166,112 @@ def _sample_equity_curve(
     return samples
 
 
+class IncrementalBacktestCheckpointBuilder:
+    """Builds backtest checkpoint states off the simulation thread.
+
+    snapshot() runs on the simulation thread and captures O(1) values only:
+    cash, the open position, and how many trades and equity points exist.
+    The build function it returns runs later on a background writer thread
+    and converts only the trades and equity samples added since the previous
+    build. Trades and equity points are append-only during a run, so the
+    prefix a snapshot refers to never changes and the built state equals
+    build_backtest_checkpoint_state() at snapshot time.
+    """
+
+    def __init__(
+        self,
+        original_request: Optional[dict[str, Any]] = None,
+        equity_sample_interval: int = DEFAULT_EQUITY_SAMPLE_INTERVAL,
+    ):
+        """Initialize the builder (one per backtest run).
+
+        Args:
+            original_request: Original backtest request for resume context.
+                If not provided, extracted from the engine's config.
+            equity_sample_interval: Interval for sampling equity curve.
+        """
+        self._original_request = original_request
+        self._interval = equity_sample_interval
+        self._lock = threading.Lock()
+        # Converted prefixes, extended by each build
+        self._trades: list[dict[str, Any]] = []
+        self._samples: list[dict[str, Any]] = []
+
+    def snapshot(
+        self,
+        engine: "BacktestingEngine",
+        bar_index: int,
+        current_timestamp: pd.Timestamp,
+    ) -> Callable[[], BacktestCheckpointState]:
+        """Capture the engine's state; return a function that builds it.
+
+        Args:
+            engine: The BacktestingEngine instance with current state.
+            bar_index: Current bar index in the simulation.
+            current_timestamp: Timestamp of the current bar.
+
+        Returns:
+            Zero-argument callable returning the BacktestCheckpointState.
+        """
+        cash = engine.position_manager.current_capital
+        positions = _extract_positions(engine)
+        trade_history = engine.position_manager.trade_history
+        trade_count = len(trade_history)
+        equity_curve = engine.performance_tracker.equity_curve
+        equity_count = len(equity_curve)
+        current_date = current_timestamp.isoformat()
+        original_request = self._original_request
+        if original_request is None:
+            original_request = _build_original_request(engine)
+
+        def build() -> BacktestCheckpointState:
+            with self._lock:
+                trades = self._trades_up_to(trade_history, trade_count)
+                equity_samples = self._samples_up_to(equity_curve, equity_count)
+            return BacktestCheckpointState(
+                bar_index=bar_index,
+                current_date=current_date,
+                cash=cash,
+                positions=positions,
+                trades=trades,
+                equity_samples=equity_samples,
+                original_request=original_request,
+            )
+
+        return build
+
+    def _trades_up_to(
+        self, trade_history: Sequence[Any], count: int
+    ) -> list[dict[str, Any]]:
+        for index in range(len(self._trades), count):
+            self._trades.append(_trade_to_dict(trade_history[index]))
+        return self._trades[:count]
+
+    def _samples_up_to(
+        self, equity_curve: Sequence[dict[str, Any]], count: int
+    ) -> list[dict[str, Any]]:
+        # Same points as _sample_equity_curve(equity_curve[:count])
+        if count == 0:
+            return []
+        for index in range(len(self._samples) * self._interval, count, self._interval):
+            self._samples.append(
+                {
+                    "bar_index": index,
+                    "equity": float(equity_curve[index]["portfolio_value"]),
+                }
+            )
+        samples = self._samples[: (count - 1) // self._interval + 1]
+        last_index = count - 1
+        if last_index % self._interval != 0:
+            samples.append(
+                {
+                    "bar_index": last_index,
+                    "equity": float(equity_curve[last_index]["portfolio_value"]),
+                }
+            )
+        return samples
+
+
 def _build_original_request(engine: "BacktestingEngine") -> dict[str, Any]:
     """Build original request from engine config.
 
@@ -0,0 +1,210 @@
+"""Compiled NumPy inference for MLP models.
+
+DecisionFunction runs one forward pass per bar. For the small MLPs used in
+backtesting, eager PyTorch spends more time on tensor construction and
+framework dispatch than on arithmetic. CompiledMLP extracts the weights of an
+``nn.Sequential`` of Linear/activation/Dropout layers once and evaluates it
+with plain NumPy into preallocated buffers.
+
+Weights are shared (read-only) between all users of a compiled model;
+per-caller scratch space lives in InferenceBuffers so concurrent backtests
+sharing one cached ModelBundle don't race on buffers.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Rows per chunk in forward_batch (bounds temporary memory)
+_BATCH_CHUNK_ROWS = 65536
+
+# Compiled output must match eager output within this tolerance
+_VERIFY_ATOL = 1e-4
+
+Activation = Callable[[np.ndarray], None]
+
+
+def _relu(x: np.ndarray) -> None:
+    np.maximum(x, 0.0, out=x)
+
+
+def _tanh(x: np.ndarray) -> None:
+    np.tanh(x, out=x)
+
+
+def _sigmoid(x: np.ndarray) -> None:
+    np.negative(x, out=x)
+    np.exp(x, out=x)
+    x += 1.0
+    np.reciprocal(x, out=x)
+
+
+def _leaky_relu(slope: float) -> Activation:
+    def apply(x: np.ndarray) -> None:
+        np.multiply(x, slope, out=x, where=x < 0)
+
+    return apply
+
+
+def _softmax(x: np.ndarray) -> None:
+    x -= x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+
+
+@dataclass(frozen=True)
+class _Layer:
+    weight_t: np.ndarray  # (in, out), C-contiguous for x @ W^T
+    bias: np.ndarray | None  # (out,)
+    activations: tuple[Activation, ...]
+
+
+class InferenceBuffers:
+    """Per-caller scratch buffers for single-row CompiledMLP evaluation."""
+
+    def __init__(self, input_size: int, layer_sizes: list[int]) -> None:
+        self.input = np.zeros(input_size, dtype=np.float32)
+        self.layers = [np.zeros(size, dtype=np.float32) for size in layer_sizes]
+
+
+class CompiledMLP:
+    """Pure-NumPy evaluator for a feed-forward ``nn.Sequential``.
+
+    Use ``compile_model()`` rather than constructing this directly.
+    """
+
+    def __init__(self, layers: list[_Layer], input_size: int) -> None:
+        self._layers = layers
+        self.input_size = input_size
+        self.output_size = int(layers[-1].weight_t.shape[1])
+
+    def make_buffers(self) -> InferenceBuffers:
+        """Allocate scratch buffers for ``forward_into``."""
+        return InferenceBuffers(
+            self.input_size, [int(layer.weight_t.shape[1]) for layer in self._layers]
+        )
+
+    def forward_into(self, buffers: InferenceBuffers) -> np.ndarray:
+        """Evaluate ``buffers.input`` without allocating.
+
+        Returns:
+            The last layer's buffer, shape (output_size,). It is overwritten by
+            the next call; copy it to keep the values.
+        """
+        current = buffers.input
+        for layer, out in zip(self._layers, buffers.layers, strict=True):
+            np.dot(current, layer.weight_t, out=out)
+            if layer.bias is not None:
+                out += layer.bias
+            for activation in layer.activations:
+                activation(out)
+            current = out
+        return current
+
+    def forward_batch(self, matrix: np.ndarray) -> np.ndarray:
+        """Evaluate a (rows, input_size) matrix.
+
+        Returns:
+            New float32 array of shape (rows, output_size)
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self.input_size:
+            raise ValueError(
+                f"Expected matrix of shape (rows, {self.input_size}), "
+                f"got {matrix.shape}"
+            )
+        result = np.empty((len(matrix), self.output_size), dtype=np.float32)
+        for start in range(0, len(matrix), _BATCH_CHUNK_ROWS):
+            current = matrix[start : start + _BATCH_CHUNK_ROWS]
+            for layer in self._layers:
+                current = current @ layer.weight_t
+                if layer.bias is not None:
+                    current += layer.bias
+                for activation in layer.activations:
+                    activation(current)
+            result[start : start + len(current)] = current
+        return result
+
+
+def compile_model(model: Any) -> CompiledMLP | None:
+    """Compile a feed-forward ``nn.Sequential`` into a CompiledMLP.
+
+    Supported layers: Linear, ReLU, Tanh, Sigmoid, LeakyReLU, Softmax (last
+    dim), Dropout and Identity (no-ops in eval mode). Anything else —
+    including LSTM/GRU models — returns None so callers fall back to eager
+    PyTorch. The compiled model is verified against eager output on a probe
+    input before being returned.
+
+    Args:
+        model: nn.Module in eval mode
+
+    Returns:
+        CompiledMLP, or None if the model can't be compiled
+    """
+    try:
+        import torch
+        import torch.nn as nn
+    except ImportError:
+        return None
+
+    if not isinstance(model, nn.Sequential):
+        return None
+
+    layers: list[_Layer] = []
+    pending_activations: list[Activation] = []
+    for module in model:
+        if isinstance(module, nn.Linear):
+            if layers:
+                layers[-1] = _with_activations(layers[-1], pending_activations)
+            elif pending_activations:
+                return None  # activation before the first Linear
+            pending_activations = []
+            weight = module.weight.detach().cpu().numpy().astype(np.float32)
+            bias = (
+                module.bias.detach().cpu().numpy().astype(np.float32)
+                if module.bias is not None
+                else None
+            )
+            layers.append(_Layer(np.ascontiguousarray(weight.T), bias, ()))
+        elif isinstance(module, nn.ReLU):
+            pending_activations.append(_relu)
+        elif isinstance(module, nn.Tanh):
+            pending_activations.append(_tanh)
+        elif isinstance(module, nn.Sigmoid):
+            pending_activations.append(_sigmoid)
+        elif isinstance(module, nn.LeakyReLU):
+            pending_activations.append(_leaky_relu(module.negative_slope))
+        elif isinstance(module, nn.Softmax) and module.dim in (-1, 1, None):
+            pending_activations.append(_softmax)
+        elif isinstance(module, (nn.Dropout, nn.Identity)):
+            continue
+        else:
+            return None
+
+    if not layers:
+        return None
+    layers[-1] = _with_activations(layers[-1], pending_activations)
+
+    compiled = CompiledMLP(layers, int(layers[0].weight_t.shape[0]))
+
+    # Verify against eager output so a subtle mismatch can never change signals
+    probe = np.random.default_rng(0).random((4, compiled.input_size), np.float32)
+    with torch.inference_mode():
+        expected = model(torch.from_numpy(probe)).cpu().numpy()
+    if expected.shape != (4, compiled.output_size) or not np.allclose(
+        compiled.forward_batch(probe), expected, atol=_VERIFY_ATOL
+    ):
+        logger.warning("Compiled MLP output mismatch; using eager inference")
+        return None
+    return compiled
+
+
+def _with_activations(layer: _Layer, activations: list[Activation]) -> _Layer:
+    return _Layer(layer.weight_t, layer.bias, tuple(activations))
@@ -0,0 +1,437 @@
+"""Worker-local cache of parsed OHLCV frames and feature matrices.
+
+Every backtest builds a fresh BacktestingEngine, which parsed the symbol's
+CSV files from the shared data directory and recomputed every indicator and
+fuzzy feature. Workers see the same handful of symbols over and over, so
+most of that work repeats.
+
+DataCache keeps both results per process, in two tiers:
+
+- memory: an LRU of frames bounded by an estimated byte budget
+  (KTRDR_WORKER_DATA_CACHE_MB)
+- disk (optional): pickled frames under KTRDR_WORKER_DATA_CACHE_DIR, also
+  LRU with its own budget, so a restarted worker starts warm
+
+OHLCV entries are keyed on the data file's version (mtime + size, see
+DataRepository.get_data_version): rewriting the file changes the key, and
+the older version of the same series is dropped. Feature entries are keyed
+on the versions of the frames they were computed from plus a digest of the
+strategy's feature configuration.
+
+Cached symbols are advertised as locality keys ("symbol:EURUSD") in the
+worker's registration, /health and heartbeats, so the backend routes
+operations for a symbol to workers that already hold it.
+
+Cached frames are shared: callers must treat them as read-only.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from ktrdr import get_logger
+
+logger = get_logger(__name__)
+
+# Locality keys advertised to the backend (matches its warm-key history)
+MAX_WARM_KEYS = 32
+
+_DISK_SUFFIX = ".pkl"
+
+
+class _Entry(NamedTuple):
+    value: Any
+    size: int
+    symbol: str
+    series: Hashable
+
+
+class _DiskEntry(NamedTuple):
+    path: Path
+    size: int
+    symbol: str
+    series_digest: str
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha1(repr(value).encode()).hexdigest()[:20]
+
+
+def _quote_symbol(symbol: str) -> str:
+    """Symbol as a file name part (no separators, no dots)."""
+    return quote(symbol, safe="").replace(".", "%2E")
+
+
+def frame_nbytes(*values: Union[pd.DataFrame, pd.Index]) -> int:
+    """Estimated memory footprint of DataFrames / indexes in bytes."""
+    total = 0
+    for value in values:
+        if isinstance(value, pd.DataFrame):
+            total += int(value.memory_usage(index=True, deep=True).sum())
+        elif isinstance(value, pd.Index):
+            total += int(value.memory_usage(deep=True))
+    return total
+
+
+class DataCache:
+    """Two-tier (memory + optional disk) LRU cache of backtest inputs."""
+
+    def __init__(
+        self,
+        max_bytes: int = 512 * 1024 * 1024,
+        disk_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 4 * 1024 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Estimated memory budget; 0 disables the memory tier
+            disk_dir: Directory of the disk tier; None disables it
+            max_disk_bytes: Disk tier budget in bytes
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._disk: Optional[OrderedDict[str, _DiskEntry]] = None
+        self._disk_bytes = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any tier is enabled."""
+        return self.max_bytes > 0 or self.disk_dir is not None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key (memory, then disk), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value
+
+        loaded = self._disk_get(key)
+        with self._lock:
+            if loaded is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+        value, symbol, series = loaded
+        self._memory_put(key, series, symbol, value, self._value_size(value))
+        return value
+
+    def put(self, key: Hashable, series: Hashable, symbol: str, value: Any) -> None:
+        """
+        Store a value in both tiers, replacing older versions of its series.
+
+        Args:
+            key: Full key (series + version stamp)
+            series: Key without the version stamp (e.g. symbol + timeframe)
+            symbol: Symbol the value belongs to (advertised as a locality key)
+            value: DataFrame, or tuple of DataFrames / indexes
+        """
+        self._memory_put(key, series, symbol, value, self._value_size(value))
+        self._disk_put(key, series, symbol, value)
+
+    def load_ohlcv(
+        self,
+        repository: Any,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        versions: Optional[dict[str, tuple[int, int]]] = None,
+    ) -> pd.DataFrame:
+        """
+        DataRepository.load_from_cache through the cache.
+
+        The whole file is cached once per version; date filters are applied
+        to a copy on every call. Repositories that cannot version the file
+        are read directly.
+
+        Args:
+            repository: DataRepository to read from on a miss
+            symbol: Trading symbol
+            timeframe: Timeframe
+            start_date: Optional start date for filtering
+            end_date: Optional end date for filtering
+            versions: If given, receives {timeframe: version} of the file read
+
+        Returns:
+            DataFrame with OHLCV data
+
+        Raises:
+            Whatever repository.load_from_cache raises
+        """
+        from ktrdr.errors import DataNotFoundError
+
+        version = repository.get_data_version(symbol, timeframe)
+        if not self.enabled or not isinstance(version, tuple):
+            return repository.load_from_cache(
+                symbol=symbol,
+                timeframe=timeframe,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+        series = ("ohlcv", str(repository.data_dir), symbol, timeframe)
+        key = (series, version)
+        df = self.get(key)
+        if df is None:
+            df = repository.load_from_cache(symbol=symbol, timeframe=timeframe)
+            self.put(key, series, symbol, df)
+        if versions is not None:
+            versions[timeframe] = version
+
+        filtered = repository.loader._apply_date_filters(df, start_date, end_date)
+        if filtered.empty:
+            raise DataNotFoundError(
+                message=f"No data found in cache for {symbol} {timeframe}",
+                error_code="DATA-EmptyCache",
+                details={
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                    "start_date": str(start_date) if start_date else None,
+                    "end_date": str(end_date) if end_date else None,
+                },
+            )
+        return filtered.copy() if filtered is df else filtered
+
+    def wrap(self, repository: Any) -> "CachedRepository":
+        """Repository view whose load_from_cache goes through this cache."""
+        return CachedRepository(repository, self)
+
+    def warm_keys(self) -> list[str]:
+        """Locality keys of cached symbols, most recently used last."""
+        with self._lock:
+            symbols = [entry.symbol for entry in self._entries.values()]
+            index = self._disk_index()
+            if index is not None:
+                symbols = [e.symbol for e in index.values()] + symbols
+        ordered = list(dict.fromkeys(reversed(symbols)))[:MAX_WARM_KEYS]
+        return [f"symbol:{symbol}" for symbol in reversed(ordered)]
+
+    def clear(self) -> None:
+        """Drop the memory tier (statistics and the disk tier are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics for logging and health endpoints."""
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk_entries": len(self._disk) if self._disk is not None else 0,
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": (
+                    (self._hits + self._disk_hits) / lookups if lookups else 0.0
+                ),
+            }
+
+    @staticmethod
+    def _value_size(value: Any) -> int:
+        if isinstance(value, tuple):
+            return frame_nbytes(*value)
+        return frame_nbytes(value)
+
+    def _memory_put(
+        self, key: Hashable, series: Hashable, symbol: str, value: Any, size: int
+    ) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            # Older versions of the same series are stale, not just cold
+            for stale in [k for k, e in self._entries.items() if e.series == series]:
+                self._bytes -= self._entries.pop(stale).size
+            self._entries[key] = _Entry(value, size, symbol, series)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evictions += 1
+
+    # Disk tier: files are named {quoted symbol}.{series digest}.{key digest}.pkl
+    # so the index can be rebuilt from a directory listing
+
+    def _disk_index(self) -> Optional[OrderedDict[str, _DiskEntry]]:
+        """Disk entries in LRU order (scanned on first use); caller holds lock."""
+        if self.disk_dir is None:
+            return None
+        if self._disk is None:
+            self._disk = OrderedDict()
+            self._disk_bytes = 0
+            try:
+                self.disk_dir.mkdir(parents=True, exist_ok=True)
+                files = []
+                for path in self.disk_dir.glob(f"*{_DISK_SUFFIX}"):
+                    parts = path.name[: -len(_DISK_SUFFIX)].split(".")
+                    if len(parts) != 3:
+                        continue
+                    stat = path.stat()
+                    files.append((stat.st_mtime_ns, path, stat.st_size, parts))
+            except OSError as e:
+                logger.warning(f"Data cache directory {self.disk_dir} unusable: {e}")
+                self.disk_dir = None
+                self._disk = None
+                return None
+            for _, path, size, (symbol, series_digest, key_digest) in sorted(files):
+                self._disk[key_digest] = _DiskEntry(
+                    path, size, unquote(symbol), series_digest
+                )
+                self._disk_bytes += size
+        return self._disk
+
+    def _disk_get(self, key: Hashable) -> Optional[tuple[Any, str, Hashable]]:
+        key_digest = _digest(key)
+        with self._lock:
+            index = self._disk_index()
+            entry = index.get(key_digest) if index is not None else None
+            if entry is None:
+                return None
+            index.move_to_end(key_digest)
+        try:
+            with open(entry.path, "rb") as f:
+                stored_key, series, value = pickle.load(f)
+            os.utime(entry.path)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable data cache file {entry.path}: {e}")
+            self._disk_remove(key_digest)
+            return None
+        if stored_key != key:
+            return None
+        return value, entry.symbol, series
+
+    def _disk_put(
+        self, key: Hashable, series: Hashable, symbol: str, value: Any
+    ) -> None:
+        with self._lock:
+            index = self._disk_index()
+        if index is None:
+            return
+
+        key_digest = _digest(key)
+        series_digest = _digest(series)
+        path = self.disk_dir / (  # type: ignore[operator]
+            f"{_quote_symbol(symbol)}.{series_digest}.{key_digest}{_DISK_SUFFIX}"
+        )
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((key, series, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = tmp.stat().st_size
+            if size > self.max_disk_bytes:
+                tmp.unlink()
+                return
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write data cache file {path}: {e}")
+            tmp.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            removed = [
+                self._disk_pop(index, d)
+                for d, e in list(index.items())
+                if e.series_digest == series_digest and d != key_digest
+            ]
+            self._disk_pop(index, key_digest)
+            index[key_digest] = _DiskEntry(path, size, symbol, series_digest)
+            self._disk_bytes += size
+            while self._disk_bytes > self.max_disk_bytes and len(index) > 1:
+                removed.append(self._disk_pop(index, next(iter(index))))
+        for entry in removed:
+            if entry is not None:
+                entry.path.unlink(missing_ok=True)
+
+    def _disk_pop(
+        self, index: OrderedDict[str, _DiskEntry], key_digest: str
+    ) -> Optional[_DiskEntry]:
+        entry = index.pop(key_digest, None)
+        if entry is not None:
+            self._disk_bytes -= entry.size
+        return entry
+
+    def _disk_remove(self, key_digest: str) -> None:
+        with self._lock:
+            entry = self._disk_pop(self._disk, key_digest) if self._disk else None
+        if entry is not None:
+            entry.path.unlink(missing_ok=True)
+
+
+class CachedRepository:
+    """DataRepository view that serves load_from_cache from a DataCache.
+
+    Every other attribute is the wrapped repository's. ``versions`` collects
+    the data version of every timeframe loaded through the view.
+    """
+
+    def __init__(self, repository: Any, cache: DataCache):
+        self.repository = repository
+        self.cache = cache
+        self.versions: dict[str, tuple[int, int]] = {}
+
+    def load_from_cache(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+    ) -> pd.DataFrame:
+        """Load data through the cache (see DataCache.load_ohlcv)."""
+        return self.cache.load_ohlcv(
+            self.repository,
+            symbol,
+            timeframe,
+            start_date=start_date,
+            end_date=end_date,
+            versions=self.versions,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repository, name)
+
+
+_cache: Optional[DataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_data_cache() -> DataCache:
+    """Return the process-wide data cache, creating it from settings on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from ktrdr.config.settings import get_worker_settings
+
+                settings = get_worker_settings()
+                _cache = DataCache(
+                    max_bytes=settings.data_cache_mb * 1024 * 1024,
+                    disk_dir=settings.data_cache_dir,
+                    max_disk_bytes=settings.data_cache_disk_mb * 1024 * 1024,
+                )
+    return _cache
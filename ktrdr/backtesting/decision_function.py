@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import logging
 import math
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -24,6 +25,8 @@ from ktrdr.decision.base import Position, Signal, TradingDecision
 if TYPE_CHECKING:
     import torch
 
+    from ktrdr.backtesting.compiled_inference import CompiledMLP
+
 logger = logging.getLogger(__name__)
 
 # Signal index → Signal enum mapping (same as BaseNeuralModel.predict)
@@ -47,6 +50,32 @@ _POSITION_MAP = {
 }
 
 
+@dataclass(frozen=True)
+class BatchPrediction:
+    """Raw model predictions for many bars (before filters).
+
+    Attributes:
+        signal_indices: (N,) int array — argmax class (classification) or
+            0/1/2 = BUY/HOLD/SELL from the cost threshold (regression)
+        confidences: (N,) float array
+        probabilities: (N, C) float array; columns follow ``class_names``
+        class_names: Column labels for ``probabilities``
+        predicted_returns: (N,) float array for regression, else None
+    """
+
+    signal_indices: np.ndarray
+    confidences: np.ndarray
+    probabilities: np.ndarray
+    class_names: list[str]
+    predicted_returns: np.ndarray | None = None
+
+    def signal(self, i: int, is_signal_output: bool = True) -> Signal:
+        """Signal enum for row ``i`` (HOLD for regime/context outputs)."""
+        if not is_signal_output:
+            return Signal.HOLD
+        return _SIGNAL_MAP.get(int(self.signal_indices[i]), Signal.HOLD)
+
+
 class DecisionFunction:
     """Stateless decision maker: (features, position, bar) → TradingDecision.
 
@@ -63,6 +92,7 @@ class DecisionFunction:
         feature_names: list[str],
         decisions_config: dict[str, Any],
         output_type: str = "classification",
+        compiled_model: CompiledMLP | None = None,
     ) -> None:
         """Initialize with a ready-to-infer model and configuration.
 
@@ -74,9 +104,16 @@ class DecisionFunction:
                 "classification" (default): BUY/HOLD/SELL
                 "regime_classification": TRENDING_UP/TRENDING_DOWN/RANGING/VOLATILE
                 "context_classification": BULLISH/BEARISH/NEUTRAL
+            compiled_model: Optional NumPy-compiled model (ModelBundle.compiled_model).
+                When given, point-in-time inference bypasses PyTorch and
+                reuses preallocated buffers.
         """
         self.model = model
         self.feature_names = feature_names
+        self._compiled = compiled_model
+        self._buffers = (
+            compiled_model.make_buffers() if compiled_model is not None else None
+        )
         self.output_type = output_type
         self._is_signal_output = output_type not in _NON_SIGNAL_OUTPUT_TYPES
         self._class_names = _CLASS_NAMES.get(
@@ -122,10 +159,7 @@ class DecisionFunction:
         Returns:
             TradingDecision with filtered signal, confidence, and reasoning
         """
-        if isinstance(bar.name, pd.Timestamp):
-            timestamp = bar.name
-        else:
-            timestamp = pd.Timestamp(bar.name)  # type: ignore[arg-type]
+        timestamp = self._bar_timestamp(bar)
 
         try:
             nn_output = self._predict(features)
@@ -139,6 +173,59 @@ class DecisionFunction:
                 current_position=_POSITION_MAP[position],
             )
 
+        return self._decide(nn_output, position, timestamp, last_signal_time)
+
+    def decide_precomputed(
+        self,
+        batch: BatchPrediction,
+        row: int,
+        position: PositionStatus,
+        bar: pd.Series,
+        last_signal_time: pd.Timestamp | None = None,
+    ) -> TradingDecision:
+        """Generate a trading decision from a row of ``predict_many`` output.
+
+        Equivalent to calling the function with that row's features, but
+        without a forward pass: only the filters run per bar.
+
+        Args:
+            batch: Predictions from ``predict_many``
+            row: Row of ``batch`` for this bar
+            position: Current position from PositionManager
+            bar: Current OHLCV bar (timestamp from bar.name)
+            last_signal_time: When the last trade was executed
+
+        Returns:
+            TradingDecision with filtered signal, confidence, and reasoning
+        """
+        nn_output: dict[str, Any] = {
+            "signal": batch.signal(row, self._is_signal_output),
+            "confidence": float(batch.confidences[row]),
+            "probabilities": {
+                name: float(batch.probabilities[row, i])
+                for i, name in enumerate(batch.class_names)
+            },
+        }
+        if batch.predicted_returns is not None:
+            nn_output["predicted_return"] = float(batch.predicted_returns[row])
+        return self._decide(
+            nn_output, position, self._bar_timestamp(bar), last_signal_time
+        )
+
+    @staticmethod
+    def _bar_timestamp(bar: pd.Series) -> pd.Timestamp:
+        if isinstance(bar.name, pd.Timestamp):
+            return bar.name
+        return pd.Timestamp(bar.name)  # type: ignore[arg-type]
+
+    def _decide(
+        self,
+        nn_output: dict[str, Any],
+        position: PositionStatus,
+        timestamp: pd.Timestamp,
+        last_signal_time: pd.Timestamp | None,
+    ) -> TradingDecision:
+        """Turn raw model output into a filtered TradingDecision."""
         raw_signal = nn_output["signal"]
         confidence = nn_output["confidence"]
 
@@ -183,29 +270,18 @@ class DecisionFunction:
             Dict with 'signal' (Signal enum), 'confidence' (float),
             and 'probabilities' (dict)
         """
-        import torch
-
-        if isinstance(features, pd.DataFrame):
-            # Sequence model: features is (seq_len, F) DataFrame
-            # Reorder columns to match feature_names
-            ordered = features[self.feature_names]
-            tensor = torch.tensor(ordered.values, dtype=torch.float32).unsqueeze(
-                0
-            )  # (1, seq_len, F)
+        if self._compiled is not None and not isinstance(features, pd.DataFrame):
+            assert self._buffers is not None
+            # Fill the preallocated input row in feature order, no tensors
+            inputs = self._buffers.input
+            for i, name in enumerate(self.feature_names):
+                inputs[i] = features[name]
+            raw_outputs = self._compiled.forward_into(self._buffers)
         else:
-            # MLP model: features is dict[str, float]
-            values = [features[name] for name in self.feature_names]
-            tensor = torch.tensor(values, dtype=torch.float32).unsqueeze(0)  # (1, F)
-
-        with torch.no_grad():
-            outputs = self.model(tensor)
-
-        # Handle output shapes
-        if hasattr(outputs, "shape") and len(outputs.shape) == 1:
-            outputs = outputs.unsqueeze(0)
+            raw_outputs = self._forward_eager(features)
 
         if self.output_format == "regression":
-            predicted_return = float(outputs[0, 0].cpu().numpy())
+            predicted_return = float(raw_outputs[0])
 
             if predicted_return > self.trade_threshold:
                 signal = Signal.BUY
@@ -237,8 +313,6 @@ class DecisionFunction:
             }
 
         # Classification path — N-class with dynamic class names
-        raw_outputs = outputs[0].cpu().numpy()
-
         # Check if softmax was already applied
         raw_sum = np.sum(raw_outputs)
         if abs(raw_sum - 1.0) < 1e-6:
@@ -271,6 +345,102 @@ class DecisionFunction:
             "probabilities": probabilities,
         }
 
+    def _forward_eager(self, features: dict[str, float] | pd.DataFrame) -> np.ndarray:
+        """Single-sample forward pass through the PyTorch model.
+
+        Returns:
+            1D array of raw model outputs for the sample
+        """
+        import torch
+
+        if isinstance(features, pd.DataFrame):
+            # Sequence model: features is (seq_len, F) DataFrame
+            # Reorder columns to match feature_names
+            ordered = features[self.feature_names]
+            tensor = torch.tensor(ordered.values, dtype=torch.float32).unsqueeze(
+                0
+            )  # (1, seq_len, F)
+        else:
+            # MLP model: features is dict[str, float]
+            values = [features[name] for name in self.feature_names]
+            tensor = torch.tensor(values, dtype=torch.float32).unsqueeze(0)  # (1, F)
+
+        with torch.no_grad():
+            outputs = self.model(tensor)
+
+        # Handle output shapes
+        if hasattr(outputs, "shape") and len(outputs.shape) == 1:
+            outputs = outputs.unsqueeze(0)
+
+        return outputs[0].cpu().numpy()
+
+    def predict_many(self, matrix: np.ndarray | pd.DataFrame) -> BatchPrediction:
+        """Run inference for many bars in one pass (no filters applied).
+
+        Uses the compiled NumPy model when available, otherwise one batched
+        PyTorch forward pass. Row ``i`` of the result equals what
+        ``_predict`` would return for row ``i`` of the input.
+
+        Args:
+            matrix: (N, F) features for point-in-time models, or
+                (N, seq_len, F) windows for sequence models. A DataFrame is
+                reordered to ``feature_names`` first.
+
+        Returns:
+            BatchPrediction with per-row signal indices, confidences and
+            probabilities
+        """
+        if isinstance(matrix, pd.DataFrame):
+            matrix = matrix[self.feature_names].to_numpy(dtype=np.float32)
+        values = np.asarray(matrix, dtype=np.float32)
+
+        if self._compiled is not None and values.ndim == 2:
+            outputs = self._compiled.forward_batch(values)
+        else:
+            import torch
+
+            with torch.inference_mode():
+                outputs = self.model(torch.from_numpy(values)).cpu().numpy()
+        if outputs.ndim == 1:
+            outputs = outputs.reshape(len(values), -1)
+
+        if self.output_format == "regression":
+            predicted = outputs[:, 0].astype(np.float64)
+            threshold = self.trade_threshold
+            signal_indices = np.full(len(predicted), 1, dtype=np.int64)
+            signal_indices[predicted > threshold] = 0
+            signal_indices[predicted < -threshold] = 2
+            confidences = np.minimum(np.abs(predicted) / (3 * threshold), 1.0)
+            if threshold > 0:
+                buy = np.maximum(predicted, 0) / threshold
+                sell = np.maximum(-predicted, 0) / threshold
+            else:
+                buy = sell = np.zeros_like(predicted)
+            return BatchPrediction(
+                signal_indices=signal_indices,
+                confidences=confidences,
+                probabilities=np.column_stack([buy, np.zeros_like(buy), sell]),
+                class_names=["BUY", "HOLD", "SELL"],
+                predicted_returns=predicted,
+            )
+
+        # Softmax rows that aren't already probability vectors
+        raw = outputs
+        needs_softmax = np.abs(raw.sum(axis=1) - 1.0) >= 1e-6
+        exp = np.exp(raw - raw.max(axis=1, keepdims=True))
+        softmax = exp / exp.sum(axis=1, keepdims=True)
+        probs = np.where(needs_softmax[:, None], softmax, raw)
+
+        signal_indices = probs.argmax(axis=1)
+        confidences = probs[np.arange(len(probs)), signal_indices]
+        num_classes = min(probs.shape[1], len(self._class_names))
+        return BatchPrediction(
+            signal_indices=signal_indices,
+            confidences=confidences,
+            probabilities=probs[:, :num_classes],
+            class_names=self._class_names[:num_classes],
+        )
+
     def _apply_filters(
         self,
         raw_signal: Signal,
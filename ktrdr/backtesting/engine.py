@@ -7,8 +7,10 @@ trading use (see DESIGN.md for rationale).
 """
 
 import asyncio
+import hashlib
+import json
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Callable, Optional, cast
 
 import pandas as pd
@@ -20,6 +22,7 @@ from ..async_infrastructure.progress_bridge import ProgressBridge
 from ..data.repository import DataRepository
 from ..decision.base import Signal
 from .checkpoint_restore import BacktestResumeContext
+from .data_cache import get_data_cache
 from .decision_function import DecisionFunction
 from .feature_cache import FeatureCache
 from .model_bundle import ModelBundle
@@ -44,6 +47,9 @@ class BacktestConfig:
     commission: float = 0.001  # 0.1%
     slippage: float = 0.0005  # 0.05%
     timeframes: list[str] = field(default_factory=list)
+    # Optional (start_date, end_date) sub-ranges of [start_date, end_date],
+    # simulated independently over one data load (see run_slices)
+    slices: list[tuple[str, str]] = field(default_factory=list)
 
     def get_all_timeframes(self) -> list[str]:
         """Return all timeframes for this backtest.
@@ -91,6 +97,28 @@ class BacktestResults:
         }
 
 
+@dataclass
+class SliceBacktestResults:
+    """Results of a multi-slice backtest: one BacktestResults per slice."""
+
+    strategy_name: str
+    symbol: str
+    timeframe: str
+    slices: list[BacktestResults]
+    execution_time_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert results to dictionary (per-slice results under "slices")."""
+        return {
+            "strategy_name": self.strategy_name,
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "execution_time_seconds": self.execution_time_seconds,
+            "slice_count": len(self.slices),
+            "slices": [result.to_dict() for result in self.slices],
+        }
+
+
 class BacktestingEngine:
     """Backtesting engine using ModelBundle + FeatureCache + DecisionFunction pipeline.
 
@@ -128,6 +156,7 @@ class BacktestingEngine:
             model=self.bundle.model,
             feature_names=self.bundle.feature_names,
             decisions_config=decisions_config,
+            compiled_model=self.bundle.compiled_model,
         )
 
         # Trade execution and tracking (SOLE position tracker)
@@ -138,8 +167,9 @@ class BacktestingEngine:
         )
         self.performance_tracker = PerformanceTracker()
 
-        # Data loading
+        # Data loading (parsed frames and features are cached per worker)
         self.repository = DataRepository()
+        self._data_versions: dict[str, tuple[int, int]] = {}
 
         # Context data (external data from FRED, IB cross-pair, CFTC, etc.)
         # Loaded from model metadata if the model was trained with context data
@@ -185,6 +215,126 @@ class BacktestingEngine:
             f"{self.config.start_date} to {self.config.end_date}"
         )
 
+        # 1-3. Load data, context data and features
+        data = self._prepare_data()
+
+        # 4. Simulate
+        start_idx = (resume_start_bar + 50) if resume_start_bar is not None else 50
+        if start_idx >= len(data):
+            raise ValueError(
+                f"Insufficient data for backtesting: {len(data)} bars "
+                f"(need at least {start_idx + 1} for indicator warm-up)"
+            )
+        self.performance_tracker.reserve(len(data) - start_idx)
+        self._simulate(
+            data,
+            start_idx,
+            len(data),
+            bridge=bridge,
+            cancellation_token=cancellation_token,
+            checkpoint_callback=checkpoint_callback,
+        )
+
+        # 5. Force-close and generate results
+        self._force_close_position(data)
+        return self._generate_results(execution_start)
+
+    def run_slices(
+        self,
+        bridge: Optional[ProgressBridge] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> SliceBacktestResults:
+        """Backtest each of ``config.slices`` over a single data load.
+
+        Data, context data and features are loaded and computed once for
+        [config.start_date, config.end_date]. Each slice is then simulated
+        with fresh PositionManager/PerformanceTracker state and force-closed
+        at its last bar, so slice results are independent of each other.
+
+        Unlike separate runs, a slice starting after the first 50 bars of the
+        loaded range uses the preceding bars as indicator warm-up and is
+        simulated from its first bar.
+
+        Args:
+            bridge: Optional ProgressBridge (progress spans all slices)
+            cancellation_token: Optional CancellationToken for cancellation
+
+        Returns:
+            SliceBacktestResults with one BacktestResults per slice, in order
+
+        Raises:
+            ValueError: If no slices are configured or a slice has no bars
+                after the indicator warm-up
+            CancellationError: If cancellation is requested
+        """
+        if not self.config.slices:
+            raise ValueError("run_slices() requires config.slices")
+        execution_start = time.time()
+
+        logger.info(
+            f"Starting {len(self.config.slices)}-slice backtest: "
+            f"{self.strategy_name} | {self.config.symbol} {self.config.timeframe} | "
+            f"{self.config.start_date} to {self.config.end_date}"
+        )
+
+        data = self._prepare_data()
+        bounds = [
+            self._slice_bounds(data, slice_start, slice_end)
+            for slice_start, slice_end in self.config.slices
+        ]
+        total_bars = sum(stop - start for start, stop in bounds)
+
+        results: list[BacktestResults] = []
+        done = 0
+        for (slice_start, slice_end), (start, stop) in zip(
+            self.config.slices, bounds, strict=True
+        ):
+            slice_started = time.time()
+            self.position_manager = PositionManager(
+                initial_capital=self.config.initial_capital,
+                commission=self.config.commission,
+                slippage=self.config.slippage,
+            )
+            self.performance_tracker = PerformanceTracker()
+            self.performance_tracker.reserve(stop - start)
+
+            self._simulate(
+                data,
+                start,
+                stop,
+                bridge=bridge,
+                cancellation_token=cancellation_token,
+                progress_offset=done,
+                progress_total=total_bars,
+            )
+            self._force_close_position(data.iloc[:stop])
+            results.append(
+                self._generate_results(
+                    slice_started,
+                    config=replace(
+                        self.config,
+                        start_date=slice_start,
+                        end_date=slice_end,
+                        slices=[],
+                    ),
+                )
+            )
+            done += stop - start
+
+        return SliceBacktestResults(
+            strategy_name=self.strategy_name,
+            symbol=self.config.symbol,
+            timeframe=self.config.timeframe,
+            slices=results,
+            execution_time_seconds=time.time() - execution_start,
+        )
+
+    def _prepare_data(self) -> pd.DataFrame:
+        """Load data and context data, pre-compute features.
+
+        Returns:
+            The base timeframe DataFrame
+        """
         # 1. Load data
         multi_tf_data = self._load_historical_data()
         base_tf = self._get_base_timeframe()
@@ -211,22 +361,61 @@ class BacktestingEngine:
         # 3. Pre-compute features (with context data if available)
         with tracer.start_as_current_span("backtest.feature_compute") as span:
             span.set_attribute("data.rows", len(data))
-            self.feature_cache.compute_all_features(
-                multi_tf_data, context_data=self._context_data
-            )
+            self._compute_features(multi_tf_data)
+        return data
 
-        # 4. Simulate
-        start_idx = (resume_start_bar + 50) if resume_start_bar is not None else 50
-        if start_idx >= len(data):
+    @staticmethod
+    def _slice_bounds(
+        data: pd.DataFrame, start_date: str, end_date: str
+    ) -> tuple[int, int]:
+        """Bar positions [start, stop) of a date slice, after warm-up."""
+        index = pd.DatetimeIndex(data.index)
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date)
+        if index.tz is not None:
+            if start_ts.tz is None:
+                start_ts = start_ts.tz_localize("UTC")
+            if end_ts.tz is None:
+                end_ts = end_ts.tz_localize("UTC")
+        start = max(int(index.searchsorted(start_ts, side="left")), 50)
+        stop = int(index.searchsorted(end_ts, side="right"))
+        if start >= stop:
             raise ValueError(
-                f"Insufficient data for backtesting: {len(data)} bars "
-                f"(need at least {start_idx + 1} for indicator warm-up)"
+                f"Insufficient data for slice {start_date} to {end_date}: "
+                f"no bars after the 50-bar indicator warm-up"
             )
+        return start, stop
+
+    def _simulate(
+        self,
+        data: pd.DataFrame,
+        start_idx: int,
+        stop_idx: int,
+        bridge: Optional[ProgressBridge] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        checkpoint_callback: Optional[Callable[..., None]] = None,
+        progress_offset: int = 0,
+        progress_total: Optional[int] = None,
+    ) -> None:
+        """Simulate bars [start_idx, stop_idx) into the current position state.
+
+        Args:
+            data: Base timeframe DataFrame (features already computed)
+            start_idx: First bar to simulate
+            stop_idx: One past the last bar to simulate
+            bridge: Optional ProgressBridge for async progress tracking
+            cancellation_token: Optional CancellationToken for cancellation
+            checkpoint_callback: Optional callback for periodic checkpoint saves
+            progress_offset: Bars already simulated before this call
+            progress_total: Total bars across calls (default: this call's bars)
+        """
+        if progress_total is None:
+            progress_total = stop_idx - start_idx
         last_signal_time = None
         pending_signal = None
         pending_metadata = None
 
-        for idx in range(start_idx, len(data)):
+        for idx in range(start_idx, stop_idx):
             bar = data.iloc[idx]
             close_price = bar["close"]
             timestamp = cast(pd.Timestamp, bar.name)
@@ -281,15 +470,12 @@ class BacktestingEngine:
                 portfolio_value = self.position_manager.get_portfolio_value(close_price)
 
             # Infrastructure (extracted to focused helpers)
+            done = progress_offset + idx - start_idx
             self._report_progress(
-                idx, start_idx, len(data), timestamp, portfolio_value, bridge
+                done, 0, progress_total, timestamp, portfolio_value, bridge
             )
             self._maybe_checkpoint(idx, start_idx, timestamp, checkpoint_callback)
-            self._check_cancellation(idx, start_idx, len(data), cancellation_token)
-
-        # 5. Force-close and generate results
-        self._force_close_position(data)
-        return self._generate_results(execution_start)
+            self._check_cancellation(done, 0, progress_total, cancellation_token)
 
     # ------------------------------------------------------------------
     # Infrastructure helpers
@@ -415,9 +601,7 @@ class BacktestingEngine:
             self._context_data = self._load_context_data(data)
 
         # 3. Compute features for full range
-        self.feature_cache.compute_all_features(
-            multi_tf_data, context_data=self._context_data
-        )
+        self._compute_features(multi_tf_data)
         logger.info("Feature cache ready")
 
         # 3. Restore portfolio state
@@ -526,6 +710,62 @@ class BacktestingEngine:
                 return list(tf_list)
         return [self.config.timeframe]
 
+    def _compute_features(self, multi_tf_data: dict[str, pd.DataFrame]) -> None:
+        """Pre-compute features, reusing the worker's cached matrix if any."""
+        cache = get_data_cache()
+        key = self._feature_cache_key(multi_tf_data)
+        cached = cache.get(key) if key is not None else None
+        if cached is not None:
+            self.feature_cache.use_precomputed(*cached)
+            return
+
+        self.feature_cache.compute_all_features(
+            multi_tf_data, context_data=self._context_data
+        )
+        computed = self.feature_cache.precomputed()
+        if key is not None and computed is not None:
+            cache.put(key, key[0], self.config.symbol, computed)
+
+    def _feature_cache_key(
+        self, multi_tf_data: dict[str, pd.DataFrame]
+    ) -> Optional[tuple]:
+        """Data cache key of the features for the loaded data, if cacheable.
+
+        Features depend on the data file versions, the date range, the
+        strategy's feature configuration and the model's normalization
+        parameters (fitted per training run). Context data comes from external
+        providers without a file version, so those models are not cached.
+        """
+        if self._context_data or not get_data_cache().enabled:
+            return None
+        if not multi_tf_data or any(
+            tf not in self._data_versions for tf in multi_tf_data
+        ):
+            return None
+
+        strategy_config = self.bundle.strategy_config
+        config_digest = hashlib.sha1(
+            json.dumps(
+                [
+                    strategy_config.model_dump(mode="json"),
+                    list(self.bundle.metadata.resolved_features),
+                    getattr(self.bundle.metadata, "normalization_params", {}),
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        series = (
+            "features",
+            str(self.repository.data_dir),
+            self.config.symbol,
+            config_digest,
+            str(self.config.start_date),
+            str(self.config.end_date),
+        )
+        versions = tuple(sorted((tf, self._data_versions[tf]) for tf in multi_tf_data))
+        return series, versions
+
     def _load_context_data(self, primary_data: pd.DataFrame) -> dict[str, pd.DataFrame]:
         """Load context data from model metadata for backtesting.
 
@@ -623,6 +863,11 @@ class BacktestingEngine:
             span.set_attribute("data.symbol", self.config.symbol)
             span.set_attribute("data.timeframe", self.config.timeframe)
 
+            # Reads go through the worker's data cache, which records the
+            # file versions that feature caching is keyed on
+            repository = get_data_cache().wrap(self.repository)
+            self._data_versions = repository.versions
+
             # Prefer config.get_all_timeframes() (threaded from API) over
             # strategy config extraction — more reliable for multi-TF models
             timeframes = self.config.get_all_timeframes()
@@ -636,7 +881,7 @@ class BacktestingEngine:
                     MultiTimeframeCoordinator,
                 )
 
-                coordinator = MultiTimeframeCoordinator(self.repository)
+                coordinator = MultiTimeframeCoordinator(repository)
                 base_tf = self._get_base_timeframe()
 
                 logger.info(
@@ -655,7 +900,7 @@ class BacktestingEngine:
                 span.set_attribute("data.rows", total_rows)
                 return multi_data
             else:
-                data = self.repository.load_from_cache(
+                data = repository.load_from_cache(
                     symbol=self.config.symbol,
                     timeframe=self.config.timeframe,
                 )
@@ -683,37 +928,37 @@ class BacktestingEngine:
                 span.set_attribute("data.rows", len(data))
                 return {self.config.timeframe: data}
 
-    def _generate_results(self, execution_start: float) -> BacktestResults:
+    def _generate_results(
+        self, execution_start: float, config: Optional[BacktestConfig] = None
+    ) -> BacktestResults:
         """Compile backtest results.
 
         Args:
             execution_start: time.time() when execution started
+            config: Config to report (default: the engine's), e.g. a slice's
 
         Returns:
             BacktestResults object
         """
+        config = config or self.config
         trades = self.position_manager.get_trade_history()
         equity_curve = self.performance_tracker.get_equity_curve()
 
-        start_date = (
-            pd.to_datetime(self.config.start_date) if self.config.start_date else None
-        )
-        end_date = (
-            pd.to_datetime(self.config.end_date) if self.config.end_date else None
-        )
+        start_date = pd.to_datetime(config.start_date) if config.start_date else None
+        end_date = pd.to_datetime(config.end_date) if config.end_date else None
 
         metrics = self.performance_tracker.calculate_metrics(
-            trades=trades,
-            initial_capital=self.config.initial_capital,
+            trades=self.position_manager.trade_history,
+            initial_capital=config.initial_capital,
             start_date=start_date,
             end_date=end_date,
         )
 
         return BacktestResults(
             strategy_name=self.strategy_name,
-            symbol=self.config.symbol,
-            timeframe=self.config.timeframe,
-            config=self.config,
+            symbol=config.symbol,
+            timeframe=config.timeframe,
+            config=config,
             trades=trades,
             metrics=metrics,
             equity_curve=equity_curve,
@@ -3,19 +3,25 @@
 Orchestrates multiple ModelBundles, FeatureCaches, and DecisionFunctions
 with a RegimeRouter to run per-bar: regime classification → routing →
 signal model → position management.
+
+Model inference does not depend on position, so every model's raw output is
+computed for all bars in one batched pass before the simulation. The per-bar
+loop then only replays filters, routing hysteresis and position management.
 """
 
 from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from ktrdr.backtesting.decision_function import DecisionFunction
+from ktrdr.backtesting.decision_function import BatchPrediction, DecisionFunction
 from ktrdr.backtesting.engine import BacktestConfig
 from ktrdr.backtesting.feature_cache import FeatureCache
 from ktrdr.backtesting.model_bundle import ModelBundle
@@ -59,6 +65,21 @@ class EnsembleBacktestResults:
         }
 
 
+@dataclass(frozen=True)
+class PrecomputedOutputs:
+    """One model's batched predictions, addressable by simulated bar offset."""
+
+    batch: BatchPrediction
+    rows: np.ndarray  # bar offset → batch row, -1 where the bar has no features
+
+    def row(self, bar_offset: int) -> int | None:
+        """Batch row for ``bar_offset``, or None if the bar has no features."""
+        if not 0 <= bar_offset < len(self.rows):
+            return None
+        row = int(self.rows[bar_offset])
+        return row if row >= 0 else None
+
+
 class EnsembleBacktestRunner:
     """Orchestrates multi-model backtesting with regime routing.
 
@@ -80,12 +101,24 @@ class EnsembleBacktestRunner:
         self._last_context_date: date | None = None
 
     def _load_models(self) -> dict[str, ModelBundle]:
-        """Load all model bundles referenced in ensemble config."""
-        bundles: dict[str, ModelBundle] = {}
-        for name, model_ref in self.ensemble_config.models.items():
+        """Load all model bundles referenced in ensemble config.
+
+        Members are loaded concurrently; torch releases the GIL while
+        deserializing weights, and the model registry coalesces duplicates.
+        """
+        models = self.ensemble_config.models
+        for name, model_ref in models.items():
             logger.info(f"Loading model '{name}' from {model_ref.model_path}")
-            bundles[name] = ModelBundle.load(model_ref.model_path)
-        return bundles
+        if not models:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=len(models), thread_name_prefix="ensemble-load"
+        ) as pool:
+            futures = {
+                name: pool.submit(ModelBundle.load, model_ref.model_path)
+                for name, model_ref in models.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
 
     def _create_feature_caches(
         self,
@@ -128,9 +161,77 @@ class EnsembleBacktestRunner:
                 feature_names=bundle.feature_names,
                 decisions_config=decisions_config,
                 output_type=output_type,
+                compiled_model=bundle.compiled_model,
             )
         return fns
 
+    def _precompute_outputs(
+        self,
+        timestamps: pd.Index,
+        feature_caches: dict[str, FeatureCache],
+        decision_functions: dict[str, DecisionFunction],
+    ) -> dict[str, PrecomputedOutputs]:
+        """Run every model over all simulated bars in one batched pass.
+
+        A model whose batch pass fails is left out and falls back to
+        per-bar inference in ``_run_bar``.
+
+        Args:
+            timestamps: Timestamps of the simulated bars, in order
+
+        Returns:
+            Dict of model name → precomputed outputs
+        """
+        outputs: dict[str, PrecomputedOutputs] = {}
+        for name, fn in decision_functions.items():
+            try:
+                features, found = feature_caches[name].get_features_for_timestamps(
+                    timestamps
+                )
+                rows = np.full(len(timestamps), -1, dtype=np.int64)
+                rows[found] = np.arange(int(found.sum()))
+                outputs[name] = PrecomputedOutputs(
+                    batch=fn.predict_many(features), rows=rows
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batched inference unavailable for '{name}', "
+                    f"falling back to per-bar: {e}"
+                )
+        return outputs
+
+    def _decide(
+        self,
+        model_name: str,
+        timestamp: pd.Timestamp,
+        bar: pd.Series,
+        position: PositionStatus,
+        feature_caches: dict[str, Any],
+        decision_functions: dict[str, Any],
+        precomputed: dict[str, PrecomputedOutputs] | None,
+        bar_offset: int | None,
+    ) -> Any:
+        """Get one model's decision for a bar, or None if it has no features.
+
+        Uses the model's precomputed batch output when available, otherwise
+        looks up features and runs a single-row forward pass.
+        """
+        outputs = (precomputed or {}).get(model_name)
+        if outputs is not None and bar_offset is not None:
+            row = outputs.row(bar_offset)
+            if row is None:
+                return None
+            return decision_functions[model_name].decide_precomputed(
+                outputs.batch, row, position=position, bar=bar
+            )
+
+        features = feature_caches[model_name].get_features_for_timestamp(timestamp)
+        if features is None:
+            return None
+        return decision_functions[model_name](
+            features=features, position=position, bar=bar
+        )
+
     def _interpret_regime_output(self, decision: Any) -> dict[str, float]:
         """Convert regime DecisionFunction output to regime probabilities.
 
@@ -162,6 +263,8 @@ class EnsembleBacktestRunner:
         decision_functions: dict[str, Any],
         position: PositionStatus,
         bar: pd.Series,
+        precomputed: dict[str, PrecomputedOutputs] | None = None,
+        bar_offset: int | None = None,
     ) -> None:
         """Re-evaluate context model when daily bar closes.
 
@@ -177,15 +280,17 @@ class EnsembleBacktestRunner:
             return  # Same day — use cached context
 
         # New day — re-evaluate context model
-        context_features = feature_caches[context_gate].get_features_for_timestamp(
-            timestamp
+        context_decision = self._decide(
+            context_gate,
+            timestamp,
+            bar,
+            position,
+            feature_caches,
+            decision_functions,
+            precomputed,
+            bar_offset,
         )
-        if context_features is not None:
-            context_decision = decision_functions[context_gate](
-                features=context_features,
-                position=position,
-                bar=bar,
-            )
+        if context_decision is not None:
             self._current_context_probs = self._interpret_context_output(
                 context_decision
             )
@@ -202,9 +307,16 @@ class EnsembleBacktestRunner:
         decision_functions: dict[str, Any],
         router: RegimeRouter,
         position_manager: PositionManager,
+        precomputed: dict[str, PrecomputedOutputs] | None = None,
+        bar_offset: int | None = None,
     ) -> dict[str, Any]:
         """Execute one bar of the ensemble backtest.
 
+        Args:
+            precomputed: Batched model outputs from ``_precompute_outputs``
+            bar_offset: Index of this bar among the simulated bars, used to
+                look up ``precomputed`` rows
+
         Returns:
             Dict with keys: regime, signal, transition, active_model
         """
@@ -217,13 +329,22 @@ class EnsembleBacktestRunner:
             decision_functions=decision_functions,
             position=position_manager.current_position_status,
             bar=bar,
+            precomputed=precomputed,
+            bar_offset=bar_offset,
         )
 
-        # 1. Get regime features and classify
-        regime_features = feature_caches[gate_model_name].get_features_for_timestamp(
-            timestamp
+        # 1. Classify regime
+        regime_decision = self._decide(
+            gate_model_name,
+            timestamp,
+            bar,
+            position_manager.current_position_status,
+            feature_caches,
+            decision_functions,
+            precomputed,
+            bar_offset,
         )
-        if regime_features is None:
+        if regime_decision is None:
             return {
                 "regime": None,
                 "signal": Signal.HOLD,
@@ -231,11 +352,6 @@ class EnsembleBacktestRunner:
                 "active_model": None,
             }
 
-        regime_decision = decision_functions[gate_model_name](
-            features=regime_features,
-            position=position_manager.current_position_status,
-            bar=bar,
-        )
         regime_probs = self._interpret_regime_output(regime_decision)
 
         # 2. Route to signal model (with optional context)
@@ -273,15 +389,17 @@ class EnsembleBacktestRunner:
         # 4. Run signal model (or HOLD for FLAT routes)
         final_signal = Signal.HOLD
         if route.active_model is not None:
-            signal_features = feature_caches[
-                route.active_model
-            ].get_features_for_timestamp(timestamp)
-            if signal_features is not None:
-                signal_decision = decision_functions[route.active_model](
-                    features=signal_features,
-                    position=position_manager.current_position_status,
-                    bar=bar,
-                )
+            signal_decision = self._decide(
+                route.active_model,
+                timestamp,
+                bar,
+                position_manager.current_position_status,
+                feature_caches,
+                decision_functions,
+                precomputed,
+                bar_offset,
+            )
+            if signal_decision is not None:
                 final_signal = signal_decision.signal
 
                 # 5. Apply context-adjusted threshold if modifier present
@@ -384,8 +502,13 @@ class EnsembleBacktestRunner:
             slippage=self.backtest_config.slippage,
         )
 
-        # 6. Per-bar simulation
+        # 6. Batched inference for every model over the simulated bars
         start_idx = 50  # Indicator warm-up
+        precomputed = self._precompute_outputs(
+            data.index[start_idx:], feature_caches, decision_functions
+        )
+
+        # 7. Per-bar simulation (filters, routing and positions only)
         regime_bars: dict[str, int] = dict.fromkeys(REGIME_NAMES, 0)
         regime_trades: dict[str, list[Trade]] = {name: [] for name in REGIME_NAMES}
         transition_count = 0
@@ -402,6 +525,8 @@ class EnsembleBacktestRunner:
                 decision_functions=decision_functions,
                 router=router,
                 position_manager=position_manager,
+                precomputed=precomputed,
+                bar_offset=idx - start_idx,
             )
 
             regime = bar_result.get("regime")
@@ -436,7 +561,7 @@ class EnsembleBacktestRunner:
             # Mark-to-market
             position_manager.update_position(bar["close"], timestamp)
 
-        # 7. Force close any open position
+        # 8. Force close any open position
         if position_manager.current_position_status != PositionStatus.FLAT:
             last_bar = data.iloc[-1]
             close_signal = (
@@ -451,7 +576,7 @@ class EnsembleBacktestRunner:
                 symbol=self.backtest_config.symbol,
             )
 
-        # 8. Build per-regime metrics
+        # 9. Build per-regime metrics
         all_trades = position_manager.get_trade_history()
         per_regime_metrics: dict[str, dict[str, Any]] = {}
         for regime in REGIME_NAMES:
@@ -2,6 +2,7 @@
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 
 from .. import get_logger
@@ -239,6 +240,30 @@ class FeatureCache:
             f"{len(self._cached_features.columns)} features"
         )
 
+    def precomputed(self) -> tuple[pd.DataFrame, pd.Index] | None:
+        """Features and base index from compute_all_features, for reuse.
+
+        Returns:
+            (features, base timeframe index), or None before computation
+        """
+        if self._cached_features is None or self._cached_index is None:
+            return None
+        return self._cached_features, self._cached_index
+
+    def use_precomputed(self, features: pd.DataFrame, index: pd.Index) -> None:
+        """Adopt features computed earlier from the same data and config.
+
+        Args:
+            features: Feature DataFrame from precomputed() (shared, read-only)
+            index: Base timeframe index from precomputed()
+        """
+        self._cached_features = features
+        self._cached_index = index
+        logger.info(
+            f"FeatureCache: Reusing {len(features)} bars x "
+            f"{len(features.columns)} cached features"
+        )
+
     def get_features_for_timestamp(
         self,
         timestamp: pd.Timestamp,
@@ -296,6 +321,31 @@ class FeatureCache:
         start = loc - sequence_length + 1
         return self._cached_features.iloc[start : loc + 1]
 
+    def get_features_for_timestamps(
+        self,
+        timestamps: pd.Index,
+    ) -> tuple[pd.DataFrame, np.ndarray]:
+        """Get pre-computed features for many timestamps at once.
+
+        Batched counterpart of get_features_for_timestamp, for callers that
+        run inference over all bars in one pass.
+
+        Args:
+            timestamps: Target timestamps
+
+        Returns:
+            Tuple of (features for the timestamps that have them, in order;
+            boolean mask over ``timestamps`` marking which ones do)
+        """
+        if not self.is_ready() or self._cached_features is None:
+            return pd.DataFrame(columns=self.expected_features), np.zeros(
+                len(timestamps), dtype=bool
+            )
+
+        positions = self._cached_features.index.get_indexer(timestamps)
+        found = positions >= 0
+        return self._cached_features.iloc[positions[found]], found
+
     def is_ready(self) -> bool:
         """Check if feature cache has pre-computed features.
 
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -22,6 +23,7 @@ from ktrdr.models.model_metadata import ModelMetadata
 if TYPE_CHECKING:
     import torch.nn
 
+    from ktrdr.backtesting.compiled_inference import CompiledMLP
     from ktrdr.config.models import StrategyConfigurationV3
 
 
@@ -226,13 +228,29 @@ class ModelBundle:
     feature_names: list[str]
     strategy_config: StrategyConfigurationV3
 
+    @cached_property
+    def compiled_model(self) -> CompiledMLP | None:
+        """NumPy-compiled fast path for MLP models, or None (LSTM/GRU, ...).
+
+        Compiled once per bundle; since bundles are shared through the model
+        registry, every backtest of the same model reuses the compilation.
+        """
+        from ktrdr.backtesting.compiled_inference import compile_model
+
+        return compile_model(self.model)
+
     @classmethod
-    def load(cls, model_path: str | Path) -> ModelBundle:
+    def load(cls, model_path: str | Path, use_cache: bool = True) -> ModelBundle:
         """Load model artifacts from disk. ONE torch.load, always CPU-safe.
 
+        By default bundles are served from the process-wide ModelRegistry, so
+        repeated backtests of the same model (e.g. evolution fitness slices)
+        share one load. The cached bundle is shared read-only.
+
         Args:
             model_path: Path to model directory containing model.pt,
                 metadata_v3.json, and features.json
+            use_cache: Serve from / populate the process-wide model registry
 
         Returns:
             Frozen ModelBundle with model in eval mode on CPU
@@ -241,6 +259,11 @@ class ModelBundle:
             FileNotFoundError: If model directory or required files don't exist
             RuntimeError: If model loading fails
         """
+        if use_cache:
+            from ktrdr.backtesting.model_registry import get_model_registry
+
+            return get_model_registry().get(model_path)
+
         path = Path(model_path)
 
         if not path.exists():
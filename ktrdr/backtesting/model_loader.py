@@ -124,7 +124,7 @@ class ModelLoader:
             Tuple of (model, metadata)
         """
         # Find all models for this strategy
-        all_models = self.model_storage.list_models(strategy_name)
+        all_models = self.model_storage.list_models(strategy_name, limit=1)
 
         if not all_models:
             raise FileNotFoundError(f"No models found for strategy: {strategy_name}")
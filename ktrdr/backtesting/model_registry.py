@@ -0,0 +1,174 @@
+"""Process-wide registry of loaded ModelBundles.
+
+Every BacktestingEngine construction used to re-read metadata, rebuild the
+architecture and ``torch.load`` the weights. Evolution runs backtest the same
+model over many slices in the same worker, so those loads dominate.
+
+ModelRegistry keeps an LRU cache of frozen bundles keyed by the model
+directory and a fingerprint of its artifact files (mtime + size). A retrained
+model in the same directory changes the fingerprint and is reloaded.
+Concurrent requests for the same model share one in-flight load.
+
+Cached bundles are shared read-only: their models are in eval mode with
+gradients disabled, and callers must not mutate them.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ktrdr.backtesting.model_bundle import ModelBundle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 8
+
+# Files whose change means the bundle on disk is a different model
+_FINGERPRINT_FILES = ("model.pt", "metadata_v3.json", "features.json", "config.json")
+
+_CacheKey = tuple[str, tuple[tuple[str, int, int], ...]]
+
+
+def _fingerprint(path: Path) -> tuple[tuple[str, int, int], ...]:
+    """(name, mtime_ns, size) for each artifact file that exists."""
+    entries = []
+    for name in _FINGERPRINT_FILES:
+        try:
+            stat = (path / name).stat()
+        except FileNotFoundError:
+            continue
+        entries.append((name, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+class ModelRegistry:
+    """Thread-safe LRU cache of ModelBundles keyed by path + file fingerprint."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._bundles: OrderedDict[_CacheKey, ModelBundle] = OrderedDict()
+        self._inflight: dict[_CacheKey, Future[ModelBundle]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, model_path: str | Path) -> ModelBundle:
+        """Return a cached bundle, loading it from disk on a miss.
+
+        Missing directories bypass the cache so ModelBundle's own errors
+        surface unchanged.
+
+        Raises:
+            Whatever ModelBundle loading raises (FileNotFoundError, ...)
+        """
+        from ktrdr.backtesting.model_bundle import ModelBundle
+
+        path = Path(model_path)
+        if not path.is_dir():
+            return ModelBundle.load(path, use_cache=False)
+
+        key: _CacheKey = (str(path.resolve()), _fingerprint(path))
+        with self._lock:
+            bundle = self._bundles.get(key)
+            if bundle is not None:
+                self._bundles.move_to_end(key)
+                self._hits += 1
+                return bundle
+            self._misses += 1
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        assert future is not None
+        if not owner:
+            # Another thread is loading this exact model; share its result
+            return future.result()
+
+        try:
+            bundle = ModelBundle.load(path, use_cache=False)
+            _freeze(bundle.model)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._store(key, bundle)
+        future.set_result(bundle)
+        logger.info(f"Model registry loaded {path} ({len(self._bundles)} cached)")
+        return bundle
+
+    def invalidate(self, model_path: str | Path | None = None) -> int:
+        """Drop cached bundles for one model directory, or all of them.
+
+        Returns:
+            Number of bundles dropped
+        """
+        with self._lock:
+            if model_path is None:
+                dropped = len(self._bundles)
+                self._bundles.clear()
+                return dropped
+            resolved = str(Path(model_path).resolve())
+            keys = [key for key in self._bundles if key[0] == resolved]
+            for key in keys:
+                del self._bundles[key]
+            return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics for logging and health endpoints."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._bundles),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _store(self, key: _CacheKey, bundle: ModelBundle) -> None:
+        # Older fingerprints of the same directory are stale, not just cold
+        for stale in [k for k in self._bundles if k[0] == key[0]]:
+            del self._bundles[stale]
+        self._bundles[key] = bundle
+        while len(self._bundles) > self.max_entries:
+            self._bundles.popitem(last=False)
+            self._evictions += 1
+
+
+def _freeze(model: Any) -> None:
+    """Disable gradients so a shared model can't accumulate state."""
+    parameters = getattr(model, "parameters", None)
+    if parameters is None:
+        return
+    for param in parameters():
+        param.requires_grad_(False)
+
+
+_registry: ModelRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
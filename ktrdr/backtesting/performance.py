@@ -1,14 +1,15 @@
 """Performance analytics for backtesting system."""
 
 import math
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
 
 from .. import get_logger
-from .position_manager import PositionStatus, Trade
+from .position_manager import PositionStatus, Trade, TradeLedger
 
 logger = get_logger(__name__)
 
@@ -103,17 +104,258 @@ class PerformanceMetrics:
         }
 
 
+class EquityCurve:
+    """Columnar equity curve: one preallocated NumPy array per field.
+
+    Rows are appended once per bar, so the arrays grow geometrically and can
+    be sized up front with ``reserve``. Indexing and iteration still yield
+    ``{timestamp, price, portfolio_value, position}`` dicts for callers that
+    treat the curve as a list of points (checkpointing, resume).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """Initialize an empty curve.
+
+        Args:
+            capacity: Initial number of rows to preallocate
+        """
+        capacity = max(capacity, 1)
+        self._length = 0
+        self._timestamps = np.empty(capacity, dtype="datetime64[ns]")
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._equity = np.empty(capacity, dtype=np.float64)
+        self._positions = np.empty(capacity, dtype=np.int8)
+        self._position_labels: list[str] = [s.value for s in PositionStatus]
+        self._position_codes = {
+            label: code for code, label in enumerate(self._position_labels)
+        }
+        self._tz: Any = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, Any]]) -> "EquityCurve":
+        """Build a curve from equity points.
+
+        Accepts full points as well as checkpoint equity samples
+        (``{bar_index, equity}``), which have no timestamp, price or position.
+        """
+        rows = list(rows)
+        curve = cls(len(rows))
+        for row in rows:
+            curve.append(
+                row.get("timestamp"),
+                row.get("price", np.nan),
+                row["portfolio_value"] if "portfolio_value" in row else row["equity"],
+                row.get("position", PositionStatus.FLAT),
+            )
+        return curve
+
+    def reserve(self, additional: int) -> None:
+        """Ensure room for ``additional`` more rows without reallocating."""
+        needed = self._length + additional
+        if needed > len(self._equity):
+            self._resize(needed)
+
+    def _resize(self, capacity: int) -> None:
+        n = self._length
+        for name in ("_timestamps", "_prices", "_equity", "_positions"):
+            old = getattr(self, name)
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:n] = old[:n]
+            setattr(self, name, grown)
+
+    def append(
+        self,
+        timestamp: Any,
+        price: float,
+        portfolio_value: float,
+        position: Any,
+    ) -> None:
+        """Append one equity point."""
+        n = self._length
+        if n == len(self._equity):
+            self._resize(2 * n)
+
+        if timestamp is None:
+            self._timestamps[n] = np.datetime64("NaT")
+        else:
+            ts = pd.Timestamp(timestamp)
+            if ts.tzinfo is not None and self._tz is None:
+                self._tz = ts.tzinfo
+            # Timestamp.value is UTC nanoseconds for tz-aware timestamps
+            self._timestamps[n] = ts.value
+
+        label = position.value if hasattr(position, "value") else str(position)
+        code = self._position_codes.get(label)
+        if code is None:
+            code = len(self._position_labels)
+            self._position_labels.append(label)
+            self._position_codes[label] = code
+
+        self._prices[n] = price
+        self._equity[n] = portfolio_value
+        self._positions[n] = code
+        self._length = n + 1
+
+    def clear(self) -> None:
+        self._length = 0
+        self._tz = None
+
+    @property
+    def equity(self) -> np.ndarray:
+        """Portfolio value per bar (read-only view)."""
+        return self._view(self._equity)
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Market price per bar (read-only view)."""
+        return self._view(self._prices)
+
+    @property
+    def position_codes(self) -> np.ndarray:
+        """Position code per bar; decode with ``position_labels`` (read-only)."""
+        return self._view(self._positions)
+
+    @property
+    def position_labels(self) -> list[str]:
+        return list(self._position_labels)
+
+    def timestamp_index(self) -> pd.DatetimeIndex:
+        """Bar timestamps, in the timezone they were recorded in."""
+        index = pd.DatetimeIndex(self._timestamps[: self._length], name="timestamp")
+        if self._tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self._tz)
+        return index
+
+    def _view(self, column: np.ndarray) -> np.ndarray:
+        view = column[: self._length]
+        view.flags.writeable = False
+        return view
+
+    def to_frame(self) -> pd.DataFrame:
+        """Convert to a DataFrame indexed by timestamp."""
+        labels = np.array(self._position_labels, dtype=object)
+        return pd.DataFrame(
+            {
+                "price": self._prices[: self._length].copy(),
+                "portfolio_value": self._equity[: self._length].copy(),
+                "position": labels[self._positions[: self._length]],
+            },
+            index=self.timestamp_index(),
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("equity curve index out of range")
+        timestamp = self._timestamps[index]
+        if np.isnat(timestamp):
+            ts = pd.NaT
+        else:
+            ts = pd.Timestamp(timestamp)
+            if self._tz is not None:
+                ts = ts.tz_localize("UTC").tz_convert(self._tz)
+        return {
+            "timestamp": ts,
+            "price": float(self._prices[index]),
+            "portfolio_value": float(self._equity[index]),
+            "position": self._position_labels[self._positions[index]],
+        }
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(self._length):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"EquityCurve({self._length} points)"
+
+
 class PerformanceTracker:
-    """Track and calculate performance metrics during backtesting."""
+    """Track and calculate performance metrics during backtesting.
 
-    def __init__(self):
-        """Initialize performance tracker."""
-        self.equity_curve: list[dict[str, Any]] = []
-        self.daily_returns: list[float] = []
-        self.peak_equity = 0.0
-        self.current_drawdown = 0.0
-        self.max_drawdown = 0.0
-        self.last_equity = 0.0
+    Each bar is written into a columnar ``EquityCurve``; returns, drawdown
+    and the risk ratios are computed from its arrays on demand rather than
+    accumulated per bar.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """Initialize performance tracker.
+
+        Args:
+            capacity: Number of bars to preallocate (grown as needed)
+        """
+        self._curve = EquityCurve(capacity)
+        # Restored checkpoint samples precede this index; returns and
+        # drawdown are tracked only from the bars simulated in this run.
+        self._live_start = 0
+        self._drawdown_cache: Optional[tuple[int, float, float, float]] = None
+
+    @property
+    def equity_curve(self) -> EquityCurve:
+        """Recorded equity points (list-like, backed by NumPy columns)."""
+        return self._curve
+
+    @equity_curve.setter
+    def equity_curve(self, rows: Iterable[dict[str, Any]]) -> None:
+        self._curve = EquityCurve.from_rows(rows)
+        self._live_start = len(self._curve)
+        self._drawdown_cache = None
+
+    def reserve(self, bars: int) -> None:
+        """Preallocate room for ``bars`` more updates."""
+        self._curve.reserve(bars)
+
+    def _live_equity(self) -> np.ndarray:
+        return self._curve.equity[self._live_start :]
+
+    @property
+    def daily_returns(self) -> np.ndarray:
+        """Bar-over-bar returns (skipping bars after a non-positive value)."""
+        equity = self._live_equity()
+        previous = equity[:-1]
+        valid = previous > 0
+        return (equity[1:][valid] - previous[valid]) / previous[valid]
+
+    def _drawdown_state(self) -> tuple[float, float, float]:
+        """Compute (peak_equity, current_drawdown, max_drawdown), cached per length."""
+        length = len(self._curve)
+        if self._drawdown_cache is not None and self._drawdown_cache[0] == length:
+            return self._drawdown_cache[1:]
+
+        equity = self._live_equity()
+        if len(equity) == 0:
+            state = (0.0, 0.0, 0.0)
+        else:
+            peak = np.maximum(np.maximum.accumulate(equity), 0.0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                drawdown = np.where(peak > 0, (peak - equity) / peak, 0.0)
+            state = (
+                float(peak[-1]),
+                float(drawdown[-1]),
+                max(0.0, float(drawdown.max())),
+            )
+        self._drawdown_cache = (length, *state)
+        return state
+
+    @property
+    def peak_equity(self) -> float:
+        return self._drawdown_state()[0]
+
+    @property
+    def current_drawdown(self) -> float:
+        return self._drawdown_state()[1]
+
+    @property
+    def max_drawdown(self) -> float:
+        return self._drawdown_state()[2]
+
+    @property
+    def last_equity(self) -> float:
+        equity = self._live_equity()
+        return float(equity[-1]) if len(equity) else 0.0
 
     def update(
         self,
@@ -130,56 +372,11 @@ class PerformanceTracker:
             portfolio_value: Current total portfolio value
             position: Current position status
         """
-        # Record equity curve point
-        equity_point = {
-            "timestamp": timestamp,
-            "price": price,
-            "portfolio_value": portfolio_value,
-            "position": position.value if hasattr(position, "value") else str(position),
-        }
-        self.equity_curve.append(equity_point)
-
-        # Calculate daily return
-        if self.last_equity > 0:
-            daily_return = (portfolio_value - self.last_equity) / self.last_equity
-            self.daily_returns.append(daily_return)
-
-        # Update drawdown tracking
-        if portfolio_value > self.peak_equity:
-            self.peak_equity = portfolio_value
-            self.current_drawdown = 0.0
-        else:
-            self.current_drawdown = (
-                self.peak_equity - portfolio_value
-            ) / self.peak_equity
-
-            # CRITICAL DEBUG: Check for impossible drawdown values
-            if self.current_drawdown > 1.0:
-                logger.error(
-                    f"🚨 IMPOSSIBLE DRAWDOWN: {self.current_drawdown:.4f} ({self.current_drawdown * 100:.1f}%)"
-                )
-                logger.error(f"   Peak equity: ${self.peak_equity:,.2f}")
-                logger.error(f"   Current portfolio: ${portfolio_value:,.2f}")
-                logger.error(
-                    f"   Difference: ${self.peak_equity - portfolio_value:,.2f}"
-                )
-
-            self.max_drawdown = max(self.max_drawdown, self.current_drawdown)
-
-            # CRITICAL DEBUG: Log when max drawdown updates
-            if (
-                self.current_drawdown == self.max_drawdown
-                and self.current_drawdown > 0.1
-            ):
-                logger.warning(
-                    f"📉 New max drawdown: {self.max_drawdown:.4f} ({self.max_drawdown * 100:.1f}%) at portfolio ${portfolio_value:,.2f}"
-                )
-
-        self.last_equity = portfolio_value
+        self._curve.append(timestamp, price, portfolio_value, position)
 
     def calculate_metrics(
         self,
-        trades: list[Trade],
+        trades: Union[Sequence[Trade], TradeLedger],
         initial_capital: float,
         start_date: Optional[pd.Timestamp] = None,
         end_date: Optional[pd.Timestamp] = None,
@@ -187,7 +384,7 @@ class PerformanceTracker:
         """Calculate comprehensive performance metrics.
 
         Args:
-            trades: List of completed trades
+            trades: Completed trades (a TradeLedger avoids rebuilding columns)
             initial_capital: Initial capital amount
             start_date: Backtest start date
             end_date: Backtest end date
@@ -195,12 +392,12 @@ class PerformanceTracker:
         Returns:
             PerformanceMetrics object
         """
-        if not self.equity_curve:
+        if not len(self._curve):
             # Return zero metrics if no data
             return self._zero_metrics()
 
         # Basic return metrics
-        final_equity = self.equity_curve[-1]["portfolio_value"]
+        final_equity = float(self._curve.equity[-1])
         total_return = final_equity - initial_capital
         total_return_pct = total_return / initial_capital  # Return as decimal 0-1
 
@@ -209,7 +406,7 @@ class PerformanceTracker:
             days = (end_date - start_date).days
             years = days / 365.25
         else:
-            years = len(self.equity_curve) / (252 * 6.5)  # Assume 6.5 hour trading day
+            years = len(self._curve) / (252 * 6.5)  # Assume 6.5 hour trading day
 
         annualized_return = (
             ((final_equity / initial_capital) ** (1 / max(years, 0.001)) - 1)
@@ -218,10 +415,11 @@ class PerformanceTracker:
         )  # Return as decimal 0-1
 
         # Volatility and Sharpe ratio with safe calculation
-        if len(self.daily_returns) > 1:
-            volatility = np.std(self.daily_returns) * np.sqrt(252)  # Annualized
-            avg_return = np.mean(self.daily_returns)
-            returns_std = np.std(self.daily_returns)
+        returns = self.daily_returns
+        if len(returns) > 1:
+            returns_std = float(np.std(returns))
+            volatility = returns_std * np.sqrt(252)  # Annualized
+            avg_return = float(np.mean(returns))
 
             if returns_std > 1e-10:  # Avoid division by near-zero values
                 sharpe_ratio = (avg_return / returns_std) * np.sqrt(252)
@@ -233,21 +431,22 @@ class PerformanceTracker:
             volatility = 0.0
             sharpe_ratio = 0.0
 
-        # Trade analysis
-        if trades:
-            winning_trades = [t for t in trades if t.net_pnl > 0]
-            losing_trades = [t for t in trades if t.net_pnl < 0]
+        # Trade analysis (vectorized over the ledger's columns)
+        ledger = trades if isinstance(trades, TradeLedger) else TradeLedger(trades)
+        if len(ledger):
+            pnl = ledger.net_pnl
+            holding = ledger.holding_period_hours
+            wins = pnl > 0
+            losses = pnl < 0
 
-            total_trades = len(trades)
-            win_count = len(winning_trades)
-            loss_count = len(losing_trades)
-            win_rate = (
-                (win_count / total_trades) if total_trades > 0 else 0
-            )  # Return as decimal 0-1
+            total_trades = len(ledger)
+            win_count = int(wins.sum())
+            loss_count = int(losses.sum())
+            win_rate = win_count / total_trades  # Return as decimal 0-1
 
             # P&L metrics
-            total_wins = sum(t.net_pnl for t in winning_trades)
-            total_losses = abs(sum(t.net_pnl for t in losing_trades))
+            total_wins = float(pnl[wins].sum())
+            total_losses = abs(float(pnl[losses].sum()))
             # Calculate profit factor with safe maximum value instead of infinity
             if total_losses > 0:
                 profit_factor = total_wins / total_losses
@@ -258,36 +457,16 @@ class PerformanceTracker:
             else:
                 profit_factor = 0.0
 
-            avg_win = (
-                float(np.mean([t.net_pnl for t in winning_trades]))
-                if winning_trades
-                else 0.0
-            )
-            avg_loss = (
-                float(np.mean([t.net_pnl for t in losing_trades]))
-                if losing_trades
-                else 0.0
-            )
-            largest_win = (
-                max([t.net_pnl for t in winning_trades]) if winning_trades else 0
-            )
-            largest_loss = (
-                min([t.net_pnl for t in losing_trades]) if losing_trades else 0
-            )
+            avg_win = float(pnl[wins].mean()) if win_count else 0.0
+            avg_loss = float(pnl[losses].mean()) if loss_count else 0.0
+            largest_win = float(pnl[wins].max()) if win_count else 0.0
+            largest_loss = float(pnl[losses].min()) if loss_count else 0.0
 
             # Holding period analysis
-            avg_holding_period = float(
-                np.mean([t.holding_period_hours for t in trades])
-            )
-            avg_win_holding_period = (
-                float(np.mean([t.holding_period_hours for t in winning_trades]))
-                if winning_trades
-                else 0.0
-            )
+            avg_holding_period = float(holding.mean())
+            avg_win_holding_period = float(holding[wins].mean()) if win_count else 0.0
             avg_loss_holding_period = (
-                float(np.mean([t.holding_period_hours for t in losing_trades]))
-                if losing_trades
-                else 0.0
+                float(holding[losses].mean()) if loss_count else 0.0
             )
         else:
             total_trades = win_count = loss_count = 0
@@ -296,13 +475,14 @@ class PerformanceTracker:
             avg_holding_period = avg_win_holding_period = avg_loss_holding_period = 0.0
 
         # Max drawdown in absolute terms
-        max_drawdown_abs = self.max_drawdown * self.peak_equity
-        max_drawdown_pct = self.max_drawdown  # Already as decimal 0-1
+        peak_equity, _, max_drawdown = self._drawdown_state()
+        max_drawdown_abs = max_drawdown * peak_equity
+        max_drawdown_pct = max_drawdown  # Already as decimal 0-1
 
         # CRITICAL DEBUG: Check for corrupted values
         logger.info("📊 Final metrics calculation:")
-        logger.info(f"   self.max_drawdown: {self.max_drawdown:.6f}")
-        logger.info(f"   self.peak_equity: ${self.peak_equity:,.2f}")
+        logger.info(f"   self.max_drawdown: {max_drawdown:.6f}")
+        logger.info(f"   self.peak_equity: ${peak_equity:,.2f}")
         logger.info(f"   max_drawdown_abs: ${max_drawdown_abs:,.2f}")
         logger.info(
             f"   max_drawdown_pct: {max_drawdown_pct:.6f} ({max_drawdown_pct * 100:.2f}%)"
@@ -312,8 +492,8 @@ class PerformanceTracker:
             logger.error(
                 f"🚨 IMPOSSIBLE: max_drawdown_pct {max_drawdown_pct:.6f} > 1.0!"
             )
-        if self.peak_equity <= 0:
-            logger.error(f"🚨 IMPOSSIBLE: peak_equity ${self.peak_equity:,.2f} <= 0!")
+        if peak_equity <= 0:
+            logger.error(f"🚨 IMPOSSIBLE: peak_equity ${peak_equity:,.2f} <= 0!")
         if max_drawdown_abs < 0:
             logger.error(
                 f"🚨 IMPOSSIBLE: max_drawdown_abs ${max_drawdown_abs:,.2f} < 0!"
@@ -328,10 +508,10 @@ class PerformanceTracker:
             calmar_ratio = 0.0
 
         # Sortino ratio (downside deviation) with safe calculation
-        negative_returns = [r for r in self.daily_returns if r < 0]
-        downside_std = np.std(negative_returns) if negative_returns else 0
+        negative_returns = returns[returns < 0]
+        downside_std = float(np.std(negative_returns)) if len(negative_returns) else 0
         if downside_std > 1e-10:  # Avoid division by near-zero values
-            sortino_ratio = (np.mean(self.daily_returns) / downside_std) * np.sqrt(252)
+            sortino_ratio = (float(np.mean(returns)) / downside_std) * np.sqrt(252)
             # Cap extreme values to prevent JSON serialization issues
             sortino_ratio = max(-999999.0, min(999999.0, sortino_ratio))
         else:
@@ -376,12 +556,10 @@ class PerformanceTracker:
         Returns:
             DataFrame with timestamp, price, portfolio_value, position columns
         """
-        if not self.equity_curve:
+        if not len(self._curve):
             return pd.DataFrame()
 
-        df = pd.DataFrame(self.equity_curve)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        return df.set_index("timestamp")
+        return self._curve.to_frame()
 
     def get_drawdown_series(self) -> pd.Series:
         """Get drawdown series.
@@ -389,13 +567,18 @@ class PerformanceTracker:
         Returns:
             Series with drawdown percentages over time
         """
-        if not self.equity_curve:
+        if not len(self._curve):
             return pd.Series()
 
-        equity_df = self.get_equity_curve()
-        peak = equity_df["portfolio_value"].expanding().max()
-        drawdown = (equity_df["portfolio_value"] - peak) / peak
-        return drawdown
+        equity = self._curve.equity
+        peak = np.maximum.accumulate(equity)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdown = (equity - peak) / peak
+        return pd.Series(
+            drawdown,
+            index=self._curve.timestamp_index(),
+            name="portfolio_value",
+        )
 
     def get_rolling_returns(self, window: int = 30) -> pd.Series:
         """Get rolling returns over specified window.
@@ -406,7 +589,7 @@ class PerformanceTracker:
         Returns:
             Series with rolling returns
         """
-        if not self.equity_curve:
+        if not len(self._curve):
             return pd.Series()
 
         equity_df = self.get_equity_curve()
@@ -443,9 +626,6 @@ class PerformanceTracker:
 
     def reset(self):
         """Reset performance tracker."""
-        self.equity_curve.clear()
-        self.daily_returns.clear()
-        self.peak_equity = 0.0
-        self.current_drawdown = 0.0
-        self.max_drawdown = 0.0
-        self.last_equity = 0.0
+        self._curve.clear()
+        self._live_start = 0
+        self._drawdown_cache = None
@@ -1,9 +1,11 @@
 """Position management for backtesting system."""
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from .. import get_logger
@@ -97,6 +99,102 @@ class Trade:
         return (self.net_pnl / (self.entry_price * self.quantity)) * 100
 
 
+class TradeLedger:
+    """Completed trades with a struct-of-arrays view of their numeric fields.
+
+    Behaves like a list of Trade objects (len, iteration, indexing), while
+    keeping each numeric field in a preallocated NumPy column so per-trade
+    statistics can be computed without iterating Trade objects.
+    """
+
+    COLUMNS = (
+        "entry_price",
+        "exit_price",
+        "quantity",
+        "gross_pnl",
+        "commission",
+        "slippage",
+        "net_pnl",
+        "holding_period_hours",
+        "max_favorable_excursion",
+        "max_adverse_excursion",
+    )
+
+    def __init__(self, trades: Iterable[Trade] = (), capacity: int = 64):
+        """Initialize the ledger.
+
+        Args:
+            trades: Initial trades
+            capacity: Initial number of rows to preallocate
+        """
+        self._trades: list[Trade] = []
+        self._columns = {
+            name: np.empty(max(capacity, 1), dtype=np.float64) for name in self.COLUMNS
+        }
+        self.extend(trades)
+
+    def append(self, trade: Trade) -> None:
+        """Add a completed trade."""
+        n = len(self._trades)
+        if n == len(self._columns["net_pnl"]):
+            self._grow(2 * n)
+        for name, column in self._columns.items():
+            column[n] = getattr(trade, name)
+        self._trades.append(trade)
+
+    def extend(self, trades: Iterable[Trade]) -> None:
+        for trade in trades:
+            self.append(trade)
+
+    def _grow(self, capacity: int) -> None:
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[: len(column)] = column
+            self._columns[name] = grown
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a read-only view of a numeric column (one value per trade)."""
+        view = self._columns[name][: len(self._trades)]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def net_pnl(self) -> np.ndarray:
+        return self.column("net_pnl")
+
+    @property
+    def holding_period_hours(self) -> np.ndarray:
+        return self.column("holding_period_hours")
+
+    def copy(self) -> list[Trade]:
+        """Get the trades as a plain list."""
+        return self._trades.copy()
+
+    def clear(self) -> None:
+        self._trades.clear()
+
+    def __len__(self) -> int:
+        return len(self._trades)
+
+    def __iter__(self) -> Iterator[Trade]:
+        return iter(self._trades)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Trade, list[Trade]]:
+        return self._trades[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TradeLedger):
+            return self._trades == other._trades
+        if isinstance(other, list):
+            return self._trades == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TradeLedger({len(self._trades)} trades)"
+
+
 class PositionManager:
     """Manages positions and trade execution with detailed tracking."""
 
@@ -119,9 +217,18 @@ class PositionManager:
         self.slippage = slippage
 
         self.current_position: Optional[Position] = None
-        self.trade_history: list[Trade] = []
+        self._trade_ledger = TradeLedger()
         self.next_trade_id = 1
 
+    @property
+    def trade_history(self) -> TradeLedger:
+        """Completed trades (list-like, with columnar numeric fields)."""
+        return self._trade_ledger
+
+    @trade_history.setter
+    def trade_history(self, trades: Iterable[Trade]) -> None:
+        self._trade_ledger = TradeLedger(trades)
+
     @property
     def current_position_status(self) -> PositionStatus:
         """Get current position status."""
@@ -650,7 +757,7 @@ class PositionManager:
         Returns:
             List of completed trades
         """
-        return self.trade_history.copy()
+        return self._trade_ledger.copy()
 
     def get_position_summary(self) -> dict[str, Any]:
         """Get current position summary.
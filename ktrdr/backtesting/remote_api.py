@@ -342,6 +342,7 @@ async def list_operations(
             active_only=active_only,
             limit=limit,
             offset=offset,
+            cached_only=True,
         )
 
         return {
@@ -5,6 +5,11 @@ policies for determining when checkpoints should be created,
 and schemas for training checkpoint state.
 """
 
+from ktrdr.checkpoint.artifact_store import (
+    ArtifactHandle,
+    CheckpointArtifacts,
+    ChunkedArtifactStore,
+)
 from ktrdr.checkpoint.checkpoint_policy import CheckpointPolicy
 from ktrdr.checkpoint.checkpoint_service import (
     CheckpointCorruptedError,
@@ -12,17 +17,22 @@ from ktrdr.checkpoint.checkpoint_service import (
     CheckpointService,
     CheckpointSummary,
 )
+from ktrdr.checkpoint.checkpoint_writer import BackgroundCheckpointWriter
 from ktrdr.checkpoint.schemas import (
     TRAINING_ARTIFACTS,
     TrainingCheckpointState,
 )
 
 __all__ = [
+    "ArtifactHandle",
+    "BackgroundCheckpointWriter",
+    "CheckpointArtifacts",
     "CheckpointCorruptedError",
     "CheckpointData",
     "CheckpointPolicy",
     "CheckpointService",
     "CheckpointSummary",
+    "ChunkedArtifactStore",
     "TRAINING_ARTIFACTS",
     "TrainingCheckpointState",
 ]
@@ -0,0 +1,471 @@
+"""Content-addressed, chunked storage for checkpoint artifacts.
+
+A training checkpoint is a handful of large artifacts (model, optimizer,
+scheduler and best-model state). Rewriting all of them on every checkpoint
+writes hundreds of MB per save, even when most of the bytes did not change:
+the best-model state is often the same as in the previous checkpoint, and
+frozen or slowly changing tensors serialize to the same bytes.
+
+Each artifact is split into fixed-size chunks named by a hash of their
+content. torch.save lays out tensor storages at stable, aligned offsets, so
+unchanged tensors produce unchanged chunks. A checkpoint directory holds:
+
+    {operation_id}/
+        manifest.json          artifact name -> ordered chunk names + size
+        chunks/{hash}[.codec]  chunk files, shared by successive checkpoints
+
+Saving writes only the chunks that are not already present, then atomically
+replaces manifest.json, then removes chunks no longer referenced. Chunks can
+optionally be compressed (zlib from the standard library; zstd and lz4 when
+the zstandard / lz4 packages are installed). A chunk is stored compressed
+only when that makes it smaller.
+
+Directories without a manifest (checkpoints written before this format) are
+read as one file per artifact.
+
+open() returns CheckpointArtifacts, which reads only the manifest. Each
+artifact is read when accessed, and ArtifactHandle.torch_load() streams it
+into torch.load chunk by chunk, or memory-maps it when the artifact is a
+single uncompressed file, so restoring never holds a second copy of the
+weights as bytes.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import zlib
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+CHUNKS_DIRNAME = "chunks"
+MANIFEST_VERSION = 1
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Codec name -> chunk file suffix
+COMPRESSION_CODECS = {"none": "", "zlib": ".zlib", "zstd": ".zst", "lz4": ".lz4"}
+
+# Writes to one directory must not interleave (a write removes the chunks the
+# other has not referenced yet). Striped so the lock set stays bounded.
+_DIRECTORY_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+
+def _directory_lock(directory: Path) -> threading.Lock:
+    return _DIRECTORY_LOCKS[hash(str(directory)) % len(_DIRECTORY_LOCKS)]
+
+
+@dataclass
+class ArtifactWriteStats:
+    """What a checkpoint write actually put on disk."""
+
+    total_bytes: int = 0
+    chunks: int = 0
+    chunks_written: int = 0
+    bytes_written: int = 0
+    chunks_removed: int = 0
+
+    @property
+    def chunks_reused(self) -> int:
+        return self.chunks - self.chunks_written
+
+
+def _load_codec(
+    name: str,
+) -> Optional[tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    """Return (compress, decompress) for a codec, or None if unavailable."""
+    if name == "zlib":
+        return (lambda data: zlib.compress(data, 1)), zlib.decompress
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            return None
+        return (
+            zstandard.ZstdCompressor(level=1).compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    if name == "lz4":
+        try:
+            import lz4.frame
+        except ImportError:
+            return None
+        return lz4.frame.compress, lz4.frame.decompress
+    return None
+
+
+class ArtifactHandle:
+    """One stored artifact, read only when asked for.
+
+    Chunk files are never modified, but the next checkpoint write of the
+    same operation removes the chunks it no longer references: read what
+    is needed before the operation checkpoints again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        files: list[Path],
+        chunk_size: Optional[int] = None,
+    ):
+        """Initialize the handle.
+
+        Args:
+            name: Artifact name (e.g. "model.pt").
+            size: Artifact size in bytes.
+            files: Chunk files in order, or the single legacy file.
+            chunk_size: Bytes per chunk; None for a legacy (unchunked) file.
+        """
+        self.name = name
+        self.size = size
+        self._files = files
+        self._chunk_size = chunk_size
+
+    @property
+    def chunked(self) -> bool:
+        """Whether the artifact is stored as content-addressed chunks."""
+        return self._chunk_size is not None
+
+    def read_bytes(self) -> bytes:
+        """Read (and verify) the whole artifact."""
+        if not self.chunked:
+            return self._files[0].read_bytes()
+        data = b"".join(_decode_chunk(path) for path in self._files)
+        if len(data) != self.size:
+            raise ValueError(
+                f"Artifact {self.name} is {len(data)} bytes, expected {self.size}"
+            )
+        return data
+
+    def open(self) -> BinaryIO:
+        """Open a seekable stream that decodes one chunk at a time."""
+        if not self.chunked:
+            return open(self._files[0], "rb")
+        return io.BufferedReader(_ChunkStream(self))
+
+    def local_path(self) -> Optional[Path]:
+        """File holding exactly this artifact's bytes, if there is one.
+
+        True for legacy files and for artifacts stored as one uncompressed
+        chunk. Such a file can be memory-mapped. The chunk's hash is not
+        checked here.
+        """
+        if not self.chunked:
+            return self._files[0]
+        if len(self._files) == 1 and "." not in self._files[0].name:
+            return self._files[0]
+        return None
+
+    def torch_load(
+        self,
+        map_location: Any = None,
+        weights_only: bool = True,
+        mmap: bool = True,
+    ) -> Any:
+        """Load the artifact with torch.load without reading it into memory.
+
+        Args:
+            map_location: Passed to torch.load.
+            weights_only: Passed to torch.load.
+            mmap: Memory-map the artifact's file when it has one.
+
+        Returns:
+            The deserialized object.
+        """
+        import torch
+
+        path = self.local_path() if mmap else None
+        if path is not None:
+            if self.chunked:
+                _verify_chunk_file(path)
+            return torch.load(
+                path, map_location=map_location, weights_only=weights_only, mmap=True
+            )
+        with self.open() as stream:
+            return torch.load(
+                stream, map_location=map_location, weights_only=weights_only
+            )
+
+    def _read_chunk(self, index: int) -> bytes:
+        return _decode_chunk(self._files[index])
+
+
+class _ChunkStream(io.RawIOBase):
+    """Seekable raw stream over the chunks of one artifact."""
+
+    def __init__(self, handle: ArtifactHandle):
+        self._handle = handle
+        self._chunk_size: int = handle._chunk_size or 1
+        self._pos = 0
+        self._index = -1
+        self._chunk = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        else:
+            pos = self._handle.size + offset
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer: Any) -> int:
+        if self._pos >= self._handle.size:
+            return 0
+        index, start = divmod(self._pos, self._chunk_size)
+        if index != self._index:
+            self._chunk = self._handle._read_chunk(index)
+            self._index = index
+        count = min(len(buffer), len(self._chunk) - start)
+        buffer[:count] = self._chunk[start : start + count]
+        self._pos += count
+        return count
+
+
+class CheckpointArtifacts(Mapping[str, bytes]):
+    """Artifacts of one checkpoint, read on access.
+
+    Behaves like the dict of artifact bytes that checkpoints used to load
+    eagerly; handle() gives access to an artifact without reading it.
+    """
+
+    def __init__(self, directory: Path, handles: dict[str, ArtifactHandle]):
+        self.directory = directory
+        self._handles = handles
+
+    def handle(self, name: str) -> ArtifactHandle:
+        """Return the handle of an artifact (KeyError if absent)."""
+        return self._handles[name]
+
+    def size(self, name: str) -> int:
+        """Return the size of an artifact without reading it."""
+        return self._handles[name].size
+
+    def __getitem__(self, name: str) -> bytes:
+        return self._handles[name].read_bytes()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._handles
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._handles)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __repr__(self) -> str:
+        sizes = {name: handle.size for name, handle in self._handles.items()}
+        return f"CheckpointArtifacts({self.directory}, {sizes})"
+
+
+class ChunkedArtifactStore:
+    """Reads and writes checkpoint artifact directories."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, compression: str = "none"):
+        """Initialize the store.
+
+        Args:
+            chunk_size: Bytes per chunk.
+            compression: One of COMPRESSION_CODECS. Falls back to "none"
+                (with a warning) if the codec's package is not installed.
+        """
+        if compression not in COMPRESSION_CODECS:
+            raise ValueError(
+                f"Compression must be one of {list(COMPRESSION_CODECS)}, "
+                f"got '{compression}'"
+            )
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self._compress: Optional[Callable[[bytes], bytes]] = None
+        if compression != "none":
+            codec = _load_codec(compression)
+            if codec is None:
+                logger.warning(
+                    f"Checkpoint compression '{compression}' is not available "
+                    "(package not installed), storing chunks uncompressed"
+                )
+                self.compression = "none"
+            else:
+                self._compress = codec[0]
+
+    def write(self, directory: Path, artifacts: dict[str, bytes]) -> ArtifactWriteStats:
+        """Write artifacts into a checkpoint directory, reusing existing chunks.
+
+        Args:
+            directory: Checkpoint directory (created if missing).
+            artifacts: Mapping of artifact name to bytes.
+
+        Returns:
+            Write statistics.
+        """
+        with _directory_lock(directory):
+            return self._write_locked(directory, artifacts)
+
+    def read(self, directory: Path) -> dict[str, bytes]:
+        """Read all artifacts of a checkpoint directory.
+
+        Raises:
+            FileNotFoundError: If the directory or a referenced chunk is missing.
+            ValueError: If a chunk or artifact does not match the manifest.
+        """
+        with _directory_lock(directory):
+            artifacts = self._open_locked(directory)
+            return {name: artifacts[name] for name in artifacts}
+
+    def open(self, directory: Path) -> CheckpointArtifacts:
+        """Open a checkpoint directory, reading only its manifest.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+            ValueError: If the manifest is unreadable.
+        """
+        with _directory_lock(directory):
+            return self._open_locked(directory)
+
+    def _write_locked(
+        self, directory: Path, artifacts: dict[str, bytes]
+    ) -> ArtifactWriteStats:
+        chunks_dir = directory / CHUNKS_DIRNAME
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+        existing = {path.name for path in chunks_dir.iterdir()}
+
+        stats = ArtifactWriteStats()
+        manifest: dict[str, dict] = {}
+        for name, data in artifacts.items():
+            view = memoryview(data)
+            chunk_names = []
+            for offset in range(0, len(data), self.chunk_size):
+                chunk = view[offset : offset + self.chunk_size]
+                digest = hashlib.blake2b(chunk, digest_size=16).hexdigest()
+                # Any stored encoding of these bytes will do
+                chunk_name = next(
+                    (
+                        digest + suffix
+                        for suffix in COMPRESSION_CODECS.values()
+                        if digest + suffix in existing
+                    ),
+                    None,
+                )
+                if chunk_name is None:
+                    chunk_name, payload = self._encode(digest, chunk)
+                    _write_file(chunks_dir / chunk_name, payload)
+                    existing.add(chunk_name)
+                    stats.chunks_written += 1
+                    stats.bytes_written += len(payload)
+                chunk_names.append(chunk_name)
+            stats.chunks += len(chunk_names)
+            stats.total_bytes += len(data)
+            manifest[name] = {"size": len(data), "chunks": chunk_names}
+
+        content = {
+            "version": MANIFEST_VERSION,
+            "chunk_size": self.chunk_size,
+            "artifacts": manifest,
+        }
+        _write_file(directory / MANIFEST_FILENAME, json.dumps(content).encode("utf-8"))
+
+        # The new manifest is in place: drop chunks and legacy files it
+        # does not reference
+        referenced = {c for entry in manifest.values() for c in entry["chunks"]}
+        for chunk_name in existing - referenced:
+            (chunks_dir / chunk_name).unlink(missing_ok=True)
+            stats.chunks_removed += 1
+        for path in directory.iterdir():
+            if path.is_file() and path.name != MANIFEST_FILENAME:
+                path.unlink(missing_ok=True)
+        return stats
+
+    def _open_locked(self, directory: Path) -> CheckpointArtifacts:
+        manifest_path = directory / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            if not directory.is_dir():
+                raise FileNotFoundError(directory)
+            # Legacy layout: one file per artifact
+            return CheckpointArtifacts(
+                directory,
+                {
+                    path.name: ArtifactHandle(path.name, path.stat().st_size, [path])
+                    for path in directory.iterdir()
+                    if path.is_file()
+                },
+            )
+
+        try:
+            manifest = json.loads(manifest_path.read_bytes())
+            chunk_size = manifest.get("chunk_size", DEFAULT_CHUNK_SIZE)
+            chunks_dir = directory / CHUNKS_DIRNAME
+            handles = {
+                name: ArtifactHandle(
+                    name,
+                    entry["size"],
+                    [chunks_dir / chunk_name for chunk_name in entry["chunks"]],
+                    chunk_size,
+                )
+                for name, entry in manifest["artifacts"].items()
+            }
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid artifact manifest {manifest_path}: {e}") from e
+        return CheckpointArtifacts(directory, handles)
+
+    def _encode(self, digest: str, chunk: memoryview) -> tuple[str, bytes]:
+        if self._compress is not None:
+            compressed = self._compress(bytes(chunk))
+            if len(compressed) < len(chunk):
+                return digest + COMPRESSION_CODECS[self.compression], compressed
+        return digest, bytes(chunk)
+
+
+def _decode_chunk(path: Path) -> bytes:
+    """Read a chunk file, decompress it and check it against its name."""
+    payload = path.read_bytes()
+    digest, _, suffix = path.name.partition(".")
+    if suffix:
+        codec_name = next(
+            name for name, ext in COMPRESSION_CODECS.items() if ext == f".{suffix}"
+        )
+        codec = _load_codec(codec_name)
+        if codec is None:
+            raise ValueError(
+                f"Chunk {path.name} needs '{codec_name}', which is not installed"
+            )
+        payload = codec[1](payload)
+    if hashlib.blake2b(payload, digest_size=16).hexdigest() != digest:
+        raise ValueError(f"Chunk {path.name} does not match its hash")
+    return payload
+
+
+def _verify_chunk_file(path: Path) -> None:
+    """Check an uncompressed chunk file against its name, 1 MiB at a time."""
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(block)
+    if hasher.hexdigest() != path.name:
+        raise ValueError(f"Chunk {path.name} does not match its hash")
+
+
+def _write_file(path: Path, content: bytes) -> None:
+    """Write a file atomically (temp file + rename)."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
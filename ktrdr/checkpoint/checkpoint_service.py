@@ -2,7 +2,9 @@
 
 Provides CRUD operations for operation checkpoints using hybrid storage:
 - PostgreSQL for metadata and state (queryable)
-- Filesystem for large artifacts (model weights, optimizer state)
+- Filesystem for large artifacts (model weights, optimizer state), stored as
+  content-addressed chunks so unchanged bytes are not rewritten (see
+  ktrdr.checkpoint.artifact_store)
 """
 
 import asyncio
@@ -10,6 +12,7 @@ import json
 import logging
 import math
 import shutil
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -21,6 +24,7 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ktrdr.api.models.db.checkpoints import CheckpointRecord
+from ktrdr.checkpoint.artifact_store import CheckpointArtifacts, ChunkedArtifactStore
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +64,8 @@ class CheckpointData:
         created_at: When the checkpoint was created.
         state: JSON-serializable state dictionary.
         artifacts_path: Path to artifacts directory on filesystem.
-        artifacts: Loaded artifact data (lazy loaded).
+        artifacts: Artifact data by name. Loaded checkpoints hold a
+            CheckpointArtifacts mapping that reads each artifact on access.
     """
 
     operation_id: str
@@ -68,7 +73,7 @@ class CheckpointData:
     created_at: datetime
     state: dict
     artifacts_path: Optional[str] = None
-    artifacts: Optional[dict[str, bytes]] = None
+    artifacts: Optional[Mapping[str, bytes]] = None
 
 
 @dataclass
@@ -104,16 +109,32 @@ class CheckpointService:
         self,
         session_factory: async_sessionmaker[AsyncSession],
         artifacts_dir: str = "data/checkpoints",
+        compression: Optional[str] = None,
+        chunk_size: Optional[int] = None,
     ):
         """Initialize the checkpoint service.
 
         Args:
             session_factory: Factory for creating async database sessions.
             artifacts_dir: Directory path for storing checkpoint artifacts.
+            compression: Artifact chunk compression (default from
+                CheckpointSettings).
+            chunk_size: Bytes per artifact chunk (default from
+                CheckpointSettings).
         """
         self._session_factory = session_factory
         self._artifacts_dir = Path(artifacts_dir)
 
+        if compression is None or chunk_size is None:
+            from ktrdr.config.settings import get_checkpoint_settings
+
+            settings = get_checkpoint_settings()
+            compression = compression or settings.compression
+            chunk_size = chunk_size or settings.chunk_size
+        self._store = ChunkedArtifactStore(
+            chunk_size=chunk_size, compression=compression
+        )
+
     @asynccontextmanager
     async def _get_session(self):
         """Get a database session for an operation."""
@@ -134,8 +155,8 @@ class CheckpointService:
         """Save checkpoint (UPSERT - overwrites existing).
 
         Atomic behavior:
-        1. Write artifacts to temp directory
-        2. Rename to final location (atomic on POSIX)
+        1. Write artifact chunks that are not already stored
+        2. Replace the artifact manifest (atomic on POSIX)
         3. UPSERT to database
         4. If DB fails, delete artifact files
 
@@ -214,9 +235,13 @@ class CheckpointService:
     ) -> Optional[CheckpointData]:
         """Load checkpoint for resume.
 
+        Artifacts are opened lazily: only the manifest is read here, and each
+        artifact is read when accessed (see CheckpointArtifacts.handle() to
+        stream or memory-map one into torch.load instead).
+
         Args:
             operation_id: Unique identifier for the operation.
-            load_artifacts: Whether to load artifacts from filesystem.
+            load_artifacts: Whether to open artifacts from filesystem.
 
         Returns:
             CheckpointData if found, None otherwise.
@@ -290,6 +315,8 @@ class CheckpointService:
     ) -> list[CheckpointSummary]:
         """List checkpoints for admin/cleanup.
 
+        Reads the database only; artifact files are never touched.
+
         Args:
             older_than_days: If set, only return checkpoints older than this.
 
@@ -396,7 +423,10 @@ class CheckpointService:
         operation_id: str,
         artifacts: dict[str, bytes],
     ) -> Path:
-        """Write artifacts atomically using temp directory + rename.
+        """Write artifacts incrementally into the operation's directory.
+
+        Only chunks that changed since the previous checkpoint are written;
+        the manifest switch makes the new checkpoint visible atomically.
 
         Args:
             operation_id: Unique identifier for the operation.
@@ -406,44 +436,34 @@ class CheckpointService:
             Path to the final artifacts directory.
         """
         final_path = self._artifacts_dir / operation_id
-        temp_path = self._artifacts_dir / f"{operation_id}.tmp"
 
         # Ensure artifacts directory exists
         self._artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-        # Clean up any existing temp directory
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
-
-        # Write to temp directory (run in thread to avoid blocking)
-        def _write_sync():
-            temp_path.mkdir(parents=True)
-            for name, data in artifacts.items():
-                (temp_path / name).write_bytes(data)
-
-        await asyncio.to_thread(_write_sync)
-
-        # Atomic rename (remove existing first if present)
-        if final_path.exists():
-            shutil.rmtree(final_path)
-        temp_path.rename(final_path)
+        # Hashing and writing run in a thread to avoid blocking
+        stats = await asyncio.to_thread(self._store.write, final_path, artifacts)
+        logger.debug(
+            f"Checkpoint artifacts for {operation_id}: {stats.total_bytes}B in "
+            f"{stats.chunks} chunks, wrote {stats.chunks_written} "
+            f"({stats.bytes_written}B), reused {stats.chunks_reused}"
+        )
 
         return final_path
 
     async def _load_artifacts(
         self, artifacts_path: str, operation_id: str
-    ) -> dict[str, bytes]:
-        """Load all artifacts from directory.
+    ) -> CheckpointArtifacts:
+        """Open the artifacts of a directory (reads only the manifest).
 
         Args:
             artifacts_path: Path to artifacts directory.
             operation_id: Operation ID for error messages.
 
         Returns:
-            Mapping of filename to binary data.
+            Mapping of filename to binary data, read on access.
 
         Raises:
-            CheckpointCorruptedError: If artifacts directory is missing.
+            CheckpointCorruptedError: If artifacts are missing or corrupted.
         """
         path = Path(artifacts_path)
         if not path.exists():
@@ -452,12 +472,10 @@ class CheckpointService:
                 f"{artifacts_path}"
             )
 
-        # Load artifacts in thread to avoid blocking
-        def _load_sync() -> dict[str, bytes]:
-            artifacts = {}
-            for file_path in path.iterdir():
-                if file_path.is_file():
-                    artifacts[file_path.name] = file_path.read_bytes()
-            return artifacts
-
-        return await asyncio.to_thread(_load_sync)
+        # Open artifacts in thread to avoid blocking
+        try:
+            return await asyncio.to_thread(self._store.open, path)
+        except (OSError, ValueError) as e:
+            raise CheckpointCorruptedError(
+                f"Artifacts unreadable for checkpoint {operation_id}: {e}"
+            ) from e
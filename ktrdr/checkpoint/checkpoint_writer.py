@@ -0,0 +1,223 @@
+"""Background checkpoint writer.
+
+Periodic checkpoints are taken from inside worker loops (training epochs run
+in a thread via asyncio.to_thread). Serializing a model and optimizer and
+writing the artifacts takes seconds for larger models, and the loop used to
+wait for all of it.
+
+BackgroundCheckpointWriter moves that work to a dedicated thread. The loop
+captures a consistent snapshot (cheap copies of the state it will keep
+mutating), submits a build function, and carries on. The writer thread runs
+the build (serialization) and schedules CheckpointService.save_checkpoint on
+the main event loop.
+
+At most one save is in flight. A checkpoint submitted while another is still
+waiting replaces it: only the newest pending checkpoint matters. A save that
+exceeds the timeout is cancelled, and the writer stays busy until it has
+actually stopped, so drain() never returns while a save can still land.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Builds (state, artifacts) for one checkpoint; runs on the writer thread
+CheckpointBuild = Callable[[], tuple[dict, Optional[dict[str, bytes]]]]
+
+
+class BackgroundCheckpointWriter:
+    """Saves checkpoints from a background thread, newest pending wins."""
+
+    def __init__(
+        self,
+        checkpoint_service: Any,
+        main_loop: asyncio.AbstractEventLoop,
+        save_timeout: float = 120.0,
+    ):
+        """Initialize the writer (its thread starts on first submit).
+
+        Args:
+            checkpoint_service: Service whose save_checkpoint() is awaited.
+            main_loop: Event loop the service's database sessions belong to.
+            save_timeout: Seconds to wait for one save before giving up.
+        """
+        self._service = checkpoint_service
+        self._main_loop = main_loop
+        self._save_timeout = save_timeout
+        self._cond = threading.Condition()
+        self._pending: Optional[tuple[str, str, CheckpointBuild]] = None
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self._saved = 0
+        self._failed = 0
+        self._superseded = 0
+        self._last_save_seconds = 0.0
+
+    def submit(
+        self, operation_id: str, checkpoint_type: str, build: CheckpointBuild
+    ) -> None:
+        """Queue a checkpoint; returns immediately.
+
+        Args:
+            operation_id: Operation being checkpointed.
+            checkpoint_type: Checkpoint type (e.g. "periodic").
+            build: Callable producing (state dict, artifacts or None).
+        """
+        with self._cond:
+            if self._closed:
+                logger.warning(
+                    f"Checkpoint writer closed, dropping checkpoint for {operation_id}"
+                )
+                return
+            if self._pending is not None:
+                self._superseded += 1
+            self._pending = (operation_id, checkpoint_type, build)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="checkpoint-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def wait_idle(
+        self, timeout: Optional[float] = None, discard_pending: bool = False
+    ) -> bool:
+        """Block until nothing is pending or in flight.
+
+        Must not be called from the main event loop's thread (saves run
+        there); use drain() from async code.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely).
+            discard_pending: Drop a checkpoint that has not started yet.
+
+        Returns:
+            True if the writer is idle.
+        """
+        with self._cond:
+            if discard_pending and self._pending is not None:
+                self._pending = None
+                self._superseded += 1
+            return self._cond.wait_for(
+                lambda: self._pending is None and not self._busy, timeout
+            )
+
+    async def drain(
+        self, timeout: Optional[float] = None, discard_pending: bool = False
+    ) -> bool:
+        """Wait (without blocking the event loop) until the writer is idle.
+
+        Call before saving a checkpoint directly (cancellation, failure,
+        shutdown) or deleting it, so a background save cannot land after it.
+        """
+        return await asyncio.to_thread(self.wait_idle, timeout, discard_pending)
+
+    async def aclose(
+        self, timeout: Optional[float] = None, discard_pending: bool = False
+    ) -> None:
+        """Drain and stop the writer thread."""
+        await self.drain(timeout, discard_pending)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        """Return writer statistics."""
+        with self._cond:
+            return {
+                "saved": self._saved,
+                "failed": self._failed,
+                "superseded": self._superseded,
+                "pending": self._pending is not None,
+                "busy": self._busy,
+                "last_save_ms": round(self._last_save_seconds * 1000, 3),
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return  # closed and drained
+                operation_id, checkpoint_type, build = self._pending
+                self._pending = None
+                self._busy = True
+
+            started = time.perf_counter()
+            try:
+                state, artifacts = build()
+                self._save_on_main_loop(
+                    self._service.save_checkpoint(
+                        operation_id=operation_id,
+                        checkpoint_type=checkpoint_type,
+                        state=state,
+                        artifacts=artifacts,
+                    )
+                )
+                ok = True
+            except Exception as e:
+                ok = False
+                logger.warning(
+                    f"Failed to save {checkpoint_type} checkpoint for "
+                    f"{operation_id}: {e}"
+                )
+
+            elapsed = time.perf_counter() - started
+            with self._cond:
+                if ok:
+                    self._saved += 1
+                    self._last_save_seconds = elapsed
+                else:
+                    self._failed += 1
+                self._busy = False
+                self._cond.notify_all()
+            if ok:
+                logger.info(
+                    f"{checkpoint_type.capitalize()} checkpoint saved for "
+                    f"{operation_id} in the background ({elapsed:.2f}s)"
+                )
+
+    def _save_on_main_loop(self, save: Coroutine[Any, Any, Any]) -> None:
+        """Run a save on the main loop and wait until it has finished.
+
+        On timeout the save is cancelled, and this still waits for the task to
+        finish: cancelling only requests it, and a save that is still running
+        could otherwise land after a later checkpoint or a delete.
+
+        Raises:
+            TimeoutError: The save was cancelled after save_timeout seconds.
+            RuntimeError: The main loop is closed or cancelled the save.
+            Exception: Whatever the save raised.
+        """
+        finished = threading.Event()
+        tasks: list[asyncio.Task] = []
+
+        def start() -> None:
+            task = self._main_loop.create_task(save)
+            task.add_done_callback(lambda _: finished.set())
+            tasks.append(task)
+
+        try:
+            self._main_loop.call_soon_threadsafe(start)
+        except RuntimeError:  # Main loop closed
+            save.close()
+            raise
+        timed_out = not finished.wait(self._save_timeout)
+        if timed_out:
+            # Runs after start() (callbacks are FIFO), so the task exists
+            self._main_loop.call_soon_threadsafe(lambda: tasks[0].cancel())
+            finished.wait()
+        task = tasks[0]
+        if task.cancelled():
+            if timed_out:
+                raise TimeoutError(f"save timed out after {self._save_timeout}s")
+            raise RuntimeError("save was cancelled")
+        task.result()
@@ -6,6 +6,7 @@ from async patterns, such as operation polling and connection reuse.
 """
 
 import asyncio
+from collections.abc import AsyncIterator
 from typing import Any, Callable, Optional
 
 import httpx
@@ -253,6 +254,55 @@ class AsyncCLIClient:
         except Exception:
             return False
 
+    async def stream_operation_events(
+        self,
+        operation_ids: list[str],
+        heartbeat: float = 15.0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Subscribe to pushed operation events over one SSE connection.
+
+        Yields one event dict per server event: ``{"event": type, "data": {...}}``
+        where type is snapshot, progress, metrics, terminal or error. Keep-alive
+        comments yield ``{"event": "keepalive", "data": {}}`` so callers get a
+        chance to react (e.g. to Ctrl+C) at least every ``heartbeat`` seconds.
+        The stream ends once every operation is terminal.
+
+        Args:
+            operation_ids: Operations to watch
+            heartbeat: Seconds between server keep-alive comments
+
+        Raises:
+            ConnectionError: Cannot connect to server
+            APIError: Server rejected the stream request
+        """
+        if self._client is None:
+            raise RuntimeError(
+                "Client not initialized. Use 'async with AsyncCLIClient() as client:'"
+            )
+
+        # Lazy import: the async_infrastructure package pulls in telemetry
+        from ktrdr.async_infrastructure.sse import iter_sse_events
+
+        url = f"{self.config.base_url}/operations/stream"
+        params = {"operation_id": operation_ids, "heartbeat": heartbeat}
+        try:
+            async with self._client.stream(
+                "GET",
+                url,
+                params=params,
+                timeout=httpx.Timeout(self.config.timeout, read=heartbeat * 4),
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    parse_response(response)  # Raises APIError
+                async for event in iter_sse_events(response.aiter_lines()):
+                    yield event
+        except httpx.ConnectError as e:
+            raise ConnectionError(
+                message=f"Could not connect to API at {url}. Is the API server running?",
+                details={"url": url, "error": str(e)},
+            ) from e
+
     async def execute_operation(
         self,
         adapter: OperationAdapter,
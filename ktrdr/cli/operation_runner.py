@@ -2,12 +2,13 @@
 
 Provides a simplified wrapper around AsyncCLIClient that supports both
 fire-and-forget (return immediately with operation ID) and follow mode
-(poll and display progress until completion).
+(stream or poll progress and display it until completion).
 """
 
 import asyncio
 import json
 import signal
+from contextlib import aclosing
 from typing import Any
 
 from rich.console import Console
@@ -24,6 +25,9 @@ from ktrdr.cli.client import AsyncCLIClient
 from ktrdr.cli.client.operations import OperationAdapter
 from ktrdr.cli.output import print_error, print_operation_started
 from ktrdr.cli.state import CLIState
+from ktrdr.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class OperationRunner:
@@ -206,6 +210,30 @@ class OperationRunner:
                 status = "pending"
                 op_data = {}
 
+                # Prefer pushed events; the poll loop below then only fetches
+                # the final result (or takes over if streaming is unavailable)
+                try:
+                    async with aclosing(
+                        client.stream_operation_events([operation_id], heartbeat=1.0)
+                    ) as events:
+                        async for event in events:
+                            if cancelled or event["event"] == "error":
+                                break
+                            if event["event"] in ("snapshot", "progress", "terminal"):
+                                status = event["data"].get("status")
+                                prog = event["data"].get("progress") or {}
+                                pct = prog.get("percentage", 0)
+                                step = prog.get("current_step") or (
+                                    f"Running {operation_type}..."
+                                )
+                                progress_bar.update(
+                                    task_id, completed=pct, description=step
+                                )
+                            if status in ("completed", "failed", "cancelled"):
+                                break
+                except Exception as e:
+                    logger.debug(f"Event stream unavailable, polling instead: {e}")
+
                 # Poll until terminal state or cancelled
                 while not cancelled:
                     result = await client.get(f"/operations/{operation_id}")
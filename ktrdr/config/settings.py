@@ -63,6 +63,14 @@ class APISettings(BaseSettings):
         KTRDR_API_CORS_ALLOW_HEADERS: JSON array of allowed HTTP headers
             (e.g. '["Authorization","Content-Type"]')
         KTRDR_API_CORS_MAX_AGE: Max age for CORS preflight cache (seconds)
+        KTRDR_API_COMPUTE_PROCESSES: Process pool size for CPU-bound work
+            (0 runs it on the thread pool). Default: 2
+        KTRDR_API_COMPUTE_THREADS: Thread pool size for blocking I/O. Default: 8
+        KTRDR_API_COMPUTE_MAX_PENDING: Jobs per pool (running + queued) before
+            new ones are rejected with 503. Default: 32
+        KTRDR_API_COMPUTE_TIMEOUT: Seconds before a compute job times out. Default: 60
+        KTRDR_API_RESULT_CACHE_MB: Memory budget per response cache for the
+            indicator and fuzzy endpoints (0 disables caching). Default: 128
     """
 
     # API metadata
@@ -105,6 +113,31 @@ class APISettings(BaseSettings):
         description="Maximum age (seconds) of CORS preflight responses to cache",
     )
 
+    # Compute executor (CPU-bound and blocking work off the event loop)
+    compute_processes: int = Field(
+        default=2,
+        ge=0,
+        description="Process pool size for CPU-bound work (0 uses the thread pool)",
+    )
+    compute_threads: int = Field(
+        default=8, gt=0, description="Thread pool size for blocking I/O"
+    )
+    compute_max_pending: int = Field(
+        default=32,
+        gt=0,
+        description="Jobs per pool (running + queued) before new ones are rejected",
+    )
+    compute_timeout: float = Field(
+        default=60.0, gt=0, description="Seconds before a compute job times out"
+    )
+
+    # Response caches for the indicator and fuzzy endpoints
+    result_cache_mb: int = Field(
+        default=128,
+        ge=0,
+        description="Memory budget (MB) per response cache; 0 disables caching",
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="KTRDR_API_",
         env_file=".env.local",
@@ -313,6 +346,17 @@ class OperationsSettings(BaseSettings):
         KTRDR_OPS_MAX_OPERATIONS: Maximum operations to track in memory. Default: 10000
         KTRDR_OPS_CLEANUP_INTERVAL_SECONDS: Interval between cleanup runs. Default: 3600
         KTRDR_OPS_RETENTION_DAYS: Days to retain completed operations. Default: 7
+        KTRDR_OPS_METRICS_MAX_ENTRIES: Full-resolution metrics kept in memory per
+            operation series. Default: 2000
+        KTRDR_OPS_METRICS_DOWNSAMPLED_ENTRIES: Downsampled metrics kept per
+            resolution tier. Default: 1000
+        KTRDR_OPS_METRICS_PERSIST_BATCH: Metrics entries written to the database
+            per batch. Default: 200
+        KTRDR_OPS_WRITE_FLUSH_INTERVAL: Seconds non-terminal operation updates
+            are held and coalesced before a batched write (0 = write
+            immediately). Default: 0.1
+        KTRDR_OPS_WRITE_MAX_BATCH: Queued operations that trigger an immediate
+            flush. Default: 500
 
     Deprecated names (still work, emit warnings at startup):
         OPERATIONS_CACHE_TTL → KTRDR_OPS_CACHE_TTL
@@ -346,6 +390,35 @@ class OperationsSettings(BaseSettings):
         description="Days to retain completed operations",
     )
 
+    # Per-operation metrics store
+    metrics_max_entries: int = Field(
+        default=2000,
+        gt=0,
+        description="Full-resolution metrics kept in memory per operation series",
+    )
+    metrics_downsampled_entries: int = Field(
+        default=1000,
+        ge=0,
+        description="Downsampled metrics kept per resolution tier (0 = none)",
+    )
+    metrics_persist_batch: int = Field(
+        default=200,
+        gt=0,
+        description="Metrics entries written to the database per batch",
+    )
+
+    # Write-behind persistence
+    write_flush_interval: float = Field(
+        default=0.1,
+        ge=0,
+        description="Seconds to coalesce operation updates before writing (0 = off)",
+    )
+    write_max_batch: int = Field(
+        default=500,
+        gt=0,
+        description="Queued operations that trigger an immediate flush",
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="KTRDR_OPS_",
         env_file=".env.local",
@@ -367,6 +440,12 @@ class CheckpointSettings(BaseSettings):
         KTRDR_CHECKPOINT_TIME_INTERVAL_SECONDS: Save checkpoint every M seconds. Default: 300
         KTRDR_CHECKPOINT_DIR: Directory for checkpoint artifacts. Default: /app/data/checkpoints
         KTRDR_CHECKPOINT_MAX_AGE_DAYS: Auto-cleanup checkpoints older than N days. Default: 30
+        KTRDR_CHECKPOINT_COMPRESSION: Artifact chunk compression (none, zlib,
+            zstd, lz4). Default: none
+        KTRDR_CHECKPOINT_CHUNK_SIZE: Bytes per content-addressed artifact
+            chunk. Default: 4194304
+        KTRDR_CHECKPOINT_BACKGROUND_WRITES: Serialize and write periodic
+            checkpoints off the training loop. Default: true
 
     Deprecated names (still work, emit warnings at startup):
         CHECKPOINT_EPOCH_INTERVAL, CHECKPOINT_TIME_INTERVAL_SECONDS,
@@ -400,6 +479,19 @@ class CheckpointSettings(BaseSettings):
         gt=0,
         description="Auto-cleanup checkpoints older than N days",
     )
+    compression: str = Field(
+        default="none",
+        description="Artifact chunk compression: none, zlib, zstd or lz4",
+    )
+    chunk_size: int = Field(
+        default=4 * 1024 * 1024,
+        gt=0,
+        description="Bytes per content-addressed artifact chunk",
+    )
+    background_writes: bool = Field(
+        default=True,
+        description="Serialize and write periodic checkpoints in a background thread",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="KTRDR_CHECKPOINT_",
@@ -407,6 +499,15 @@ class CheckpointSettings(BaseSettings):
         extra="ignore",
     )
 
+    @field_validator("compression")
+    @classmethod
+    def validate_compression(cls, v: str) -> str:
+        """Validate that the compression codec is known."""
+        allowed = ["none", "zlib", "zstd", "lz4"]
+        if v.lower() not in allowed:
+            raise ValueError(f"Compression must be one of {allowed}, got '{v}'")
+        return v.lower()
+
 
 class DatabaseSettings(BaseSettings):
     """Database connection settings.
@@ -421,6 +522,11 @@ class DatabaseSettings(BaseSettings):
         KTRDR_DB_USER: Database user. Default: ktrdr
         KTRDR_DB_PASSWORD: Database password. Default: localdev (insecure)
         KTRDR_DB_ECHO: Enable SQLAlchemy echo mode. Default: false
+        KTRDR_DB_POOL_SIZE: Connections kept open in the pool. Default: 5
+        KTRDR_DB_MAX_OVERFLOW: Extra connections allowed under load. Default: 10
+        KTRDR_DB_POOL_TIMEOUT: Seconds to wait for a pooled connection. Default: 30
+        KTRDR_DB_STATEMENT_CACHE_SIZE: Prepared statements cached per
+            connection (0 = disabled, e.g. behind pgbouncer). Default: 100
 
     Deprecated names (still work, emit warnings at startup):
         DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD, DB_ECHO
@@ -433,6 +539,22 @@ class DatabaseSettings(BaseSettings):
     password: str = deprecated_field("localdev", "KTRDR_DB_PASSWORD", "DB_PASSWORD")
     echo: bool = deprecated_field(False, "KTRDR_DB_ECHO", "DB_ECHO")
 
+    # Connection pool
+    pool_size: int = Field(
+        default=5, gt=0, description="Connections kept open in the pool"
+    )
+    max_overflow: int = Field(
+        default=10, ge=0, description="Extra connections allowed under load"
+    )
+    pool_timeout: float = Field(
+        default=30.0, gt=0, description="Seconds to wait for a pooled connection"
+    )
+    statement_cache_size: int = Field(
+        default=100,
+        ge=0,
+        description="Prepared statements cached per connection (0 = disabled)",
+    )
+
     model_config = SettingsConfigDict(env_prefix="KTRDR_DB_", env_file=".env.local")
 
     @computed_field  # type: ignore[prop-decorator]
@@ -477,6 +599,11 @@ class IBSettings(BaseSettings):
         KTRDR_IB_RETRY_MAX_DELAY: Max retry delay in seconds. Default: 60.0
         KTRDR_IB_PACING_DELAY: Pacing delay between requests. Default: 0.6
         KTRDR_IB_MAX_REQUESTS_PER_10MIN: Max requests per 10 minutes. Default: 60
+        KTRDR_IB_RESPONSE_CACHE_MODE: Historical response cache mode, one of
+            off, read_write or replay. Default: read_write
+        KTRDR_IB_RESPONSE_CACHE_DIR: Response cache directory. Default: data/ib_cache
+        KTRDR_IB_RESPONSE_CACHE_OPEN_TTL: Seconds to keep responses for windows
+            that are still open. Default: 60
 
     Deprecated names (still work, emit warnings at startup):
         IB_HOST, IB_PORT, IB_CLIENT_ID, IB_TIMEOUT, IB_READONLY,
@@ -516,6 +643,24 @@ class IBSettings(BaseSettings):
         60, "KTRDR_IB_MAX_REQUESTS_PER_10MIN", "IB_MAX_REQUESTS_10MIN", gt=0
     )
 
+    # Historical response cache (IB host service)
+    response_cache_mode: str = Field(
+        default="read_write",
+        description=(
+            "off disables the cache; replay serves only recorded responses "
+            "and never contacts IB"
+        ),
+    )
+    response_cache_dir: str = Field(
+        default="data/ib_cache",
+        description="Directory for persisted historical responses",
+    )
+    response_cache_open_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds to cache responses for windows that touch now",
+    )
+
     # Static data fetching chunk sizes (not configurable via env vars)
     # These are IB-specific limits based on bar size
     _chunk_days: dict[str, float] = {
@@ -546,6 +691,15 @@ class IBSettings(BaseSettings):
         extra="ignore",
     )
 
+    @field_validator("response_cache_mode")
+    @classmethod
+    def validate_response_cache_mode(cls, v: str) -> str:
+        """Validate that the response cache mode is off, read_write or replay."""
+        allowed = ["off", "read_write", "replay"]
+        if v.lower() not in allowed:
+            raise ValueError(f"Response cache mode must be one of {allowed}, got '{v}'")
+        return v.lower()
+
     def get_connection_config(self) -> dict[str, Any]:
         """Get connection configuration for IbConnectionManager.
 
@@ -604,6 +758,9 @@ class IBSettings(BaseSettings):
             "retry_max_delay": self.retry_max_delay,
             "pacing_delay": self.pacing_delay,
             "max_requests_per_10min": self.max_requests_per_10min,
+            "response_cache_mode": self.response_cache_mode,
+            "response_cache_dir": self.response_cache_dir,
+            "response_cache_open_ttl": self.response_cache_open_ttl,
             "is_paper": self.is_paper_trading(),
             "is_live": self.is_live_trading(),
         }
@@ -826,6 +983,13 @@ class WorkerSettings(BaseSettings):
         KTRDR_WORKER_HEALTH_CHECK_TIMEOUT: Health check timeout in seconds. Default: 5
         KTRDR_WORKER_HEALTH_CHECK_FAILURES: Failures before unavailable. Default: 3
         KTRDR_WORKER_REMOVAL_THRESHOLD: Seconds before removing dead workers. Default: 300
+        KTRDR_WORKER_HEALTH_CHECK_CONCURRENCY: Concurrent health probes. Default: 16
+        KTRDR_WORKER_SLOTS: Operations a worker runs concurrently. Default: 1
+        KTRDR_WORKER_DISPATCH_QUEUE_TIMEOUT: Seconds to queue for a free slot. Default: 30
+        KTRDR_WORKER_PROGRESS_PUSH_INTERVAL: Progress push interval (0 disables). Default: 0.5
+        KTRDR_WORKER_DATA_CACHE_MB: Memory budget of the backtest data cache (0 disables). Default: 512
+        KTRDR_WORKER_DATA_CACHE_DIR: Disk tier of the backtest data cache. Default: None (memory only)
+        KTRDR_WORKER_DATA_CACHE_DISK_MB: Disk budget of the backtest data cache. Default: 4096
 
     Deprecated names (still work, emit warnings at startup):
         WORKER_ID, WORKER_PORT, WORKER_ENDPOINT_URL, WORKER_PUBLIC_BASE_URL,
@@ -906,6 +1070,46 @@ class WorkerSettings(BaseSettings):
         gt=0,
         description="Seconds before removing unresponsive workers (default: 5 minutes)",
     )
+    health_check_concurrency: int = Field(
+        default=16,
+        gt=0,
+        description="Maximum concurrent worker health probes",
+    )
+
+    # Capacity-aware scheduling
+    slots: int = Field(
+        default=1,
+        gt=0,
+        description="Operations this worker runs concurrently (advertised at registration)",
+    )
+    dispatch_queue_timeout: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an operation waits for a free worker slot (0 disables queueing)",
+    )
+
+    # Progress push (worker → backend) instead of backend polling the worker
+    progress_push_interval: float = Field(
+        default=0.5,
+        ge=0,
+        description="Seconds between progress pushes to the backend (0 disables)",
+    )
+
+    # Worker-local cache of parsed OHLCV frames and feature matrices
+    data_cache_mb: int = Field(
+        default=512,
+        ge=0,
+        description="Memory budget in MB of the backtest data cache (0 disables)",
+    )
+    data_cache_dir: str | None = Field(
+        default=None,
+        description="Directory of the data cache's disk tier (None: memory only)",
+    )
+    data_cache_disk_mb: int = Field(
+        default=4096,
+        gt=0,
+        description="Disk budget in MB of the data cache's disk tier",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="KTRDR_WORKER_",
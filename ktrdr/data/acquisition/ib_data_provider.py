@@ -14,10 +14,12 @@ IMPORTANT: This provider NEVER imports from ktrdr.ib.
 It only communicates with IB via HTTP through the host service.
 """
 
+from collections.abc import Callable
 from datetime import datetime, timezone
 from io import StringIO
 from typing import Any, Optional
 
+import httpx
 import pandas as pd
 
 from ktrdr.async_infrastructure.service_adapter import (
@@ -30,11 +32,20 @@ from ktrdr.data.acquisition.external_data_interface import (
     DataProviderError,
     ExternalDataProvider,
 )
+from ktrdr.data.bar_codec import BAR_CONTENT_TYPE, decode_bars
 from ktrdr.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _parse_historical_response(response: httpx.Response) -> dict[str, Any]:
+    """Decode a /data/historical response in either wire format."""
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith(BAR_CONTENT_TYPE):
+        return {"success": True, "frame": decode_bars(response.content)}
+    return response.json()
+
+
 class IbDataProvider(ExternalDataProvider, AsyncServiceAdapter):
     """
     IB data provider that communicates exclusively via HTTP host service.
@@ -101,15 +112,25 @@ class IbDataProvider(ExternalDataProvider, AsyncServiceAdapter):
             await self._setup_connection_pool()
 
     async def _call_host_service_post(
-        self, endpoint: str, data: dict[str, Any], cancellation_token=None
-    ) -> dict[str, Any]:
+        self,
+        endpoint: str,
+        data: dict[str, Any],
+        cancellation_token=None,
+        headers: Optional[dict[str, str]] = None,
+        response_parser: Optional[Callable[[httpx.Response], Any]] = None,
+    ) -> Any:
         """Make POST request to host service using AsyncServiceAdapter."""
         # Ensure HTTP client is initialized
         await self._ensure_client_initialized()
 
         try:
             return await AsyncServiceAdapter._call_host_service_post(
-                self, endpoint, data, cancellation_token
+                self,
+                endpoint,
+                data,
+                cancellation_token,
+                headers=headers,
+                response_parser=response_parser,
             )
         except Exception as e:
             # Translate AsyncServiceAdapter errors to DataProvider errors for compatibility
@@ -272,7 +293,8 @@ class IbDataProvider(ExternalDataProvider, AsyncServiceAdapter):
             self._validate_timeframe(timeframe)
             self._validate_datetime_range(start, end)
 
-            # Use host service for data fetching
+            # Use host service for data fetching; bars come back in the binary
+            # columnar format when the host service supports it, JSON otherwise
             response = await self._call_host_service_post(
                 "/data/historical",
                 {
@@ -282,6 +304,8 @@ class IbDataProvider(ExternalDataProvider, AsyncServiceAdapter):
                     "end": end.isoformat(),
                     "instrument_type": instrument_type,
                 },
+                headers={"Accept": f"{BAR_CONTENT_TYPE}, application/json;q=0.9"},
+                response_parser=_parse_historical_response,
             )
 
             if not response["success"]:
@@ -290,8 +314,10 @@ class IbDataProvider(ExternalDataProvider, AsyncServiceAdapter):
                     provider="IB",
                 )
 
+            if "frame" in response:
+                result = response["frame"]
             # Convert JSON response back to DataFrame
-            if response.get("data"):
+            elif response.get("data"):
                 result = pd.read_json(StringIO(response["data"]), orient="index")
                 # Ensure datetime index
                 if not result.empty:
@@ -20,7 +20,7 @@ import pandas as pd
 from ktrdr import get_logger
 from ktrdr.data.local_data_loader import LocalDataLoader
 from ktrdr.data.repository.data_quality_validator import DataQualityValidator
-from ktrdr.errors import DataNotFoundError
+from ktrdr.errors import DataNotFoundError, ValidationError
 
 logger = get_logger(__name__)
 
@@ -122,6 +122,28 @@ class DataRepository:
         )
         return df
 
+    def get_data_version(
+        self, symbol: str, timeframe: str
+    ) -> Optional[tuple[int, int]]:
+        """
+        Get a version stamp for a cached data file.
+
+        The stamp changes whenever the file is rewritten, so results computed
+        from the file can be cached against it.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+
+        Returns:
+            (mtime_ns, size) of the cache file, or None if it doesn't exist
+        """
+        try:
+            stat = self.loader._build_file_path(symbol, timeframe).stat()
+        except (OSError, ValidationError):
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def save_to_cache(
         self,
         symbol: str,
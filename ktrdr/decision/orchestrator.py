@@ -25,7 +25,9 @@ import yaml
 
 from .. import get_logger
 from ..backtesting.model_loader import ModelLoader
+from ..errors import ConfigurationError
 from ..fuzzy.engine import FuzzyEngine
+from ..indicators.incremental_engine import IncrementalIndicatorEngine
 from ..indicators.indicator_engine import IndicatorEngine
 from .base import Position, Signal, TradingDecision
 from .engine import DecisionEngine
@@ -156,6 +158,12 @@ class DecisionOrchestrator:
         # Initialize fuzzy engine with strategy fuzzy sets
         self.fuzzy_engine = self._initialize_fuzzy_engine()
 
+        # Per-(symbol, timeframe) incremental indicator state for real-time mode
+        self._incremental_engines: dict[tuple[str, str], IncrementalIndicatorEngine] = (
+            {}
+        )
+        self._incremental_unsupported = False
+
         # Load trained model
         self.model_loader = ModelLoader()
         self.model = None
@@ -264,7 +272,7 @@ class DecisionOrchestrator:
         else:
             # Real-time computation (for non-backtest modes)
             mapped_indicators, fuzzy_values = self._compute_features_realtime(
-                historical_data, current_bar
+                historical_data, current_bar, symbol, timeframe
             )
 
         # Step 3: Prepare decision context
@@ -367,80 +375,107 @@ class DecisionOrchestrator:
         return final_decision
 
     def _compute_features_realtime(
-        self, historical_data: pd.DataFrame, current_bar: pd.Series
+        self,
+        historical_data: pd.DataFrame,
+        current_bar: pd.Series,
+        symbol: str = "",
+        timeframe: str = "",
     ) -> tuple[dict[str, float], dict[str, float]]:
-        """Compute features in real-time (original expensive method).
+        """Compute features in real-time for the latest bar.
+
+        Indicators are advanced incrementally: each (symbol, timeframe) keeps
+        an IncrementalIndicatorEngine that is warmed up from the history once
+        and then fed only the bars it hasn't seen, so a new bar costs O(1)
+        instead of a full recompute. Strategies with indicators that don't
+        support incremental updates fall back to the batch IndicatorEngine.
 
         Args:
             historical_data: Historical bars including current
             current_bar: Current price bar
+            symbol: Trading symbol (keys the incremental state)
+            timeframe: Bar timeframe (keys the incremental state)
 
         Returns:
             Tuple of (mapped_indicators, fuzzy_values) dictionaries
         """
-        # Step 1: Calculate indicators
-        # Initialize indicator engine with v3 strategy config if not already done
-        if not self.indicator_engine._indicators:
-            # V3 format: indicators is already a dict mapping indicator_id to definition
-            indicator_configs = self.strategy_config["indicators"]
-
-            from ..indicators.indicator_engine import IndicatorEngine
-
-            self.indicator_engine = IndicatorEngine(indicators=indicator_configs)
+        bar_label = (
+            cast(pd.Timestamp, current_bar.name).strftime("%Y-%m-%d %H:%M")
+            if hasattr(current_bar, "name")
+            else "Unknown"
+        )
+        engine = self._get_incremental_engine(symbol, timeframe)
+        if engine is None:
+            return self._compute_features_batch(historical_data)
 
-        # Apply indicators to get calculated values
-        indicators_df = self.indicator_engine.apply(historical_data)
+        index = historical_data.index
+        if engine.last_timestamp is None:
+            new_bars = historical_data
+        else:
+            position = index.searchsorted(engine.last_timestamp, side="right")
+            if position == 0 or index[position - 1] != engine.last_timestamp:
+                # History no longer contains the last processed bar: resync
+                logger.info(
+                    f"🔁 [{bar_label}] Re-warming incremental indicators for "
+                    f"{symbol} {timeframe}"
+                )
+                engine.reset()
+                new_bars = historical_data
+            else:
+                new_bars = historical_data.iloc[position:]
 
-        # Map indicators to original names for fuzzy processing (same as training)
-        mapped_indicators = {}
-        for config in self.strategy_config["indicators"]:
-            original_name = config["name"]
-            indicator_type = config["name"].upper()
-
-            # Find matching columns
-            for col in indicators_df.columns:
-                if col.upper().startswith(indicator_type):
-                    if indicator_type == "MACD":
-                        # Use main MACD line
-                        if (
-                            col.startswith("MACD_")
-                            and "_signal_" not in col
-                            and "_hist_" not in col
-                        ):
-                            mapped_indicators[original_name] = indicators_df[col].iloc[
-                                -1
-                            ]
-                            break
-                    else:
-                        # Use raw values for all indicators (including SMA/EMA)
-                        # Fuzzy engine handles transformations via input_transform
-                        mapped_indicators[original_name] = indicators_df[col].iloc[-1]
-                        break
-
-        # Step 2: Generate fuzzy memberships
-        fuzzy_values: dict[str, Any] = {}
+        mapped_indicators = engine.warm_up(new_bars)
+        fuzzy_values = engine.fuzzify(mapped_indicators)
         logger.debug(
-            f"🔀 [{cast(pd.Timestamp, current_bar.name).strftime('%Y-%m-%d %H:%M') if hasattr(current_bar, 'name') else 'Unknown'}] Generating fuzzy memberships for {len(mapped_indicators)} indicators"
+            f"🔀 [{bar_label}] Advanced indicators by {len(new_bars)} bar(s), "
+            f"{len(fuzzy_values)} fuzzy features"
         )
+        return mapped_indicators, fuzzy_values
 
-        # Get current bar price data for input_transform
-        current_price_data = historical_data.iloc[[-1]]  # Last row as DataFrame
-
-        for indicator_name, indicator_value in mapped_indicators.items():
-            if indicator_name in self.strategy_config["fuzzy_sets"]:
-                # Fuzzify this indicator with context_data for transforms
-                membership_result = self.fuzzy_engine.fuzzify(
-                    indicator_name, indicator_value, context_data=current_price_data
+    def _get_incremental_engine(
+        self, symbol: str, timeframe: str
+    ) -> Optional[IncrementalIndicatorEngine]:
+        """Get the incremental engine for a series, or None if unsupported."""
+        if self._incremental_unsupported:
+            return None
+        key = (symbol, timeframe)
+        engine = self._incremental_engines.get(key)
+        if engine is None:
+            try:
+                engine = IncrementalIndicatorEngine(
+                    self.strategy_config["indicators"], self.fuzzy_engine
                 )
-                fuzzy_values.update(membership_result)
-                logger.debug(
-                    f"🔀 [{cast(pd.Timestamp, current_bar.name).strftime('%Y-%m-%d %H:%M') if hasattr(current_bar, 'name') else 'Unknown'}] Fuzzified {indicator_name}={indicator_value:.4f} → {len(membership_result)} memberships"
+            except ConfigurationError as e:
+                logger.warning(
+                    f"Falling back to batch indicator computation: {e.message}"
                 )
+                self._incremental_unsupported = True
+                return None
+            self._incremental_engines[key] = engine
+        return engine
 
-        logger.debug(
-            f"🔀 [{cast(pd.Timestamp, current_bar.name).strftime('%Y-%m-%d %H:%M') if hasattr(current_bar, 'name') else 'Unknown'}] Total fuzzy features: {len(fuzzy_values)}"
-        )
+    def _compute_features_batch(
+        self, historical_data: pd.DataFrame
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """Compute the latest bar's features by recomputing the full history."""
+        if not self.indicator_engine._indicators:
+            self.indicator_engine = IndicatorEngine(
+                indicators=self.strategy_config["indicators"]
+            )
+        indicators_df = self.indicator_engine.apply(historical_data)
 
+        mapped_indicators = {
+            column: float(indicators_df[column].iloc[-1])
+            for column in indicators_df.columns
+            if column not in historical_data.columns
+        }
+        fuzzy_values: dict[str, float] = {}
+        for fuzzy_set_id in self.strategy_config["fuzzy_sets"]:
+            indicator_id = self.fuzzy_engine.get_indicator_for_fuzzy_set(fuzzy_set_id)
+            if indicator_id in indicators_df.columns:
+                memberships = self.fuzzy_engine.fuzzify(
+                    fuzzy_set_id, indicators_df[indicator_id].iloc[[-1]]
+                )
+                fuzzy_values.update(memberships.iloc[-1].to_dict())
         return mapped_indicators, fuzzy_values
 
     def _initialize_fuzzy_engine(self) -> FuzzyEngine:
@@ -763,6 +798,7 @@ class DecisionOrchestrator:
         else:
             self.position_states.clear()
             self.decision_history.clear()
+            self._incremental_engines.clear()
 
     def _check_v3_model(self, model_path: str) -> bool:
         """Check if model is v3 format by looking for metadata_v3.json.
@@ -839,9 +875,9 @@ class DecisionOrchestrator:
                 return str(latest)
 
             # Fallback: list all models and find the most recent for this strategy
-            models = storage.list_models(self.strategy_name)
+            models = storage.list_models(self.strategy_name, limit=1)
             if models:
-                # Models are already sorted by created_at descending
+                # Models are sorted by created_at descending
                 best_model = models[0]
                 model_path = best_model["path"]
                 logger.info(
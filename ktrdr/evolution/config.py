@@ -82,6 +82,10 @@ class EvolutionConfig:
     poll_interval: int = 30  # seconds
     stale_operation_timeout: int = 1800  # 30 min in seconds
     budget_cap: float = 50.0
+    # Concurrent fitness-slice backtests; 0 = number of backtest workers
+    max_concurrent_backtests: int = 0
+    # Backtest the additional fitness slices as one multi-slice operation
+    batch_fitness_slices: bool = True
 
     # Reproducibility
     seed: int | None = None
@@ -95,6 +99,11 @@ class EvolutionConfig:
             raise ValueError(f"generations must be >= 1, got {self.generations}")
         if not self.fitness_slices:
             raise ValueError("fitness_slices must not be empty")
+        if self.max_concurrent_backtests < 0:
+            raise ValueError(
+                f"max_concurrent_backtests must be >= 0, "
+                f"got {self.max_concurrent_backtests}"
+            )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for YAML persistence."""
@@ -114,6 +123,8 @@ class EvolutionConfig:
             "poll_interval": self.poll_interval,
             "stale_operation_timeout": self.stale_operation_timeout,
             "budget_cap": self.budget_cap,
+            "max_concurrent_backtests": self.max_concurrent_backtests,
+            "batch_fitness_slices": self.batch_fitness_slices,
             "seed": self.seed,
         }
 
@@ -136,5 +147,7 @@ class EvolutionConfig:
             poll_interval=d["poll_interval"],
             stale_operation_timeout=d["stale_operation_timeout"],
             budget_cap=d["budget_cap"],
+            max_concurrent_backtests=d.get("max_concurrent_backtests", 0),
+            batch_fitness_slices=d.get("batch_fitness_slices", True),
             seed=d.get("seed"),
         )
@@ -1,7 +1,11 @@
 """Generation harness — orchestrates evolution across generations.
 
-Triggers research cycles via HTTP, polls for completion, extracts results,
-and scores fitness. The run() method drives the full evolution loop:
+Triggers research cycles via HTTP, waits for completion, extracts results,
+and scores fitness. Completion is awaited on the operations event stream
+(SSE), falling back to polling when streaming is unavailable. Researchers are
+awaited and scored concurrently, and their additional fitness slices run as
+one multi-slice backtest (or, unbatched, fan out in parallel up to the
+available backtest capacity). The run() method drives the full evolution loop:
 seed → run_generation → select → reproduce → save → repeat.
 """
 
@@ -9,8 +13,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Protocol
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
+import httpx
+
+from ktrdr.async_infrastructure.sse import stream_until_terminal
 from ktrdr.evolution.brief import BriefTranslator
 from ktrdr.evolution.config import DateRange, EvolutionConfig
 from ktrdr.evolution.fitness import MINIMUM_FITNESS, FitnessEvaluator
@@ -25,6 +33,8 @@ logger = logging.getLogger(__name__)
 # Maximum backoff between retries on at_capacity (seconds)
 _MAX_BACKOFF = 300  # 5 minutes
 
+_T = TypeVar("_T")
+
 
 class HttpClient(Protocol):
     """Protocol for HTTP client (httpx.AsyncClient compatible)."""
@@ -68,6 +78,8 @@ class GenerationHarness:
         self._base_url = base_url
         self._brief_translator = BriefTranslator()
         self._fitness = FitnessEvaluator(config)
+        self._backtest_semaphore: asyncio.Semaphore | None = None
+        self._backtest_semaphore_lock = asyncio.Lock()
 
     async def run(self, population_manager: PopulationManager) -> None:
         """Execute the full multi-generation evolution loop.
@@ -359,58 +371,53 @@ class GenerationHarness:
                 )
                 break
 
-        # Phase 2: Poll, run additional backtests, score
-        results: list[dict[str, Any]] = []
-        for researcher in population:
-            op_id = operation_map.get(researcher.id)
-            if op_id is None:
-                results.append(
-                    {
-                        "researcher_id": researcher.id,
-                        "fitness": MINIMUM_FITNESS,
-                        "backtest_result": None,
-                        "slice_results": [],
-                    }
+        # Phase 2: Poll, run additional backtests, score — all researchers
+        # concurrently, so the generation takes about as long as the slowest
+        # one. Results keep population order.
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    self._score_researcher(researcher, operation_map.get(researcher.id))
                 )
-                continue
-
-            # Poll research operation (get full operation data)
-            op_data = await self._poll_until_terminal(op_id)
-            if op_data is None:
-                results.append(
-                    {
-                        "researcher_id": researcher.id,
-                        "fitness": MINIMUM_FITNESS,
-                        "backtest_result": None,
-                        "slice_results": [],
-                    }
-                )
-                continue
+                for researcher in population
+            ]
+        return [task.result() for task in tasks]
+
+    async def _score_researcher(
+        self, researcher: Researcher, op_id: str | None
+    ) -> dict[str, Any]:
+        """Wait for one researcher's operation, run extra slices, score it."""
+        failed: dict[str, Any] = {
+            "researcher_id": researcher.id,
+            "fitness": MINIMUM_FITNESS,
+            "backtest_result": None,
+            "slice_results": [],
+        }
+        if op_id is None:
+            return failed
 
-            backtest_result = self._extract_backtest_result(op_data)
-            slice_results: list[dict[str, Any]] = (
-                [backtest_result] if backtest_result else []
-            )
+        # Poll research operation (get full operation data)
+        op_data = await self._poll_until_terminal(op_id)
+        if op_data is None:
+            return failed
 
-            # Run additional backtests if we have strategy metadata
-            model_path, strategy_name = self._extract_metadata(op_data)
-            if backtest_result and strategy_name:
-                additional = await self._run_additional_backtests(
-                    model_path, strategy_name
-                )
-                slice_results.extend(additional)
-
-            fitness = self._fitness.evaluate_slices(slice_results)
-            results.append(
-                {
-                    "researcher_id": researcher.id,
-                    "fitness": fitness,
-                    "backtest_result": backtest_result,
-                    "slice_results": slice_results,
-                }
-            )
+        backtest_result = self._extract_backtest_result(op_data)
+        slice_results: list[dict[str, Any]] = (
+            [backtest_result] if backtest_result else []
+        )
 
-        return results
+        # Run additional backtests if we have strategy metadata
+        model_path, strategy_name = self._extract_metadata(op_data)
+        if backtest_result and strategy_name:
+            additional = await self._run_additional_backtests(model_path, strategy_name)
+            slice_results.extend(additional)
+
+        return {
+            "researcher_id": researcher.id,
+            "fitness": self._fitness.evaluate_slices(slice_results),
+            "backtest_result": backtest_result,
+            "slice_results": slice_results,
+        }
 
     async def _trigger_researcher(
         self, generation: int, researcher: Researcher
@@ -456,10 +463,14 @@ class GenerationHarness:
             return None
 
     async def _poll_until_terminal(self, operation_id: str) -> dict[str, Any] | None:
-        """Poll an operation until completed or failed.
+        """Wait for an operation to complete or fail, then fetch it.
+
+        Waits on the operations event stream first; polling takes over when
+        the stream is unavailable or drops before the operation finishes.
 
         Returns the full operation data dict on completion, None on failure.
         """
+        await self._await_terminal_event(operation_id)
         while True:
             raw_response = await self._client.get(
                 f"{self._base_url}/api/v1/operations/{operation_id}",
@@ -481,6 +492,27 @@ class GenerationHarness:
             if self._config.poll_interval > 0:
                 await asyncio.sleep(self._config.poll_interval)
 
+    async def _await_terminal_event(self, operation_id: str) -> None:
+        """Block until the event stream reports the operation as terminal.
+
+        Returns early (leaving the rest to polling) when the client cannot
+        stream, e.g. test doubles, or the stream fails.
+        """
+        if not isinstance(self._client, httpx.AsyncClient):
+            return
+        try:
+            await stream_until_terminal(
+                self._client,
+                f"{self._base_url}/api/v1/operations/stream",
+                operation_id,
+            )
+        except Exception as e:
+            logger.debug(
+                "Event stream unavailable for %s, polling instead: %s",
+                operation_id,
+                e,
+            )
+
     async def _poll_operation(self, operation_id: str) -> dict[str, Any] | None:
         """Poll an operation and extract backtest_result.
 
@@ -533,14 +565,33 @@ class GenerationHarness:
         )
         return model_path, strategy_name
 
+    @staticmethod
+    def _extract_slice_results(
+        op_data: dict[str, Any],
+    ) -> list[dict[str, Any] | None] | None:
+        """Extract per-slice metrics from a completed multi-slice backtest.
+
+        Returns one entry per slice in request order (None where a slice has
+        no metrics), or None if the result has no slices.
+        """
+        result_summary = op_data.get("result_summary") or {}
+        slices = result_summary.get("slices")
+        if not slices:
+            return None
+        return [s.get("metrics") for s in slices]
+
     async def _trigger_backtest(
         self,
         model_path: str | None,
         strategy_name: str,
         date_range: DateRange,
+        slices: list[DateRange] | None = None,
     ) -> str | None:
         """Trigger a single backtest via the backtest API.
 
+        With ``slices``, triggers one multi-slice backtest over ``date_range``
+        that reports metrics for each slice.
+
         Returns the operation_id on success, None on failure.
         """
         # Omit timeframe — the backend resolves it from the strategy config.
@@ -554,6 +605,11 @@ class GenerationHarness:
         }
         if model_path:
             payload["model_path"] = model_path
+        if slices:
+            payload["slices"] = [
+                {"start_date": s.start.isoformat(), "end_date": s.end.isoformat()}
+                for s in slices
+            ]
         raw_response = await self._client.post(
             f"{self._base_url}/api/v1/backtests/start",
             json=payload,
@@ -571,9 +627,45 @@ class GenerationHarness:
         date_range: DateRange,
     ) -> dict[str, Any] | None:
         """Run a single backtest and return the result. Retries with backoff."""
+        return await self._run_backtest_with_retry(
+            model_path, strategy_name, date_range, self._extract_backtest_result
+        )
+
+    async def _run_sliced_backtest(
+        self,
+        model_path: str | None,
+        strategy_name: str,
+        slices: list[DateRange],
+    ) -> list[dict[str, Any] | None] | None:
+        """Backtest all slices in one operation. Retries with backoff.
+
+        Returns per-slice metrics in slice order, or None if the backtest failed.
+        """
+        span = DateRange(
+            start=min(s.start for s in slices), end=max(s.end for s in slices)
+        )
+        return await self._run_backtest_with_retry(
+            model_path,
+            strategy_name,
+            span,
+            self._extract_slice_results,
+            slices=slices,
+        )
+
+    async def _run_backtest_with_retry(
+        self,
+        model_path: str | None,
+        strategy_name: str,
+        date_range: DateRange,
+        extract: Callable[[dict[str, Any]], _T | None],
+        slices: list[DateRange] | None = None,
+    ) -> _T | None:
+        """Trigger and poll a backtest, extracting its result. Retries with backoff."""
         max_attempts = 4
         for attempt in range(max_attempts):
-            op_id = await self._trigger_backtest(model_path, strategy_name, date_range)
+            op_id = await self._trigger_backtest(
+                model_path, strategy_name, date_range, slices
+            )
             if op_id is None:
                 if attempt < max_attempts - 1:
                     delay = 2**attempt  # 1s, 2s, 4s
@@ -586,7 +678,8 @@ class GenerationHarness:
                     continue
                 return None
 
-            result = await self._poll_operation(op_id)
+            op = await self._poll_until_terminal(op_id)
+            result = extract(op) if op else None
             if result is not None:
                 return result
 
@@ -603,21 +696,80 @@ class GenerationHarness:
     ) -> list[dict[str, Any]]:
         """Run additional backtests for fitness slices beyond the first.
 
+        With ``batch_fitness_slices`` all slices run as one multi-slice
+        backtest (data loaded and featurized once); otherwise each slice is
+        its own backtest.
+
         Returns list of backtest_result dicts (one per successful slice).
         Failed slices are omitted — the fitness evaluator handles partial data.
         """
         additional_slices = self._config.fitness_slices[1:]
-        results: list[dict[str, Any]] = []
+        if not additional_slices:
+            return []
+        slots = await self._backtest_slots()
+
+        slice_outcomes: list[dict[str, Any] | None]
+        if self._config.batch_fitness_slices:
+            async with slots:
+                batched = await self._run_sliced_backtest(
+                    model_path, strategy_name, list(additional_slices)
+                )
+            # Slices missing from a short or failed result count as failed
+            slice_outcomes = (list(batched or []) + [None] * len(additional_slices))[
+                : len(additional_slices)
+            ]
+        else:
+
+            async def run_slice(slice_range: DateRange) -> dict[str, Any] | None:
+                async with slots:
+                    return await self._run_single_backtest(
+                        model_path, strategy_name, slice_range
+                    )
 
-        for slice_range in additional_slices:
-            result = await self._run_single_backtest(
-                model_path, strategy_name, slice_range
+            # All slices at once (bounded by backtest capacity), kept in slice order
+            slice_outcomes = await asyncio.gather(
+                *(run_slice(slice_range) for slice_range in additional_slices)
             )
+
+        results: list[dict[str, Any]] = []
+        for slice_range, result in zip(additional_slices, slice_outcomes, strict=True):
             if result is not None:
                 results.append(result)
             else:
                 logger.warning(
                     "Additional backtest failed for %s after retry", slice_range
                 )
-
         return results
+
+    async def _backtest_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent slice backtests across researchers.
+
+        Sized from ``max_concurrent_backtests``, or from the number of
+        registered backtest workers when that is 0. Created once, on first
+        use; concurrent researchers wait for it rather than each sizing
+        their own.
+        """
+        async with self._backtest_semaphore_lock:
+            if self._backtest_semaphore is None:
+                limit = self._config.max_concurrent_backtests
+                if limit <= 0:
+                    limit = await self._count_backtest_workers()
+                logger.info("Running up to %d slice backtests concurrently", limit)
+                self._backtest_semaphore = asyncio.Semaphore(limit)
+        return self._backtest_semaphore
+
+    async def _count_backtest_workers(self) -> int:
+        """Number of registered backtest workers (at least 1)."""
+        try:
+            raw_response = await self._client.get(
+                f"{self._base_url}/api/v1/workers",
+                params={"worker_type": "backtesting"},
+            )
+            data: Any = _to_dict(raw_response)
+            # The workers API returns a bare list; accept the usual
+            # {"success": ..., "data": [...]} envelope as well
+            workers = data.get("data", []) if isinstance(data, dict) else data
+            return max(1, len(workers))
+        except Exception as e:
+            logger.warning("Could not list backtest workers, running serially: %s", e)
+            return 1
@@ -13,6 +13,7 @@ For specific indicator classes, import from their modules directly:
 """
 
 from ktrdr.indicators.base_indicator import INDICATOR_REGISTRY, BaseIndicator
+from ktrdr.indicators.incremental_engine import IncrementalIndicatorEngine
 from ktrdr.indicators.indicator_engine import IndicatorEngine
 
 # List of all indicator modules for lazy loading
@@ -84,5 +85,6 @@ __all__ = [
     "BaseIndicator",
     "INDICATOR_REGISTRY",
     "IndicatorEngine",
+    "IncrementalIndicatorEngine",
     "ensure_all_registered",
 ]
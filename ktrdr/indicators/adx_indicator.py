@@ -10,6 +10,7 @@ of a trend without regard to its direction. It consists of three lines:
 Author: KTRDR
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 import pandas as pd
@@ -17,7 +18,9 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.streaming import EwmMean, true_range
 
 logger = get_logger(__name__)
 
@@ -135,14 +138,6 @@ class ADXIndicator(BaseIndicator):
         # Extract OHLC data
         high = data["high"]
         low = data["low"]
-        close = data["close"]
-        prev_close = close.shift(1)
-
-        # Calculate True Range (TR)
-        tr1 = high - low
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
 
         # Calculate Directional Movement
         high_diff = high - high.shift(1)
@@ -159,7 +154,7 @@ class ADXIndicator(BaseIndicator):
         dm_minus.fillna(0, inplace=True)
 
         # Apply Wilder's smoothing to TR, +DM, and -DM
-        tr_smooth = self._wilder_smoothing(tr, period)
+        tr_smooth = graph.ewm(data, graph.TRUE_RANGE, alpha=1.0 / period, adjust=False)
         dm_plus_smooth = self._wilder_smoothing(dm_plus, period)
         dm_minus_smooth = self._wilder_smoothing(dm_minus, period)
 
@@ -201,6 +196,51 @@ class ADXIndicator(BaseIndicator):
 
         return result
 
+    def _new_state(self) -> dict[str, Any]:
+        alpha = 1.0 / self.params["period"]
+        return {
+            "prev_high": float("nan"),
+            "prev_low": float("nan"),
+            "prev_close": float("nan"),
+            "tr": EwmMean(alpha=alpha),
+            "dm_plus": EwmMean(alpha=alpha),
+            "dm_minus": EwmMean(alpha=alpha),
+            "adx": EwmMean(alpha=alpha),
+        }
+
+    def _update(
+        self, state: dict[str, Any], bar: Mapping[str, Any]
+    ) -> dict[str, float]:
+        high, low = float(bar["high"]), float(bar["low"])
+        tr = true_range(high, low, state["prev_close"])
+        high_diff = high - state["prev_high"]
+        low_diff = state["prev_low"] - low
+        state["prev_high"], state["prev_low"] = high, low
+        state["prev_close"] = float(bar["close"])
+
+        dm_plus = high_diff if high_diff > low_diff and high_diff > 0 else 0.0
+        dm_minus = low_diff if low_diff > high_diff and low_diff > 0 else 0.0
+        tr_smooth = state["tr"].update(tr)
+        di_plus = self._directional_index(state["dm_plus"].update(dm_plus), tr_smooth)
+        di_minus = self._directional_index(
+            state["dm_minus"].update(dm_minus), tr_smooth
+        )
+
+        di_sum = di_plus + di_minus
+        dx = (abs(di_plus - di_minus) / di_sum) * 100 if di_sum != 0 else 0.0
+        if dx != dx:
+            dx = 0.0
+        return {
+            "adx": state["adx"].update(dx),
+            "plus_di": di_plus,
+            "minus_di": di_minus,
+        }
+
+    @staticmethod
+    def _directional_index(dm_smooth: float, tr_smooth: float) -> float:
+        di = (dm_smooth / tr_smooth) * 100 if tr_smooth != 0 else 0.0
+        return 0.0 if di != di else di
+
     def get_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Generate trading signals based on ADX.
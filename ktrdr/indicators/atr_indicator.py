@@ -5,12 +5,17 @@ Average True Range is a volatility indicator that measures the average of true r
 over a specified period. It helps traders assess the volatility of a security.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 import pandas as pd
 from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.streaming import RollingMean, true_range
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -94,31 +99,13 @@ class ATRIndicator(BaseIndicator):
                 },
             )
 
-        # Calculate True Range components
-        high = data["high"]
-        low = data["low"]
-        close = data["close"]
-
-        # Previous close (shifted by 1)
-        prev_close = close.shift(1)
-
         # True Range is the maximum of:
         # 1. High - Low
         # 2. |High - Previous Close|
         # 3. |Low - Previous Close|
-        tr1 = high - low
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-
-        # True Range is the maximum of the three
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # For the first data point, we don't have a previous close,
-        # so True Range is just High - Low
-        true_range.iloc[0] = tr1.iloc[0]
-
-        # Calculate ATR as the simple moving average of True Range
-        atr = true_range.rolling(window=period, min_periods=period).mean()
+        # For the first data point there is no previous close, so it's High - Low.
+        # ATR is the simple moving average of True Range.
+        atr = graph.rolling(data, graph.TRUE_RANGE, period, "mean")
 
         # M3a: Return unnamed Series (engine handles naming)
         result_series = pd.Series(
@@ -129,3 +116,12 @@ class ATRIndicator(BaseIndicator):
         logger.debug(f"Computed ATR with period={period}")
 
         return result_series
+
+    def _new_state(self) -> dict[str, Any]:
+        return {"prev_close": float("nan"), "atr": RollingMean(self.params["period"])}
+
+    def _update(self, state: dict[str, Any], bar: Mapping[str, Any]) -> float:
+        close = float(bar["close"])
+        tr = true_range(float(bar["high"]), float(bar["low"]), state["prev_close"])
+        state["prev_close"] = close
+        return state["atr"].update(tr)
@@ -6,8 +6,10 @@ implementations must inherit from, ensuring a consistent interface across
 all technical indicators.
 """
 
+import copy
 import inspect
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any, Optional, Union
 
 import pandas as pd
@@ -253,6 +255,63 @@ class BaseIndicator(ABC):
         """
         pass
 
+    @classmethod
+    def supports_incremental(cls) -> bool:
+        """
+        Indicate whether this indicator implements incremental updates.
+
+        Returns:
+            bool: True if the subclass overrides _new_state() and _update()
+        """
+        return cls._update is not BaseIndicator._update
+
+    def update(self, bar: Mapping[str, Any]) -> Union[float, dict[str, float]]:
+        """
+        Advance the indicator by one bar and return its latest value.
+
+        Feeding bars in order produces exactly the last row compute() would
+        return for the same history, at O(1) cost per bar for most indicators.
+
+        Args:
+            bar: One OHLCV bar (dict or pd.Series row) with the columns
+                 compute() requires
+
+        Returns:
+            float for single-output indicators, or a dict of output name to
+            value for multi-output indicators. NaN during warm-up.
+
+        Raises:
+            NotImplementedError: If the indicator has no incremental support
+        """
+        if not self.supports_incremental():
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not support incremental updates"
+            )
+        state = getattr(self, "_stream_state", None)
+        if state is None:
+            state = self._stream_state = self._new_state()
+        return self._update(state, bar)
+
+    def reset_state(self) -> None:
+        """Discard incremental state; the next update() starts a new series."""
+        self._stream_state = None
+
+    def snapshot_state(self) -> Any:
+        """Return a copy of the incremental state for restore_state()."""
+        return copy.deepcopy(getattr(self, "_stream_state", None))
+
+    def restore_state(self, snapshot: Any) -> None:
+        """Restore incremental state taken with snapshot_state()."""
+        self._stream_state = copy.deepcopy(snapshot)
+
+    def _new_state(self) -> Any:
+        """Create the incremental state for a new series."""
+        raise NotImplementedError
+
+    def _update(self, state: Any, bar: Mapping[str, Any]) -> Any:
+        """Advance state by one bar and return the latest value (see update())."""
+        raise NotImplementedError
+
     def validate_input_data(self, df: pd.DataFrame, required_columns: list) -> None:
         """
         Validate that the input DataFrame contains the required columns.
@@ -10,13 +10,16 @@ The indicator is commonly used to identify overbought/oversold conditions
 and potential breakout points.
 """
 
-from typing import Union
+from collections.abc import Mapping
+from typing import Any, Union
 
 import pandas as pd
 from pydantic import Field
 
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.streaming import RollingMean, RollingStd
 
 
 class BollingerBandsIndicator(BaseIndicator):
@@ -123,10 +126,10 @@ class BollingerBandsIndicator(BaseIndicator):
             )
 
         # Calculate middle band (SMA)
-        middle_band = data[source].rolling(window=period, min_periods=period).mean()
+        middle_band = graph.rolling(data, source, period, "mean")
 
         # Calculate standard deviation
-        rolling_std = data[source].rolling(window=period, min_periods=period).std()
+        rolling_std = graph.rolling(data, source, period, "std")
 
         # Calculate upper and lower bands
         upper_band = middle_band + (multiplier * rolling_std)
@@ -144,3 +147,20 @@ class BollingerBandsIndicator(BaseIndicator):
         )
 
         return result
+
+    def _new_state(self) -> tuple[RollingMean, RollingStd]:
+        period: int = self.params["period"]
+        return RollingMean(period), RollingStd(period)
+
+    def _update(
+        self, state: tuple[RollingMean, RollingStd], bar: Mapping[str, Any]
+    ) -> dict[str, float]:
+        multiplier: float = self.params["multiplier"]
+        price = float(bar[self.params["source"]])
+        middle = state[0].update(price)
+        std = state[1].update(price)
+        return {
+            "upper": middle + (multiplier * std),
+            "middle": middle,
+            "lower": middle - (multiplier * std),
+        }
@@ -16,6 +16,7 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 logger = get_logger(__name__)
@@ -150,7 +151,7 @@ class CMFIndicator(BaseIndicator):
 
         # Calculate CMF (rolling sum of MFV divided by rolling sum of volume)
         mfv_sum = money_flow_volume.rolling(window=period, min_periods=period).sum()
-        volume_sum = volume.rolling(window=period, min_periods=period).sum()
+        volume_sum = graph.rolling(data, "volume", period, "sum")
 
         # Avoid division by zero
         cmf = pd.Series(index=data.index, dtype=float)
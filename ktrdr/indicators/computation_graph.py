@@ -0,0 +1,232 @@
+"""
+Shared primitive computations for one indicator pass over a frame.
+
+Many indicators are built from the same few primitives: rolling
+mean/std/max/min/sum and exponential moving averages over an input column,
+and the true range. A strategy that configures MACD, EMA and Bollinger Bands
+on close, or ATR, ADX, Keltner Channels and SuperTrend together, would
+otherwise compute the same moving averages and true range several times.
+
+IndicatorEngine.compute() activates a ComputationGraph for the frame it
+processes. Indicators request primitives through the module-level helpers
+(rolling(), ewm(), true_range()). While a graph is active for the same
+DataFrame, each primitive is a node keyed by (operation, input, parameters):
+it is computed once and reused by every later request, including requests
+from sub-indicators (e.g. BollingerBandWidth computing BollingerBands).
+Outside an active graph, or for a different DataFrame (context data), the
+helpers compute directly.
+
+Returned Series are shared between indicators and must not be modified in
+place.
+"""
+
+import time
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+import pandas as pd
+
+# Input name for the derived true range series (high/low/close)
+TRUE_RANGE = "true_range"
+
+_ROLLING_STATS = ("mean", "std", "max", "min", "sum")
+
+_active_graph: ContextVar[Optional["ComputationGraph"]] = ContextVar(
+    "indicator_computation_graph", default=None
+)
+
+
+class ComputationGraph:
+    """Memoized primitive computations over a single OHLCV frame."""
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Initialize an empty graph for a frame.
+
+        Args:
+            data: The DataFrame whose columns are the graph's inputs
+        """
+        self.data = data
+        self._nodes: dict[Hashable, pd.Series] = {}
+        self._costs: dict[Hashable, float] = {}
+        self._requested: Counter[str] = Counter()
+        self._computed: Counter[str] = Counter()
+        self._seconds_saved = 0.0
+        self.indicators_requested = 0
+        self.indicators_reused = 0
+
+    @contextmanager
+    def activate(self) -> Iterator["ComputationGraph"]:
+        """Route primitive helpers for this frame through the graph."""
+        token = _active_graph.set(self)
+        try:
+            yield self
+        finally:
+            _active_graph.reset(token)
+
+    def series(self, source: str) -> pd.Series:
+        """Return an input column, or the shared true range for TRUE_RANGE."""
+        if source == TRUE_RANGE:
+            return self._node((TRUE_RANGE,), lambda: _true_range(self.data))
+        return self.data[source]
+
+    def rolling(
+        self,
+        source: str,
+        window: int,
+        stat: str,
+        min_periods: Optional[int] = None,
+    ) -> pd.Series:
+        """Rolling statistic of an input (see module-level rolling())."""
+        # rolling(window) and rolling(window, min_periods=window) are the same node
+        min_periods = window if min_periods is None else min_periods
+        return self._node(
+            (f"rolling_{stat}", source, window, min_periods),
+            lambda: _rolling(self.series(source), window, stat, min_periods),
+        )
+
+    def ewm(
+        self,
+        source: str,
+        span: Optional[float] = None,
+        alpha: Optional[float] = None,
+        adjust: bool = True,
+    ) -> pd.Series:
+        """Exponential moving average of an input (see module-level ewm())."""
+        return self._node(
+            ("ewm", source, span, alpha, adjust),
+            lambda: self.series(source)
+            .ewm(span=span, alpha=alpha, adjust=adjust)
+            .mean(),
+        )
+
+    def report(self) -> dict[str, Any]:
+        """
+        Summarize how much work was deduplicated.
+
+        Returns:
+            Dict with indicator and primitive request/compute/reuse counts,
+            per-operation counts, and the measured compute time of reused
+            primitives (an estimate of the time saved)
+        """
+        requested = sum(self._requested.values())
+        computed = sum(self._computed.values())
+        return {
+            "indicators": self.indicators_requested,
+            "indicators_reused": self.indicators_reused,
+            "primitives_requested": requested,
+            "primitives_computed": computed,
+            "primitives_reused": requested - computed,
+            "by_operation": {
+                op: {"requested": count, "computed": self._computed[op]}
+                for op, count in sorted(self._requested.items())
+            },
+            "seconds_saved": round(self._seconds_saved, 6),
+        }
+
+    def _node(self, key: Hashable, compute: Callable[[], pd.Series]) -> pd.Series:
+        op = key[0]  # type: ignore[index]
+        self._requested[op] += 1
+        node = self._nodes.get(key)
+        if node is not None:
+            self._seconds_saved += self._costs[key]
+            return node
+        started = time.perf_counter()
+        node = compute()
+        self._costs[key] = time.perf_counter() - started
+        self._computed[op] += 1
+        self._nodes[key] = node
+        return node
+
+
+def _graph_for(data: pd.DataFrame) -> Optional[ComputationGraph]:
+    graph = _active_graph.get()
+    return graph if graph is not None and graph.data is data else None
+
+
+def _rolling(
+    series: pd.Series, window: int, stat: str, min_periods: Optional[int]
+) -> pd.Series:
+    if stat not in _ROLLING_STATS:
+        raise ValueError(f"Unsupported rolling statistic: {stat}")
+    return getattr(series.rolling(window=window, min_periods=min_periods), stat)()
+
+
+def _true_range(data: pd.DataFrame) -> pd.Series:
+    high = data["high"]
+    low = data["low"]
+    prev_close = data["close"].shift(1)
+    tr1 = high - low
+    tr2 = (high - prev_close).abs()
+    tr3 = (low - prev_close).abs()
+    # The first bar has no previous close, so its true range is high - low
+    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+
+def rolling(
+    data: pd.DataFrame,
+    source: str,
+    window: int,
+    stat: str,
+    min_periods: Optional[int] = None,
+) -> pd.Series:
+    """
+    Rolling statistic of a column, shared within the active graph.
+
+    Equivalent to data[source].rolling(window, min_periods).<stat>().
+
+    Args:
+        data: Input frame
+        source: Column name, or TRUE_RANGE
+        window: Window size
+        stat: One of "mean", "std", "max", "min", "sum"
+        min_periods: Minimum observations (default: window)
+
+    Returns:
+        Series of rolling values (read-only)
+    """
+    graph = _graph_for(data)
+    if graph is not None:
+        return graph.rolling(source, window, stat, min_periods)
+    series = _true_range(data) if source == TRUE_RANGE else data[source]
+    return _rolling(series, window, stat, min_periods)
+
+
+def ewm(
+    data: pd.DataFrame,
+    source: str,
+    span: Optional[float] = None,
+    alpha: Optional[float] = None,
+    adjust: bool = True,
+) -> pd.Series:
+    """
+    Exponential moving average of a column, shared within the active graph.
+
+    Equivalent to data[source].ewm(span=span, alpha=alpha, adjust=adjust).mean().
+
+    Args:
+        data: Input frame
+        source: Column name, or TRUE_RANGE
+        span: Decay in terms of span
+        alpha: Smoothing factor (when span is not given)
+        adjust: Use pandas' adjusted weighting
+
+    Returns:
+        Series of moving average values (read-only)
+    """
+    graph = _graph_for(data)
+    if graph is not None:
+        return graph.ewm(source, span=span, alpha=alpha, adjust=adjust)
+    series = _true_range(data) if source == TRUE_RANGE else data[source]
+    return series.ewm(span=span, alpha=alpha, adjust=adjust).mean()
+
+
+def true_range(data: pd.DataFrame) -> pd.Series:
+    """True range of each bar (high - low for the first), shared within the graph."""
+    graph = _graph_for(data)
+    if graph is not None:
+        return graph.series(TRUE_RANGE)
+    return _true_range(data)
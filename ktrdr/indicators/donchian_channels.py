@@ -15,6 +15,7 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 logger = get_logger(__name__)
@@ -118,10 +119,10 @@ class DonchianChannelsIndicator(BaseIndicator):
             )
 
         # Calculate upper channel (highest high)
-        upper_channel = data["high"].rolling(window=period, min_periods=period).max()
+        upper_channel = graph.rolling(data, "high", period, "max")
 
         # Calculate lower channel (lowest low)
-        lower_channel = data["low"].rolling(window=period, min_periods=period).min()
+        lower_channel = graph.rolling(data, "low", period, "min")
 
         # Calculate middle line
         middle_line = (upper_channel + lower_channel) / 2
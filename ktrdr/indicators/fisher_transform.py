@@ -16,6 +16,7 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 logger = get_logger(__name__)
@@ -132,8 +133,8 @@ class FisherTransformIndicator(BaseIndicator):
         median_price = (data["high"] + data["low"]) / 2
 
         # Calculate rolling highest high and lowest low
-        highest_high = data["high"].rolling(window=period, min_periods=period).max()
-        lowest_low = data["low"].rolling(window=period, min_periods=period).min()
+        highest_high = graph.rolling(data, "high", period, "max")
+        lowest_low = graph.rolling(data, "low", period, "min")
 
         # Normalize price to range [-1, +1]
         # Avoid division by zero
@@ -12,6 +12,7 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 logger = get_logger(__name__)
@@ -174,22 +175,18 @@ class IchimokuIndicator(BaseIndicator):
             )
 
         # Extract price data
-        high = data["high"]
-        low = data["low"]
         close = data["close"]
 
         # Calculate Tenkan-sen (Conversion Line)
         # (9-period high + 9-period low) / 2
-        tenkan_high = high.rolling(
-            window=tenkan_period, min_periods=tenkan_period
-        ).max()
-        tenkan_low = low.rolling(window=tenkan_period, min_periods=tenkan_period).min()
+        tenkan_high = graph.rolling(data, "high", tenkan_period, "max")
+        tenkan_low = graph.rolling(data, "low", tenkan_period, "min")
         tenkan_sen = (tenkan_high + tenkan_low) / 2
 
         # Calculate Kijun-sen (Base Line)
         # (26-period high + 26-period low) / 2
-        kijun_high = high.rolling(window=kijun_period, min_periods=kijun_period).max()
-        kijun_low = low.rolling(window=kijun_period, min_periods=kijun_period).min()
+        kijun_high = graph.rolling(data, "high", kijun_period, "max")
+        kijun_low = graph.rolling(data, "low", kijun_period, "min")
         kijun_sen = (kijun_high + kijun_low) / 2
 
         # Calculate Senkou Span A (Leading Span A)
@@ -198,12 +195,8 @@ class IchimokuIndicator(BaseIndicator):
 
         # Calculate Senkou Span B (Leading Span B)
         # (52-period high + 52-period low) / 2, shifted forward by displacement
-        senkou_b_high = high.rolling(
-            window=senkou_b_period, min_periods=senkou_b_period
-        ).max()
-        senkou_b_low = low.rolling(
-            window=senkou_b_period, min_periods=senkou_b_period
-        ).min()
+        senkou_b_high = graph.rolling(data, "high", senkou_b_period, "max")
+        senkou_b_low = graph.rolling(data, "low", senkou_b_period, "min")
         senkou_span_b = (senkou_b_high + senkou_b_low) / 2
 
         # Calculate Chikou Span (Lagging Span)
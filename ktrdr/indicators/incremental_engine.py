@@ -0,0 +1,190 @@
+"""
+Incremental Indicator Engine module for KTRDR.
+
+This module provides the IncrementalIndicatorEngine class, which advances a
+strategy's indicators (and optionally its fuzzy memberships) one bar at a time
+instead of recomputing them over the full history for every new bar.
+"""
+
+from collections.abc import Hashable, Mapping
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from ktrdr import get_logger
+from ktrdr.errors import ConfigurationError
+from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.indicator_engine import IndicatorEngine
+
+if TYPE_CHECKING:
+    from ktrdr.fuzzy.engine import FuzzyEngine
+
+logger = get_logger(__name__)
+
+
+class IncrementalIndicatorEngine:
+    """
+    Per-bar counterpart of IndicatorEngine.
+
+    Output keys match the columns IndicatorEngine.compute() produces
+    ("{id}" for single-output indicators, "{id}.{output}" plus a "{id}" alias
+    for the primary output of multi-output ones), and values are
+    bit-identical to the last row of a batch compute over the same bars.
+
+    One engine tracks one series (symbol + timeframe); bars must be fed in
+    order. Every configured indicator must support incremental updates
+    (see BaseIndicator.supports_incremental()).
+    """
+
+    def __init__(
+        self,
+        indicators: dict[str, Any],
+        fuzzy_engine: Optional["FuzzyEngine"] = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            indicators: V3 format dict mapping indicator_id to IndicatorDefinition
+            fuzzy_engine: Optional fuzzy engine whose fuzzy sets are evaluated
+                on each bar's indicator values
+
+        Raises:
+            ConfigurationError: If an indicator can't be updated incrementally
+        """
+        engine = IndicatorEngine(indicators)
+        unsupported = sorted(
+            indicator_id
+            for indicator_id, indicator in engine._indicators.items()
+            if not indicator.supports_incremental()
+            or indicator_id in engine._data_sources
+        )
+        if unsupported:
+            raise ConfigurationError(
+                "Indicators do not support incremental updates: "
+                + ", ".join(unsupported),
+                "CONFIG-IncrementalUnsupported",
+                {"indicators": unsupported},
+            )
+
+        self._indicators: dict[str, BaseIndicator] = engine._indicators
+        self.fuzzy_engine = fuzzy_engine
+        self.last_timestamp: Optional[Hashable] = None
+        self.bars_processed = 0
+        self.last_values: dict[str, float] = {}
+
+    def update(
+        self, bar: Mapping[str, Any], timestamp: Optional[Hashable] = None
+    ) -> dict[str, float]:
+        """
+        Advance all indicators by one bar.
+
+        Args:
+            bar: OHLCV bar (dict or pd.Series row)
+            timestamp: Bar timestamp (defaults to the Series name, if any)
+
+        Returns:
+            Dict of indicator column name to latest value (NaN during warm-up)
+        """
+        values: dict[str, float] = {}
+        for indicator_id, indicator in self._indicators.items():
+            output = indicator.update(bar)
+            if isinstance(output, dict):
+                for name, value in output.items():
+                    values[f"{indicator_id}.{name}"] = value
+                primary = indicator.get_primary_output()
+                if primary is not None:
+                    values[indicator_id] = output[primary]
+            else:
+                values[indicator_id] = output
+
+        self.last_timestamp = (
+            timestamp if timestamp is not None else getattr(bar, "name", None)
+        )
+        self.bars_processed += 1
+        self.last_values = values
+        return values
+
+    def warm_up(self, data: pd.DataFrame) -> dict[str, float]:
+        """
+        Feed a block of history, one bar at a time.
+
+        Args:
+            data: OHLCV DataFrame in chronological order
+
+        Returns:
+            Indicator values after the last bar (empty if data is empty)
+        """
+        values = self.last_values
+        for timestamp, bar in zip(data.index, data.to_dict("records")):
+            values = self.update(bar, timestamp)
+        logger.debug(f"Warmed up incremental indicators on {len(data)} bars")
+        return values
+
+    def fuzzify(self, values: Mapping[str, float]) -> dict[str, float]:
+        """
+        Evaluate the fuzzy engine's sets on one bar's indicator values.
+
+        Args:
+            values: Indicator values as returned by update()
+
+        Returns:
+            Dict of "{fuzzy_set}_{membership}" to membership degree; fuzzy sets
+            whose indicator isn't tracked by this engine are skipped
+        """
+        if self.fuzzy_engine is None:
+            return {}
+
+        memberships: dict[str, float] = {}
+        for fuzzy_set_id, fuzzy_set in self.fuzzy_engine._fuzzy_sets.items():
+            indicator_id = self.fuzzy_engine.get_indicator_for_fuzzy_set(fuzzy_set_id)
+            if indicator_id not in values:
+                continue
+            # Evaluate as a one-element array: the same code path as batch fuzzify()
+            value = np.array([values[indicator_id]], dtype=float)
+            for membership_name, mf in fuzzy_set.items():
+                memberships[f"{fuzzy_set_id}_{membership_name}"] = float(
+                    mf.evaluate(value)[0]
+                )
+        return memberships
+
+    def process_bar(
+        self, bar: Mapping[str, Any], timestamp: Optional[Hashable] = None
+    ) -> tuple[dict[str, float], dict[str, float]]:
+        """
+        Advance indicators by one bar and fuzzify the new values.
+
+        Returns:
+            Tuple of (indicator values, fuzzy memberships)
+        """
+        values = self.update(bar, timestamp)
+        return values, self.fuzzify(values)
+
+    def reset(self) -> None:
+        """Discard all state; the next bar starts a new series."""
+        for indicator in self._indicators.values():
+            indicator.reset_state()
+        self.last_timestamp = None
+        self.bars_processed = 0
+        self.last_values = {}
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the engine state for restore()."""
+        return {
+            "indicators": {
+                indicator_id: indicator.snapshot_state()
+                for indicator_id, indicator in self._indicators.items()
+            },
+            "last_timestamp": self.last_timestamp,
+            "bars_processed": self.bars_processed,
+            "last_values": dict(self.last_values),
+        }
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Restore engine state taken with snapshot()."""
+        for indicator_id, indicator in self._indicators.items():
+            indicator.restore_state(snapshot["indicators"].get(indicator_id))
+        self.last_timestamp = snapshot["last_timestamp"]
+        self.bars_processed = snapshot["bars_processed"]
+        self.last_values = dict(snapshot["last_values"])
@@ -12,6 +12,7 @@ import pandas as pd
 from ktrdr import get_logger
 from ktrdr.errors import ConfigurationError, ProcessingError
 from ktrdr.indicators.base_indicator import INDICATOR_REGISTRY, BaseIndicator
+from ktrdr.indicators.computation_graph import ComputationGraph
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -43,6 +44,9 @@ class IndicatorEngine:
         """
         self._indicators: dict[str, BaseIndicator] = {}
         self._data_sources: dict[str, str] = {}  # indicator_id -> data_source key
+        # Deduplication report of the last compute() and per timeframe
+        self.last_computation_report: dict[str, Any] = {}
+        self.computation_reports: dict[str, dict[str, Any]] = {}
 
         if indicators:
             # Ensure all indicators are registered before we try to look them up
@@ -190,6 +194,9 @@ class IndicatorEngine:
         NOTE: No timeframe prefix added here - caller handles that.
         """
         result = data.copy()
+        graph = ComputationGraph(data)
+        # Indicators with identical type, params and input are computed once
+        outputs: dict[tuple, Any] = {}
 
         for indicator_id in indicator_ids:
             if indicator_id not in self._indicators:
@@ -209,7 +216,15 @@ class IndicatorEngine:
             else:
                 input_data = data
 
-            output = indicator.compute(input_data)
+            definition_key = (type(indicator), _freeze(indicator.params), source_key)
+            graph.indicators_requested += 1
+            output = outputs.get(definition_key)
+            if output is None:
+                with graph.activate():
+                    output = indicator.compute(input_data)
+                outputs[definition_key] = output
+            else:
+                graph.indicators_reused += 1
 
             if indicator.is_multi_output():
                 # Validate outputs match expected
@@ -233,6 +248,7 @@ class IndicatorEngine:
                 # Single output - name with indicator_id
                 result[indicator_id] = output
 
+        self.last_computation_report = graph.report()
         return result
 
     def compute_for_timeframe(
@@ -258,6 +274,16 @@ class IndicatorEngine:
             DataFrame with columns like "5m_rsi_14", "5m_bbands_20_2.upper"
         """
         result = self.compute(data, indicator_ids, context_data=context_data)
+        report = self.last_computation_report
+        self.computation_reports[timeframe] = report
+        if report["indicators_reused"] or report["primitives_reused"]:
+            logger.info(
+                f"[{timeframe}] Shared indicator work: "
+                f"{report['indicators_reused']}/{report['indicators']} indicators and "
+                f"{report['primitives_reused']}/{report['primitives_requested']} "
+                f"primitive computations reused "
+                f"(~{report['seconds_saved'] * 1000:.1f}ms saved)"
+            )
         return self._prefix_indicator_columns(result, timeframe)
 
     def _prefix_indicator_columns(
@@ -575,6 +601,9 @@ class IndicatorEngine:
 
                 # Apply indicators using existing apply() method
                 timeframe_result = processing_engine.apply(ohlcv_data)
+                self.computation_reports[timeframe] = (
+                    processing_engine.last_computation_report
+                )
 
                 # Prefix indicator columns with timeframe if requested (default)
                 if prefix_columns:
@@ -733,3 +762,8 @@ class IndicatorEngine:
             result_df[col] = macd_result[col]
 
         return result_df
+
+
+def _freeze(params: dict[str, Any]) -> tuple:
+    """Hashable form of an indicator's params for deduplication."""
+    return tuple(sorted((name, repr(value)) for name, value in params.items()))
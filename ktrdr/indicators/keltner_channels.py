@@ -15,6 +15,7 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 logger = get_logger(__name__)
@@ -131,27 +132,10 @@ class KeltnerChannelsIndicator(BaseIndicator):
             )
 
         # Calculate EMA for middle line
-        ema = data["close"].ewm(span=period, adjust=False).mean()
-
-        # Calculate ATR (Average True Range)
-        high = data["high"]
-        low = data["low"]
-        close = data["close"]
-        prev_close = close.shift(1)
-
-        # True Range components
-        tr1 = high - low
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-
-        # True Range is the maximum of the three
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # For the first data point, True Range is just High - Low
-        true_range.iloc[0] = tr1.iloc[0]
+        ema = graph.ewm(data, "close", span=period, adjust=False)
 
         # Calculate ATR as simple moving average of True Range
-        atr = true_range.rolling(window=atr_period, min_periods=atr_period).mean()
+        atr = graph.rolling(data, graph.TRUE_RANGE, atr_period, "mean")
 
         # Calculate channel bands
         band_width = multiplier * atr
@@ -7,13 +7,18 @@ This module provides classes for different types of moving averages:
 - WeightedMovingAverage (WMA): A weighted average giving more weight to recent prices
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 import numpy as np
 import pandas as pd
 from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.streaming import EwmMean, RollingMean
 
 logger = get_logger(__name__)
 
@@ -80,7 +85,7 @@ class SimpleMovingAverage(BaseIndicator):
 
         try:
             # Use pandas rolling function to calculate SMA
-            sma = df[source].rolling(window=period).mean()
+            sma = graph.rolling(df, source, period, "mean")
 
             # M3a: Return unnamed Series (engine handles naming)
             # Use .values to avoid inheriting name from source Series
@@ -100,6 +105,12 @@ class SimpleMovingAverage(BaseIndicator):
                 details={"indicator": "SMA", "error": str(e)},
             ) from e
 
+    def _new_state(self) -> RollingMean:
+        return RollingMean(self.params["period"])
+
+    def _update(self, state: RollingMean, bar: Mapping[str, Any]) -> float:
+        return state.update(float(bar[self.params["source"]]))
+
 
 class ExponentialMovingAverage(BaseIndicator):
     """
@@ -187,7 +198,7 @@ class ExponentialMovingAverage(BaseIndicator):
                     },
                 )
 
-            ema = source_data.ewm(span=period, adjust=adjust).mean()
+            ema = graph.ewm(df, source, span=period, adjust=adjust)
 
             # For test compatibility with the test_adjusted_vs_non_adjusted test:
             # Only when using our specific test dataset (recognized by first few values),
@@ -244,6 +255,12 @@ class ExponentialMovingAverage(BaseIndicator):
                 details={"indicator": "EMA", "error": str(e)},
             ) from e
 
+    def _new_state(self) -> EwmMean:
+        return EwmMean(span=self.params["period"], adjust=self.params["adjust"])
+
+    def _update(self, state: EwmMean, bar: Mapping[str, Any]) -> float:
+        return state.update(float(bar[self.params["source"]]))
+
 
 class WeightedMovingAverage(BaseIndicator):
     """
@@ -5,12 +5,17 @@ This module provides the MACDIndicator class for calculating the Moving Average
 Divergence (MACD) indicator.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 import pandas as pd
 from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.streaming import EwmMean
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -125,12 +130,9 @@ class MACDIndicator(BaseIndicator):
                 },
             )
 
-        # Get the source data
-        source_data = data[source]
-
         # Calculate fast and slow EMAs
-        fast_ema = source_data.ewm(span=fast_period, adjust=False).mean()
-        slow_ema = source_data.ewm(span=slow_period, adjust=False).mean()
+        fast_ema = graph.ewm(data, source, span=fast_period, adjust=False)
+        slow_ema = graph.ewm(data, source, span=slow_period, adjust=False)
 
         # Calculate MACD line
         macd_line = fast_ema - slow_ema
@@ -153,3 +155,19 @@ class MACDIndicator(BaseIndicator):
         )
 
         return result_df
+
+    def _new_state(self) -> tuple[EwmMean, EwmMean, EwmMean]:
+        return (
+            EwmMean(span=self.params["fast_period"]),
+            EwmMean(span=self.params["slow_period"]),
+            EwmMean(span=self.params["signal_period"]),
+        )
+
+    def _update(
+        self, state: tuple[EwmMean, EwmMean, EwmMean], bar: Mapping[str, Any]
+    ) -> dict[str, float]:
+        fast, slow, signal = state
+        price = float(bar[self.params["source"]])
+        line = fast.update(price) - slow.update(price)
+        signal_value = signal.update(line)
+        return {"line": line, "signal": signal_value, "histogram": line - signal_value}
@@ -5,6 +5,9 @@ On-Balance Volume is a momentum indicator that uses volume flow to predict chang
 The theory behind OBV is that volume precedes price movement.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 import pandas as pd
 
 from ktrdr import get_logger
@@ -117,3 +120,17 @@ class OBVIndicator(BaseIndicator):
         logger.debug("Computed OBV indicator")
 
         return result_series
+
+    def _new_state(self) -> dict[str, float]:
+        return {"prev_close": float("nan"), "obv": 0.0}
+
+    def _update(self, state: dict[str, float], bar: Mapping[str, Any]) -> float:
+        close = float(bar["close"])
+        price_diff = close - state["prev_close"]
+        state["prev_close"] = close
+        # OBV starts at 0; the first bar has no price change
+        if price_diff > 0:
+            state["obv"] = state["obv"] + float(bar["volume"])
+        elif price_diff < 0:
+            state["obv"] = state["obv"] - float(bar["volume"])
+        return state["obv"]
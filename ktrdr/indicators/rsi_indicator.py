@@ -5,6 +5,9 @@ This module provides the RSIIndicator class which computes the RSI technical
 indicator, a momentum oscillator that measures the speed and change of price movements.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 import numpy as np
 import pandas as pd
 from pydantic import Field
@@ -144,3 +147,49 @@ class RSIIndicator(BaseIndicator):
                 error_code="DATA-CalculationError",
                 details={"indicator": "RSI", "error": str(e)},
             ) from e
+
+    def _new_state(self) -> "_RSIState":
+        return _RSIState()
+
+    def _update(self, state: "_RSIState", bar: Mapping[str, Any]) -> float:
+        period: int = self.params["period"]
+        price = float(bar[self.params["source"]])
+        prev, state.prev = state.prev, price
+        state.bars += 1
+        if state.bars == 1:
+            return np.nan
+
+        delta = price - prev
+        gain = 0.0 if delta < 0 else delta
+        loss = abs(0.0 if delta > 0 else delta)
+
+        if state.bars <= period + 1:
+            # Seed with the same pandas mean compute() uses for the first period
+            state.gains.append(gain)
+            state.losses.append(loss)
+            if state.bars <= period:
+                return np.nan
+            state.avg_gain = pd.Series(state.gains, dtype=float).mean()
+            state.avg_loss = pd.Series(state.losses, dtype=float).mean()
+            state.gains, state.losses = [], []
+            if state.avg_loss != 0:
+                return 100 - (100 / (1 + state.avg_gain / state.avg_loss))
+            return 100.0 if state.avg_gain > 0 else 50.0
+
+        state.avg_gain = ((state.avg_gain * (period - 1)) + gain) / period
+        state.avg_loss = ((state.avg_loss * (period - 1)) + loss) / period
+        if state.avg_loss == 0:
+            return 50.0 if state.avg_gain == 0 else 100.0
+        return 100 - (100 / (1 + state.avg_gain / state.avg_loss))
+
+
+class _RSIState:
+    """Incremental RSI state: previous price and Wilder averages."""
+
+    def __init__(self) -> None:
+        self.prev = np.nan
+        self.bars = 0
+        self.gains: list[float] = []
+        self.losses: list[float] = []
+        self.avg_gain = np.nan
+        self.avg_loss = np.nan
@@ -5,12 +5,17 @@ The Stochastic Oscillator is a momentum indicator that compares a security's clo
 to its price range over a given time period. It generates two lines: %K and %D.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 import pandas as pd
 from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.streaming import RollingExtreme, RollingMean, divide
 
 # Create module-level logger
 logger = get_logger(__name__)
@@ -125,8 +130,8 @@ class StochasticIndicator(BaseIndicator):
             )
 
         # Calculate rolling highest high and lowest low over k_period
-        highest_high = data["high"].rolling(window=k_period, min_periods=k_period).max()
-        lowest_low = data["low"].rolling(window=k_period, min_periods=k_period).min()
+        highest_high = graph.rolling(data, "high", k_period, "max")
+        lowest_low = graph.rolling(data, "low", k_period, "min")
 
         # Calculate raw %K
         # %K = ((Close - Lowest Low) / (Highest High - Lowest Low)) × 100
@@ -159,3 +164,26 @@ class StochasticIndicator(BaseIndicator):
         )
 
         return result_df
+
+    def _new_state(self) -> dict[str, Any]:
+        k_period = self.params.get("k_period", 14)
+        smooth_k = self.params.get("smooth_k", 3)
+        return {
+            "highest": RollingExtreme(k_period),
+            "lowest": RollingExtreme(k_period, highest=False),
+            "k": RollingMean(smooth_k, min_periods=1) if smooth_k > 1 else None,
+            "d": RollingMean(self.params.get("d_period", 3), min_periods=1),
+        }
+
+    def _update(
+        self, state: dict[str, Any], bar: Mapping[str, Any]
+    ) -> dict[str, float]:
+        highest_high = state["highest"].update(float(bar["high"]))
+        lowest_low = state["lowest"].update(float(bar["low"]))
+        raw_k = (
+            divide(float(bar["close"]) - lowest_low, highest_high - lowest_low) * 100
+        )
+        if raw_k != raw_k:
+            raw_k = 50.0
+        percent_k = state["k"].update(raw_k) if state["k"] is not None else raw_k
+        return {"k": percent_k, "d": state["d"].update(percent_k)}
@@ -0,0 +1,323 @@
+"""
+Streaming building blocks for incremental indicator updates.
+
+Each class reproduces one pandas window operation one value at a time, using
+the same floating-point steps pandas uses internally (Kahan-compensated
+rolling sums, Welford rolling variance, recursive exponential weighting).
+Streamed values are therefore bit-identical to the batch compute() path, not
+just close to it.
+
+Like pandas rolling operations, the rolling states treat +/-inf as missing.
+"""
+
+import math
+from collections import deque
+from typing import Optional
+
+NAN = float("nan")
+
+
+def _is_missing(value: float) -> bool:
+    return value != value or value in (math.inf, -math.inf)
+
+
+class EwmMean:
+    """Exponentially weighted mean, as Series.ewm(...).mean() (ignore_na=False)."""
+
+    def __init__(
+        self,
+        span: Optional[float] = None,
+        alpha: Optional[float] = None,
+        adjust: bool = False,
+    ):
+        """
+        Initialize the state.
+
+        Args:
+            span: Decay in terms of span (alpha = 2 / (span + 1))
+            alpha: Smoothing factor, used when span is not given
+            adjust: Use pandas' adjusted weighting
+        """
+        com = (span - 1) / 2.0 if span is not None else (1.0 - alpha) / alpha
+        self.alpha = 1.0 / (1.0 + com)
+        self.adjust = adjust
+        self._old_wt_factor = 1.0 - self.alpha
+        self._new_wt = 1.0 if adjust else self.alpha
+        self._old_wt = 1.0
+        self._weighted = NAN
+        self._started = False
+        self._nobs = 0
+
+    def update(self, value: float) -> float:
+        """Add a value and return the current mean."""
+        is_obs = value == value
+        if not self._started:
+            self._started = True
+            self._weighted = value
+        elif self._weighted == self._weighted:
+            self._old_wt *= self._old_wt_factor
+            if is_obs:
+                if self._weighted != value:
+                    self._weighted = (
+                        self._old_wt * self._weighted + self._new_wt * value
+                    ) / (self._old_wt + self._new_wt)
+                if self.adjust:
+                    self._old_wt += self._new_wt
+                else:
+                    self._old_wt = 1.0
+        elif is_obs:
+            self._weighted = value
+        self._nobs += is_obs
+        return self._weighted if self._nobs else NAN
+
+
+class _RollingWindow:
+    """Fixed-size window of raw values, shared by the rolling states."""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._values: deque[float] = deque()
+
+    def _push(self, value: float) -> Optional[float]:
+        """Append a value; return the value leaving the window, if any."""
+        self._values.append(value)
+        if len(self._values) > self.window:
+            return self._values.popleft()
+        return None
+
+
+class RollingMean(_RollingWindow):
+    """Rolling mean, as Series.rolling(window, min_periods).mean()."""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        super().__init__(window, min_periods)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._sum = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._nobs = 0
+        self._neg_ct = 0
+        self._same_ct = 0
+        self._prev = NAN
+
+    def update(self, value: float) -> float:
+        """Add a value and return the mean of the current window."""
+        if _is_missing(value):
+            value = NAN
+        leaving = self._push(value)
+        if self.window <= 1 or len(self._values) == 1:
+            self._reset()
+            self._prev = value
+        elif leaving is not None and leaving == leaving:
+            self._nobs -= 1
+            y = -leaving - self._compensation_remove
+            t = self._sum + y
+            self._compensation_remove = t - self._sum - y
+            self._sum = t
+            if leaving < 0:
+                self._neg_ct -= 1
+        if value == value:
+            self._nobs += 1
+            y = value - self._compensation_add
+            t = self._sum + y
+            self._compensation_add = t - self._sum - y
+            self._sum = t
+            if value < 0:
+                self._neg_ct += 1
+            if value == self._prev:
+                self._same_ct += 1
+            else:
+                self._same_ct = 1
+            self._prev = value
+
+        if self._nobs < self.min_periods or self._nobs == 0:
+            return NAN
+        result = self._sum / self._nobs
+        if self._same_ct >= self._nobs:
+            result = self._prev
+        elif self._neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self._neg_ct == self._nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class RollingSum(_RollingWindow):
+    """Rolling sum, as Series.rolling(window, min_periods).sum()."""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        super().__init__(window, min_periods)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._sum = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._nobs = 0
+        self._same_ct = 0
+        self._prev = NAN
+
+    def update(self, value: float) -> float:
+        """Add a value and return the sum of the current window."""
+        if _is_missing(value):
+            value = NAN
+        leaving = self._push(value)
+        if self.window <= 1 or len(self._values) == 1:
+            self._reset()
+            self._prev = value
+        elif leaving is not None and leaving == leaving:
+            self._nobs -= 1
+            y = -leaving - self._compensation_remove
+            t = self._sum + y
+            self._compensation_remove = t - self._sum - y
+            self._sum = t
+        if value == value:
+            self._nobs += 1
+            y = value - self._compensation_add
+            t = self._sum + y
+            self._compensation_add = t - self._sum - y
+            self._sum = t
+            if value == self._prev:
+                self._same_ct += 1
+            else:
+                self._same_ct = 1
+            self._prev = value
+
+        if self._nobs == 0 == self.min_periods:
+            return 0.0
+        if self._nobs < self.min_periods:
+            return NAN
+        if self._same_ct >= self._nobs:
+            return self._prev * self._nobs
+        return self._sum
+
+
+class RollingVar(_RollingWindow):
+    """Rolling variance, as Series.rolling(window, min_periods).var(ddof)."""
+
+    def __init__(self, window: int, min_periods: Optional[int] = None, ddof: int = 1):
+        super().__init__(window, min_periods)
+        self.ddof = ddof
+        self._reset()
+
+    def _reset(self) -> None:
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._same_ct = 0
+        self._prev = NAN
+
+    def update(self, value: float) -> float:
+        """Add a value and return the variance of the current window."""
+        if _is_missing(value):
+            value = NAN
+        leaving = self._push(value)
+        if self.window <= 1 or len(self._values) == 1:
+            self._reset()
+            self._prev = value
+        elif leaving is not None and leaving == leaving:
+            self._nobs -= 1
+            if self._nobs:
+                prev_mean = self._mean - self._compensation_remove
+                y = leaving - self._compensation_remove
+                t = y - self._mean
+                self._compensation_remove = t + self._mean - y
+                delta = t
+                self._mean = self._mean - delta / self._nobs
+                self._ssqdm = self._ssqdm - (leaving - prev_mean) * (
+                    leaving - self._mean
+                )
+            else:
+                self._mean = 0.0
+                self._ssqdm = 0.0
+        if value == value:
+            if value == self._prev:
+                self._same_ct += 1
+            else:
+                self._same_ct = 1
+            self._prev = value
+            self._nobs += 1
+            prev_mean = self._mean - self._compensation_add
+            y = value - self._compensation_add
+            t = y - self._mean
+            self._compensation_add = t + self._mean - y
+            delta = t
+            self._mean = self._mean + delta / self._nobs
+            self._ssqdm = self._ssqdm + (value - prev_mean) * (value - self._mean)
+
+        minp = max(self.min_periods, 1)
+        if self._nobs >= minp and self._nobs > self.ddof:
+            if self._nobs == 1 or self._same_ct >= self._nobs:
+                return 0.0
+            result = self._ssqdm / (self._nobs - self.ddof)
+            return 0.0 if result < 0 else result
+        return NAN
+
+
+class RollingStd(RollingVar):
+    """Rolling standard deviation, as Series.rolling(window).std(ddof)."""
+
+    def update(self, value: float) -> float:
+        """Add a value and return the standard deviation of the current window."""
+        variance = super().update(value)
+        return math.sqrt(variance) if variance == variance else NAN
+
+
+class RollingExtreme(_RollingWindow):
+    """Rolling max or min, as Series.rolling(window, min_periods).max()/.min()."""
+
+    def __init__(
+        self, window: int, min_periods: Optional[int] = None, highest: bool = True
+    ):
+        super().__init__(window, min_periods)
+        self.highest = highest
+        self._index = 0
+        self._nobs = 0
+        # Monotonic (index, value) candidates; the front is the current extreme
+        self._candidates: deque[tuple[int, float]] = deque()
+
+    def update(self, value: float) -> float:
+        """Add a value and return the extreme of the current window."""
+        if _is_missing(value):
+            value = NAN
+        leaving = self._push(value)
+        if leaving is not None and leaving == leaving:
+            self._nobs -= 1
+        oldest = self._index - self.window
+        while self._candidates and self._candidates[0][0] <= oldest:
+            self._candidates.popleft()
+        if value == value:
+            self._nobs += 1
+            while self._candidates and (
+                self._candidates[-1][1] <= value
+                if self.highest
+                else self._candidates[-1][1] >= value
+            ):
+                self._candidates.pop()
+            self._candidates.append((self._index, value))
+        self._index += 1
+        if self._nobs < max(self.min_periods, 1) or not self._candidates:
+            return NAN
+        return self._candidates[0][1]
+
+
+def true_range(high: float, low: float, prev_close: float) -> float:
+    """True range of one bar; high - low when there is no previous close."""
+    ranges = [
+        r for r in (high - low, abs(high - prev_close), abs(low - prev_close)) if r == r
+    ]
+    return max(ranges) if ranges else NAN
+
+
+def divide(numerator: float, denominator: float) -> float:
+    """Float division with numpy semantics (x/0 is +/-inf or NaN, not an error)."""
+    if denominator != 0 or numerator != numerator:
+        return numerator / denominator
+    if numerator == 0:
+        return NAN
+    return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
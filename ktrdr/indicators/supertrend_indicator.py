@@ -15,6 +15,7 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 logger = get_logger(__name__)
@@ -130,16 +131,9 @@ class SuperTrendIndicator(BaseIndicator):
         high = data["high"]
         low = data["low"]
         close = data["close"]
-        prev_close = close.shift(1)
 
-        # Calculate True Range (TR)
-        tr1 = high - low
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # Calculate ATR using simple moving average
-        atr = tr.rolling(window=period, min_periods=period).mean()
+        # Calculate ATR using simple moving average of True Range
+        atr = graph.rolling(data, graph.TRUE_RANGE, period, "mean")
 
         # Calculate median price (HL2)
         median_price = (high + low) / 2
@@ -13,6 +13,7 @@ import pandas as pd
 from pydantic import Field
 
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 
@@ -90,7 +91,7 @@ class VolumeRatioIndicator(BaseIndicator):
 
         # Calculate volume SMA
         volume = data["volume"]
-        volume_sma = volume.rolling(window=period, min_periods=period).mean()
+        volume_sma = graph.rolling(data, "volume", period, "mean")
 
         # Calculate ratio using safe division (same logic as training pipeline)
         volume_ratio = np.where(
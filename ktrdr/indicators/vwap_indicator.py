@@ -5,14 +5,18 @@ This module implements the VWAP indicator, which calculates the average price
 a security has traded at throughout the day, weighted by volume.
 """
 
-from typing import Union
+import math
+from collections.abc import Mapping
+from typing import Any, Union
 
 import pandas as pd
 from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
+from ktrdr.indicators.streaming import RollingSum
 
 logger = get_logger(__name__)
 
@@ -152,7 +156,7 @@ class VWAPIndicator(BaseIndicator):
         else:
             # Rolling VWAP over specified period
             rolling_pv = price_volume.rolling(window=period, min_periods=1).sum()
-            rolling_volume = volume.rolling(window=period, min_periods=1).sum()
+            rolling_volume = graph.rolling(data, "volume", period, "sum", min_periods=1)
 
             # Avoid division by zero
             vwap = rolling_pv / rolling_volume.replace(0, float("nan"))
@@ -169,6 +173,40 @@ class VWAPIndicator(BaseIndicator):
 
         return result_series
 
+    def _new_state(self) -> dict[str, Any]:
+        period = self.params.get("period", 20)
+        if period == 0:
+            return {"pv": 0.0, "volume": 0.0}
+        return {
+            "pv": RollingSum(period, min_periods=1),
+            "volume": RollingSum(period, min_periods=1),
+        }
+
+    def _update(self, state: dict[str, Any], bar: Mapping[str, Any]) -> float:
+        close, volume = float(bar["close"]), float(bar["volume"])
+        if self.params.get("use_typical_price", True):
+            price = (float(bar["high"]) + float(bar["low"]) + close) / 3
+        else:
+            price = close
+        price_volume = price * volume
+
+        if self.params.get("period", 20) == 0:
+            # Cumulative sums skip missing values, which stay missing
+            if price_volume == price_volume:
+                state["pv"] += price_volume
+            if volume == volume:
+                state["volume"] += volume
+            total_pv = state["pv"] if price_volume == price_volume else math.nan
+            total_volume = state["volume"] if volume == volume else math.nan
+        else:
+            total_pv = state["pv"].update(price_volume)
+            total_volume = state["volume"].update(volume)
+
+        if total_volume == 0 or total_volume != total_volume:
+            return math.nan
+        vwap = total_pv / total_volume
+        return math.nan if math.isinf(vwap) else vwap
+
     def get_name(self) -> str:
         """Get indicator name."""
         period = self.params.get("period", 20)
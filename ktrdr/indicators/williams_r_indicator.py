@@ -10,6 +10,7 @@ from pydantic import Field
 
 from ktrdr import get_logger
 from ktrdr.errors import DataError
+from ktrdr.indicators import computation_graph as graph
 from ktrdr.indicators.base_indicator import BaseIndicator
 
 # Create module-level logger
@@ -105,14 +106,11 @@ class WilliamsRIndicator(BaseIndicator):
                 },
             )
 
-        # Extract high/low/close as Series
-        high_data = data["high"]
-        low_data = data["low"]
         close_data = data["close"]
 
         # Calculate rolling highest high and lowest low over period
-        highest_high = high_data.rolling(window=period, min_periods=period).max()
-        lowest_low = low_data.rolling(window=period, min_periods=period).min()
+        highest_high = graph.rolling(data, "high", period, "max")
+        lowest_low = graph.rolling(data, "low", period, "min")
 
         # Calculate Williams %R
         # %R = ((Highest High - Close) / (Highest High - Lowest Low)) × -100
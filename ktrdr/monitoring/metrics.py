@@ -9,6 +9,18 @@ Metrics:
 - ktrdr_operations_active: Active operations count
 - ktrdr_operations_total: Total operations by type and status
 - ktrdr_operation_duration_seconds: Operation duration distribution
+- ktrdr_worker_health_probe_seconds: Worker health probe latency by type/outcome
+- ktrdr_worker_health_probe_last_seconds: Latest health probe latency per worker
+- ktrdr_worker_dispatch_queue_depth: Operations waiting for a worker slot by type
+- ktrdr_worker_dispatch_wait_seconds: Time operations waited for a worker slot
+- ktrdr_compute_jobs_in_flight: Compute executor jobs running or queued by pool
+- ktrdr_compute_pool_capacity: Maximum jobs in flight by pool
+- ktrdr_compute_queue_wait_seconds: Time compute jobs waited for a pool worker
+- ktrdr_compute_job_seconds: Compute job duration by pool and outcome
+- ktrdr_compute_jobs_rejected_total: Jobs rejected because a pool was saturated
+- ktrdr_operations_write_queue_depth: Operations with queued (write-behind) writes
+- ktrdr_operations_write_flush_seconds: Write-behind flush latency by outcome
+- ktrdr_operations_write_rows_total: Operation rows written by write-behind flushes
 """
 
 import logging
@@ -60,6 +72,96 @@ operation_duration_seconds = Histogram(
 )
 
 
+# Health probe buckets (in seconds): sub-millisecond LAN to probe timeout
+PROBE_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+worker_health_probe_seconds = Histogram(
+    "ktrdr_worker_health_probe_seconds",
+    "Worker health probe latency",
+    ["worker_type", "outcome"],
+    buckets=PROBE_BUCKETS,
+)
+
+worker_health_probe_last_seconds = Gauge(
+    "ktrdr_worker_health_probe_last_seconds",
+    "Latency of the latest health probe per worker",
+    ["worker_id"],
+)
+
+# Dispatch queue wait buckets (in seconds): immediate grant to queue timeout
+QUEUE_WAIT_BUCKETS = [0.01, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120]
+
+worker_dispatch_queue_depth = Gauge(
+    "ktrdr_worker_dispatch_queue_depth",
+    "Operations waiting for a free worker slot",
+    ["worker_type"],
+)
+
+worker_dispatch_wait_seconds = Histogram(
+    "ktrdr_worker_dispatch_wait_seconds",
+    "Time operations waited for a free worker slot",
+    ["worker_type", "outcome"],
+    buckets=QUEUE_WAIT_BUCKETS,
+)
+
+
+# Compute executor metrics (saturation = in_flight / capacity)
+COMPUTE_BUCKETS = [0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+compute_jobs_in_flight = Gauge(
+    "ktrdr_compute_jobs_in_flight",
+    "Compute executor jobs running or queued",
+    ["pool"],
+)
+
+compute_pool_capacity = Gauge(
+    "ktrdr_compute_pool_capacity",
+    "Maximum compute executor jobs in flight",
+    ["pool"],
+)
+
+compute_queue_wait_seconds = Histogram(
+    "ktrdr_compute_queue_wait_seconds",
+    "Time compute jobs waited for a pool worker",
+    ["pool"],
+    buckets=COMPUTE_BUCKETS,
+)
+
+compute_job_seconds = Histogram(
+    "ktrdr_compute_job_seconds",
+    "Compute job duration from submission to result",
+    ["pool", "outcome"],
+    buckets=COMPUTE_BUCKETS,
+)
+
+compute_jobs_rejected = Counter(
+    "ktrdr_compute_jobs_rejected_total",
+    "Compute jobs rejected because the pool was saturated",
+    ["pool"],
+)
+
+
+# Operations write-behind metrics
+FLUSH_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5]
+
+operations_write_queue_depth = Gauge(
+    "ktrdr_operations_write_queue_depth",
+    "Operations with queued writes not yet flushed to the database",
+)
+
+operations_write_flush_seconds = Histogram(
+    "ktrdr_operations_write_flush_seconds",
+    "Latency of batched operation write flushes",
+    ["outcome"],
+    buckets=FLUSH_BUCKETS,
+)
+
+operations_write_rows = Counter(
+    "ktrdr_operations_write_rows_total",
+    "Operation rows written by batched flushes",
+)
+
+
 def update_worker_metrics(workers: dict[str, Any]) -> None:
     """
     Update worker metrics from the workers dictionary.
@@ -134,6 +236,107 @@ def record_operation_duration(
     )
 
 
+def record_worker_probe(
+    worker_id: str, worker_type: str, duration_seconds: float, success: bool
+) -> None:
+    """
+    Record the latency of a worker health probe.
+
+    Args:
+        worker_id: Probed worker
+        worker_type: Worker type value (e.g., "backtesting")
+        duration_seconds: Probe round-trip time in seconds
+        success: Whether the probe succeeded
+    """
+    outcome = "success" if success else "failure"
+    worker_health_probe_seconds.labels(
+        worker_type=worker_type, outcome=outcome
+    ).observe(duration_seconds)
+    worker_health_probe_last_seconds.labels(worker_id=worker_id).set(duration_seconds)
+
+
+def remove_worker_probe_metrics(worker_id: str) -> None:
+    """
+    Drop the per-worker probe gauge of a removed worker.
+
+    Args:
+        worker_id: Removed worker
+    """
+    try:
+        worker_health_probe_last_seconds.remove(worker_id)
+    except KeyError:
+        pass  # Never probed
+
+
+def update_dispatch_queue_depth(worker_type: str, depth: int) -> None:
+    """
+    Set the number of operations queued for a worker type.
+
+    Args:
+        worker_type: Worker type value (e.g., "backtesting")
+        depth: Operations currently waiting for a slot
+    """
+    worker_dispatch_queue_depth.labels(worker_type=worker_type).set(depth)
+
+
+def record_dispatch_wait(worker_type: str, wait_seconds: float, granted: bool) -> None:
+    """
+    Record how long an operation waited in the dispatch queue.
+
+    Args:
+        worker_type: Worker type value (e.g., "backtesting")
+        wait_seconds: Time from enqueue to grant (or timeout)
+        granted: Whether a worker slot was granted
+    """
+    outcome = "granted" if granted else "timeout"
+    worker_dispatch_wait_seconds.labels(
+        worker_type=worker_type, outcome=outcome
+    ).observe(wait_seconds)
+
+
+def record_compute_job(
+    pool: str, duration_seconds: float, outcome: str, wait_seconds: float | None
+) -> None:
+    """
+    Record a finished compute executor job.
+
+    Args:
+        pool: Executor pool ("process" or "thread")
+        duration_seconds: Time from submission to result (or failure)
+        outcome: "ok", "error", "timeout" or "cancelled"
+        wait_seconds: Time spent queued before a pool worker picked it up
+            (None if the job never started)
+    """
+    compute_job_seconds.labels(pool=pool, outcome=outcome).observe(duration_seconds)
+    if wait_seconds is not None:
+        compute_queue_wait_seconds.labels(pool=pool).observe(max(wait_seconds, 0.0))
+
+
+def update_operations_write_queue_depth(depth: int) -> None:
+    """
+    Set the number of operations with queued writes.
+
+    Args:
+        depth: Operations waiting for the next write-behind flush
+    """
+    operations_write_queue_depth.set(depth)
+
+
+def record_operations_write_flush(duration_seconds: float, rows: int, ok: bool) -> None:
+    """
+    Record a write-behind flush of the operations table.
+
+    Args:
+        duration_seconds: Time to write and commit the batch
+        rows: Operation rows written
+        ok: Whether the flush committed
+    """
+    outcome = "ok" if ok else "error"
+    operations_write_flush_seconds.labels(outcome=outcome).observe(duration_seconds)
+    if rows:
+        operations_write_rows.inc(rows)
+
+
 def reset_metrics() -> None:
     """
     Reset all custom metrics to their initial values.
@@ -5,12 +5,14 @@ and related PyTorch objects during training.
 """
 
 import io
+from collections.abc import Callable, Mapping
 from typing import Any, Optional
 
 import torch
 import torch.nn as nn
 import torch.optim as optim
 
+from ktrdr.checkpoint.artifact_store import CheckpointArtifacts
 from ktrdr.checkpoint.schemas import TRAINING_ARTIFACTS, TrainingCheckpointState
 from ktrdr.training.model_trainer import ModelTrainer
 
@@ -103,22 +105,87 @@ def build_training_checkpoint_artifacts(
     Returns:
         Dictionary mapping artifact names to their serialized bytes.
     """
+    return _serialize_artifacts(
+        model.state_dict(),
+        optimizer.state_dict(),
+        scheduler.state_dict() if scheduler is not None else None,
+        best_model_state,
+    )
+
+
+def snapshot_training_checkpoint_artifacts(
+    model: nn.Module,
+    optimizer: optim.Optimizer,
+    scheduler: Optional[Any] = None,
+    best_model_state: Optional[dict[str, Any]] = None,
+) -> Callable[[], dict[str, bytes]]:
+    """Snapshot training state now, serialize it later.
+
+    state_dict() tensors share storage with the live parameters, which keep
+    changing as training continues. The snapshot copies them (a memory copy,
+    much cheaper than torch.save) so the returned callable can serialize a
+    consistent checkpoint from a background thread.
+
+    Args:
+        model: The PyTorch model to checkpoint.
+        optimizer: The optimizer with current state.
+        scheduler: Optional learning rate scheduler.
+        best_model_state: Optional best model state dict to save.
+
+    Returns:
+        Zero-argument callable returning the same artifacts as
+        build_training_checkpoint_artifacts().
+    """
+    model_state = _detached_copy(model.state_dict())
+    optimizer_state = _detached_copy(optimizer.state_dict())
+    scheduler_state = (
+        _detached_copy(scheduler.state_dict()) if scheduler is not None else None
+    )
+    best_state = (
+        _detached_copy(best_model_state) if best_model_state is not None else None
+    )
+
+    def serialize() -> dict[str, bytes]:
+        return _serialize_artifacts(
+            model_state, optimizer_state, scheduler_state, best_state
+        )
+
+    return serialize
+
+
+def _detached_copy(obj: Any) -> Any:
+    """Copy tensors (recursively through dicts, lists and tuples)."""
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().clone()
+    if isinstance(obj, dict):
+        return {key: _detached_copy(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_detached_copy(value) for value in obj)
+    return obj
+
+
+def _serialize_artifacts(
+    model_state: dict[str, Any],
+    optimizer_state: dict[str, Any],
+    scheduler_state: Optional[dict[str, Any]],
+    best_model_state: Optional[dict[str, Any]],
+) -> dict[str, bytes]:
     artifacts: dict[str, bytes] = {}
 
     # Required: model.pt
     model_buffer = io.BytesIO()
-    torch.save(model.state_dict(), model_buffer)
+    torch.save(model_state, model_buffer)
     artifacts["model.pt"] = model_buffer.getvalue()
 
     # Required: optimizer.pt
     optimizer_buffer = io.BytesIO()
-    torch.save(optimizer.state_dict(), optimizer_buffer)
+    torch.save(optimizer_state, optimizer_buffer)
     artifacts["optimizer.pt"] = optimizer_buffer.getvalue()
 
     # Optional: scheduler.pt
-    if scheduler is not None:
+    if scheduler_state is not None:
         scheduler_buffer = io.BytesIO()
-        torch.save(scheduler.state_dict(), scheduler_buffer)
+        torch.save(scheduler_state, scheduler_buffer)
         artifacts["scheduler.pt"] = scheduler_buffer.getvalue()
 
     # Optional: best_model.pt
@@ -130,11 +197,13 @@ def build_training_checkpoint_artifacts(
     return artifacts
 
 
-def validate_artifacts(artifacts: dict[str, bytes]) -> None:
+def validate_artifacts(artifacts: Mapping[str, bytes]) -> None:
     """Validate that artifacts contain all required items.
 
+    Lazily opened artifacts are checked by size, without reading them.
+
     Args:
-        artifacts: Dictionary of artifact name to bytes.
+        artifacts: Mapping of artifact name to bytes.
 
     Raises:
         ArtifactValidationError: If required artifacts are missing or empty.
@@ -149,7 +218,12 @@ def validate_artifacts(artifacts: dict[str, bytes]) -> None:
                 f"Required artifacts: {[k for k, v in TRAINING_ARTIFACTS.items() if v == 'required']}"
             )
 
-        if not artifacts[name]:
+        size = (
+            artifacts.size(name)
+            if isinstance(artifacts, CheckpointArtifacts)
+            else len(artifacts[name])
+        )
+        if not size:
             raise ArtifactValidationError(
                 f"Required artifact is empty: {name}. "
                 "Artifact bytes cannot be empty."
@@ -2,17 +2,27 @@
 
 Provides functions and data structures to restore training from a checkpoint
 for resuming cancelled or failed training operations.
+
+Artifacts are passed on as ArtifactHandle objects rather than bytes, so each
+one is streamed (or memory-mapped) into torch.load when the trainer restores
+it instead of being held in memory twice.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from io import BytesIO
+from typing import Any, Optional, Union
 
+from ktrdr.checkpoint.artifact_store import ArtifactHandle, CheckpointArtifacts
 from ktrdr.checkpoint.checkpoint_service import CheckpointService
 from ktrdr.training.checkpoint_builder import (
     ArtifactValidationError,
     validate_artifacts,
 )
 
+# Serialized state: in-memory bytes or a handle on the stored artifact
+ArtifactSource = Union[bytes, ArtifactHandle]
+
 
 class CheckpointNotFoundError(Exception):
     """Raised when no checkpoint is found for an operation."""
@@ -35,10 +45,10 @@ class TrainingResumeContext:
 
     Attributes:
         start_epoch: The epoch to start from (checkpoint_epoch + 1).
-        model_weights: Serialized model state_dict bytes.
-        optimizer_state: Serialized optimizer state_dict bytes.
-        scheduler_state: Optional serialized scheduler state_dict bytes.
-        best_model_weights: Optional serialized best model state_dict bytes.
+        model_weights: Serialized model state_dict (bytes or artifact handle).
+        optimizer_state: Serialized optimizer state_dict.
+        scheduler_state: Optional serialized scheduler state_dict.
+        best_model_weights: Optional serialized best model state_dict.
         training_history: History of training metrics for plotting.
         best_val_loss: Best validation loss seen before checkpoint.
         original_request: Original training request parameters.
@@ -46,12 +56,12 @@ class TrainingResumeContext:
 
     # Required - always present
     start_epoch: int
-    model_weights: bytes
-    optimizer_state: bytes
+    model_weights: ArtifactSource
+    optimizer_state: ArtifactSource
 
     # Optional - may not be in checkpoint
-    scheduler_state: Optional[bytes] = None
-    best_model_weights: Optional[bytes] = None
+    scheduler_state: Optional[ArtifactSource] = None
+    best_model_weights: Optional[ArtifactSource] = None
 
     # State from checkpoint
     training_history: dict[str, list[float]] = field(default_factory=dict)
@@ -59,6 +69,36 @@ class TrainingResumeContext:
     original_request: dict[str, Any] = field(default_factory=dict)
 
 
+def load_resume_artifact(
+    source: ArtifactSource, weights_only: bool = True, map_location: Any = None
+) -> Any:
+    """Deserialize a resume artifact with torch.load.
+
+    Args:
+        source: Artifact bytes or handle.
+        weights_only: Passed to torch.load.
+        map_location: Passed to torch.load.
+
+    Returns:
+        The deserialized state.
+    """
+    if isinstance(source, ArtifactHandle):
+        return source.torch_load(map_location=map_location, weights_only=weights_only)
+
+    import torch
+
+    return torch.load(
+        BytesIO(source), map_location=map_location, weights_only=weights_only
+    )
+
+
+def _artifact_source(artifacts: Mapping[str, bytes], name: str) -> ArtifactSource:
+    """Handle on a lazily opened artifact, its bytes otherwise."""
+    if isinstance(artifacts, CheckpointArtifacts):
+        return artifacts.handle(name)
+    return artifacts[name]
+
+
 async def restore_from_checkpoint(
     checkpoint_service: CheckpointService,
     operation_id: str,
@@ -107,12 +147,21 @@ async def restore_from_checkpoint(
     start_epoch = state.get("epoch", 0) + 1
 
     # Extract required artifacts
-    model_weights = checkpoint.artifacts["model.pt"]
-    optimizer_state = checkpoint.artifacts["optimizer.pt"]
+    artifacts = checkpoint.artifacts
+    model_weights = _artifact_source(artifacts, "model.pt")
+    optimizer_state = _artifact_source(artifacts, "optimizer.pt")
 
     # Extract optional artifacts
-    scheduler_state = checkpoint.artifacts.get("scheduler.pt")
-    best_model_weights = checkpoint.artifacts.get("best_model.pt")
+    scheduler_state = (
+        _artifact_source(artifacts, "scheduler.pt")
+        if "scheduler.pt" in artifacts
+        else None
+    )
+    best_model_weights = (
+        _artifact_source(artifacts, "best_model.pt")
+        if "best_model.pt" in artifacts
+        else None
+    )
 
     # Extract state fields
     training_history = state.get("training_history", {})
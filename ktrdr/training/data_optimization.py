@@ -5,6 +5,7 @@ import threading
 import time
 from collections.abc import Iterator
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Optional, Union
 
 import numpy as np
@@ -125,10 +126,32 @@ class EfficientMultiSymbolDataset(Dataset):
                     self.symbol_class_to_indices[(symbol, class_idx)] = indices
 
     def _setup_memory_mapping(self):
-        """Setup memory mapping for large datasets."""
-        # For now, just log that memory mapping would be setup
-        # In production, this would create memory-mapped files
-        logger.debug("Memory mapping setup (placeholder)")
+        """Spill features and labels to a memory-mapped store in cache_dir.
+
+        After this, ``feature_tensor``/``label_tensor`` are backed by the page
+        cache rather than private memory. Without a ``cache_dir`` the tensors
+        stay in memory.
+        """
+        if not self.config.cache_dir:
+            logger.debug("Memory mapping enabled but no cache_dir set; skipping")
+            return
+
+        from .memmap_dataset import MemmapTrainingStore
+
+        feature_names = self.feature_names
+        if len(feature_names) != self.num_features:
+            feature_names = [f"feature_{i}" for i in range(self.num_features)]
+
+        store = MemmapTrainingStore.create(
+            Path(self.config.cache_dir) / "efficient_multi_symbol_dataset",
+            feature_names,
+            label_dtype=self.label_tensor.numpy().dtype,
+        )
+        store.append(self.feature_tensor, self.label_tensor)
+        store.finalize()
+        self.memmap_store = store
+        self.feature_tensor, self.label_tensor = store.as_tensors()
+        logger.info(f"Dataset memory-mapped from {store.directory}")
 
     def __len__(self) -> int:
         """Get dataset length."""
@@ -0,0 +1,541 @@
+"""Out-of-core training data backed by memory-mapped feature files.
+
+Training normally materialises the full feature matrix as an in-memory
+``torch.FloatTensor`` (plus a NaN-scrubbed copy, plus a concatenated
+multi-symbol copy). For many symbols of 1m data that exceeds RAM.
+
+This module provides:
+
+- ``MemmapTrainingStore``: a directory of raw little-endian ``float32``
+  features, labels and optional per-sample weights plus a
+  ``manifest.json`` describing their shape. Rows are appended in chunks,
+  so frames can be spilled symbol by symbol without ever holding the
+  combined matrix in memory.
+- ``ChunkedShuffleDataset``: an ``IterableDataset`` that reads contiguous
+  chunks from the store (optionally restricted to a set of row indices),
+  shuffles chunk order and rows within each chunk, and yields ready-made
+  batches. Memory use is bounded by ``chunk_size`` rows regardless of
+  dataset size.
+"""
+
+import json
+import math
+import shutil
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+import torch
+from torch.utils.data import IterableDataset, get_worker_info
+
+from ktrdr import get_logger
+
+from .exceptions import TrainingDataError
+
+logger = get_logger(__name__)
+
+ArrayLike = Union[np.ndarray, torch.Tensor, pd.DataFrame, pd.Series]
+
+
+class MemmapTrainingStore:
+    """On-disk, memory-mapped layout for prepared features and labels.
+
+    Layout::
+
+        <directory>/
+            manifest.json   # shapes, dtypes, feature names
+            features.bin    # float32, C-order, shape (rows, num_features)
+            labels.bin      # label dtype, shape (rows,)
+            weights.bin     # optional float32 sample weights, shape (rows,)
+
+    Use ``create()`` to obtain a writable store, ``append()`` chunks, then
+    ``finalize()``. ``open()`` maps an existing store read-only (copy-on-write).
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    FEATURES_FILE = "features.bin"
+    LABELS_FILE = "labels.bin"
+    WEIGHTS_FILE = "weights.bin"
+    FEATURE_DTYPE = np.dtype("<f4")
+
+    def __init__(
+        self,
+        directory: Path,
+        feature_names: list[str],
+        label_dtype: np.dtype,
+        num_rows: int = 0,
+        finalized: bool = False,
+        has_weights: bool = False,
+    ):
+        self.directory = Path(directory)
+        self.feature_names = list(feature_names)
+        self.label_dtype = np.dtype(label_dtype)
+        self.num_rows = num_rows
+        self.has_weights = has_weights
+        self._finalized = finalized
+        self._features: Optional[np.memmap] = None
+        self._labels: Optional[np.memmap] = None
+        self._weights: Optional[np.memmap] = None
+
+    @property
+    def num_features(self) -> int:
+        return len(self.feature_names)
+
+    @property
+    def finalized(self) -> bool:
+        return self._finalized
+
+    @classmethod
+    def create(
+        cls,
+        directory: Union[str, Path],
+        feature_names: list[str],
+        label_dtype: Union[str, np.dtype] = np.int64,
+        overwrite: bool = True,
+        with_weights: bool = False,
+    ) -> "MemmapTrainingStore":
+        """Create an empty store ready for ``append()``.
+
+        Args:
+            directory: Target directory (created if missing)
+            feature_names: Column names, defines the feature width
+            label_dtype: dtype of labels (int64 for classification, float32
+                for regression)
+            overwrite: Remove an existing store at ``directory`` first
+            with_weights: Also store one float32 sample weight per row
+                (e.g. triple-barrier uniqueness weights)
+
+        Raises:
+            TrainingDataError: If the store exists and ``overwrite`` is False
+        """
+        path = Path(directory)
+        if path.exists() and any(path.iterdir()):
+            if not overwrite:
+                raise TrainingDataError(f"Memmap store already exists at {path}")
+            shutil.rmtree(path)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / cls.FEATURES_FILE).touch()
+        (path / cls.LABELS_FILE).touch()
+        if with_weights:
+            (path / cls.WEIGHTS_FILE).touch()
+        return cls(path, feature_names, np.dtype(label_dtype), has_weights=with_weights)
+
+    @classmethod
+    def open(cls, directory: Union[str, Path]) -> "MemmapTrainingStore":
+        """Open a finalized store.
+
+        Raises:
+            TrainingDataError: If the manifest is missing or inconsistent
+        """
+        path = Path(directory)
+        manifest_path = path / cls.MANIFEST_FILE
+        if not manifest_path.exists():
+            raise TrainingDataError(f"No memmap store manifest at {manifest_path}")
+        manifest = json.loads(manifest_path.read_text())
+        store = cls(
+            path,
+            manifest["feature_names"],
+            np.dtype(manifest["label_dtype"]),
+            num_rows=int(manifest["num_rows"]),
+            finalized=True,
+            has_weights=bool(manifest.get("has_weights", False)),
+        )
+        expected = store.num_rows * store.num_features * cls.FEATURE_DTYPE.itemsize
+        actual = (path / cls.FEATURES_FILE).stat().st_size
+        if actual != expected:
+            raise TrainingDataError(
+                f"Memmap store at {path} is corrupt: features.bin has {actual} "
+                f"bytes, manifest implies {expected}"
+            )
+        return store
+
+    def append(
+        self,
+        features: ArrayLike,
+        labels: ArrayLike,
+        weights: Optional[ArrayLike] = None,
+        chunk_rows: int = 65536,
+    ) -> int:
+        """Append rows to the store.
+
+        Rows are converted and NaN-scrubbed ``chunk_rows`` at a time, so the
+        only transient allocation is one chunk, not a full copy of the input.
+
+        Args:
+            features: 2D array-like of shape (rows, num_features)
+            labels: 1D array-like of shape (rows,)
+            weights: 1D array-like of shape (rows,); required if and only if
+                the store was created ``with_weights``
+            chunk_rows: Rows converted per write
+
+        Returns:
+            Number of rows appended
+
+        Raises:
+            TrainingDataError: On shape mismatch or if already finalized
+        """
+        if self._finalized:
+            raise TrainingDataError("Cannot append to a finalized memmap store")
+
+        feature_values = _as_numpy(features)
+        label_values = _as_numpy(labels)
+        if feature_values.ndim != 2 or feature_values.shape[1] != self.num_features:
+            raise TrainingDataError(
+                f"Expected features of shape (rows, {self.num_features}), "
+                f"got {feature_values.shape}"
+            )
+        if label_values.ndim != 1 or len(label_values) != len(feature_values):
+            raise TrainingDataError(
+                f"Feature/label size mismatch: features={len(feature_values)}, "
+                f"labels={label_values.shape}"
+            )
+        if (weights is not None) != self.has_weights:
+            raise TrainingDataError(
+                "Sample weights must be given for every append to a store "
+                "created with_weights, and only then"
+            )
+        weight_values = _as_numpy(weights) if weights is not None else None
+        if weight_values is not None and weight_values.shape != label_values.shape:
+            raise TrainingDataError(
+                f"Weight/label size mismatch: weights={weight_values.shape}, "
+                f"labels={label_values.shape}"
+            )
+
+        rows = len(feature_values)
+        with (
+            open(self.directory / self.FEATURES_FILE, "ab") as feature_file,
+            open(self.directory / self.LABELS_FILE, "ab") as label_file,
+        ):
+            for start in range(0, rows, chunk_rows):
+                end = min(start + chunk_rows, rows)
+                chunk = np.array(
+                    feature_values[start:end], dtype=self.FEATURE_DTYPE, order="C"
+                )
+                np.nan_to_num(chunk, copy=False, nan=0.0)
+                feature_file.write(chunk.tobytes())
+                label_file.write(
+                    np.ascontiguousarray(
+                        label_values[start:end], dtype=self.label_dtype
+                    ).tobytes()
+                )
+        if weight_values is not None:
+            with open(self.directory / self.WEIGHTS_FILE, "ab") as weight_file:
+                for start in range(0, rows, chunk_rows):
+                    weight_file.write(
+                        np.ascontiguousarray(
+                            weight_values[start : start + chunk_rows],
+                            dtype=self.FEATURE_DTYPE,
+                        ).tobytes()
+                    )
+
+        self.num_rows += rows
+        return rows
+
+    def finalize(self) -> "MemmapTrainingStore":
+        """Write the manifest; the store becomes readable and immutable."""
+        manifest = {
+            "num_rows": self.num_rows,
+            "feature_names": self.feature_names,
+            "feature_dtype": self.FEATURE_DTYPE.str,
+            "label_dtype": self.label_dtype.str,
+            "has_weights": self.has_weights,
+        }
+        (self.directory / self.MANIFEST_FILE).write_text(json.dumps(manifest))
+        self._finalized = True
+        logger.info(
+            f"Memmap training store finalized at {self.directory}: "
+            f"{self.num_rows} rows x {self.num_features} features"
+        )
+        return self
+
+    @property
+    def features(self) -> np.ndarray:
+        """Memory-mapped feature matrix (copy-on-write, never written back)."""
+        self._require_finalized()
+        if self._features is None:
+            self._features = self._map(
+                self.FEATURES_FILE,
+                self.FEATURE_DTYPE,
+                (self.num_rows, self.num_features),
+            )
+        return self._features
+
+    @property
+    def labels(self) -> np.ndarray:
+        """Memory-mapped label vector (copy-on-write, never written back)."""
+        self._require_finalized()
+        if self._labels is None:
+            self._labels = self._map(
+                self.LABELS_FILE, self.label_dtype, (self.num_rows,)
+            )
+        return self._labels
+
+    @property
+    def weights(self) -> Optional[np.ndarray]:
+        """Memory-mapped sample weights, or None if the store has none."""
+        self._require_finalized()
+        if not self.has_weights:
+            return None
+        if self._weights is None:
+            self._weights = self._map(
+                self.WEIGHTS_FILE, self.FEATURE_DTYPE, (self.num_rows,)
+            )
+        return self._weights
+
+    def as_tensors(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Zero-copy tensors over the mapped files.
+
+        Slicing these tensors (e.g. train/val/test splits) yields views that
+        stay backed by the page cache rather than private memory.
+        """
+        return torch.from_numpy(self.features), torch.from_numpy(self.labels)
+
+    def _map(self, filename: str, dtype: np.dtype, shape: tuple[int, ...]):
+        if self.num_rows == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(self.directory / filename, dtype=dtype, mode="c", shape=shape)
+
+    def _require_finalized(self) -> None:
+        if not self._finalized:
+            raise TrainingDataError(
+                "Memmap store must be finalized before it can be read"
+            )
+
+
+def write_frames_to_store(
+    directory: Union[str, Path],
+    frames: Iterable[tuple[ArrayLike, ...]],
+    feature_names: list[str],
+    label_dtype: Union[str, np.dtype] = np.int64,
+    chunk_rows: int = 65536,
+    with_weights: bool = False,
+) -> MemmapTrainingStore:
+    """Spill (features, labels) pairs into a new store, one pair at a time.
+
+    This is the out-of-core counterpart of
+    ``TrainingPipeline.combine_multi_symbol_data``: pairs are appended in
+    iteration order (preserving per-symbol temporal order), and the caller
+    can produce each symbol's frame lazily.
+
+    Args:
+        directory: Target store directory
+        frames: (features, labels) pairs, or (features, labels, weights)
+            triples when ``with_weights`` is set
+        feature_names: Column names, defines the feature width
+        label_dtype: dtype of labels
+        chunk_rows: Rows converted per write
+        with_weights: Store per-sample weights from each triple
+
+    Returns:
+        The finalized store
+    """
+    store = MemmapTrainingStore.create(
+        directory, feature_names, label_dtype, with_weights=with_weights
+    )
+    for frame in frames:
+        store.append(*frame, chunk_rows=chunk_rows)
+    return store.finalize()
+
+
+class ChunkedShuffleDataset(IterableDataset):
+    """Iterate a (possibly memory-mapped) dataset in shuffled chunks.
+
+    Each epoch, contiguous chunks of ``chunk_size`` rows are visited in random
+    order and the rows within each chunk are permuted before being cut into
+    batches. This gives near-uniform shuffling while keeping disk reads
+    sequential and peak memory at one chunk.
+
+    ``indices`` restricts iteration to a subset of rows (e.g. a purged train
+    split) without materialising that subset; chunks are then cut over the
+    index array and only the selected rows are read.
+
+    With ``weights``, rows are drawn with replacement in proportion to their
+    weight, like ``WeightedRandomSampler``: each chunk's number of draws is
+    sampled from the chunks' total weights, then rows are drawn within the
+    chunk. Each epoch still yields ``len(indices)`` samples.
+
+    Yields ``(features, labels)`` batch tensors, so wrap it with
+    ``DataLoader(dataset, batch_size=None)``. When used with multiple
+    DataLoader workers, chunks are sharded across workers.
+    """
+
+    def __init__(
+        self,
+        features: Union[np.ndarray, torch.Tensor],
+        labels: Union[np.ndarray, torch.Tensor],
+        batch_size: int = 32,
+        chunk_size: int = 65536,
+        shuffle: bool = True,
+        seed: Optional[int] = None,
+        indices: Optional[ArrayLike] = None,
+        weights: Optional[ArrayLike] = None,
+    ):
+        """Initialize chunked shuffle dataset.
+
+        Args:
+            features: 2D array (rows, features), typically a memmap
+            labels: 1D array (rows,)
+            batch_size: Rows per yielded batch
+            chunk_size: Rows read from storage at a time
+            shuffle: Shuffle chunk order and rows within chunks
+            seed: Base seed; combined with the epoch for reproducibility
+            indices: Strictly ascending rows to iterate (default: all rows)
+            weights: Sampling weight per iterated row, aligned with
+                ``indices`` (or with all rows when ``indices`` is None)
+
+        Raises:
+            ValueError: On invalid sizes or mismatched lengths
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if chunk_size < batch_size:
+            raise ValueError(
+                f"chunk_size ({chunk_size}) must be >= batch_size ({batch_size})"
+            )
+        if len(features) != len(labels):
+            raise ValueError(
+                f"features and labels must have same length, "
+                f"got {len(features)} and {len(labels)}"
+            )
+        if indices is None:
+            rows = np.arange(len(features), dtype=np.int64)
+        else:
+            rows = _as_numpy(indices).astype(np.int64, copy=False)
+            if rows.ndim != 1 or (
+                len(rows) > 0
+                and (
+                    rows[0] < 0
+                    or rows[-1] >= len(features)
+                    or bool((np.diff(rows) <= 0).any())
+                )
+            ):
+                raise ValueError(
+                    f"indices must be strictly ascending rows in "
+                    f"[0, {len(features)})"
+                )
+        self.features = features
+        self.labels = labels
+        self.indices = rows
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+
+        self.weights: Optional[np.ndarray] = None
+        self._chunk_weights: Optional[np.ndarray] = None
+        if weights is not None:
+            weight_values = _as_numpy(weights).astype(np.float64)
+            if weight_values.shape != rows.shape:
+                raise ValueError(
+                    f"weights must have one entry per iterated row, "
+                    f"got {weight_values.shape} for {len(rows)} rows"
+                )
+            if (weight_values < 0).any() or (
+                len(rows) > 0 and weight_values.sum() <= 0
+            ):
+                raise ValueError("weights must be non-negative with a positive sum")
+            self.weights = weight_values
+            self._chunk_weights = (
+                np.add.reduceat(weight_values, np.arange(0, len(rows), chunk_size))
+                if len(rows) > 0
+                else np.empty(0)
+            )
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch used to derive this pass's shuffle order."""
+        self.epoch = epoch
+
+    def __len__(self) -> int:
+        """Number of batches per epoch (across all workers)."""
+        return math.ceil(len(self.indices) / self.batch_size)
+
+    def __iter__(self) -> Iterator[tuple[torch.Tensor, torch.Tensor]]:
+        num_rows = len(self.indices)
+        chunk_starts = np.arange(0, num_rows, self.chunk_size)
+
+        seed = self.seed if self.seed is not None else torch.initial_seed()
+        rng = np.random.default_rng((seed + self.epoch) % (2**63))
+        draws = None
+        if self._chunk_weights is not None:
+            draws = rng.multinomial(
+                num_rows, self._chunk_weights / self._chunk_weights.sum()
+            )
+        chunk_ids = np.arange(len(chunk_starts))
+        if self.shuffle or draws is not None:
+            rng.shuffle(chunk_ids)
+
+        worker_info = get_worker_info()
+        if worker_info is not None:
+            chunk_ids = chunk_ids[worker_info.id :: worker_info.num_workers]
+
+        # Rows left over from the previous chunk, so every batch is full
+        # except the last one of the epoch.
+        carry_x: Optional[torch.Tensor] = None
+        carry_y: Optional[torch.Tensor] = None
+        for chunk_id in chunk_ids:
+            start = int(chunk_starts[chunk_id])
+            end = min(start + self.chunk_size, num_rows)
+            rows = self.indices[start:end]
+            order: Optional[np.ndarray] = None
+            if draws is not None and self.weights is not None:
+                if draws[chunk_id] == 0:
+                    continue
+                chunk_weights = self.weights[start:end]
+                order = rng.choice(
+                    len(rows),
+                    size=int(draws[chunk_id]),
+                    replace=True,
+                    p=chunk_weights / chunk_weights.sum(),
+                )
+            elif self.shuffle:
+                order = rng.permutation(len(rows))
+
+            chunk_x = _take_rows(self.features, rows)
+            chunk_y = _take_rows(self.labels, rows)
+            if order is not None:
+                order_t = torch.from_numpy(order)
+                chunk_x = chunk_x[order_t]
+                chunk_y = chunk_y[order_t]
+            if carry_x is not None and carry_y is not None:
+                chunk_x = torch.cat([carry_x, chunk_x])
+                chunk_y = torch.cat([carry_y, chunk_y])
+                carry_x = carry_y = None
+
+            full = len(chunk_x) - len(chunk_x) % self.batch_size
+            for batch_start in range(0, full, self.batch_size):
+                batch_end = batch_start + self.batch_size
+                yield chunk_x[batch_start:batch_end], chunk_y[batch_start:batch_end]
+            if full < len(chunk_x):
+                carry_x, carry_y = chunk_x[full:], chunk_y[full:]
+
+        if carry_x is not None and carry_y is not None:
+            yield carry_x, carry_y
+
+
+def _as_numpy(values: Any) -> np.ndarray:
+    if isinstance(values, (pd.DataFrame, pd.Series)):
+        return values.to_numpy(copy=False)
+    if isinstance(values, torch.Tensor):
+        return values.detach().cpu().numpy()
+    return np.asarray(values)
+
+
+def _take_rows(
+    values: Union[np.ndarray, torch.Tensor], rows: np.ndarray
+) -> torch.Tensor:
+    """Read ``rows`` as a private, writable tensor.
+
+    Contiguous row runs are read with a single slice; otherwise only the
+    selected rows are gathered.
+    """
+    if len(rows) > 0 and rows[-1] - rows[0] + 1 == len(rows):
+        selected = values[int(rows[0]) : int(rows[-1]) + 1]
+        if isinstance(selected, torch.Tensor):
+            return selected.clone()
+        return torch.from_numpy(np.array(selected))
+    if isinstance(values, torch.Tensor):
+        return values[torch.from_numpy(rows)]
+    return torch.from_numpy(np.asarray(values[rows]))
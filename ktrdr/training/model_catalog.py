@@ -0,0 +1,275 @@
+"""SQLite catalog of saved model versions.
+
+ModelStorage keeps each model version in its own directory
+(``{models_dir}/{strategy}/{timeframe}_v{N}/``) with a ``metadata.json``.
+Listing models or finding the latest version used to walk every strategy and
+version directory and parse every metadata file, which takes seconds once
+evolution runs have produced thousands of versions.
+
+The catalog is one row per version directory, kept in
+``{models_dir}/.model_catalog.sqlite`` and updated by ModelStorage.save_model
+and delete_model. Lookups by strategy, timeframe, symbol and version, and
+listings sorted by creation time or accuracy, are served from indexes.
+
+The directory tree stays the source of truth: a catalog that does not exist
+yet is built from the tree on first use, and rebuild() re-indexes a tree that
+was changed outside ModelStorage (see scripts/rebuild_model_catalog.py).
+SQLite's file locking makes the catalog safe to share between the backend and
+workers that mount the same models directory.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from ktrdr.logging import get_logger
+
+logger = get_logger(__name__)
+
+CATALOG_FILENAME = ".model_catalog.sqlite"
+
+# Sortable columns for ModelCatalog.query()
+SORT_COLUMNS = ("created_at", "accuracy", "version")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    path TEXT PRIMARY KEY,
+    strategy TEXT NOT NULL,
+    series TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    strategy_name TEXT,
+    symbol TEXT,
+    timeframe TEXT,
+    created_at TEXT,
+    accuracy REAL,
+    metrics TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_models_series_version
+    ON models (strategy, series, version DESC);
+CREATE INDEX IF NOT EXISTS ix_models_strategy_created_at
+    ON models (strategy, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_models_created_at ON models (created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_models_timeframe_created_at
+    ON models (timeframe, created_at DESC);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_COLUMNS = (
+    "path",
+    "strategy",
+    "series",
+    "version",
+    "strategy_name",
+    "symbol",
+    "timeframe",
+    "created_at",
+    "accuracy",
+    "metrics",
+)
+
+
+def parse_version_dir(name: str) -> Optional[tuple[str, int]]:
+    """Split a version directory name into (series, version).
+
+    "1h_v7" → ("1h", 7); legacy "EURUSD_1h_v3" → ("EURUSD_1h", 3). Returns
+    None for names that are not version directories (e.g. "1h_latest").
+    """
+    series, sep, version = name.rpartition("_v")
+    if not sep or not series or not version.isdigit():
+        return None
+    return series, int(version)
+
+
+def read_catalog_entry(model_dir: Path) -> Optional[dict[str, Any]]:
+    """Build a catalog entry from a version directory's metadata.json.
+
+    Returns:
+        Entry dict, or None if the directory is not a complete model version
+    """
+    parsed = parse_version_dir(model_dir.name)
+    if parsed is None:
+        return None
+    try:
+        with open(model_dir / "metadata.json") as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    summary = metadata.get("training_summary") or {}
+    return {
+        "path": str(model_dir),
+        "strategy": model_dir.parent.name,
+        "series": parsed[0],
+        "version": parsed[1],
+        "strategy_name": metadata.get("strategy_name"),
+        "symbol": metadata.get("symbol"),
+        "timeframe": metadata.get("timeframe"),
+        "created_at": metadata.get("created_at"),
+        "accuracy": summary.get("best_val_accuracy", 0),
+        "metrics": json.dumps(summary, default=str),
+    }
+
+
+class ModelCatalog:
+    """Indexed catalog of the model versions under a models directory."""
+
+    def __init__(self, base_path: str | Path):
+        """Open (creating if needed) the catalog of a models directory.
+
+        Args:
+            base_path: ModelStorage base directory
+        """
+        self.base_path = Path(base_path)
+        self.db_path = self.base_path / CATALOG_FILENAME
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the catalog has been built from the directory tree."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM catalog_meta WHERE key = 'built_at'"
+            ).fetchone()
+        return row is not None
+
+    def ensure_built(self) -> None:
+        """Build the catalog from the tree if it has never been built."""
+        if not self.is_built:
+            self.rebuild()
+
+    def add(self, entry: dict[str, Any]) -> None:
+        """Insert or replace the row of one version directory."""
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO models ({', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                tuple(entry.get(column) for column in _COLUMNS),
+            )
+
+    def remove(self, path: str | Path) -> None:
+        """Remove the row of a version directory."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM models WHERE path = ?", (str(path),))
+
+    def query(
+        self,
+        strategy: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        symbol: Optional[str] = None,
+        order_by: str = "created_at",
+        descending: bool = True,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """List catalogued model versions.
+
+        Args:
+            strategy: Strategy directory name
+            timeframe: Model timeframe
+            symbol: Symbol recorded at training time
+            order_by: One of SORT_COLUMNS
+            descending: Sort direction
+            limit: Maximum rows to return
+
+        Returns:
+            Rows as dicts (metrics decoded)
+
+        Raises:
+            ValueError: If order_by is not a sortable column
+        """
+        if order_by not in SORT_COLUMNS:
+            raise ValueError(f"order_by must be one of {SORT_COLUMNS}, got {order_by}")
+
+        clauses, params = [], []
+        for column, value in (
+            ("strategy", strategy),
+            ("timeframe", timeframe),
+            ("symbol", symbol),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM models"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        direction = "DESC" if descending else "ASC"
+        sql += f" ORDER BY {order_by} {direction}, path {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def latest_path(self, strategy: str, series: str) -> Optional[Path]:
+        """Highest version directory of a strategy's series (e.g. "1h")."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT path FROM models WHERE strategy = ? AND series = ? "
+                "ORDER BY version DESC LIMIT 1",
+                (strategy, series),
+            ).fetchone()
+        return Path(row[0]) if row else None
+
+    def rebuild(self) -> int:
+        """Re-index every version directory under the models directory.
+
+        Returns:
+            Number of catalogued model versions
+        """
+        started = time.perf_counter()
+        entries = list(self._scan())
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._connect() as conn:
+            conn.execute("DELETE FROM models")
+            conn.executemany(
+                f"INSERT OR REPLACE INTO models ({', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                [tuple(entry.get(column) for column in _COLUMNS) for entry in entries],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) "
+                "VALUES ('built_at', datetime('now'))"
+            )
+        logger.info(
+            f"Rebuilt model catalog for {self.base_path}: {len(entries)} versions "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return len(entries)
+
+    def _scan(self) -> Iterator[dict[str, Any]]:
+        for strategy_dir in self.base_path.iterdir():
+            if not strategy_dir.is_dir():
+                continue
+            for model_dir in strategy_dir.iterdir():
+                if model_dir.is_symlink() or not model_dir.is_dir():
+                    continue
+                entry = read_catalog_entry(model_dir)
+                if entry is not None:
+                    yield entry
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call: the catalog is shared across
+        # threads and processes, and the commit closes each transaction
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_entry(row: tuple) -> dict[str, Any]:
+        entry = dict(zip(_COLUMNS, row, strict=True))
+        entry["metrics"] = json.loads(entry["metrics"]) if entry["metrics"] else {}
+        return entry
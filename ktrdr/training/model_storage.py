@@ -3,13 +3,23 @@
 import json
 import pickle
 import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
+from ktrdr.logging import get_logger
+from ktrdr.training.model_catalog import (
+    SORT_COLUMNS,
+    ModelCatalog,
+    read_catalog_entry,
+)
+
 if TYPE_CHECKING:
     import torch
 
+logger = get_logger(__name__)
+
 
 def _get_default_models_dir() -> str:
     """Get models directory from settings."""
@@ -32,6 +42,34 @@ class ModelStorage:
             base_path = _get_default_models_dir()
         self.base_path = Path(base_path)
         self.base_path.mkdir(exist_ok=True, parents=True)
+        self._catalog: Optional[ModelCatalog] = None
+        self._catalog_failed = False
+
+    @property
+    def catalog(self) -> Optional[ModelCatalog]:
+        """Model catalog, built from the tree on first use.
+
+        None if the catalog cannot be opened; callers then scan the tree.
+        """
+        if self._catalog is None and not self._catalog_failed:
+            try:
+                catalog = ModelCatalog(self.base_path)
+                catalog.ensure_built()
+                self._catalog = catalog
+            except (sqlite3.Error, OSError) as e:
+                self._catalog_failed = True
+                logger.warning(f"Model catalog unavailable, scanning models: {e}")
+        return self._catalog
+
+    def rebuild_catalog(self) -> int:
+        """Re-index all model versions (for trees changed outside ModelStorage).
+
+        Returns:
+            Number of catalogued model versions
+        """
+        self._catalog = ModelCatalog(self.base_path)
+        self._catalog_failed = False
+        return self._catalog.rebuild()
 
     def save_model(
         self,
@@ -178,6 +216,9 @@ class ModelStorage:
         # Create symlink to latest version
         self._update_latest_symlink(strategy_name, symbol, timeframe, model_dir)
 
+        # Catalog the version once all its files are written
+        self._catalog_update(model_dir)
+
         return str(model_dir)
 
     def load_model(
@@ -314,15 +355,49 @@ class ModelStorage:
             "is_pure_fuzzy": is_pure_fuzzy,
         }
 
-    def list_models(self, strategy_name: Optional[str] = None) -> list[dict[str, Any]]:
-        """List all available models.
+    def list_models(
+        self,
+        strategy_name: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        symbol: Optional[str] = None,
+        order_by: str = "created_at",
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """List available models, newest (or best) first.
+
+        Served from the model catalog; falls back to scanning the tree when
+        the catalog is unavailable.
 
         Args:
             strategy_name: Filter by strategy name (None for all)
+            timeframe: Filter by timeframe
+            symbol: Filter by the symbol recorded at training time
+            order_by: Sort key, descending: "created_at", "accuracy" or "version"
+            limit: Maximum number of models to return
 
         Returns:
             List of model information dictionaries
+
+        Raises:
+            ValueError: If order_by is not a sortable column
         """
+        if order_by not in SORT_COLUMNS:
+            raise ValueError(f"order_by must be one of {SORT_COLUMNS}, got {order_by}")
+
+        catalog = self.catalog
+        if catalog is not None:
+            try:
+                entries = catalog.query(
+                    strategy=strategy_name,
+                    timeframe=timeframe,
+                    symbol=symbol,
+                    order_by=order_by,
+                    limit=limit,
+                )
+                return [self._model_info(entry) for entry in entries]
+            except sqlite3.Error as e:
+                logger.warning(f"Model catalog query failed, scanning models: {e}")
+
         models = []
 
         search_paths = (
@@ -339,25 +414,29 @@ class ModelStorage:
                 if not model_dir.is_dir() or "_latest" in model_dir.name:
                     continue
 
-                metadata_path = model_dir / "metadata.json"
-                if metadata_path.exists():
-                    with open(metadata_path) as f:
-                        metadata = json.load(f)
-
-                    models.append(
-                        {
-                            "path": str(model_dir),
-                            "strategy_name": metadata.get("strategy_name"),
-                            "symbol": metadata.get("symbol"),
-                            "timeframe": metadata.get("timeframe"),
-                            "created_at": metadata.get("created_at"),
-                            "accuracy": metadata.get("training_summary", {}).get(
-                                "best_val_accuracy", 0
-                            ),
-                        }
-                    )
+                entry = read_catalog_entry(model_dir)
+                if entry is None:
+                    continue
+                if (timeframe is None or entry["timeframe"] == timeframe) and (
+                    symbol is None or entry["symbol"] == symbol
+                ):
+                    models.append(self._model_info(entry))
 
-        return sorted(models, key=lambda x: x["created_at"], reverse=True)
+        missing = "" if order_by == "created_at" else 0
+        models.sort(key=lambda x: x[order_by] or missing, reverse=True)
+        return models[:limit] if limit is not None else models
+
+    @staticmethod
+    def _model_info(entry: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "path": entry["path"],
+            "strategy_name": entry["strategy_name"],
+            "symbol": entry["symbol"],
+            "timeframe": entry["timeframe"],
+            "created_at": entry["created_at"],
+            "accuracy": entry["accuracy"],
+            "version": entry["version"],
+        }
 
     def delete_model(
         self, strategy_name: str, symbol: str, timeframe: str, version: str
@@ -374,6 +453,11 @@ class ModelStorage:
 
         if model_dir.exists():
             shutil.rmtree(model_dir)
+            if self.catalog is not None:
+                try:
+                    self.catalog.remove(model_dir)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to uncatalog model {model_dir}: {e}")
 
             # Update latest symlink if this was the latest
             latest_link = (
@@ -478,6 +562,17 @@ class ModelStorage:
             # Legacy symbol-specific pattern
             pattern = f"{symbol}_{timeframe}_v"
 
+        catalog = self.catalog
+        if catalog is not None:
+            try:
+                latest = catalog.latest_path(strategy_name, pattern[:-2])
+            except sqlite3.Error as e:
+                logger.warning(f"Model catalog lookup failed, scanning models: {e}")
+                latest = None
+            if latest is not None and latest.is_dir():
+                return latest
+            # Not catalogued (or deleted outside ModelStorage): scan below
+
         versions = []
 
         for path in strategy_dir.iterdir():
@@ -492,3 +587,17 @@ class ModelStorage:
             return max(versions, key=lambda x: x[0])[1]
 
         return None
+
+    def _catalog_update(self, model_dir: Path) -> None:
+        """Add or refresh the catalog row of a version directory."""
+        catalog = self.catalog
+        if catalog is None:
+            return
+        entry = read_catalog_entry(model_dir)
+        if entry is None:
+            return
+        try:
+            catalog.add(entry)
+        except sqlite3.Error as e:
+            # The tree stays authoritative; rebuild_catalog() recovers
+            logger.warning(f"Failed to catalog model {model_dir}: {e}")
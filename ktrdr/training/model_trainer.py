@@ -4,7 +4,6 @@ import json
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -136,8 +135,11 @@ class ModelTrainer:
 
         # If resuming, restore best model state from checkpoint
         if resume_context is not None and resume_context.best_model_weights:
-            buffer = BytesIO(resume_context.best_model_weights)
-            self.best_model_state = torch.load(buffer, weights_only=True)
+            from .checkpoint_restore import load_resume_artifact
+
+            self.best_model_state = load_resume_artifact(
+                resume_context.best_model_weights, weights_only=True
+            )
             # Restore best val_loss from checkpoint
             if resume_context.best_val_loss < float("inf"):
                 self.best_val_loss = resume_context.best_val_loss
@@ -199,6 +201,7 @@ class ModelTrainer:
         X_val: Optional[torch.Tensor] = None,
         y_val: Optional[torch.Tensor] = None,
         sample_weights: Optional[torch.Tensor] = None,
+        train_indices: Optional[Any] = None,
     ) -> dict[str, Any]:
         """Train the neural network model.
 
@@ -211,6 +214,10 @@ class ModelTrainer:
             sample_weights: Optional per-sample weights for weighted sampling.
                 When provided, uses WeightedRandomSampler instead of uniform
                 shuffle. Higher-weighted samples are sampled more frequently.
+            train_indices: Optional ascending rows of X_train/y_train to train
+                on. Out-of-core training reads them straight from the
+                memory-mapped store; otherwise they are selected up front.
+                sample_weights, if given, align with these rows.
 
         Returns:
             Training history and metrics
@@ -220,8 +227,13 @@ class ModelTrainer:
 
         # Resume: Load model weights from checkpoint if resuming
         if self._resume_context is not None:
-            buffer = BytesIO(self._resume_context.model_weights)
-            model.load_state_dict(torch.load(buffer, weights_only=True))
+            from .checkpoint_restore import load_resume_artifact
+
+            model.load_state_dict(
+                load_resume_artifact(
+                    self._resume_context.model_weights, weights_only=True
+                )
+            )
             print(
                 f"🔄 Resuming from checkpoint: loaded model weights, "
                 f"starting from epoch {self._resume_context.start_epoch}"
@@ -269,17 +281,57 @@ class ModelTrainer:
         model_type = self.config.get("type", "mlp").lower()
         architecture_cfg = self.config.get("architecture") or {}
         seq_len = architecture_cfg.get("sequence_length")
-        train_dataset: Any  # TensorDataset or SequenceDataset
-        if model_type in ("lstm", "gru") and isinstance(seq_len, int) and seq_len > 0:
+        is_sequence_model = (
+            model_type in ("lstm", "gru") and isinstance(seq_len, int) and seq_len > 0
+        )
+        out_of_core_cfg = self.config.get("out_of_core") or {}
+        use_chunked_dataset = (
+            out_of_core_cfg.get("enabled", False) and not is_sequence_model
+        )
+        if train_indices is not None and not use_chunked_dataset:
+            rows = torch.as_tensor(train_indices, dtype=torch.long)
+            X_train_cpu, y_train_cpu = X_train_cpu[rows], y_train_cpu[rows]
+            train_indices = None
+        y_train_selected = (
+            y_train_cpu
+            if train_indices is None
+            else y_train_cpu[torch.as_tensor(train_indices, dtype=torch.long)]
+        )
+
+        train_dataset: Any  # TensorDataset, SequenceDataset or ChunkedShuffleDataset
+        if is_sequence_model:
             from .sequence_dataset import SequenceDataset
 
             train_dataset = SequenceDataset(X_train_cpu, y_train_cpu, seq_len)
+        elif use_chunked_dataset:
+            # Out-of-core: X_train is memmap-backed; read it in shuffled
+            # contiguous chunks so resident memory stays bounded. Splits and
+            # sample weights are applied per chunk rather than by copying.
+            from .memmap_dataset import ChunkedShuffleDataset
+
+            train_dataset = ChunkedShuffleDataset(
+                X_train_cpu,
+                y_train_cpu,
+                batch_size=batch_size,
+                chunk_size=max(out_of_core_cfg.get("chunk_size", 65536), batch_size),
+                seed=out_of_core_cfg.get("seed"),
+                indices=train_indices,
+                weights=sample_weights,
+            )
         else:
             train_dataset = TensorDataset(X_train_cpu, y_train_cpu)
 
+        if use_chunked_dataset:
+            # Dataset yields ready-made batches and shuffles internally
+            train_loader = DataLoader(
+                train_dataset,
+                batch_size=None,
+                pin_memory=use_pin_memory,
+                num_workers=0,
+            )
         # Use WeightedRandomSampler when sample weights provided (e.g., TB uniqueness weights)
         # This samples higher-weighted samples more frequently, replacing uniform shuffle.
-        if sample_weights is not None:
+        elif sample_weights is not None:
             if len(sample_weights) != len(train_dataset):
                 raise ValueError(
                     f"sample_weights length ({len(sample_weights)}) does not match "
@@ -331,8 +383,13 @@ class ModelTrainer:
 
         # Resume: Load optimizer state from checkpoint if resuming
         if self._resume_context is not None:
-            buffer = BytesIO(self._resume_context.optimizer_state)
-            optimizer.load_state_dict(torch.load(buffer, weights_only=False))
+            from .checkpoint_restore import load_resume_artifact
+
+            optimizer.load_state_dict(
+                load_resume_artifact(
+                    self._resume_context.optimizer_state, weights_only=False
+                )
+            )
             print("🔄 Restored optimizer state from checkpoint")
 
         # Setup loss function
@@ -353,7 +410,9 @@ class ModelTrainer:
             # equal attention to all classes regardless of how many examples
             # each class has.  Without this, the model can "cheat" by always
             # predicting the most common class.
-            class_weights = self._compute_class_weights(y_train).to(self.device)
+            class_weights = self._compute_class_weights(y_train_selected).to(
+                self.device
+            )
 
             loss_type = self.config.get("loss", "cross_entropy")
             if loss_type == "focal":
@@ -370,8 +429,13 @@ class ModelTrainer:
         # Resume: Load scheduler state from checkpoint if resuming and scheduler exists
         if self._resume_context is not None and self._resume_context.scheduler_state:
             if scheduler is not None and hasattr(scheduler, "load_state_dict"):
-                buffer = BytesIO(self._resume_context.scheduler_state)
-                scheduler.load_state_dict(torch.load(buffer, weights_only=False))
+                from .checkpoint_restore import load_resume_artifact
+
+                scheduler.load_state_dict(
+                    load_resume_artifact(
+                        self._resume_context.scheduler_state, weights_only=False
+                    )
+                )
                 print("🔄 Restored scheduler state from checkpoint")
 
         # Setup early stopping
@@ -391,7 +455,7 @@ class ModelTrainer:
         # For resumed training, only count remaining batches
         remaining_epochs = epochs - start_epoch
         total_batches = remaining_epochs * total_batches_per_epoch
-        total_bars = len(X_train)  # Total number of market data bars
+        total_bars = len(y_train_selected)  # Total number of market data bars
         total_bars_all_epochs = total_bars * epochs  # Total bars across all epochs
 
         # Training loop (starts from start_epoch for resumed training)
@@ -401,6 +465,8 @@ class ModelTrainer:
 
             # Training phase
             model.train()
+            if hasattr(train_dataset, "set_epoch"):
+                train_dataset.set_epoch(epoch)
             train_loss = 0.0
             train_correct = 0
             train_total = 0
@@ -607,13 +673,20 @@ class ModelTrainer:
                         # Fallback to training data if no validation
                         with torch.no_grad():
                             model.eval()
-                            analytics_outputs = model(
-                                X_train[:1000]
+                            sample_rows = (
+                                slice(0, 1000)
+                                if train_indices is None
+                                else torch.as_tensor(
+                                    train_indices[:1000], dtype=torch.long
+                                )
                             )  # Sample for efficiency
+                            analytics_outputs = model(
+                                X_train_cpu[sample_rows].to(self.device)
+                            )
                             _, analytics_predicted = torch.max(
                                 analytics_outputs.data, 1
                             )
-                            analytics_true = y_train[:1000]
+                            analytics_true = y_train_cpu[sample_rows]
                             model.train()
 
                     # Collect detailed analytics (only if we have valid data)
@@ -648,7 +721,7 @@ class ModelTrainer:
                             y_true=analytics_true,
                             model_outputs=analytics_outputs,
                             batch_count=len(train_loader),
-                            total_samples=len(X_train),
+                            total_samples=len(y_train_selected),
                             early_stopping_triggered=False,  # Will be updated if early stopping triggers
                         )
 
@@ -803,6 +803,7 @@ class TrainingPipeline:
         checkpoint_callback=None,
         resume_context: "Optional[TrainingResumeContext]" = None,
         sample_weights: Optional[torch.Tensor] = None,
+        train_indices: Optional[np.ndarray] = None,
     ) -> dict[str, Any]:
         """
         Train the neural network model (symbol-agnostic).
@@ -835,6 +836,10 @@ class TrainingPipeline:
             sample_weights: Optional per-sample weights (length must match X_train).
                 When provided, uses WeightedRandomSampler for importance sampling
                 (e.g., uniqueness weights from triple barrier labels).
+            train_indices: Optional ascending rows of X_train/y_train to train
+                on, so out-of-core training can read a split from the
+                memory-mapped store without copying it. sample_weights then
+                align with these rows.
 
         Returns:
             Training results dict containing:
@@ -871,6 +876,7 @@ class TrainingPipeline:
             X_val=X_val,
             y_val=y_val,
             sample_weights=sample_weights,
+            train_indices=train_indices,
         )
 
         # Use the actual keys returned by ModelTrainer
@@ -1179,95 +1185,10 @@ class TrainingPipelineV3:
 
         all_features = []
         for _symbol, tf_data in data.items():
-            symbol_dfs = []
-
-            for timeframe, df in tf_data.items():
-                if timeframe not in tf_requirements:
-                    logger.debug(
-                        f"Skipping timeframe {timeframe} - not required by nn_inputs"
-                    )
-                    continue
-
-                reqs = tf_requirements[timeframe]
-
-                # Compute required indicators for this timeframe
-                indicator_df = self.indicator_engine.compute_for_timeframe(
-                    df,
-                    timeframe,
-                    reqs["indicators"],
-                    context_data=context_data,
-                )
-
-                # Apply fuzzy sets to compute membership values
-                for fuzzy_set_id in reqs["fuzzy_sets"]:
-                    # Get the indicator this fuzzy set uses
-                    indicator_ref = self.fuzzy_engine.get_indicator_for_fuzzy_set(
-                        fuzzy_set_id
-                    )
-
-                    # Handle dot notation for multi-output indicators
-                    if "." in indicator_ref:
-                        base_indicator, output_name = indicator_ref.split(".", 1)
-                        indicator_col = f"{timeframe}_{base_indicator}.{output_name}"
-                    else:
-                        indicator_col = f"{timeframe}_{indicator_ref}"
-
-                    # Check if column exists
-                    if indicator_col not in indicator_df.columns:
-                        raise ValueError(
-                            f"Indicator column '{indicator_col}' not found in data. "
-                            f"Available columns: {list(indicator_df.columns)}"
-                        )
-
-                    # Fuzzify indicator values
-                    # In v3 mode, fuzzify returns a DataFrame
-                    fuzzify_result = self.fuzzy_engine.fuzzify(
-                        fuzzy_set_id, indicator_df[indicator_col]
-                    )
-
-                    # Type assertion for v3 mode (always returns DataFrame for Series input)
-                    if not isinstance(fuzzify_result, pd.DataFrame):
-                        raise TypeError(
-                            f"Expected DataFrame from fuzzify, got {type(fuzzify_result)}"
-                        )
-                    fuzzy_df: pd.DataFrame = fuzzify_result
-
-                    # Add timeframe prefix to fuzzy columns
-                    # fuzzify returns columns like "rsi_fast_oversold"
-                    # We need "5m_rsi_fast_oversold"
-                    fuzzy_df = fuzzy_df.rename(
-                        columns={col: f"{timeframe}_{col}" for col in fuzzy_df.columns}
-                    )
-
-                    symbol_dfs.append(fuzzy_df)
-
-                # Extract raw indicator features (hybrid encoding)
-                for raw_feature in reqs.get("raw_features", []):
-                    # Build the indicator column name
-                    if raw_feature.indicator_output:
-                        indicator_col = (
-                            f"{timeframe}_{raw_feature.indicator_id}"
-                            f".{raw_feature.indicator_output}"
-                        )
-                    else:
-                        indicator_col = f"{timeframe}_{raw_feature.indicator_id}"
-
-                    if indicator_col not in indicator_df.columns:
-                        raise ValueError(
-                            f"Raw indicator column '{indicator_col}' not found. "
-                            f"Available: {list(indicator_df.columns)}"
-                        )
-
-                    # Extract raw values as a single-column DataFrame
-                    raw_col = indicator_df[[indicator_col]].copy()
-                    raw_col = raw_col.rename(
-                        columns={indicator_col: raw_feature.feature_id}
-                    )
-                    symbol_dfs.append(raw_col)
-
-            if symbol_dfs:
-                # Combine all fuzzy DataFrames for this symbol
-                symbol_features = pd.concat(symbol_dfs, axis=1)
+            symbol_features = self._prepare_symbol_features(
+                tf_data, tf_requirements, context_data
+            )
+            if symbol_features is not None:
                 all_features.append(symbol_features)
 
         if not all_features:
@@ -1294,6 +1215,176 @@ class TrainingPipelineV3:
 
         return result
 
+    def feature_columns(self, data: dict[str, dict[str, pd.DataFrame]]) -> list[str]:
+        """
+        Feature columns ``prepare_features`` will produce for ``data``.
+
+        Resolved features are kept, in canonical order, when at least one
+        symbol has data for their timeframe. Lets callers size outputs before
+        computing any feature.
+
+        Args:
+            data: {symbol: {timeframe: DataFrame}}
+
+        Returns:
+            Feature ids in FeatureResolver order
+        """
+        available = {tf for tf_data in data.values() for tf in tf_data}
+        return [
+            f.feature_id
+            for f in self.feature_resolver.resolve(self.config)
+            if f.timeframe in available
+        ]
+
+    def feature_row_count(self, tf_data: dict[str, pd.DataFrame]) -> int:
+        """
+        Number of feature rows one symbol's data yields, without computing them.
+
+        Per-timeframe feature frames keep their source index and are joined
+        column-wise, so the row count is the size of the union of the indexes
+        of the timeframes that contribute features.
+
+        Args:
+            tf_data: {timeframe: DataFrame} for one symbol
+
+        Returns:
+            Row count of ``_prepare_symbol_features`` for the same data
+        """
+        tf_requirements = self._group_requirements_by_timeframe(
+            self.feature_resolver.resolve(self.config)
+        )
+        index: Optional[pd.Index] = None
+        for timeframe, df in tf_data.items():
+            if timeframe in tf_requirements:
+                index = df.index if index is None else index.union(df.index)
+        return 0 if index is None else len(index)
+
+    def prepare_symbol_features(
+        self,
+        tf_data: dict[str, pd.DataFrame],
+        context_data: Optional[dict[str, pd.DataFrame]] = None,
+        columns: Optional[list[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Prepare one symbol's features, e.g. to stream symbols to disk.
+
+        Args:
+            tf_data: {timeframe: DataFrame} for one symbol
+            context_data: Optional external data sources, as in
+                ``prepare_features``
+            columns: Output columns (typically ``feature_columns()``); columns
+                this symbol lacks are filled with NaN, as the multi-symbol
+                concatenation in ``prepare_features`` does
+
+        Returns:
+            Feature DataFrame, or None if no timeframe contributed features
+        """
+        tf_requirements = self._group_requirements_by_timeframe(
+            self.feature_resolver.resolve(self.config)
+        )
+        result = self._prepare_symbol_features(tf_data, tf_requirements, context_data)
+        if result is None or columns is None:
+            return result
+        return result.reindex(columns=columns)
+
+    def _prepare_symbol_features(
+        self,
+        tf_data: dict[str, pd.DataFrame],
+        tf_requirements: dict[str, dict],
+        context_data: Optional[dict[str, pd.DataFrame]],
+    ) -> Optional[pd.DataFrame]:
+        """Compute and column-join one symbol's per-timeframe features."""
+        symbol_dfs = []
+
+        for timeframe, df in tf_data.items():
+            if timeframe not in tf_requirements:
+                logger.debug(
+                    f"Skipping timeframe {timeframe} - not required by nn_inputs"
+                )
+                continue
+
+            reqs = tf_requirements[timeframe]
+
+            # Compute required indicators for this timeframe
+            indicator_df = self.indicator_engine.compute_for_timeframe(
+                df,
+                timeframe,
+                reqs["indicators"],
+                context_data=context_data,
+            )
+
+            # Apply fuzzy sets to compute membership values
+            for fuzzy_set_id in reqs["fuzzy_sets"]:
+                # Get the indicator this fuzzy set uses
+                indicator_ref = self.fuzzy_engine.get_indicator_for_fuzzy_set(
+                    fuzzy_set_id
+                )
+
+                # Handle dot notation for multi-output indicators
+                if "." in indicator_ref:
+                    base_indicator, output_name = indicator_ref.split(".", 1)
+                    indicator_col = f"{timeframe}_{base_indicator}.{output_name}"
+                else:
+                    indicator_col = f"{timeframe}_{indicator_ref}"
+
+                # Check if column exists
+                if indicator_col not in indicator_df.columns:
+                    raise ValueError(
+                        f"Indicator column '{indicator_col}' not found in data. "
+                        f"Available columns: {list(indicator_df.columns)}"
+                    )
+
+                # Fuzzify indicator values
+                # In v3 mode, fuzzify returns a DataFrame
+                fuzzify_result = self.fuzzy_engine.fuzzify(
+                    fuzzy_set_id, indicator_df[indicator_col]
+                )
+
+                # Type assertion for v3 mode (always returns DataFrame for Series input)
+                if not isinstance(fuzzify_result, pd.DataFrame):
+                    raise TypeError(
+                        f"Expected DataFrame from fuzzify, got {type(fuzzify_result)}"
+                    )
+                fuzzy_df: pd.DataFrame = fuzzify_result
+
+                # Add timeframe prefix to fuzzy columns
+                # fuzzify returns columns like "rsi_fast_oversold"
+                # We need "5m_rsi_fast_oversold"
+                fuzzy_df = fuzzy_df.rename(
+                    columns={col: f"{timeframe}_{col}" for col in fuzzy_df.columns}
+                )
+
+                symbol_dfs.append(fuzzy_df)
+
+            # Extract raw indicator features (hybrid encoding)
+            for raw_feature in reqs.get("raw_features", []):
+                # Build the indicator column name
+                if raw_feature.indicator_output:
+                    indicator_col = (
+                        f"{timeframe}_{raw_feature.indicator_id}"
+                        f".{raw_feature.indicator_output}"
+                    )
+                else:
+                    indicator_col = f"{timeframe}_{raw_feature.indicator_id}"
+
+                if indicator_col not in indicator_df.columns:
+                    raise ValueError(
+                        f"Raw indicator column '{indicator_col}' not found. "
+                        f"Available: {list(indicator_df.columns)}"
+                    )
+
+                # Extract raw values as a single-column DataFrame
+                raw_col = indicator_df[[indicator_col]].copy()
+                raw_col = raw_col.rename(
+                    columns={indicator_col: raw_feature.feature_id}
+                )
+                symbol_dfs.append(raw_col)
+
+        if not symbol_dfs:
+            return None
+        # Combine all fuzzy DataFrames for this symbol
+        return pd.concat(symbol_dfs, axis=1)
+
     def _group_requirements_by_timeframe(
         self, resolved: list["ResolvedFeature"]
     ) -> dict[str, dict]:
@@ -125,6 +125,9 @@ class TrainingWorker(WorkerAPIBase):
         # This is populated by epoch callbacks and used by _save_checkpoint on SIGTERM
         self._last_checkpoint_state: dict | None = None
 
+        # Background checkpoint writers of running operations (by operation ID)
+        self._checkpoint_writers: dict[str, Any] = {}
+
         # Register domain-specific endpoint
         @self.app.post("/training/start")
         async def start_training(request: TrainingStartRequest):
@@ -260,6 +263,9 @@ class TrainingWorker(WorkerAPIBase):
             logger.warning(f"No checkpoint state available to save for {operation_id}")
             return
 
+        # A queued periodic save must not land after the shutdown checkpoint
+        await self._stop_checkpoint_writer(operation_id, discard_pending=True)
+
         state = self._last_checkpoint_state
         if state.get("trainer") is None:
             logger.warning(
@@ -298,6 +304,35 @@ class TrainingWorker(WorkerAPIBase):
         except Exception as e:
             logger.error(f"Failed to save shutdown checkpoint: {e}")
 
+    def _start_checkpoint_writer(
+        self, operation_id: str, checkpoint_service: Any, main_loop: Any
+    ) -> Any:
+        """Create the background checkpoint writer for an operation.
+
+        Returns:
+            BackgroundCheckpointWriter, or None if background writes are disabled
+        """
+        if not get_checkpoint_settings().background_writes:
+            return None
+
+        from ktrdr.checkpoint import BackgroundCheckpointWriter
+
+        writer = BackgroundCheckpointWriter(checkpoint_service, main_loop)
+        self._checkpoint_writers[operation_id] = writer
+        return writer
+
+    async def _stop_checkpoint_writer(
+        self, operation_id: str, discard_pending: bool = False
+    ) -> None:
+        """Wait for an operation's background checkpoint save, then stop its writer.
+
+        Must run before any checkpoint is saved directly or deleted, so that a
+        background save cannot overwrite or resurrect it.
+        """
+        writer = self._checkpoint_writers.pop(operation_id, None)
+        if writer is not None:
+            await writer.aclose(discard_pending=discard_pending)
+
     async def _execute_training_work(
         self,
         operation_id: str,
@@ -449,11 +484,15 @@ class TrainingWorker(WorkerAPIBase):
 
                 # Capture main event loop for checkpoint callback
                 main_loop = asyncio.get_running_loop()
+                writer = self._start_checkpoint_writer(
+                    operation_id, checkpoint_service, main_loop
+                )
 
                 # Import checkpoint builders
                 from ktrdr.training.checkpoint_builder import (
                     build_training_checkpoint_artifacts,
                     build_training_checkpoint_state,
+                    snapshot_training_checkpoint_artifacts,
                 )
 
                 # Create state builder closure that captures original_request
@@ -462,9 +501,15 @@ class TrainingWorker(WorkerAPIBase):
                         kwargs["trainer"], kwargs["epoch"], original_request
                     )
 
-                # Create artifacts builder closure
+                # Create artifacts builder closure (a background writer
+                # serializes a snapshot off the training loop)
                 def training_artifacts_builder(**kwargs):
-                    return build_training_checkpoint_artifacts(
+                    build = (
+                        snapshot_training_checkpoint_artifacts
+                        if writer is not None
+                        else build_training_checkpoint_artifacts
+                    )
+                    return build(
                         kwargs["model"],
                         kwargs["optimizer"],
                         kwargs.get("scheduler"),
@@ -482,6 +527,7 @@ class TrainingWorker(WorkerAPIBase):
                     main_loop=main_loop,
                     last_checkpoint_state=last_checkpoint_state,
                     artifacts_builder=training_artifacts_builder,
+                    writer=writer,
                 )
 
                 # Wrap callback to also store to instance for graceful shutdown (M6)
@@ -506,6 +552,10 @@ class TrainingWorker(WorkerAPIBase):
                 # Run training (async)
                 result = await orchestrator.run()
             finally:
+                # Let a queued periodic save finish before the checkpoint is
+                # deleted or replaced below
+                await self._stop_checkpoint_writer(operation_id)
+
                 # Clean up temp directory
                 import shutil
 
@@ -820,11 +870,15 @@ class TrainingWorker(WorkerAPIBase):
 
             # Capture main event loop for checkpoint callback
             main_loop = asyncio.get_running_loop()
+            writer = self._start_checkpoint_writer(
+                operation_id, checkpoint_service, main_loop
+            )
 
             # Import checkpoint builders
             from ktrdr.training.checkpoint_builder import (
                 build_training_checkpoint_artifacts,
                 build_training_checkpoint_state,
+                snapshot_training_checkpoint_artifacts,
             )
 
             # Create state builder closure that captures original_request
@@ -833,9 +887,15 @@ class TrainingWorker(WorkerAPIBase):
                     kwargs["trainer"], kwargs["epoch"], original_request
                 )
 
-            # Create artifacts builder closure
+            # Create artifacts builder closure (a background writer
+            # serializes a snapshot off the training loop)
             def training_artifacts_builder(**kwargs):
-                return build_training_checkpoint_artifacts(
+                build = (
+                    snapshot_training_checkpoint_artifacts
+                    if writer is not None
+                    else build_training_checkpoint_artifacts
+                )
+                return build(
                     kwargs["model"],
                     kwargs["optimizer"],
                     kwargs.get("scheduler"),
@@ -853,6 +913,7 @@ class TrainingWorker(WorkerAPIBase):
                 main_loop=main_loop,
                 last_checkpoint_state=last_checkpoint_state,
                 artifacts_builder=training_artifacts_builder,
+                writer=writer,
             )
 
             # Wrap callback to also store to instance for graceful shutdown (M6)
@@ -879,6 +940,10 @@ class TrainingWorker(WorkerAPIBase):
             result = await orchestrator.run()
 
         finally:
+            # Let a queued periodic save finish before the checkpoint is
+            # deleted below
+            await self._stop_checkpoint_writer(operation_id)
+
             # Clean up temp directory
             import shutil
 
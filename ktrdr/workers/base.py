@@ -39,6 +39,7 @@ from ktrdr.api.services.operations_service import (
 )
 from ktrdr.config.settings import get_worker_settings
 from ktrdr.logging import get_logger
+from ktrdr.workers.progress_pusher import OperationProgressPusher
 
 logger = get_logger(__name__)
 
@@ -177,6 +178,11 @@ class WorkerAPIBase:
         # Background task for monitoring health checks
         self._monitor_task: Optional[asyncio.Task] = None
 
+        # Heartbeats pushed to the backend (started in lifespan). While they
+        # arrive, the backend skips probing /health.
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._heartbeat_check_interval: float = 1.0  # seconds between status checks
+
         # Graceful shutdown support (M6 Task 6.1)
         # Used to detect SIGTERM and allow operations to save checkpoints
         self._shutdown_event = asyncio.Event()
@@ -190,6 +196,9 @@ class WorkerAPIBase:
         # Started when backend notifies us it's shutting down
         self._reconnection_task: Optional[asyncio.Task] = None
 
+        # Pushes operation progress to the backend (started in lifespan)
+        self._progress_pusher: Optional[OperationProgressPusher] = None
+
         # Register common endpoints
         self._register_operations_endpoints()
         self._register_health_endpoint()
@@ -225,9 +234,33 @@ class WorkerAPIBase:
             # Start re-registration monitor (Task 1.7)
             await worker._start_reregistration_monitor()
 
+            # Push heartbeats so the backend doesn't have to probe us
+            worker._heartbeat_task = asyncio.create_task(
+                worker._heartbeat_loop(get_worker_settings().heartbeat_interval)
+            )
+
+            # Push progress to the backend instead of waiting to be polled
+            push_interval = get_worker_settings().progress_push_interval
+            if push_interval > 0:
+                worker._progress_pusher = OperationProgressPusher(
+                    worker._operations_service,
+                    worker.backend_url,
+                    interval=push_interval,
+                )
+                worker._progress_pusher.start()
+
             yield  # App is running
 
-            # Shutdown (if any cleanup needed)
+            # Shutdown: stop heartbeats, flush final progress before exiting
+            if worker._heartbeat_task is not None:
+                worker._heartbeat_task.cancel()
+                try:
+                    await worker._heartbeat_task
+                except asyncio.CancelledError:
+                    pass
+                worker._heartbeat_task = None
+            if worker._progress_pusher is not None:
+                await worker._progress_pusher.stop()
 
         return lifespan
 
@@ -383,6 +416,7 @@ class WorkerAPIBase:
                     limit=limit,
                     offset=offset,
                     active_only=active_only,
+                    cached_only=True,
                 )
 
                 operation_summaries = [
@@ -472,19 +506,12 @@ class WorkerAPIBase:
             self._last_health_check_received = datetime.now(UTC)
 
             try:
-                active_ops, _, _ = await self._operations_service.list_operations(
-                    operation_type=self.operation_type, active_only=True
-                )
-
                 return {
                     "healthy": True,
                     "service": f"{self.worker_type.value}-worker",
                     "timestamp": datetime.now(UTC).isoformat(),
                     "status": "operational",
-                    "worker_status": "busy" if active_ops else "idle",
-                    "current_operation": (
-                        active_ops[0].operation_id if active_ops else None
-                    ),
+                    **(await self._worker_status()),
                 }
 
             except Exception as e:
@@ -495,6 +522,23 @@ class WorkerAPIBase:
                     "error": "Health check failed - see server logs for details",
                 }
 
+    async def _worker_status(self) -> dict[str, Any]:
+        """
+        Busy/idle status reported in /health and in heartbeats.
+
+        The worker is busy once every slot (KTRDR_WORKER_SLOTS) is taken;
+        active_operations lets the backend schedule onto the free ones.
+        """
+        active_ops, _, _ = await self._operations_service.list_operations(
+            operation_type=self.operation_type, active_only=True
+        )
+        slots = get_worker_settings().slots
+        return {
+            "worker_status": "busy" if len(active_ops) >= slots else "idle",
+            "current_operation": active_ops[0].operation_id if active_ops else None,
+            "active_operations": len(active_ops),
+        }
+
     def _register_metrics_endpoint(self) -> None:
         """
         Register Prometheus metrics endpoint.
@@ -902,7 +946,8 @@ class WorkerAPIBase:
             Dictionary containing worker registration data
         """
         # Determine worker capabilities (GPU detection for training workers)
-        capabilities: dict[str, Any] = {}
+        worker_settings = get_worker_settings()
+        capabilities: dict[str, Any] = {"slots": worker_settings.slots}
         if self.worker_type.value == "training":
             # Detect GPU for training workers
             try:
@@ -923,7 +968,6 @@ class WorkerAPIBase:
 
         # Use public_base_url from settings if set (for distributed deployments),
         # otherwise fall back to container hostname (for local Docker Compose)
-        worker_settings = get_worker_settings()
         if worker_settings.public_base_url:
             endpoint_url = worker_settings.public_base_url
             logger.debug(f"Using public_base_url from settings: {endpoint_url}")
@@ -1034,6 +1078,52 @@ class WorkerAPIBase:
                 logger.error(f"Error in re-registration monitor: {e}")
                 await asyncio.sleep(5)  # Back off on error
 
+    async def _heartbeat_loop(self, interval: float) -> None:
+        """
+        Push heartbeats to the backend.
+
+        A heartbeat is sent every ``interval`` seconds and as soon as the
+        worker's busy/idle status changes, so the backend learns that a worker
+        became free without waiting for a probe. An acknowledged heartbeat
+        also proves the backend is up (like receiving a health check); a 404
+        means the backend lost our registration, so we re-register.
+
+        Args:
+            interval: Seconds between heartbeats when nothing changes
+        """
+        import httpx
+
+        url = f"{self.backend_url}/api/v1/workers/{self.worker_id}/heartbeat"
+        loop = asyncio.get_running_loop()
+        last_sent: Optional[dict[str, Any]] = None
+        next_due = 0.0
+
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            while True:
+                try:
+                    status = await self._worker_status()
+                    if status != last_sent or loop.time() >= next_due:
+                        response = await client.post(url, json=status)
+                        if response.status_code == 200:
+                            last_sent = status
+                            next_due = loop.time() + interval
+                            self._last_health_check_received = datetime.now(UTC)
+                        elif response.status_code == 404:
+                            logger.warning(
+                                "Heartbeat rejected: not registered - re-registering"
+                            )
+                            last_sent = None
+                            await self.self_register()
+                        else:
+                            logger.debug(
+                                f"Heartbeat rejected: HTTP {response.status_code}"
+                            )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug(f"Heartbeat failed: {e}")
+                await asyncio.sleep(self._heartbeat_check_interval)
+
     async def _ensure_registered(self) -> None:
         """
         Check if this worker is registered with the backend.
@@ -1101,6 +1191,7 @@ class WorkerAPIBase:
         main_loop: asyncio.AbstractEventLoop,
         last_checkpoint_state: dict[str, Any],
         artifacts_builder: Any = None,
+        writer: Any = None,
     ) -> Any:
         """
         Create a checkpoint callback with proper event loop handling.
@@ -1121,6 +1212,11 @@ class WorkerAPIBase:
             main_loop: The main asyncio event loop (capture before entering thread)
             last_checkpoint_state: Dict to store latest state for cancellation checkpoints
             artifacts_builder: Optional callable to build artifacts (for training)
+            writer: Optional BackgroundCheckpointWriter. When given, the
+                callback only captures state and returns; serialization and
+                the save happen in the background. state_builder and
+                artifacts_builder may then return zero-argument callables,
+                which are called on the writer thread to finish the build.
 
         Returns:
             A callback function suitable for use in worker loops
@@ -1167,6 +1263,30 @@ class WorkerAPIBase:
                     if artifacts_builder:
                         artifacts = artifacts_builder(**kwargs)
 
+                    if writer is not None:
+                        pending_state = state
+                        pending_artifacts = artifacts
+
+                        def build():
+                            built_state = (
+                                pending_state()
+                                if callable(pending_state)
+                                else pending_state
+                            )
+                            built_artifacts = (
+                                pending_artifacts()
+                                if callable(pending_artifacts)
+                                else pending_artifacts
+                            )
+                            return built_state.to_dict(), built_artifacts
+
+                        writer.submit(operation_id, "periodic", build)
+                        checkpoint_policy.record_checkpoint(unit_value)
+                        logger.debug(
+                            f"Periodic checkpoint queued for {operation_id} at unit {unit_value}"
+                        )
+                        return
+
                     # Schedule checkpoint save on main event loop
                     # This avoids "Future attached to different loop" errors
                     future = asyncio.run_coroutine_threadsafe(
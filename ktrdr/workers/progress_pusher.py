@@ -0,0 +1,138 @@
+"""
+Push operation progress from a worker to the backend.
+
+Without this, the backend learns about worker progress only by polling the
+worker's /operations endpoints through OperationServiceProxy whenever a
+client polls the backend. The pusher subscribes to the worker's own
+OperationsService events and forwards them to the backend's
+POST /operations/{id}/events:
+
+- progress is coalesced per operation and sent at most once per interval
+- metrics deltas are accumulated between sends, with the worker cursor
+- terminal events are sent immediately
+
+Pushes are best-effort. A failed push is dropped: the backend's pull path
+still works and its metrics cursor only advances on successful pushes, so
+nothing is lost, only delayed until the next pull.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import httpx
+
+from ktrdr.api.services.operation_events import (
+    EVENT_METRICS,
+    EVENT_TERMINAL,
+    OperationEvent,
+)
+from ktrdr.api.services.operations_service import OperationsService
+from ktrdr.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class OperationProgressPusher:
+    """Forwards a worker's operation events to the backend."""
+
+    def __init__(
+        self,
+        operations_service: OperationsService,
+        backend_url: str,
+        interval: float = 0.5,
+        timeout: float = 5.0,
+    ):
+        """
+        Initialize the pusher.
+
+        Args:
+            operations_service: The worker's OperationsService
+            backend_url: Backend base URL (without /api/v1)
+            interval: Seconds between coalesced pushes
+            timeout: HTTP timeout per push
+        """
+        self._operations_service = operations_service
+        self._backend_url = backend_url.rstrip("/")
+        self.interval = interval
+        self._timeout = timeout
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.pushes_sent = 0
+        self.pushes_failed = 0
+
+    def start(self) -> None:
+        """Start the background push loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush pending updates and stop the push loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        subscription = self._operations_service.subscribe()
+        try:
+            async with httpx.AsyncClient(timeout=self._timeout) as client:
+                try:
+                    await self._loop(subscription, client)
+                finally:
+                    # Don't lose terminal state on shutdown
+                    await asyncio.shield(self.flush(client))
+        finally:
+            subscription.close()
+
+    async def _loop(self, subscription: Any, client: httpx.AsyncClient) -> None:
+        loop = asyncio.get_running_loop()
+        next_flush = loop.time() + self.interval
+        while True:
+            timeout = max(0.0, next_flush - loop.time())
+            event = await subscription.get(timeout=timeout)
+            if event is not None:
+                self.record(event)
+                if not event.is_terminal:
+                    continue
+            else:
+                # Bridges are pull-based: pulling publishes any new progress
+                self._operations_service.refresh_local_operations()
+            await self.flush(client)
+            next_flush = loop.time() + self.interval
+
+    def record(self, event: OperationEvent) -> None:
+        """Merge an event into the pending update for its operation."""
+        pending = self._pending.setdefault(event.operation_id, {})
+        if event.event_type == EVENT_METRICS:
+            pending.setdefault("metrics", []).extend(event.data.get("metrics", []))
+            if event.data.get("cursor") is not None:
+                pending["metrics_cursor"] = event.data["cursor"]
+            return
+        pending["status"] = event.data.get("status")
+        pending["progress"] = event.data.get("progress")
+        if event.event_type == EVENT_TERMINAL:
+            for key in ("result_summary", "error_message", "completed_at"):
+                if event.data.get(key) is not None:
+                    pending[key] = event.data[key]
+
+    async def flush(self, client: httpx.AsyncClient) -> None:
+        """Send every pending update."""
+        pending, self._pending = self._pending, {}
+        for operation_id, update in pending.items():
+            url = f"{self._backend_url}/api/v1/operations/{operation_id}/events"
+            try:
+                response = await client.post(url, json=update)
+                if response.status_code == 200:
+                    self.pushes_sent += 1
+                    continue
+                logger.debug(
+                    f"Progress push for {operation_id} rejected: "
+                    f"{response.status_code}"
+                )
+            except Exception as e:
+                logger.debug(f"Progress push for {operation_id} failed: {e}")
+            self.pushes_failed += 1
@@ -1,9 +1,16 @@
 """Operations management API client"""
 
+import asyncio
 from typing import Any, Optional
 
+import structlog
+
+from ktrdr.async_infrastructure.sse import TERMINAL_STATUSES, stream_until_terminal
+
 from .base import BaseAPIClient
 
+logger = structlog.get_logger()
+
 
 class OperationsAPIClient(BaseAPIClient):
     """API client for operations management"""
@@ -32,6 +39,48 @@ class OperationsAPIClient(BaseAPIClient):
         # Return full response (tests expect success + data fields)
         return await self._request("GET", f"/operations/{operation_id}")
 
+    async def wait_for_operation(
+        self, operation_id: str, timeout: float = 600.0, poll_interval: float = 2.0
+    ) -> dict[str, Any]:
+        """
+        Wait until an operation completes, fails or is cancelled.
+
+        Waits on the pushed event stream (/operations/stream) and falls back to
+        polling get_operation_status() when the stream is unavailable.
+
+        Args:
+            operation_id: Operation ID
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between status polls in fallback mode
+
+        Returns:
+            dict: Final get_operation_status() response; the operation is
+                still running if the timeout elapsed first
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            await asyncio.wait_for(
+                stream_until_terminal(self.client, "/operations/stream", operation_id),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            return await self.get_operation_status(operation_id)
+        except Exception as e:
+            logger.debug(
+                "Event stream unavailable, polling instead",
+                operation_id=operation_id,
+                error=str(e),
+            )
+
+        while True:
+            result = await self.get_operation_status(operation_id)
+            status = result.get("data", {}).get("status")
+            remaining = deadline - loop.time()
+            if status in TERMINAL_STATUSES or remaining <= 0:
+                return result
+            await asyncio.sleep(min(poll_interval, remaining))
+
     async def cancel_operation(
         self, operation_id: str, reason: Optional[str] = None
     ) -> dict[str, Any]:
@@ -615,8 +615,9 @@ async def get_operation_status(operation_id: str) -> dict[str, Any]:
     """
     Get detailed status and progress of a specific operation.
 
-    Poll for real-time progress updates on data loading, training, or other async
-    operations. Returns current status, progress percentage, ETA, and any errors.
+    Snapshot of progress for data loading, training, or other async operations.
+    Returns current status, progress percentage, ETA, and any errors. To block
+    until an operation finishes, use wait_for_operation() instead of polling.
 
     Args:
         operation_id: Unique operation identifier from list_operations() or operation start
@@ -653,11 +654,12 @@ async def get_operation_status(operation_id: str) -> dict[str, Any]:
 
     See Also:
         - list_operations(): Find operation IDs
+        - wait_for_operation(): Block until the operation finishes
         - cancel_operation(): Stop running operations
         - get_operation_results(): Get final results after completion
 
     Notes:
-        - Poll every 2-5 seconds for smooth progress tracking
+        - Prefer wait_for_operation() over repeated polling
         - Status persists for 24 hours after completion
         - Use metadata field for operation-specific details
     """
@@ -671,6 +673,56 @@ async def get_operation_status(operation_id: str) -> dict[str, Any]:
         raise
 
 
+@trace_mcp_tool("wait_for_operation")
+@mcp.tool()
+async def wait_for_operation(
+    operation_id: str, timeout_seconds: int = 600
+) -> dict[str, Any]:
+    """
+    Wait until an operation completes, fails or is cancelled.
+
+    Follows the operation over the backend's pushed event stream, so it
+    returns as soon as the operation finishes, without repeated status calls.
+    Falls back to polling when the stream is unavailable.
+
+    Args:
+        operation_id: Unique operation identifier from list_operations() or operation start
+        timeout_seconds: Maximum seconds to wait (default 600, max 3600)
+
+    Returns:
+        Same structure as get_operation_status(). If the timeout elapsed first,
+        data.status is still "pending" or "running" - call again to keep waiting.
+
+    Raises:
+        KTRDRAPIError: If operation_id not found or backend communication fails
+
+    Examples:
+        # Start training and wait for it
+        result = await start_training(...)
+        status = await wait_for_operation(result["operation_id"], timeout_seconds=1800)
+        if status["data"]["status"] == "completed":
+            results = await get_operation_results(result["operation_id"])
+
+    See Also:
+        - get_operation_status(): Non-blocking progress snapshot
+        - get_operation_results(): Get final results after completion
+    """
+    try:
+        async with get_api_client() as client:
+            result = await client.operations.wait_for_operation(
+                operation_id, timeout=max(0, min(timeout_seconds, 3600))
+            )
+            logger.info(
+                "Waited for operation",
+                operation_id=operation_id,
+                status=result.get("data", {}).get("status"),
+            )
+            return result
+    except Exception as e:
+        logger.error("Failed to wait for operation", error=str(e))
+        raise
+
+
 @trace_mcp_tool("cancel_operation")
 @mcp.tool()
 async def cancel_operation(
@@ -1169,13 +1221,8 @@ async def start_backtest(
             model_path="models/neuro_mean_reversion/1d_v2/model.pt"
         )
 
-        # Check progress
-        status = await get_operation_status(operation_id)
-
         # Wait for completion
-        while status["data"]["status"] == "running":
-            await asyncio.sleep(2)
-            status = await get_operation_status(operation_id)
+        status = await wait_for_operation(operation_id)
 
         # Get results
         results = status["data"]["results"]
@@ -1184,7 +1231,7 @@ async def start_backtest(
         print(f"Max drawdown: {results['max_drawdown']:.2%}")
 
     See Also:
-        - get_operation_status(): Monitor backtest progress
+        - wait_for_operation(): Wait for the backtest to finish
         - get_operation_results(): Get detailed metrics after completion
         - get_available_strategies(): List valid strategy names
         - trigger_data_loading(): Ensure data is available first
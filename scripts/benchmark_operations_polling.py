@@ -0,0 +1,115 @@
+"""Load benchmark: N concurrent pollers against M running remote operations.
+
+Simulates the backend polling distributed operations while workers respond
+with configurable latency, with one optional pathologically slow worker.
+Reports poll latency percentiles and how many worker fetches were issued.
+
+Usage:
+    uv run python scripts/benchmark_operations_polling.py \\
+        --pollers 200 --operations 20 --latency-ms 20 --slow-worker-ms 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+
+from ktrdr.api.models.operations import (
+    OperationInfo,
+    OperationMetadata,
+    OperationStatus,
+    OperationType,
+)
+from ktrdr.api.services.operations_service import OperationsService
+
+
+class FakeWorkerProxy:
+    """Stands in for OperationServiceProxy with fixed response latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def get_operation(self, host_operation_id: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return {"status": "running", "progress": {"percentage": 50.0}}
+
+    async def get_metrics(self, host_operation_id: str, cursor: int):
+        await asyncio.sleep(self.latency)
+        return [], cursor
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    service = OperationsService()
+    service._cache_ttl = args.cache_ttl
+
+    proxies = []
+    for i in range(args.operations):
+        operation_id = f"op_{i}"
+        service._cache[operation_id] = OperationInfo(
+            operation_id=operation_id,
+            operation_type=OperationType.TRAINING,
+            status=OperationStatus.RUNNING,
+            created_at=datetime.now(timezone.utc),
+            metadata=OperationMetadata(),
+        )
+        latency = args.latency_ms / 1000
+        if i == 0 and args.slow_worker_ms:
+            latency = args.slow_worker_ms / 1000
+        proxy = FakeWorkerProxy(latency)
+        proxies.append(proxy)
+        service.register_remote_proxy(operation_id, proxy, f"host_{operation_id}")
+
+    latencies: list[float] = []
+    deadline = time.perf_counter() + args.duration
+
+    async def poller(index: int) -> None:
+        # Poller 0 always watches the slow operation; others spread evenly
+        operation_id = f"op_{index % args.operations}"
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if index % 10 == 0:
+                await service.list_operations(active_only=True)
+            else:
+                await service.get_operation(operation_id)
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(args.interval_ms / 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(poller(i) for i in range(args.pollers)))
+    elapsed = time.perf_counter() - started
+
+    fast = [lat for lat in latencies if lat < (args.slow_worker_ms or 1e9) / 1000]
+    print(
+        f"pollers={args.pollers} operations={args.operations} "
+        f"latency={args.latency_ms}ms slow_worker={args.slow_worker_ms}ms"
+    )
+    print(f"polls:          {len(latencies)} in {elapsed:.1f}s")
+    print(f"throughput:     {len(latencies) / elapsed:.0f} polls/s")
+    print(f"latency p50:    {statistics.median(latencies) * 1000:.1f} ms")
+    print(f"latency p99:    {_percentile(latencies, 0.99) * 1000:.1f} ms")
+    print(f"unaffected p99: {_percentile(fast, 0.99) * 1000:.1f} ms")
+    print(f"worker fetches: {sum(p.calls for p in proxies)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pollers", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--slow-worker-ms", type=float, default=2000.0)
+    parser.add_argument("--interval-ms", type=float, default=50.0)
+    parser.add_argument("--cache-ttl", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Rebuild the model catalog of a models directory.
+
+ModelStorage keeps a SQLite catalog of saved model versions
+(<models_dir>/.model_catalog.sqlite) for fast listing and latest-version
+lookups. It is maintained by save_model/delete_model and built automatically
+the first time a tree is used; run this script after model directories were
+copied, moved or deleted by hand.
+
+Usage:
+    python scripts/rebuild_model_catalog.py [--models-dir models]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def main() -> int:
+    """Rebuild the catalog and print a per-strategy summary."""
+    from ktrdr.training.model_storage import ModelStorage
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--models-dir",
+        default=None,
+        help="Models directory (default: configured KTRDR_DATA_MODELS_DIR)",
+    )
+    args = parser.parse_args()
+
+    storage = ModelStorage(args.models_dir)
+    count = storage.rebuild_catalog()
+
+    per_strategy: dict[str, int] = {}
+    for model in storage.list_models():
+        name = Path(model["path"]).parent.name
+        per_strategy[name] = per_strategy.get(name, 0) + 1
+    for name, versions in sorted(per_strategy.items()):
+        print(f"  {name}: {versions} versions")
+    print(f"Catalogued {count} model versions in {storage.base_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -482,3 +482,77 @@ class TestBacktestStartRequestModel:
 
         assert request.symbol is None
         assert request.timeframe is None
+
+    def test_model_accepts_slices_within_range(self):
+        """Slices inside start_date..end_date are accepted in order."""
+        from ktrdr.api.models.backtesting import BacktestStartRequest
+
+        request = BacktestStartRequest(
+            strategy_name="test_strategy",
+            start_date="2024-01-01",
+            end_date="2024-06-01",
+            slices=[
+                {"start_date": "2024-01-01", "end_date": "2024-02-01"},
+                {"start_date": "2024-04-01", "end_date": "2024-06-01"},
+            ],
+        )
+
+        assert [s.start_date for s in request.slices] == ["2024-01-01", "2024-04-01"]
+
+    @pytest.mark.parametrize(
+        "slices",
+        [
+            [],
+            [{"start_date": "2023-12-01", "end_date": "2024-02-01"}],
+            [{"start_date": "2024-03-01", "end_date": "2024-02-01"}],
+        ],
+    )
+    def test_model_rejects_invalid_slices(self, slices):
+        """Empty, out-of-range and reversed slices are rejected."""
+        from pydantic import ValidationError
+
+        from ktrdr.api.models.backtesting import BacktestStartRequest
+
+        with pytest.raises(ValidationError):
+            BacktestStartRequest(
+                strategy_name="test_strategy",
+                start_date="2024-01-01",
+                end_date="2024-06-01",
+                slices=slices,
+            )
+
+    @pytest.mark.api
+    def test_start_backtest_passes_slices_to_service(
+        self, client_with_mocked_service, mock_backtesting_service
+    ):
+        """Slices reach the service as (start, end) datetime pairs."""
+        mock_backtesting_service.run_backtest.return_value = {
+            "success": True,
+            "operation_id": "op_backtest_slices",
+            "status": "started",
+            "message": "Backtest started for AAPL 1h",
+            "symbol": "AAPL",
+            "timeframe": "1h",
+        }
+
+        response = client_with_mocked_service.post(
+            "/api/v1/backtests/start",
+            json={
+                "strategy_name": "test_strategy",
+                "symbol": "AAPL",
+                "timeframe": "1h",
+                "start_date": "2024-01-01",
+                "end_date": "2024-06-01",
+                "slices": [
+                    {"start_date": "2024-01-01", "end_date": "2024-02-01"},
+                    {"start_date": "2024-04-01", "end_date": "2024-06-01"},
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        call_kwargs = mock_backtesting_service.run_backtest.call_args[1]
+        assert call_kwargs["slices"] == [
+            (datetime(2024, 1, 1), datetime(2024, 2, 1)),
+            (datetime(2024, 4, 1), datetime(2024, 6, 1)),
+        ]
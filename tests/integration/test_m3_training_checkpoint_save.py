@@ -295,13 +295,11 @@ class TestM3PeriodicCheckpoint:
         # Verify artifacts exist on filesystem
         artifact_path = temp_artifacts_dir / operation_id
         assert artifact_path.exists()
-        assert (artifact_path / "model.pt").exists()
-        assert (artifact_path / "optimizer.pt").exists()
+        stored = checkpoint_service._store.read(artifact_path)
+        assert set(stored) == {"model.pt", "optimizer.pt"}
 
         # Verify content
-        assert (
-            artifact_path / "model.pt"
-        ).read_bytes() == b"model_weights_data_for_testing"
+        assert stored["model.pt"] == b"model_weights_data_for_testing"
 
     @pytest.mark.asyncio
     async def test_periodic_checkpoint_overwrites_previous(
@@ -337,7 +335,8 @@ class TestM3PeriodicCheckpoint:
 
         # Verify only one checkpoint directory (not two)
         artifact_path = temp_artifacts_dir / operation_id
-        assert (artifact_path / "model.pt").read_bytes() == b"epoch_10_weights"
+        stored = checkpoint_service._store.read(artifact_path)
+        assert stored["model.pt"] == b"epoch_10_weights"
 
 
 # ============================================================================
@@ -419,7 +418,8 @@ class TestM3CancellationCheckpoint:
 
         # Verify artifacts updated
         artifact_path = temp_artifacts_dir / operation_id
-        assert (artifact_path / "model.pt").read_bytes() == b"cancellation_model"
+        stored = checkpoint_service._store.read(artifact_path)
+        assert stored["model.pt"] == b"cancellation_model"
 
 
 # ============================================================================
@@ -543,13 +543,10 @@ class TestM3FilesystemArtifactsVerification:
 
         # Verify all files present
         artifact_path = temp_artifacts_dir / operation_id
-        assert (artifact_path / "model.pt").exists()
-        assert (artifact_path / "optimizer.pt").exists()
-        assert (artifact_path / "scheduler.pt").exists()
+        assert checkpoint_service._store.read(artifact_path) == artifacts
 
-        # Verify no temp directory left behind
-        temp_path = temp_artifacts_dir / f"{operation_id}.tmp"
-        assert not temp_path.exists()
+        # Verify no temp files left behind
+        assert not list(temp_artifacts_dir.rglob("*.tmp"))
 
     @pytest.mark.asyncio
     async def test_artifacts_can_be_loaded(
@@ -623,7 +620,7 @@ class TestM3FilesystemArtifactsVerification:
         )
 
         artifact_path = temp_artifacts_dir / operation_id
-        assert (artifact_path / "old_file.pt").exists()
+        assert "old_file.pt" in checkpoint_service._store.read(artifact_path)
 
         # Update checkpoint with new artifacts (no old_file.pt)
         await checkpoint_service.save_checkpoint(
@@ -634,8 +631,8 @@ class TestM3FilesystemArtifactsVerification:
         )
 
         # Verify old artifacts removed, new artifacts present
-        assert (artifact_path / "model.pt").read_bytes() == b"new_model"
-        assert not (artifact_path / "old_file.pt").exists()
+        stored = checkpoint_service._store.read(artifact_path)
+        assert stored == {"model.pt": b"new_model"}
 
 
 # ============================================================================
@@ -705,7 +702,7 @@ class TestM3FullFlow:
         # Step 3: Verify artifacts on filesystem
         artifact_path = temp_artifacts_dir / operation_id
         assert artifact_path.exists()
-        assert (artifact_path / "model.pt").exists()
+        assert "model.pt" in checkpoint_service._store.read(artifact_path)
 
         # Step 4 & 5: Training cancelled, save cancellation checkpoint
         cancellation_epoch = 8  # Cancelled during epoch 8
@@ -732,7 +729,8 @@ class TestM3FullFlow:
         assert record["state"]["epoch"] == cancellation_epoch
 
         # Verify artifacts updated
-        assert (artifact_path / "model.pt").read_bytes() == b"model_at_cancellation"
+        stored = checkpoint_service._store.read(artifact_path)
+        assert stored["model.pt"] == b"model_at_cancellation"
 
     @pytest.mark.asyncio
     async def test_failure_checkpoint_flow(
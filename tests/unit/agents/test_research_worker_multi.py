@@ -19,6 +19,7 @@ import pytest_asyncio
 from ktrdr.api.models.operations import (
     OperationInfo,
     OperationMetadata,
+    OperationProgress,
     OperationStatus,
     OperationType,
 )
@@ -1424,3 +1425,64 @@ class TestChildTaskCancellation:
             await task
         except asyncio.CancelledError:
             pass  # Expected during test cleanup after explicit cancel
+
+
+# ============================================================================
+# TestEventDrivenWait
+# ============================================================================
+
+
+class TestEventDrivenWait:
+    """The coordinator wakes on terminal operation events, not just the interval."""
+
+    @pytest.mark.asyncio
+    async def test_terminal_event_cuts_wait_short(
+        self, mock_design_worker, mock_assessment_worker, monkeypatch
+    ):
+        from ktrdr.agents.workers.research_worker import AgentResearchWorker
+        from ktrdr.api.services.operations_service import OperationsService
+
+        # Keep the completion out of the global Prometheus histogram
+        monkeypatch.setattr(
+            "ktrdr.api.services.operations_service.record_operation_duration",
+            lambda *args, **kwargs: None,
+        )
+        ops = OperationsService()
+        worker = AgentResearchWorker(
+            operations_service=ops,
+            design_worker=mock_design_worker,
+            assessment_worker=mock_assessment_worker,
+        )
+        child = await ops.create_operation(
+            operation_type=OperationType.TRAINING, metadata=OperationMetadata()
+        )
+        await ops.start_operation(child.operation_id)
+
+        subscription = worker._subscribe_to_operations()
+        try:
+            waiting = asyncio.create_task(
+                worker._wait_for_operation_events(subscription, 30)
+            )
+            await asyncio.sleep(0.05)
+            await ops.update_progress(
+                child.operation_id, OperationProgress(percentage=50.0)
+            )
+            await asyncio.sleep(0.05)
+            assert not waiting.done()  # Progress alone doesn't wake the loop
+
+            await ops.complete_operation(child.operation_id, {"ok": True})
+            await asyncio.wait_for(waiting, 1)
+        finally:
+            subscription.close()
+
+    def test_services_without_event_bus_fall_back_to_sleep(
+        self, mock_operations_service, mock_design_worker, mock_assessment_worker
+    ):
+        from ktrdr.agents.workers.research_worker import AgentResearchWorker
+
+        worker = AgentResearchWorker(
+            operations_service=mock_operations_service,
+            design_worker=mock_design_worker,
+            assessment_worker=mock_assessment_worker,
+        )
+        assert worker._subscribe_to_operations() is None
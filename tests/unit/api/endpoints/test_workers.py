@@ -423,3 +423,37 @@ class TestShutdownModeEndpoint:
         )
 
         assert response.status_code == 200
+
+
+class TestWorkerHeartbeatEndpoint:
+    """Tests for POST /api/v1/workers/{worker_id}/heartbeat endpoint."""
+
+    def test_heartbeat_updates_status(self, client, worker_registry):
+        """A heartbeat from a registered worker updates its status."""
+        client.post(
+            "/api/v1/workers/register",
+            json={
+                "worker_id": "backtest-1",
+                "worker_type": "backtesting",
+                "endpoint_url": "http://192.168.1.201:5003",
+            },
+        )
+
+        response = client.post(
+            "/api/v1/workers/backtest-1/heartbeat",
+            json={"worker_status": "busy", "current_operation": "op-1"},
+        )
+
+        assert response.status_code == 200
+        worker = worker_registry.get_worker("backtest-1")
+        assert worker.status == WorkerStatus.BUSY
+        assert worker.current_operation_id == "op-1"
+        assert "backtest-1" in worker_registry._last_heartbeat
+
+    def test_heartbeat_unknown_worker_returns_404(self, client):
+        """Unknown workers get 404 so they re-register."""
+        response = client.post(
+            "/api/v1/workers/missing/heartbeat", json={"worker_status": "idle"}
+        )
+
+        assert response.status_code == 404
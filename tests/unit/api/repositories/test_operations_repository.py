@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from ktrdr.api.models.db.operations import OperationRecord
 from ktrdr.api.models.operations import (
@@ -458,6 +459,46 @@ class TestOperationsRepositoryList:
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_list_uses_keyset_pagination(
+        self, mock_session, mock_session_factory
+    ):
+        """list should order newest first and page with a keyset predicate."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        repo = OperationsRepository(mock_session_factory)
+        after = (datetime(2024, 12, 21, 10, 0, 0, tzinfo=timezone.utc), "op_b")
+
+        await repo.list(parent_operation_id="op_parent", limit=20, after=after)
+
+        stmt = mock_session.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "operations.parent_operation_id = " in sql
+        assert "(operations.created_at, operations.operation_id) < " in sql
+        assert (
+            "ORDER BY operations.created_at DESC, operations.operation_id DESC" in sql
+        )
+        assert "OFFSET" not in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.asyncio
+    async def test_count_applies_filters(self, mock_session, mock_session_factory):
+        """count should issue a filtered COUNT query."""
+        mock_result = MagicMock()
+        mock_result.scalar_one.return_value = 7
+        mock_session.execute.return_value = mock_result
+
+        repo = OperationsRepository(mock_session_factory)
+
+        assert await repo.count(status="completed") == 7
+        sql = str(
+            mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "count(" in sql
+        assert "operations.status = " in sql
+
 
 class TestOperationsRepositoryDelete:
     """Tests for OperationsRepository.delete method."""
@@ -504,6 +545,23 @@ class TestOperationsRepositoryDelete:
         mock_session.delete.assert_called_once_with(sample_record)
         mock_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_delete_removes_metric_series_in_same_transaction(
+        self, mock_session, mock_session_factory, sample_record
+    ):
+        """delete should also remove the operation's operation_metrics rows."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_record
+        mock_session.execute.return_value = mock_result
+
+        await OperationsRepository(mock_session_factory).delete("op_to_delete")
+
+        statement = mock_session.execute.call_args_list[-1][0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM operation_metrics")
+        assert statement.compile().params == {"operation_id_1": "op_to_delete"}
+        mock_session.commit.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_delete_returns_false_when_not_found(
         self, mock_session, mock_session_factory
@@ -798,3 +856,65 @@ class TestOperationsRepositoryTryResume:
         # Verify a single execute call (atomic operation)
         assert mock_session.execute.call_count == 1
         # The update is atomic - no separate SELECT before UPDATE
+
+
+class TestOperationsRepositoryMetrics:
+    """Tests for OperationsRepository metrics batch methods."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock async session."""
+        session = AsyncMock()
+        session.commit = AsyncMock()
+        return session
+
+    @pytest.fixture
+    def mock_session_factory(self, mock_session):
+        """Create a mock session factory."""
+        return create_mock_session_factory(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_add_metrics_inserts_batch_in_one_statement(
+        self, mock_session, mock_session_factory
+    ):
+        """add_metrics should write the whole batch with a single INSERT."""
+        repo = OperationsRepository(mock_session_factory)
+
+        count = await repo.add_metrics(
+            "op_test",
+            [
+                ("epochs", 0, {"val_loss": 0.5}),
+                ("epochs", 1, {"val_loss": float("nan")}),
+            ],
+        )
+
+        assert count == 2
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert params["data_m1"] == {"val_loss": None}  # NaN sanitized
+
+    @pytest.mark.asyncio
+    async def test_add_metrics_skips_empty_batch(
+        self, mock_session, mock_session_factory
+    ):
+        """add_metrics should not open a transaction for an empty batch."""
+        repo = OperationsRepository(mock_session_factory)
+
+        assert await repo.add_metrics("op_test", []) == 0
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_returns_seq_and_entry(
+        self, mock_session, mock_session_factory
+    ):
+        """get_metrics should return (seq, entry) tuples in order."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(3, {"bar": 3}), (4, {"bar": 4})]
+        mock_session.execute.return_value = mock_result
+
+        repo = OperationsRepository(mock_session_factory)
+
+        result = await repo.get_metrics("op_test", "bars", cursor=3)
+
+        assert result == [(3, {"bar": 3}), (4, {"bar": 4})]
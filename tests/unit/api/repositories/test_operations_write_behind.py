@@ -0,0 +1,246 @@
+"""Unit tests for WriteBehindOperationsRepository.
+
+Tests use a mocked SQLAlchemy async session and check which statements are
+issued, without requiring a real database connection.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from ktrdr.api.models.db.operations import OperationRecord
+from ktrdr.api.models.operations import (
+    OperationInfo,
+    OperationMetadata,
+    OperationStatus,
+    OperationType,
+)
+from ktrdr.api.repositories.operations_write_behind import (
+    MAX_FLUSH_ATTEMPTS,
+    WriteBehindOperationsRepository,
+)
+
+
+def create_mock_session_factory(mock_session):
+    """Create a mock session factory that returns the given mock session."""
+
+    @asynccontextmanager
+    async def mock_factory():
+        yield mock_session
+
+    return mock_factory
+
+
+def make_operation(operation_id: str) -> OperationInfo:
+    return OperationInfo(
+        operation_id=operation_id,
+        operation_type=OperationType.BACKTESTING,
+        status=OperationStatus.PENDING,
+        created_at=datetime(2024, 12, 21, 10, 0, 0, tzinfo=timezone.utc),
+        metadata=OperationMetadata(symbol="EURUSD"),
+    )
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock()
+    session.add = MagicMock()
+    return session
+
+
+@pytest.fixture
+def repo(mock_session):
+    # Long interval: tests flush explicitly
+    return WriteBehindOperationsRepository(
+        create_mock_session_factory(mock_session), flush_interval=60, max_batch=100
+    )
+
+
+@pytest.mark.asyncio
+class TestWriteBehindQueue:
+    async def test_create_and_updates_coalesce_into_one_insert(
+        self, repo, mock_session
+    ):
+        """Updates to a queued create are folded into the inserted row."""
+        await repo.create(make_operation("op_1"))
+        await repo.update("op_1", status="running", progress_percent=10.0)
+        await repo.update("op_1", progress_percent=50.0)
+
+        mock_session.execute.assert_not_called()
+        assert repo.queue_depth == 1
+
+        assert await repo.flush() == 1
+        mock_session.execute.assert_called_once()
+        rows = mock_session.execute.call_args[0][1]
+        assert rows[0]["status"] == "running"
+        assert rows[0]["progress_percent"] == 50.0
+        mock_session.commit.assert_called_once()
+        assert repo.stats()["updates_coalesced"] == 2
+        await repo.close()
+
+    async def test_updates_are_batched_by_column_set(self, repo, mock_session):
+        """Updates with the same columns share one executemany UPDATE."""
+        await repo.update("op_1", status="running")
+        await repo.update("op_2", status="running")
+        await repo.update("op_3", progress_percent=5.0, progress_message="x")
+
+        assert await repo.flush() == 3
+        assert mock_session.execute.call_count == 2
+        statements = [c[0][0] for c in mock_session.execute.call_args_list]
+        params = [c[0][1] for c in mock_session.execute.call_args_list]
+        assert sorted(len(p) for p in params) == [1, 2]
+        sql = str(statements[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE operations SET")
+        assert "WHERE operations.operation_id =" in sql
+        await repo.close()
+
+    async def test_terminal_update_is_written_synchronously(self, repo, mock_session):
+        """Terminal transitions flush the queue and update immediately."""
+        await repo.update("op_1", status="running")
+        record = OperationRecord(
+            operation_id="op_1",
+            operation_type="backtesting",
+            status="running",
+            created_at=datetime(2024, 12, 21, 10, 0, 0, tzinfo=timezone.utc),
+            progress_percent=0.0,
+            metadata_={},
+        )
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = record
+        mock_session.execute.return_value = result
+
+        await repo.update("op_1", status="completed")
+
+        assert repo.queue_depth == 0
+        # Queued UPDATE, then SELECT for the synchronous update
+        assert mock_session.execute.call_count == 2
+        assert record.status == "completed"
+        assert record.completed_at is not None
+
+    async def test_get_flushes_pending_writes_for_the_operation(
+        self, repo, mock_session
+    ):
+        """Reading an operation with queued writes flushes them first."""
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = result
+
+        await repo.get("op_unknown")
+        assert mock_session.commit.call_count == 0
+
+        await repo.create(make_operation("op_1"))
+        await repo.get("op_1")
+        assert mock_session.commit.call_count == 1
+        assert repo.queue_depth == 0
+        await repo.close()
+
+    async def test_max_batch_triggers_flush(self, mock_session):
+        """Reaching max_batch queued operations flushes immediately."""
+        repo = WriteBehindOperationsRepository(
+            create_mock_session_factory(mock_session), flush_interval=60, max_batch=3
+        )
+        for i in range(3):
+            await repo.update(f"op_{i}", status="running")
+
+        assert repo.queue_depth == 0
+        assert repo.stats()["rows_written"] == 3
+
+    async def test_background_flusher_writes_after_interval(self, mock_session):
+        """Queued writes are flushed by the background task."""
+        repo = WriteBehindOperationsRepository(
+            create_mock_session_factory(mock_session), flush_interval=0.01
+        )
+        await repo.update("op_1", status="running")
+        for _ in range(50):
+            if repo.queue_depth == 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert repo.queue_depth == 0
+        assert repo.stats()["flushes"] == 1
+        await repo.close()
+
+
+@pytest.mark.asyncio
+class TestWriteBehindFailures:
+    async def test_failed_flush_is_requeued_with_newer_values(self, repo, mock_session):
+        """A failed flush keeps its writes; newer queued values win."""
+        mock_session.commit.side_effect = RuntimeError("db down")
+        await repo.update("op_1", status="running", progress_percent=1.0)
+
+        assert await repo.flush() == 0
+        await repo.update("op_1", progress_percent=2.0)
+        assert repo.queue_depth == 1
+
+        mock_session.commit.side_effect = None
+        assert await repo.flush() == 1
+        rows = mock_session.execute.call_args[0][1]
+        assert rows == [
+            {
+                "b_operation_id": "op_1",
+                "b_status": "running",
+                "b_progress_percent": 2.0,
+            }
+        ]
+        await repo.close()
+
+    async def test_batch_dropped_after_repeated_failures(self, repo, mock_session):
+        """A batch that keeps failing is eventually dropped."""
+        mock_session.commit.side_effect = RuntimeError("db down")
+        await repo.update("op_1", status="running")
+
+        for _ in range(MAX_FLUSH_ATTEMPTS):
+            await repo.flush()
+
+        stats = repo.stats()
+        assert repo.queue_depth == 0
+        assert stats["flush_failures"] == MAX_FLUSH_ATTEMPTS
+        assert stats["rows_dropped"] == 1
+
+    async def test_bad_row_does_not_sink_the_batch(self, repo, mock_session):
+        """A failing batch is retried per operation; only the bad row fails."""
+
+        async def execute(statement, params=None):
+            ids = {row.get("operation_id", row.get("b_operation_id")) for row in params}
+            if "op_bad" in ids:
+                raise RuntimeError("duplicate key value violates unique constraint")
+
+        mock_session.execute.side_effect = execute
+        await repo.create(make_operation("op_1"))
+        await repo.create(make_operation("op_bad"))
+        await repo.update("op_2", status="running")
+
+        assert await repo.flush() == 2
+        assert repo.queue_depth == 1
+        assert repo._is_pending("op_bad")
+
+        for _ in range(MAX_FLUSH_ATTEMPTS - 1):
+            assert await repo.flush() == 0
+        assert repo.queue_depth == 0
+        assert repo.stats()["rows_dropped"] == 1
+        await repo.close()
+
+    async def test_terminal_write_is_never_dropped(self, repo, mock_session):
+        """A terminal transition that cannot be written raises and stays queued."""
+        mock_session.commit.side_effect = RuntimeError("db down")
+        await repo.update("op_1", status="running")
+        assert await repo.flush() == 0
+
+        with pytest.raises(RuntimeError):
+            await repo.update("op_1", status="failed", error_message="boom")
+
+        for _ in range(MAX_FLUSH_ATTEMPTS * 2):
+            await repo.flush()
+        assert repo._updates["op_1"]["status"] == "failed"
+        assert repo.stats()["rows_dropped"] == 0
+
+        mock_session.commit.side_effect = None
+        assert await repo.flush() == 1
+        rows = mock_session.execute.call_args[0][1]
+        assert rows[0]["b_status"] == "failed"
+        assert rows[0]["b_completed_at"] is not None
+        await repo.close()
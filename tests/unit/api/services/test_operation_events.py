@@ -0,0 +1,260 @@
+"""Unit tests for pushed operation events (event bus, service hooks, SSE stream)."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ktrdr.api.endpoints.operations import stream_operation_events
+from ktrdr.api.models.operations import (
+    OperationMetadata,
+    OperationProgress,
+    OperationPushUpdate,
+    OperationStatus,
+    OperationType,
+)
+from ktrdr.api.services.operation_events import (
+    EVENT_METRICS,
+    EVENT_PROGRESS,
+    EVENT_TERMINAL,
+    OperationEventBus,
+)
+from ktrdr.api.services.operations_service import OperationsService
+
+
+@pytest.fixture(autouse=True)
+def _no_duration_metrics(monkeypatch):
+    """Keep completed operations out of the global Prometheus histogram."""
+    monkeypatch.setattr(
+        "ktrdr.api.services.operations_service.record_operation_duration",
+        lambda *args, **kwargs: None,
+    )
+
+
+async def _create(service: OperationsService, operation_id: str) -> None:
+    await service.create_operation(
+        operation_type=OperationType.TRAINING,
+        metadata=OperationMetadata(),
+        operation_id=operation_id,
+    )
+    await service.start_operation(operation_id)
+
+
+def _drain(subscription) -> list:
+    events = []
+    while not subscription._queue.empty():
+        events.append(subscription._queue.get_nowait())
+    return events
+
+
+class TestOperationEventBus:
+    @pytest.mark.asyncio
+    async def test_filters_by_operation(self):
+        bus = OperationEventBus()
+        watched = bus.subscribe(["op_a"])
+        everything = bus.subscribe()
+
+        bus.publish("op_a", EVENT_PROGRESS, {})
+        bus.publish("op_b", EVENT_PROGRESS, {})
+
+        assert [e.operation_id for e in _drain(watched)] == ["op_a"]
+        assert [e.operation_id for e in _drain(everything)] == ["op_a", "op_b"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_sheds_progress_not_metrics_or_terminal(self):
+        bus = OperationEventBus()
+        subscription = bus.subscribe(max_queue=3)
+
+        bus.publish("op", EVENT_PROGRESS, {"n": 1})
+        bus.publish("op", EVENT_METRICS, {"metrics": [1]})
+        bus.publish("op", EVENT_PROGRESS, {"n": 2})
+        bus.publish("op", EVENT_TERMINAL, {})
+
+        assert [e.event_type for e in _drain(subscription)] == [
+            EVENT_METRICS,
+            EVENT_TERMINAL,
+        ]
+        assert subscription.dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_context_manager_unsubscribes(self):
+        bus = OperationEventBus()
+        async with bus.subscribe():
+            assert bus.subscriber_count == 1
+        assert bus.subscriber_count == 0
+
+    def test_sse_format(self):
+        bus = OperationEventBus()
+        subscription = bus.subscribe()
+        bus.publish("op", EVENT_PROGRESS, {"status": "running"})
+        message = _drain(subscription)[0].to_sse()
+
+        assert message.startswith("id: 1\nevent: progress\ndata: ")
+        assert message.endswith("\n\n")
+        payload = json.loads(message.split("data: ", 1)[1])
+        assert payload == {"operation_id": "op", "status": "running"}
+
+
+class TestOperationsServicePublishing:
+    @pytest.mark.asyncio
+    async def test_lifecycle_events(self):
+        service = OperationsService()
+        subscription = service.subscribe()
+        await _create(service, "op_1")
+
+        await service.update_progress("op_1", OperationProgress(percentage=40.0))
+        await service.add_operation_metrics("op_1", {"epoch": 0, "val_loss": 0.5})
+        await service.complete_operation("op_1", {"accuracy": 0.9})
+
+        events = _drain(subscription)
+        assert [e.event_type for e in events] == [
+            EVENT_PROGRESS,  # started
+            EVENT_PROGRESS,
+            EVENT_METRICS,
+            EVENT_TERMINAL,
+        ]
+        assert events[1].data["progress"]["percentage"] == 40.0
+        assert events[2].data["metrics"] == [{"epoch": 0, "val_loss": 0.5}]
+        assert events[3].data["result_summary"] == {"accuracy": 0.9}
+
+    @pytest.mark.asyncio
+    async def test_bridge_refresh_publishes_progress_and_metrics(self):
+        service = OperationsService()
+        await _create(service, "op_1")
+        bridge = MagicMock()
+        bridge.get_status.return_value = {"percentage": 20.0, "message": "Epoch 2"}
+        bridge.get_metrics.return_value = ([{"epoch": 1}], 1)
+        service.register_local_bridge("op_1", bridge)
+        subscription = service.subscribe(["op_1"])
+
+        service.refresh_local_operations()
+
+        events = _drain(subscription)
+        assert [e.event_type for e in events] == [EVENT_PROGRESS, EVENT_METRICS]
+        assert events[1].data == {"metrics": [{"epoch": 1}], "cursor": 1}
+
+
+class TestApplyPushedUpdate:
+    @pytest.mark.asyncio
+    async def test_push_by_host_id_updates_and_skips_next_pull(self):
+        service = OperationsService()
+        await _create(service, "op_backend")
+        proxy = MagicMock()
+        proxy.get_operation = AsyncMock()
+        service.register_remote_proxy("op_backend", proxy, "op_worker")
+
+        applied = await service.apply_pushed_update(
+            "op_worker",
+            OperationPushUpdate(
+                progress=OperationProgress(percentage=55.0),
+                metrics=[{"epoch": 4}],
+                metrics_cursor=5,
+            ),
+        )
+
+        assert applied
+        operation = await service.get_operation("op_backend")
+        assert operation.progress.percentage == 55.0
+        assert operation.metrics["epochs"] == [{"epoch": 4}]
+        assert service._metrics_cursors["op_backend"] == 5
+        proxy.get_operation.assert_not_awaited()  # Fresh push, no pull
+
+    @pytest.mark.asyncio
+    async def test_unknown_operation(self):
+        service = OperationsService()
+        assert not await service.apply_pushed_update(
+            "missing", OperationPushUpdate(status=OperationStatus.RUNNING)
+        )
+
+    @pytest.mark.asyncio
+    async def test_late_push_does_not_reopen_cancelled_operation(self):
+        service = OperationsService()
+        await _create(service, "op_1")
+        await service.cancel_operation("op_1")
+
+        await service.apply_pushed_update(
+            "op_1", OperationPushUpdate(status=OperationStatus.RUNNING)
+        )
+
+        assert service._cache["op_1"].status == OperationStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_terminal_push_fills_completed_at(self):
+        service = OperationsService()
+        await _create(service, "op_1")
+        await service.apply_pushed_update(
+            "op_1",
+            OperationPushUpdate(
+                status=OperationStatus.COMPLETED, result_summary={"ok": True}
+            ),
+        )
+        operation = service._cache["op_1"]
+        assert operation.result_summary == {"ok": True}
+        assert operation.completed_at <= datetime.now(timezone.utc)
+
+
+def _request() -> MagicMock:
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+    return request
+
+
+def _parse(messages: list[str]) -> list[tuple[str, dict]]:
+    events = []
+    for message in messages:
+        if message.startswith(":"):
+            continue
+        lines = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestStreamEndpoint:
+    @pytest.mark.asyncio
+    async def test_streams_multiple_operations_until_terminal(self):
+        service = OperationsService()
+        await _create(service, "op_a")
+        await _create(service, "op_b")
+
+        response = await stream_operation_events(
+            _request(), ["op_a", "op_b"], 15.0, service
+        )
+
+        async def drive():
+            await asyncio.sleep(0.01)
+            await service.apply_pushed_update(
+                "op_a", OperationPushUpdate(progress=OperationProgress(percentage=50))
+            )
+            await service.complete_operation("op_a", {"ok": True})
+            await service.fail_operation("op_b", "boom")
+
+        driver = asyncio.create_task(drive())
+        messages = [m async for m in response.body_iterator]
+        await driver
+
+        events = _parse(messages)
+        assert [(e, d["operation_id"]) for e, d in events] == [
+            ("snapshot", "op_a"),
+            ("snapshot", "op_b"),
+            ("progress", "op_a"),
+            ("terminal", "op_a"),
+            ("terminal", "op_b"),
+        ]
+        assert events[-1][1]["error_message"] == "boom"
+        assert service._events.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_terminal_and_missing_operations_end_immediately(self):
+        service = OperationsService()
+        await _create(service, "op_done")
+        await service.complete_operation("op_done", {"ok": True})
+
+        response = await stream_operation_events(
+            _request(), ["op_done", "op_missing"], 15.0, service
+        )
+        events = _parse([m async for m in response.body_iterator])
+
+        assert [e for e, _ in events] == ["snapshot", "error"]
+        assert events[0][1]["result_summary"] == {"ok": True}
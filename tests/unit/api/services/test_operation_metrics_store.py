@@ -0,0 +1,172 @@
+"""Unit tests for the bounded per-operation metrics store."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ktrdr.api.models.operations import OperationMetadata, OperationType
+from ktrdr.api.services.operation_metrics import (
+    MetricsSeries,
+    OperationMetricsStore,
+    lttb,
+)
+from ktrdr.api.services.operations_service import OperationsService
+
+
+class TestLttb:
+    def test_keeps_all_points_under_threshold(self):
+        assert lttb([1.0, 2.0, 3.0], 5) == [0, 1, 2]
+
+    def test_keeps_endpoints_and_extremes(self):
+        values = [0.0] * 100
+        values[37] = 50.0
+        selected = lttb(values, 10)
+
+        assert len(selected) == 10
+        assert selected[0] == 0 and selected[-1] == 99
+        assert 37 in selected
+        assert selected == sorted(selected)
+
+
+class TestMetricsSeries:
+    def test_ring_buffer_is_bounded(self):
+        series = MetricsSeries("epochs", max_entries=100, downsampled_entries=50)
+        shared = series.recent
+        series.append({"epoch": i, "val_loss": float(i)} for i in range(1000))
+
+        assert len(series) == 1000
+        assert len(series.recent) == 100
+        assert series.recent is shared  # trimmed in place
+        assert series.first_seq == 900
+        assert series.recent[0]["epoch"] == 900
+        stats = series.stats()
+        # Two tiers of 50, plus blocks still waiting to be downsampled
+        assert 0 < stats["downsampled"] < 100 + 2 * 80
+        assert (
+            stats["full_resolution"] + stats["downsampled"] + stats["dropped"] <= 1000
+        )
+
+    def test_cursor_reads(self):
+        series = MetricsSeries("bars", max_entries=10, downsampled_entries=0)
+        series.append({"bar": i} for i in range(25))
+
+        entries, cursor, missed = series.read(20)
+        assert [e["bar"] for e in entries] == [20, 21, 22, 23, 24]
+        assert cursor == 25 and missed == 0
+
+        entries, cursor, missed = series.read(5, limit=3)
+        assert [e["bar"] for e in entries] == [15, 16, 17]
+        assert cursor == 18 and missed == 10
+
+        assert series.read(25) == ([], 25, 0)
+
+    def test_history_is_ordered_and_downsampled(self):
+        series = MetricsSeries("epochs", max_entries=50, downsampled_entries=100)
+        series.append({"val_loss": float(i % 7)} for i in range(500))
+
+        history = series.history()
+        seqs = [entry["seq"] for entry in history]
+        assert seqs == sorted(seqs)
+        assert seqs[-1] == 499
+        assert len(series.history(max_points=20)) == 20
+
+    def test_unpersisted_tracking(self):
+        series = MetricsSeries("epochs", max_entries=5, track_unpersisted=True)
+        series.append({"epoch": i} for i in range(3))
+
+        batch = series.take_unpersisted()
+        assert [seq for seq, _ in batch] == [0, 1, 2]
+        assert series.unpersisted_count == 0
+
+        series.requeue(batch)
+        assert series.unpersisted_count == 3
+
+
+class TestOperationMetricsStore:
+    def test_batches_are_due_at_threshold(self):
+        store = OperationMetricsStore(max_entries=100, persist_batch=4, persistent=True)
+        store.append("op", "epochs", [{"epoch": 0}, {"epoch": 1}])
+        store.append("op", "history", [{"x": 1}])
+        assert not store.batch_due("op")
+
+        store.append("op", "epochs", [{"epoch": 2}])
+        assert store.batch_due("op")
+        batch = store.take_batch("op")
+        assert sorted((name, seq) for name, seq, _ in batch) == [
+            ("epochs", 0),
+            ("epochs", 1),
+            ("epochs", 2),
+            ("history", 0),
+        ]
+        assert not store.batch_due("op")
+
+    def test_not_persistent_tracks_nothing(self):
+        store = OperationMetricsStore(persist_batch=1)
+        store.append("op", "bars", [{"bar": 0}])
+        assert store.take_batch("op") == []
+
+
+@pytest.mark.asyncio
+class TestOperationsServiceMetricsStore:
+    async def test_backtest_metrics_are_bounded_and_persisted_in_batches(self):
+        repository = AsyncMock()
+        repository.get.return_value = None
+        repository.create.side_effect = lambda op: op
+        repository.add_metrics.return_value = 0
+        service = OperationsService(repository=repository)
+        service._metrics_store.max_entries = 50
+        service._metrics_store.persist_batch = 20
+
+        operation = await service.create_operation(
+            operation_type=OperationType.BACKTESTING,
+            metadata=OperationMetadata(),
+        )
+        op_id = operation.operation_id
+        for i in range(60):
+            service._append_metrics(operation, [{"bar": i, "equity": 100.0 + i}])
+        await service._persist_metrics(op_id)
+
+        assert len(operation.metrics["bars"]) == 50
+        assert operation.metrics["bars"][-1]["bar"] == 59
+        persisted = repository.add_metrics.await_args.args[1]
+        assert len(persisted) == 60
+
+        entries, cursor = await service.get_operation_metrics(op_id, cursor=55)
+        assert [e["bar"] for e in entries] == [55, 56, 57, 58, 59]
+        assert cursor == 60
+
+    async def test_failed_persist_is_requeued(self):
+        repository = AsyncMock()
+        repository.get.return_value = None
+        repository.create.side_effect = lambda op: op
+        repository.add_metrics.side_effect = RuntimeError("db down")
+        service = OperationsService(repository=repository)
+
+        operation = await service.create_operation(
+            operation_type=OperationType.TRAINING, metadata=OperationMetadata()
+        )
+        service._append_metrics(operation, [{"epoch": 0}])
+        await service._persist_metrics(operation.operation_id, force=True)
+
+        series = service._metrics_store.get(operation.operation_id, "epochs")
+        assert series.unpersisted_count == 1
+
+    async def test_best_epoch_survives_eviction(self):
+        service = OperationsService()
+        service._metrics_store.max_entries = 5
+        operation = await service.create_operation(
+            operation_type=OperationType.TRAINING, metadata=OperationMetadata()
+        )
+        losses = [0.9, 0.1, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95]
+        for i, loss in enumerate(losses):
+            await service.add_operation_metrics(
+                operation.operation_id,
+                {"epoch": i, "train_loss": loss, "val_loss": loss},
+            )
+
+        metrics = operation.metrics
+        assert len(metrics["epochs"]) == 5
+        assert metrics["total_epochs_completed"] == 8
+        assert metrics["best_epoch"] == 1
+        assert metrics["best_val_loss"] == 0.1
+        assert metrics["epochs_since_improvement"] == 6
@@ -0,0 +1,160 @@
+"""Unit tests for OperationsService read-path concurrency.
+
+Remote refreshes run outside the service lock and are coalesced, so one slow
+worker can't stall queries for other operations and concurrent pollers of the
+same operation share a single worker fetch.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ktrdr.api.models.operations import (
+    OperationInfo,
+    OperationMetadata,
+    OperationStatus,
+    OperationType,
+)
+from ktrdr.api.services.operations_service import OperationsService
+
+
+def _operation(operation_id: str, status=OperationStatus.RUNNING) -> OperationInfo:
+    return OperationInfo(
+        operation_id=operation_id,
+        operation_type=OperationType.TRAINING,
+        status=status,
+        created_at=datetime.now(timezone.utc),
+        metadata=OperationMetadata(),
+    )
+
+
+def _slow_proxy(delay: float, release: asyncio.Event | None = None) -> MagicMock:
+    """Proxy whose get_operation waits for ``delay`` (or ``release``)."""
+
+    async def get_operation(host_operation_id):
+        if release is not None:
+            await release.wait()
+        else:
+            await asyncio.sleep(delay)
+        return {"status": "running", "progress": {"percentage": 50.0}}
+
+    proxy = MagicMock()
+    proxy.get_operation = AsyncMock(side_effect=get_operation)
+    proxy.get_metrics = AsyncMock(return_value=([{"epoch": 1}], 1))
+    return proxy
+
+
+@pytest.fixture
+def service():
+    svc = OperationsService()
+    svc._cache_ttl = 0.0  # Every poll refreshes unless coalesced
+    return svc
+
+
+class TestRemoteRefreshCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_pollers_share_one_fetch(self, service):
+        service._cache["op_1"] = _operation("op_1")
+        proxy = _slow_proxy(0.05)
+        service.register_remote_proxy("op_1", proxy, "host_op_1")
+
+        results = await asyncio.gather(
+            *(service.get_operation("op_1") for _ in range(10))
+        )
+
+        assert all(r is results[0] for r in results)
+        assert proxy.get_operation.await_count == 1
+        # Metrics delta appended once, not once per poller
+        assert results[0].metrics["epochs"] == [{"epoch": 1}]
+        assert service._inflight_refreshes == {}
+
+    @pytest.mark.asyncio
+    async def test_missing_operation_fetch_is_coalesced(self, service):
+        proxy = _slow_proxy(0.05)
+        service.register_remote_proxy("op_remote", proxy, "host_op")
+
+        results = await asyncio.gather(
+            *(service.get_operation("op_remote") for _ in range(5))
+        )
+
+        assert all(r is results[0] for r in results)
+        assert service._cache["op_remote"] is results[0]
+        # One fetch to materialize the operation, one shared refresh after it
+        assert proxy.get_operation.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_poller_does_not_cancel_shared_fetch(self, service):
+        service._cache["op_1"] = _operation("op_1")
+        release = asyncio.Event()
+        proxy = _slow_proxy(0, release)
+        service.register_remote_proxy("op_1", proxy, "host_op_1")
+
+        first = asyncio.create_task(service.get_operation("op_1"))
+        second = asyncio.create_task(service.get_operation("op_1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert (await second).progress.percentage == 50.0
+        assert proxy.get_operation.await_count == 1
+
+
+class TestSlowWorkerIsolation:
+    @pytest.mark.asyncio
+    async def test_slow_worker_does_not_block_other_reads(self, service):
+        service._cache["op_slow"] = _operation("op_slow")
+        service._cache["op_local"] = _operation("op_local")
+        release = asyncio.Event()
+        service.register_remote_proxy("op_slow", _slow_proxy(0, release), "host")
+
+        slow = asyncio.create_task(service.get_operation("op_slow"))
+        await asyncio.sleep(0)
+
+        local = await asyncio.wait_for(service.get_operation("op_local"), 0.5)
+        listed, total, _ = await asyncio.wait_for(service.list_operations(), 0.5)
+        assert local.operation_id == "op_local"
+        assert total == 2
+        assert not slow.done()
+
+        release.set()
+        await slow
+
+    @pytest.mark.asyncio
+    async def test_reads_proceed_while_lock_is_held(self, service):
+        service._cache["op_1"] = _operation("op_1")
+        async with service._lock:
+            op = await asyncio.wait_for(service.get_operation("op_1"), 0.5)
+            ops, _, _ = await asyncio.wait_for(service.list_operations(), 0.5)
+        assert op is ops[0]
+
+    @pytest.mark.asyncio
+    async def test_local_transition_during_fetch_is_not_clobbered(self, service):
+        service._cache["op_1"] = _operation("op_1")
+        release = asyncio.Event()
+        proxy = _slow_proxy(0, release)
+        service.register_remote_proxy("op_1", proxy, "host")
+
+        poll = asyncio.create_task(service.get_operation("op_1"))
+        while proxy.get_operation.await_count == 0:
+            await asyncio.sleep(0)  # Wait until the fetch is in flight
+        service._cache["op_1"].status = OperationStatus.CANCELLED
+        release.set()
+
+        assert (await poll).status == OperationStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_repository_read_keeps_concurrently_cached_entry(self):
+        repository = AsyncMock()
+        service = OperationsService(repository=repository)
+        cached = _operation("op_1", OperationStatus.COMPLETED)
+
+        async def get(operation_id):
+            # Another coroutine populates the cache while we await the DB
+            service._cache[operation_id] = cached
+            return _operation(operation_id, OperationStatus.COMPLETED)
+
+        repository.get = AsyncMock(side_effect=get)
+
+        assert await service.get_operation("op_1") is cached
@@ -6,7 +6,7 @@ and their phase operations (design, training, backtest).
 """
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -214,6 +214,46 @@ class TestGetChildrenOperations:
         assert children[1].operation_id == child2.operation_id
         assert children[2].operation_id == child3.operation_id
 
+    @pytest.mark.asyncio
+    async def test_get_children_includes_children_evicted_from_cache(
+        self, agent_research_metadata, agent_design_metadata
+    ):
+        """Finished children that left the cache come from the repository."""
+        repository = AsyncMock()
+        repository.get.return_value = None
+        repository.create.side_effect = lambda op: op
+        service = OperationsService(repository=repository)
+
+        parent = await service.create_operation(
+            operation_type=OperationType.AGENT_RESEARCH,
+            metadata=agent_research_metadata,
+        )
+        live = await service.create_operation(
+            operation_type=OperationType.AGENT_DESIGN,
+            metadata=agent_design_metadata,
+            parent_operation_id=parent.operation_id,
+        )
+        finished = OperationInfo(
+            operation_id="op_finished_child",
+            operation_type=OperationType.AGENT_DESIGN,
+            status=OperationStatus.COMPLETED,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            metadata=agent_design_metadata,
+            parent_operation_id=parent.operation_id,
+        )
+        repository.list.return_value = [live.model_copy(), finished]
+
+        children = await service.get_children(parent.operation_id)
+
+        repository.list.assert_awaited_once_with(
+            parent_operation_id=parent.operation_id
+        )
+        assert [c.operation_id for c in children] == [
+            "op_finished_child",
+            live.operation_id,
+        ]
+        assert children[1] is live
+
 
 class TestCancellationCascade:
     """Test that cancelling parent cascades to children."""
@@ -424,6 +424,31 @@ class TestOperationsServiceBackwardCompatibility:
         updated = await service.get_operation(operation.operation_id)
         assert updated.status == OperationStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_try_resume_without_repository_indexes_and_publishes(
+        self, sample_metadata
+    ):
+        """A resumed operation should be listed as active and streamed."""
+        service = OperationsService()  # No repository
+        operation = await service.create_operation(
+            operation_type=OperationType.TRAINING,
+            metadata=sample_metadata,
+        )
+        operation.status = OperationStatus.FAILED
+        await service.list_operations(active_only=True)  # Prunes the active index
+        assert operation.operation_id not in service._active_ids
+
+        async with service.subscribe([operation.operation_id]) as subscription:
+            assert await service.try_resume(operation.operation_id)
+            event = await subscription.get(timeout=1)
+
+        resuming, _, _ = await service.list_operations(
+            status=OperationStatus.RESUMING
+        )
+        assert [op.operation_id for op in resuming] == [operation.operation_id]
+        assert event is not None
+        assert event.data["status"] == OperationStatus.RESUMING.value
+
 
 class TestOperationsServiceListWithRepository:
     """Test list_operations with repository."""
@@ -432,7 +457,7 @@ class TestOperationsServiceListWithRepository:
     async def test_list_operations_returns_cached_operations(
         self, mock_repository, sample_metadata
     ):
-        """list_operations should return operations from cache."""
+        """list_operations should return cached instances of listed operations."""
         service = OperationsService(repository=mock_repository)
 
         # Add operations to cache
@@ -445,15 +470,84 @@ class TestOperationsServiceListWithRepository:
             progress=OperationProgress(percentage=0.0),
         )
         service._cache["op_cache_only"] = cached_operation
+        mock_repository.list.return_value = [cached_operation.model_copy()]
+        mock_repository.count.return_value = 1
 
-        # List should return cached operations
+        # History listing is pushed down to the repository
         operations, total, active = await service.list_operations()
 
-        # Verify cached operation is returned
+        # Verify the cached (live) instance is returned
         assert len(operations) == 1
-        assert operations[0].operation_id == "op_cache_only"
+        assert operations[0] is cached_operation
         assert total == 1
 
+    @pytest.mark.asyncio
+    async def test_list_operations_pushes_filters_and_cursor_down(
+        self, mock_repository, sample_metadata
+    ):
+        """History listings should use the repository's keyset query."""
+        service = OperationsService(repository=mock_repository)
+        mock_repository.count.return_value = 0
+        created_at = datetime(2024, 12, 21, 10, 0, 0, tzinfo=timezone.utc)
+        last = OperationInfo(
+            operation_id="op_last",
+            operation_type=OperationType.TRAINING,
+            status=OperationStatus.COMPLETED,
+            created_at=created_at,
+            metadata=sample_metadata,
+        )
+
+        await service.list_operations(
+            status=OperationStatus.COMPLETED,
+            limit=20,
+            offset=40,
+            cursor=service.list_cursor(last),
+        )
+
+        mock_repository.list.assert_awaited_once_with(
+            status="completed",
+            operation_type=None,
+            limit=20,
+            offset=0,
+            after=(created_at, "op_last"),
+        )
+        mock_repository.count.assert_awaited_once_with(
+            status="completed", operation_type=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_active_listing_is_served_from_the_active_index(
+        self, mock_repository, sample_metadata
+    ):
+        """active_only listings should not query the repository."""
+        mock_repository.get.return_value = None
+        mock_repository.create.side_effect = lambda op: op
+        service = OperationsService(repository=mock_repository)
+
+        running = await service.create_operation(
+            operation_type=OperationType.TRAINING, metadata=sample_metadata
+        )
+        await service.start_operation(running.operation_id, MagicMock())
+        done = await service.create_operation(
+            operation_type=OperationType.TRAINING, metadata=sample_metadata
+        )
+        await service.complete_operation(done.operation_id, {})
+
+        operations, total, active = await service.list_operations(active_only=True)
+
+        assert [op.operation_id for op in operations] == [running.operation_id]
+        assert active == 1
+        assert list(service._active_ids) == [running.operation_id]
+        mock_repository.list.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self, mock_repository):
+        """Malformed cursors should be rejected."""
+        service = OperationsService(repository=mock_repository)
+
+        with pytest.raises(ValueError):
+            await service.list_operations(cursor="not-a-cursor")
+
 
 class TestOperationsServiceCacheNaming:
     """Test that internal storage uses _cache naming (not _operations)."""
@@ -0,0 +1,182 @@
+"""Unit tests for the API response caches and their service integration."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ktrdr.api.models.indicators import IndicatorCalculateRequest, IndicatorConfig
+from ktrdr.api.services import indicator_service as indicator_module
+from ktrdr.api.services.indicator_service import IndicatorService
+from ktrdr.api.services.result_cache import (
+    ResultCache,
+    frame_fingerprint,
+    values_converged,
+)
+from ktrdr.async_infrastructure.compute_executor import ComputeExecutor
+from ktrdr.data.repository import DataRepository
+from ktrdr.indicators import ensure_all_registered
+
+
+class TestResultCache:
+    def test_hits_misses_and_hit_rate(self):
+        cache = ResultCache(max_bytes=100)
+        assert cache.get("a") is None
+        cache.put("a", "series", [1], size=10)
+
+        assert cache.get("a") == [1]
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_evicts_least_recently_used_to_fit_budget(self):
+        cache = ResultCache(max_bytes=100)
+        cache.put("a", "sa", "A", size=40)
+        cache.put("b", "sb", "B", size=40)
+        cache.get("a")
+        cache.put("c", "sc", "C", size=40)
+
+        assert cache.get("b") is None
+        assert cache.get_latest("sb") is None
+        assert cache.get("a") == "A"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 80
+
+    def test_latest_tracks_series(self):
+        cache = ResultCache()
+        cache.put(("s", 1), "s", "first", size=1)
+        cache.put(("s", 2), "s", "second", size=1)
+        assert cache.get_latest("s") == "second"
+
+    def test_zero_budget_disables_caching(self):
+        cache = ResultCache(max_bytes=0)
+        cache.put("a", "s", "A", size=1)
+        assert cache.get("a") is None
+
+    def test_latest_requires_unchanged_input_rows(self):
+        data = _ohlcv(50)
+        cache = ResultCache()
+        cache.put("k", "s", "value", size=1, fingerprint=frame_fingerprint(data[:30]))
+
+        # Appended bars and a later start still match the cached rows
+        assert cache.get_latest("s", frame_fingerprint(data)) == "value"
+        assert cache.get_latest("s", frame_fingerprint(data[10:])) == "value"
+
+        edited = data.copy()
+        edited.iloc[15, edited.columns.get_loc("close")] += 1
+        inserted = pd.concat([data, data.iloc[[5]].set_axis([data.index[5]])])
+        for changed in (edited, inserted.sort_index(), data.drop(data.index[20])):
+            assert cache.get_latest("s", frame_fingerprint(changed)) is None
+
+        # Entries stored without a fingerprint are never offered for extension
+        cache.put("k2", "s2", "value", size=1)
+        assert cache.get_latest("s2", frame_fingerprint(data)) is None
+        assert cache.get_latest("s2") == "value"
+
+    def test_values_converged(self):
+        assert values_converged([1.0, None], [1.0 + 1e-12, float("nan")])
+        assert not values_converged([1.0, 2.0], [1.0, 2.1])
+        assert not values_converged([1.0], [1.0, 2.0])
+
+
+def _ohlcv(bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    index = pd.date_range("2024-01-01", periods=bars, freq="1h", tz="UTC")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.integers(100, 1000, bars).astype(float),
+        },
+        index=index,
+    )
+
+
+def _request(end: str, indicator: str = "ema") -> IndicatorCalculateRequest:
+    return IndicatorCalculateRequest(
+        symbol="TEST",
+        timeframe="1h",
+        indicators=[IndicatorConfig(id=indicator, parameters={"period": 10})],
+        start_date="2024-01-01T00:00:00+00:00",
+        end_date=end,
+    )
+
+
+class TestIndicatorServiceCaching:
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        ensure_all_registered()
+        cache = ResultCache()
+        executor = ComputeExecutor(processes=0, threads=2)
+        monkeypatch.setattr(indicator_module, "get_result_cache", lambda name: cache)
+        monkeypatch.setattr(indicator_module, "get_compute_executor", lambda: executor)
+        repository = DataRepository(data_dir=str(tmp_path))
+        repository.save_to_cache("TEST", "1h", _ohlcv(600))
+        service = IndicatorService()
+        service.repository = repository
+        service.cache = cache
+        yield service
+        executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_is_served_from_cache(self, service):
+        request = _request("2024-01-10T00:00:00+00:00")
+        first = await service.calculate_indicators(request)
+        second = await service.calculate_indicators(request)
+
+        assert first == second
+        assert service.cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rewritten_data_file_misses(self, service):
+        request = _request("2024-01-10T00:00:00+00:00")
+        await service.calculate_indicators(request)
+        service.repository.save_to_cache("TEST", "1h", _ohlcv(601))
+        await service.calculate_indicators(request)
+
+        assert service.cache.stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_moving_end_extends_cached_series(self, service):
+        await service.calculate_indicators(_request("2024-01-10T00:00:00+00:00"))
+        dates, values, metadata = await service.calculate_indicators(
+            _request("2024-01-20T00:00:00+00:00")
+        )
+
+        assert service.cache.stats()["extended"] == 1
+        service.cache.clear()
+        full_dates, full_values, _ = await service.calculate_indicators(
+            _request("2024-01-20T00:00:00+00:00")
+        )
+        assert dates == full_dates
+        np.testing.assert_allclose(values["ema_10"], full_values["ema_10"], rtol=1e-6)
+        assert metadata["end_date"] == "2024-01-20 00:00:00"
+
+    @pytest.mark.asyncio
+    async def test_edited_mid_range_bar_recomputes(self, service):
+        await service.calculate_indicators(_request("2024-01-10T00:00:00+00:00"))
+        corrected = _ohlcv(600)
+        corrected.iloc[50, corrected.columns.get_loc("close")] += 5
+        service.repository.save_to_cache("TEST", "1h", corrected)
+
+        request = _request("2024-01-20T00:00:00+00:00")
+        _, values, _ = await service.calculate_indicators(request)
+
+        assert service.cache.stats()["extended"] == 0
+        service.cache.clear()
+        _, full_values, _ = await service.calculate_indicators(request)
+        np.testing.assert_allclose(values["ema_10"], full_values["ema_10"], rtol=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_cumulative_indicator_falls_back_to_full_compute(self, service):
+        request = _request("2024-01-10T00:00:00+00:00", indicator="obv")
+        request.indicators[0].parameters = {}
+        await service.calculate_indicators(request)
+        request.end_date = datetime(2024, 1, 20).isoformat() + "+00:00"
+
+        await service.calculate_indicators(request)
+
+        assert service.cache.stats()["extended"] == 0
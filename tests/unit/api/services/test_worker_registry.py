@@ -1199,3 +1199,305 @@ class TestShutdownMode:
         registry.begin_shutdown()
 
         assert registry.is_shutting_down() is True
+
+
+async def _register_workers(registry: WorkerRegistry, count: int) -> None:
+    for i in range(count):
+        await registry.register_worker(
+            worker_id=f"worker-{i}",
+            worker_type=WorkerType.BACKTESTING,
+            endpoint_url=f"http://worker-{i}:5003",
+        )
+
+
+class TestConcurrentHealthChecks:
+    """Tests for concurrent, adaptively scheduled health probes."""
+
+    @pytest.mark.asyncio
+    async def test_hung_worker_does_not_block_other_probes(self):
+        """A worker that never answers only delays its own probes."""
+        registry = WorkerRegistry()
+        registry._health_check_interval = 0.05
+        await _register_workers(registry, 2)
+        calls = []
+
+        async def mock_health_check(worker_id):
+            calls.append(worker_id)
+            if worker_id == "worker-0":
+                await asyncio.sleep(10)
+            return True
+
+        with patch.object(
+            registry, "health_check_worker", side_effect=mock_health_check
+        ):
+            await registry.start()
+            await asyncio.sleep(0.3)
+            await registry.stop()
+
+        assert calls.count("worker-0") == 1
+        assert calls.count("worker-1") >= 2
+        assert registry._probe_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_probe_concurrency_is_bounded(self):
+        """No more than health_check_concurrency probes run at once."""
+        registry = WorkerRegistry()
+        registry._health_check_concurrency = 2
+        await _register_workers(registry, 5)
+        running = 0
+        peak = 0
+
+        async def mock_health_check(worker_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        with patch.object(
+            registry, "health_check_worker", side_effect=mock_health_check
+        ):
+            registry._start_due_probes()
+            await asyncio.gather(*registry._probe_tasks.values())
+
+        assert peak == 2
+        assert set(registry._next_probe_at) == {f"worker-{i}" for i in range(5)}
+
+    @pytest.mark.asyncio
+    async def test_fresh_heartbeat_skips_probe(self):
+        """Workers with a fresh heartbeat are not probed."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 2)
+        registry.get_worker("worker-0").health_check_failures = 2
+
+        assert registry.record_heartbeat("worker-0", "busy", "op-1")
+        assert not registry.record_heartbeat("unknown")
+
+        worker = registry.get_worker("worker-0")
+        assert worker.status == WorkerStatus.BUSY
+        assert worker.current_operation_id == "op-1"
+        assert worker.health_check_failures == 0
+
+        with patch.object(registry, "health_check_worker", new=AsyncMock()):
+            registry._start_due_probes()
+            assert set(registry._probe_tasks) == {"worker-1"}
+            await asyncio.gather(*registry._probe_tasks.values())
+
+    @pytest.mark.asyncio
+    async def test_probe_interval_grows_for_stable_and_busy_workers(self):
+        """Stable workers back off up to 2x, busy ones a further 1.5x."""
+        registry = WorkerRegistry()
+        registry._health_check_interval = 10
+        await _register_workers(registry, 1)
+        worker = registry.get_worker("worker-0")
+
+        assert 9.0 <= registry._probe_interval(worker, 0) <= 11.0
+        assert 18.0 <= registry._probe_interval(worker, 10) <= 22.0
+        worker.status = WorkerStatus.BUSY
+        assert 27.0 <= registry._probe_interval(worker, 10) <= 33.0
+
+    @pytest.mark.asyncio
+    async def test_health_check_uses_shared_client_and_records_latency(self):
+        """Probes reuse the registry's client and record their latency."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 1)
+        response = AsyncMock()
+        response.status_code = 200
+        response.json = lambda: {"worker_status": "idle"}
+        client = AsyncMock()
+        client.get = AsyncMock(return_value=response)
+        registry._http_client = client
+
+        assert await registry.health_check_worker("worker-0")
+        assert await registry.health_check_worker("worker-0")
+
+        assert client.get.await_count == 2
+        client.get.assert_awaited_with("http://worker-0:5003/health")
+        assert registry.get_worker("worker-0").metadata["probe_latency_ms"] >= 0
+
+        await registry.stop()
+        client.aclose.assert_awaited_once()
+        assert registry._http_client is None
+
+
+class TestCapacityScheduling:
+    """Tests for slot-aware, locality-aware selection and the dispatch queue."""
+
+    @pytest.mark.asyncio
+    async def test_multi_slot_worker_stays_available_until_full(self):
+        """A worker is selectable until all its declared slots are taken."""
+        registry = WorkerRegistry()
+        await registry.register_worker(
+            worker_id="worker-1",
+            worker_type=WorkerType.BACKTESTING,
+            endpoint_url="http://worker-1:5003",
+            capabilities={"slots": 2},
+        )
+        worker = registry.get_worker("worker-1")
+
+        registry.mark_busy("worker-1", "op-1")
+        assert worker.status == WorkerStatus.AVAILABLE
+        assert registry.select_worker(WorkerType.BACKTESTING) is worker
+
+        registry.mark_busy("worker-1", "op-2")
+        assert worker.status == WorkerStatus.BUSY
+        assert registry.select_worker(WorkerType.BACKTESTING) is None
+
+        registry.mark_available("worker-1")
+        assert worker.status == WorkerStatus.AVAILABLE
+        assert worker.metadata["active_operations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_health_report_with_active_operations(self):
+        """Reported active_operations decides the free slots."""
+        registry = WorkerRegistry()
+        await registry.register_worker(
+            worker_id="worker-1",
+            worker_type=WorkerType.BACKTESTING,
+            endpoint_url="http://worker-1:5003",
+            capabilities={"slots": 3},
+        )
+        registry.record_heartbeat("worker-1", "idle", "op-1", active_operations=2)
+
+        worker = registry.get_worker("worker-1")
+        assert worker.status == WorkerStatus.AVAILABLE
+        assert worker.current_operation_id == "op-1"
+        assert registry._free_slots(worker) == 1
+
+    @pytest.mark.asyncio
+    async def test_select_prefers_warm_worker_then_free_capacity(self):
+        """Cache locality beats LRU; free capacity beats LRU."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 2)
+
+        first = registry.select_worker(WorkerType.BACKTESTING, symbol="EURUSD")
+        again = registry.select_worker(WorkerType.BACKTESTING, symbol="EURUSD")
+        assert again is first
+        assert "symbol:EURUSD" in first.metadata["warm_keys"]
+
+        other = registry.select_worker(WorkerType.BACKTESTING, symbol="GBPUSD")
+        assert other is not first
+
+        # A half-used 4-slot worker loses to an idle one, whatever the LRU order
+        first.capabilities = {"slots": 4}
+        first.metadata["active_operations"] = 2
+        other.capabilities = {"slots": 4}
+        assert registry.select_worker(WorkerType.BACKTESTING) is other
+        assert registry.select_worker(WorkerType.BACKTESTING) is other
+
+    @pytest.mark.asyncio
+    async def test_select_prefers_worker_reporting_cached_symbol(self):
+        """Cache contents reported at registration/heartbeat attract the symbol."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 2)
+        await registry.register_worker(
+            worker_id="worker-1",
+            worker_type=WorkerType.BACKTESTING,
+            endpoint_url="http://worker-1:5003",
+            warm_keys=["symbol:EURUSD"],
+        )
+        warm = registry.get_worker("worker-1")
+
+        assert registry.select_worker(WorkerType.BACKTESTING, symbol="EURUSD") is warm
+        assert registry.select_worker(WorkerType.BACKTESTING, symbol="EURUSD") is warm
+
+        # The cache evicted EURUSD and now holds GBPUSD
+        registry.record_heartbeat("worker-1", "idle", warm_keys=["symbol:GBPUSD"])
+        assert warm.metadata["cached_keys"] == ["symbol:GBPUSD"]
+        assert registry.select_worker(WorkerType.BACKTESTING, symbol="GBPUSD") is warm
+
+    @pytest.mark.asyncio
+    async def test_acquire_reserves_slot_until_marked_busy(self):
+        """An acquired slot is not handed out again; release gives it back."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 1)
+
+        worker = await registry.acquire_worker(WorkerType.BACKTESTING, timeout=0)
+        assert worker is not None
+        assert registry.select_worker(WorkerType.BACKTESTING) is None
+
+        registry.release_worker(worker.worker_id)
+        assert registry.select_worker(WorkerType.BACKTESTING) is worker
+
+        await registry.acquire_worker(WorkerType.BACKTESTING, timeout=0)
+        registry.mark_busy(worker.worker_id, "op-1")
+        assert registry._reservations[worker.worker_id] == []
+        assert worker.status == WorkerStatus.BUSY
+
+    @pytest.mark.asyncio
+    async def test_queued_requests_granted_by_priority_as_slots_free(self):
+        """Queued operations are dispatched highest priority first."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 1)
+        registry.mark_busy("worker-0", "op-running")
+
+        low = asyncio.create_task(
+            registry.acquire_worker(WorkerType.BACKTESTING, priority=0, timeout=5)
+        )
+        await asyncio.sleep(0)
+        high = asyncio.create_task(
+            registry.acquire_worker(WorkerType.BACKTESTING, priority=5, timeout=5)
+        )
+        await asyncio.sleep(0)
+        assert registry.queue_depth(WorkerType.BACKTESTING) == 2
+        assert registry.select_worker(WorkerType.BACKTESTING) is None
+
+        registry.mark_available("worker-0")
+        assert (await high).worker_id == "worker-0"
+        assert not low.done()
+
+        registry.mark_busy("worker-0", "op-high")
+        registry.record_heartbeat("worker-0", "idle")
+        assert (await low).worker_id == "worker-0"
+        assert registry.queue_depth(WorkerType.BACKTESTING) == 0
+
+    @pytest.mark.asyncio
+    async def test_excluded_workers_are_never_granted(self):
+        """Excluded workers are skipped, without blocking other queued requests."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 2)
+        registry.mark_busy("worker-1", "op-running")
+
+        assert (
+            await registry.acquire_worker(
+                WorkerType.BACKTESTING, excluded_workers=["worker-0", "worker-1"]
+            )
+            is None
+        )
+        registry.mark_busy("worker-0", "op-running")
+
+        retry = asyncio.create_task(
+            registry.acquire_worker(
+                WorkerType.BACKTESTING,
+                priority=5,
+                excluded_workers=["worker-0"],
+                timeout=5,
+            )
+        )
+        await asyncio.sleep(0)
+        other = asyncio.create_task(
+            registry.acquire_worker(WorkerType.BACKTESTING, timeout=5)
+        )
+        await asyncio.sleep(0)
+
+        registry.mark_available("worker-0")
+        assert (await other).worker_id == "worker-0"
+        assert not retry.done()
+
+        registry.mark_available("worker-1")
+        assert (await retry).worker_id == "worker-1"
+        assert registry.queue_depth(WorkerType.BACKTESTING) == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_returns_none(self):
+        """A request that waits past its timeout leaves the queue."""
+        registry = WorkerRegistry()
+        await _register_workers(registry, 1)
+        registry.mark_busy("worker-0", "op-running")
+
+        result = await registry.acquire_worker(WorkerType.BACKTESTING, timeout=0.01)
+
+        assert result is None
+        assert registry.queue_depth(WorkerType.BACKTESTING) == 0
+        assert registry._dispatch_queues[WorkerType.BACKTESTING] == []
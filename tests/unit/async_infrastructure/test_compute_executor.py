@@ -0,0 +1,93 @@
+"""Unit tests for the managed compute executor."""
+
+import asyncio
+import math
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from ktrdr.api.services.indicator_service import _compute_indicator_values
+from ktrdr.async_infrastructure.compute_executor import ComputeExecutor
+from ktrdr.errors.exceptions import ApiTimeoutError, ServiceUnavailableError
+
+
+@pytest.fixture
+def executor():
+    executor = ComputeExecutor(processes=0, threads=2, max_pending=2, timeout=5.0)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+class TestComputeExecutor:
+    @pytest.mark.asyncio
+    async def test_run_io_runs_off_the_event_loop(self, executor):
+        loop_thread = threading.get_ident()
+
+        thread = await executor.run_io(threading.get_ident)
+
+        assert thread != loop_thread
+        assert executor.stats()["in_flight"] == {"process": 0, "thread": 0}
+
+    @pytest.mark.asyncio
+    async def test_cpu_jobs_fall_back_to_threads_without_processes(self, executor):
+        assert await executor.run_cpu(sum, [1, 2, 3]) == 6
+        assert "process" not in executor._pools
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_rejects_new_jobs(self, executor):
+        release = threading.Event()
+        running = [asyncio.create_task(executor.run_io(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            await executor.run_io(time.sleep, 0)
+        assert exc_info.value.error_code == "COMPUTE-Saturated"
+
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        assert await executor.run_io(abs, -1) == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_frees_the_slot(self, executor):
+        release = threading.Event()
+
+        with pytest.raises(ApiTimeoutError) as exc_info:
+            await executor.run_io(release.wait, timeout=0.05)
+
+        assert exc_info.value.error_code == "COMPUTE-Timeout"
+        assert executor.stats()["in_flight"]["thread"] == 0
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self):
+        executor = ComputeExecutor(processes=1, threads=1, timeout=60.0)
+        try:
+            assert await executor.run_cpu(math.factorial, 10) == 3628800
+            assert "process" in executor._pools
+        finally:
+            executor.shutdown(wait=True)
+
+
+def test_indicator_values_are_json_safe():
+    index = pd.date_range("2024-01-01", periods=30, freq="1h")
+    df = pd.DataFrame(
+        {
+            "open": range(30),
+            "high": range(1, 31),
+            "low": range(30),
+            "close": [float(i % 7) for i in range(30)],
+            "volume": [100] * 30,
+        },
+        index=index,
+    )
+
+    dates, values = _compute_indicator_values(
+        df, {"sma_5": {"type": "sma", "period": 5}}
+    )
+
+    assert dates[0] == "2024-01-01 00:00:00"
+    assert len(values["sma_5"]) == 30
+    assert values["sma_5"][0] == 0.0  # NaN warm-up replaced
+    assert values["sma_5"][4] == pytest.approx(2.0)
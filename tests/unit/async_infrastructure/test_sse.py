@@ -0,0 +1,73 @@
+"""Tests for client-side consumption of the operations event stream."""
+
+import httpx
+import pytest
+
+from ktrdr.async_infrastructure.sse import iter_sse_events, stream_until_terminal
+
+
+def _client(body: str, status: int = 200) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url="http://test",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(status, text=body)
+        ),
+    )
+
+
+async def _lines(*lines: str):
+    for line in lines:
+        yield line
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_events_parses_events_and_keepalives():
+    events = [
+        e
+        async for e in iter_sse_events(
+            _lines(
+                "id: 1",
+                "event: progress",
+                'data: {"status": "running",',
+                'data: "progress": {"percentage": 10}}',
+                "",
+                ": keepalive",
+                "",
+                'data: {"x": 1}',
+                "",
+            )
+        )
+    ]
+    assert events == [
+        {
+            "event": "progress",
+            "data": {"status": "running", "progress": {"percentage": 10}},
+        },
+        {"event": "keepalive", "data": {}},
+        {"event": "message", "data": {"x": 1}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_until_terminal_returns_terminal_data():
+    body = (
+        'event: snapshot\ndata: {"status": "running"}\n\n'
+        'event: terminal\ndata: {"status": "failed", "error_message": "boom"}\n\n'
+    )
+    async with _client(body) as client:
+        data = await stream_until_terminal(client, "/operations/stream", "op_1")
+    assert data == {"status": "failed", "error_message": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_stream_until_terminal_without_terminal_event():
+    body = 'event: error\ndata: {"error": "Operation not found: op_1"}\n\n'
+    async with _client(body) as client:
+        assert await stream_until_terminal(client, "/operations/stream", "op_1") is None
+
+
+@pytest.mark.asyncio
+async def test_stream_until_terminal_raises_on_http_error():
+    async with _client("", status=503) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await stream_until_terminal(client, "/operations/stream", "op_1")
@@ -395,3 +395,52 @@ class TestCheckpointCallbackEventLoop:
         assert (
             ".result(" in source
         ), "Base class callback should wait with future.result(timeout=...)"
+
+
+class TestBackgroundPeriodicCheckpoint:
+    """Periodic checkpoints handed to a BackgroundCheckpointWriter."""
+
+    @pytest.mark.asyncio
+    async def test_callback_defers_state_build_to_writer(self):
+        """A callable returned by the state builder runs on the writer thread."""
+        import asyncio
+        import threading
+
+        from ktrdr.backtesting.backtest_worker import BacktestWorker
+        from ktrdr.checkpoint import BackgroundCheckpointWriter
+        from ktrdr.checkpoint.checkpoint_policy import CheckpointPolicy
+
+        worker = BacktestWorker(worker_port=8001, backend_url="http://localhost:8000")
+        service = AsyncMock()
+        writer = BackgroundCheckpointWriter(service, asyncio.get_running_loop())
+        build_threads = []
+
+        def state_builder(**kwargs):
+            def build():
+                build_threads.append(threading.current_thread().name)
+                state = MagicMock()
+                state.to_dict.return_value = {"bar_index": kwargs["bar_index"]}
+                return state
+
+            return build
+
+        callback = worker.create_checkpoint_callback(
+            operation_id="op_bt",
+            checkpoint_service=service,
+            checkpoint_policy=CheckpointPolicy(unit_interval=100),
+            state_builder=state_builder,
+            main_loop=asyncio.get_running_loop(),
+            last_checkpoint_state={},
+            writer=writer,
+        )
+
+        await asyncio.to_thread(callback, bar_index=100, engine=None)
+        await writer.aclose(timeout=5)
+
+        assert build_threads == ["checkpoint-writer"]
+        service.save_checkpoint.assert_awaited_once_with(
+            operation_id="op_bt",
+            checkpoint_type="periodic",
+            state={"bar_index": 100},
+            artifacts=None,
+        )
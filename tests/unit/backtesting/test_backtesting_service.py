@@ -166,6 +166,95 @@ class TestBacktestingServiceWorkerDispatch:
                 # Verify proxy was registered
                 mock_ops.register_remote_proxy.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_busy_worker_released_and_retry_reacquired(
+        self, backtest_service, worker_registry
+    ):
+        """A 503 releases the slot and re-acquires a different worker."""
+        import httpx
+
+        for worker_id in ("worker-1", "worker-2"):
+            await worker_registry.register_worker(
+                worker_id=worker_id,
+                worker_type=WorkerType.BACKTESTING,
+                endpoint_url=f"http://{worker_id}:5003",
+            )
+
+        async def post(url, json, timeout):
+            response = MagicMock()
+            if url.startswith(first_url):
+                request = httpx.Request("POST", url)
+                response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                    "busy", request=request, response=httpx.Response(503)
+                )
+            else:
+                response.json.return_value = {"operation_id": "remote_op"}
+            return response
+
+        first_url = "http://worker-1"
+        # worker-1 was used least recently, so it is picked first
+        worker_registry.get_worker("worker-2").metadata["last_selected"] = 1.0
+        release = MagicMock(wraps=worker_registry.release_worker)
+        worker_registry.release_worker = release
+        backtest_service.operations_service = MagicMock()
+
+        with (
+            patch(
+                "ktrdr.backtesting.backtesting_service.httpx.AsyncClient"
+            ) as MockClient,
+            patch("ktrdr.backtesting.backtesting_service.OperationServiceProxy"),
+        ):
+            MockClient.return_value.__aenter__.return_value.post = post
+            result = await backtest_service.run_backtest_on_worker(
+                operation_id="op_503",
+                symbol="AAPL",
+                timeframe="1h",
+                strategy_config_path="strategies/test.yaml",
+                model_path=None,
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 12, 31),
+                initial_capital=100000.0,
+            )
+
+        assert result["worker_id"] == "worker-2"
+        release.assert_called_once_with("worker-1")
+        assert worker_registry._reservations.get("worker-1") == []
+        assert worker_registry._reservations.get("worker-2") == []
+        assert worker_registry.get_worker("worker-2").status == WorkerStatus.BUSY
+
+    @pytest.mark.asyncio
+    async def test_failed_dispatch_releases_reservation(
+        self, backtest_service, worker_registry
+    ):
+        """Any dispatch error hands the reserved slot back."""
+        await worker_registry.register_worker(
+            worker_id="worker-1",
+            worker_type=WorkerType.BACKTESTING,
+            endpoint_url="http://worker-1:5003",
+        )
+        backtest_service.operations_service = MagicMock()
+
+        with patch(
+            "ktrdr.backtesting.backtesting_service.httpx.AsyncClient"
+        ) as MockClient:
+            MockClient.return_value.__aenter__.return_value.post = AsyncMock(
+                side_effect=ConnectionError("refused")
+            )
+            with pytest.raises(ConnectionError):
+                await backtest_service.run_backtest_on_worker(
+                    operation_id="op_fail",
+                    symbol="AAPL",
+                    timeframe="1h",
+                    strategy_config_path="strategies/test.yaml",
+                    model_path=None,
+                    start_date=datetime(2024, 1, 1),
+                    end_date=datetime(2024, 12, 31),
+                    initial_capital=100000.0,
+                )
+
+        assert worker_registry._reservations.get("worker-1") == []
+        assert worker_registry.select_worker(WorkerType.BACKTESTING) is not None
+
 
 class TestBacktestingServiceErrorHandling:
     """Test error handling and validation."""
@@ -365,3 +454,49 @@ class TestBacktestingServiceWorkerRegistry:
 
         # Should not raise error for nonexistent operation
         service.cleanup_worker("nonexistent_op")
+
+    @pytest.mark.asyncio
+    async def test_worker_dispatch_waits_for_free_slot(self):
+        """When every worker is busy, dispatch queues until a slot frees up."""
+        import asyncio
+
+        registry = WorkerRegistry()
+        await registry.register_worker(
+            worker_id="worker-1",
+            worker_type=WorkerType.BACKTESTING,
+            endpoint_url="http://worker-1:5003",
+        )
+        registry.mark_busy("worker-1", "op_running")
+        service = BacktestingService(worker_registry=registry)
+        service.operations_service = MagicMock()
+
+        with patch(
+            "ktrdr.backtesting.backtesting_service.httpx.AsyncClient"
+        ) as MockClient:
+            with patch("ktrdr.backtesting.backtesting_service.OperationServiceProxy"):
+                mock_response = MagicMock()
+                mock_response.json.return_value = {"operation_id": "remote_op"}
+                mock_client = MockClient.return_value.__aenter__.return_value
+                mock_client.post = AsyncMock(return_value=mock_response)
+
+                dispatch = asyncio.create_task(
+                    service.run_backtest_on_worker(
+                        operation_id="op_queued",
+                        symbol="AAPL",
+                        timeframe="1h",
+                        strategy_config_path="strategies/test.yaml",
+                        model_path="models/test.pt",
+                        start_date=datetime(2024, 1, 1),
+                        end_date=datetime(2024, 12, 31),
+                        initial_capital=100000.0,
+                    )
+                )
+                await asyncio.sleep(0.01)
+                assert registry.queue_depth(WorkerType.BACKTESTING) == 1
+                mock_client.post.assert_not_called()
+
+                registry.mark_available("worker-1")
+                result = await dispatch
+
+        assert result["worker_id"] == "worker-1"
+        assert registry.get_worker("worker-1").current_operation_id == "op_queued"
@@ -350,3 +350,86 @@ class TestEquitySampling:
 
         bar_indices = [s["bar_index"] for s in state.equity_samples]
         assert bar_indices == sorted(bar_indices)
+
+
+class TestIncrementalBacktestCheckpointBuilder:
+    """Snapshots built later must match a synchronous build at snapshot time."""
+
+    @staticmethod
+    def make_trade(trade_id: int) -> MagicMock:
+        return MagicMock(
+            trade_id=trade_id,
+            symbol="EURUSD",
+            side="BUY",
+            entry_price=1.08,
+            entry_time=pd.Timestamp("2023-01-15T09:00:00"),
+            exit_price=1.09,
+            exit_time=pd.Timestamp("2023-01-16T09:00:00"),
+            quantity=100,
+            net_pnl=float(trade_id),
+            gross_pnl=float(trade_id),
+            commission=1.0,
+            slippage=0.5,
+            holding_period_hours=24.0,
+            max_favorable_excursion=10.0,
+            max_adverse_excursion=-5.0,
+        )
+
+    @pytest.fixture
+    def engine(self):
+        engine = MagicMock()
+        engine.config.symbol = "EURUSD"
+        engine.position_manager.current_capital = 100000.0
+        engine.position_manager.current_position = None
+        engine.position_manager.trade_history = []
+        engine.performance_tracker.equity_curve = []
+        return engine
+
+    def advance(self, engine, bars: int) -> None:
+        curve = engine.performance_tracker.equity_curve
+        for _ in range(bars):
+            curve.append({"portfolio_value": 100000.0 + len(curve)})
+            if len(curve) % 37 == 0:
+                trades = engine.position_manager.trade_history
+                trades.append(self.make_trade(len(trades) + 1))
+                engine.position_manager.current_capital += 1.0
+
+    def test_matches_synchronous_build(self, engine):
+        from ktrdr.backtesting.checkpoint_builder import (
+            IncrementalBacktestCheckpointBuilder,
+            build_backtest_checkpoint_state,
+        )
+
+        builder = IncrementalBacktestCheckpointBuilder({"symbol": "EURUSD"})
+        for step, bars in enumerate([1, 99, 150, 250, 1, 400]):
+            self.advance(engine, bars)
+            timestamp = pd.Timestamp("2023-01-01") + pd.Timedelta(hours=step)
+            bar_index = len(engine.performance_tracker.equity_curve)
+            expected = build_backtest_checkpoint_state(
+                engine, bar_index, timestamp, {"symbol": "EURUSD"}
+            ).to_dict()
+
+            build = builder.snapshot(engine, bar_index, timestamp)
+            # Simulation continues before the writer thread builds
+            self.advance(engine, 120)
+
+            assert build().to_dict() == expected
+
+    def test_superseded_snapshots_are_skipped(self, engine):
+        from ktrdr.backtesting.checkpoint_builder import (
+            IncrementalBacktestCheckpointBuilder,
+            build_backtest_checkpoint_state,
+        )
+
+        builder = IncrementalBacktestCheckpointBuilder({})
+        timestamp = pd.Timestamp("2023-01-01")
+        self.advance(engine, 80)
+        builder.snapshot(engine, 80, timestamp)()
+        self.advance(engine, 300)
+        builder.snapshot(engine, 380, timestamp)  # never built
+        self.advance(engine, 300)
+        expected = build_backtest_checkpoint_state(engine, 680, timestamp, {})
+
+        state = builder.snapshot(engine, 680, timestamp)()
+
+        assert state.to_dict() == expected.to_dict()
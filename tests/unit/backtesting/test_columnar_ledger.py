@@ -0,0 +1,169 @@
+"""Tests for the columnar equity curve and trade ledger."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ktrdr.backtesting.checkpoint_builder import _sample_equity_curve
+from ktrdr.backtesting.performance import EquityCurve, PerformanceTracker
+from ktrdr.backtesting.position_manager import (
+    PositionManager,
+    PositionStatus,
+    Trade,
+    TradeLedger,
+)
+from ktrdr.decision.base import Signal
+
+
+def _trade(trade_id: int, net_pnl: float, hours: float) -> Trade:
+    ts = pd.Timestamp("2024-01-01")
+    return Trade(
+        trade_id=trade_id,
+        symbol="EURUSD",
+        side="LONG",
+        entry_price=1.0,
+        entry_time=ts,
+        exit_price=1.0,
+        exit_time=ts + pd.Timedelta(hours=hours),
+        quantity=1000,
+        gross_pnl=net_pnl,
+        commission=0.0,
+        slippage=0.0,
+        net_pnl=net_pnl,
+        holding_period_hours=hours,
+        max_favorable_excursion=0.0,
+        max_adverse_excursion=0.0,
+    )
+
+
+def _tracker(values: list[float], tz: str | None = "UTC") -> PerformanceTracker:
+    tracker = PerformanceTracker(capacity=2)
+    timestamps = pd.date_range("2024-01-01", periods=len(values), freq="1h", tz=tz)
+    statuses = [PositionStatus.FLAT, PositionStatus.LONG, PositionStatus.SHORT]
+    for i, (ts, value) in enumerate(zip(timestamps, values)):
+        tracker.update(ts, 100.0 + i, value, statuses[i % 3])
+    return tracker
+
+
+class TestEquityCurve:
+    def test_grows_past_capacity_and_indexes_like_a_list(self):
+        tracker = _tracker([100.0, 101.0, 99.0, 102.0, 98.0])
+        curve = tracker.equity_curve
+
+        assert len(curve) == 5
+        assert curve[-1]["portfolio_value"] == 98.0
+        assert curve[1]["position"] == "LONG"
+        assert curve[0]["timestamp"] == pd.Timestamp("2024-01-01", tz="UTC")
+        assert [row["price"] for row in curve] == [100.0, 101.0, 102.0, 103.0, 104.0]
+        with pytest.raises(IndexError):
+            curve[5]
+
+    def test_columns_are_read_only_views(self):
+        tracker = _tracker([100.0, 101.0])
+        with pytest.raises(ValueError):
+            tracker.equity_curve.equity[0] = 0.0
+
+    @pytest.mark.parametrize("tz", ["UTC", None])
+    def test_frame_matches_row_based_construction(self, tz):
+        tracker = _tracker([100.0, 101.0, 99.0], tz=tz)
+
+        expected = pd.DataFrame(list(tracker.equity_curve))
+        expected["timestamp"] = pd.to_datetime(expected["timestamp"])
+        expected = expected.set_index("timestamp")
+
+        pd.testing.assert_frame_equal(tracker.get_equity_curve(), expected)
+
+    def test_restored_samples_feed_checkpoint_sampling(self):
+        tracker = PerformanceTracker()
+        tracker.equity_curve = [
+            {"bar_index": 0, "equity": 100000.0},
+            {"bar_index": 100, "equity": 100500.0},
+        ]
+        tracker.update(pd.Timestamp("2024-01-01"), 1.0, 101000.0, PositionStatus.FLAT)
+
+        samples = _sample_equity_curve(tracker.equity_curve, sample_interval=1)
+
+        assert [s["equity"] for s in samples] == [100000.0, 100500.0, 101000.0]
+        assert tracker.equity_curve[0]["timestamp"] is pd.NaT
+
+    def test_reserve_keeps_existing_rows(self):
+        curve = EquityCurve(capacity=1)
+        curve.append(pd.Timestamp("2024-01-01"), 1.0, 10.0, PositionStatus.FLAT)
+        curve.reserve(1000)
+        assert len(curve) == 1
+        assert curve.equity.tolist() == [10.0]
+
+
+class TestVectorizedMetrics:
+    def test_drawdown_state_matches_running_peak(self):
+        tracker = _tracker([100000, 110000, 105000, 95000, 115000, 112000])
+
+        assert tracker.peak_equity == 115000
+        assert tracker.max_drawdown == pytest.approx(15000 / 110000)
+        assert tracker.current_drawdown == pytest.approx(3000 / 115000)
+        assert tracker.last_equity == 112000
+
+    def test_returns_skip_bars_after_non_positive_equity(self):
+        tracker = _tracker([100.0, 0.0, 50.0, 55.0])
+        np.testing.assert_allclose(tracker.daily_returns, [-1.0, 0.1])
+
+    def test_restored_samples_excluded_from_returns_and_drawdown(self):
+        tracker = PerformanceTracker()
+        tracker.equity_curve = [{"bar_index": 0, "equity": 200000.0}]
+        tracker.update(pd.Timestamp("2024-01-01"), 1.0, 100000.0, PositionStatus.FLAT)
+        tracker.update(pd.Timestamp("2024-01-02"), 1.0, 101000.0, PositionStatus.FLAT)
+
+        assert tracker.peak_equity == 101000.0
+        assert tracker.max_drawdown == 0.0
+        np.testing.assert_allclose(tracker.daily_returns, [0.01])
+
+    def test_trade_stats_from_ledger_and_list_agree(self):
+        tracker = _tracker([100000, 101000, 100500, 102000])
+        trades = [_trade(1, 2000, 24), _trade(2, -500, 12), _trade(3, 1500, 36)]
+
+        from_list = tracker.calculate_metrics(trades, 100000)
+        from_ledger = tracker.calculate_metrics(TradeLedger(trades), 100000)
+
+        assert from_list == from_ledger
+        assert from_list.winning_trades == 2
+        assert from_list.profit_factor == pytest.approx(3500 / 500)
+        assert from_list.largest_loss == -500
+        assert from_list.avg_win_holding_period == pytest.approx(30.0)
+        assert from_list.avg_loss_holding_period == pytest.approx(12.0)
+
+    def test_reset_clears_curve(self):
+        tracker = _tracker([100.0, 90.0])
+        tracker.reset()
+        assert len(tracker.equity_curve) == 0
+        assert tracker.max_drawdown == 0.0
+
+
+class TestTradeLedger:
+    def test_columns_track_appended_trades(self):
+        ledger = TradeLedger(capacity=1)
+        for i, pnl in enumerate([10.0, -5.0, 3.0], start=1):
+            ledger.append(_trade(i, pnl, float(i)))
+
+        assert ledger.net_pnl.tolist() == [10.0, -5.0, 3.0]
+        assert ledger.column("quantity").tolist() == [1000.0] * 3
+        assert ledger[1].trade_id == 2
+        assert ledger == ledger.copy()
+
+    def test_position_manager_records_exits_in_ledger(self):
+        manager = PositionManager(initial_capital=100000, commission=0, slippage=0)
+        ts = pd.Timestamp("2024-01-01")
+        manager.execute_trade(Signal.BUY, 100.0, ts, "EURUSD")
+        manager.execute_trade(Signal.SELL, 110.0, ts + pd.Timedelta(hours=2), "EURUSD")
+
+        history = manager.trade_history
+        assert len(history) == 1
+        assert history.net_pnl[0] == history[0].net_pnl > 0
+        assert manager.get_trade_history() == [history[0]]
+
+    def test_assigning_a_list_rebuilds_the_ledger(self):
+        manager = PositionManager(initial_capital=100000)
+        manager.trade_history = [_trade(1, 5.0, 1.0), _trade(7, -1.0, 2.0)]
+
+        assert isinstance(manager.trade_history, TradeLedger)
+        assert max(t.trade_id for t in manager.trade_history) == 7
+        assert manager.trade_history.net_pnl.tolist() == [5.0, -1.0]
@@ -0,0 +1,314 @@
+"""Tests for compiled NumPy MLP inference and batched DecisionFunction predictions."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+torch = pytest.importorskip("torch")
+import torch.nn as nn  # noqa: E402
+
+from ktrdr.backtesting.compiled_inference import compile_model  # noqa: E402
+from ktrdr.backtesting.decision_function import DecisionFunction  # noqa: E402
+from ktrdr.backtesting.position_manager import PositionStatus  # noqa: E402
+from ktrdr.decision.base import Signal  # noqa: E402
+
+FEATURES = ["f0", "f1", "f2", "f3"]
+
+
+def _mlp(activation: nn.Module | None = None, out: int = 3) -> nn.Module:
+    torch.manual_seed(0)
+    model = nn.Sequential(
+        nn.Linear(4, 8),
+        activation or nn.ReLU(),
+        nn.Dropout(0.2),
+        nn.Linear(8, 6),
+        nn.Tanh(),
+        nn.Linear(6, out),
+    )
+    return model.eval()
+
+
+def _rows(n: int = 50) -> np.ndarray:
+    return np.random.default_rng(1).normal(size=(n, 4)).astype(np.float32)
+
+
+class TestCompileModel:
+    @pytest.mark.parametrize(
+        "activation", [nn.ReLU(), nn.Tanh(), nn.Sigmoid(), nn.LeakyReLU(0.1)]
+    )
+    def test_matches_eager_output(self, activation: nn.Module):
+        model = _mlp(activation)
+        compiled = compile_model(model)
+        assert compiled is not None
+
+        rows = _rows()
+        with torch.no_grad():
+            expected = model(torch.from_numpy(rows)).numpy()
+        np.testing.assert_allclose(compiled.forward_batch(rows), expected, atol=1e-5)
+
+    def test_single_row_uses_buffers(self):
+        model = _mlp()
+        compiled = compile_model(model)
+        assert compiled is not None
+        buffers = compiled.make_buffers()
+
+        row = _rows(1)[0]
+        buffers.input[:] = row
+        out = compiled.forward_into(buffers)
+
+        with torch.no_grad():
+            expected = model(torch.from_numpy(row).unsqueeze(0))[0].numpy()
+        np.testing.assert_allclose(out, expected, atol=1e-5)
+        assert out is buffers.layers[-1]
+
+    def test_softmax_head_supported(self):
+        model = nn.Sequential(nn.Linear(4, 3), nn.Softmax(dim=-1)).eval()
+        compiled = compile_model(model)
+        assert compiled is not None
+        np.testing.assert_allclose(
+            compiled.forward_batch(_rows()).sum(axis=1), 1.0, rtol=1e-6
+        )
+
+    def test_unsupported_models_return_none(self):
+        assert compile_model(nn.LSTM(4, 8)) is None
+        assert compile_model(nn.Sequential(nn.Linear(4, 4), nn.BatchNorm1d(4))) is None
+        assert compile_model(nn.Sequential(nn.ReLU(), nn.Linear(4, 3))) is None
+        assert compile_model(object()) is None
+
+    def test_training_mode_model_not_compiled(self):
+        """Active dropout makes eager output differ, so verification rejects it."""
+        model = nn.Sequential(nn.Linear(4, 64), nn.Dropout(0.9), nn.Linear(64, 3))
+        model.train()
+        assert compile_model(model) is None
+
+
+def _decision_fns(
+    model: nn.Module, decisions_config: dict
+) -> tuple[DecisionFunction, DecisionFunction]:
+    eager = DecisionFunction(model, FEATURES, decisions_config)
+    compiled = DecisionFunction(
+        model, FEATURES, decisions_config, compiled_model=compile_model(model)
+    )
+    return eager, compiled
+
+
+class TestDecisionFunctionCompiledPath:
+    def test_classification_matches_eager(self):
+        eager, compiled = _decision_fns(_mlp(), {"confidence_threshold": 0.3})
+        for row in _rows(20):
+            features = dict(zip(FEATURES, row.tolist(), strict=True))
+            expected = eager._predict(features)
+            actual = compiled._predict(features)
+            assert actual["signal"] == expected["signal"]
+            assert actual["confidence"] == pytest.approx(expected["confidence"])
+            assert actual["probabilities"] == pytest.approx(expected["probabilities"])
+
+    def test_regression_matches_eager(self):
+        config = {"output_format": "regression"}
+        eager, compiled = _decision_fns(_mlp(out=1), config)
+        for row in _rows(20):
+            features = dict(zip(FEATURES, row.tolist(), strict=True))
+            expected = eager._predict(features)
+            actual = compiled._predict(features)
+            assert actual["signal"] == expected["signal"]
+            assert actual["predicted_return"] == pytest.approx(
+                expected["predicted_return"], abs=1e-6
+            )
+
+
+class TestPredictMany:
+    @pytest.mark.parametrize("use_compiled", [True, False])
+    def test_classification_rows_match_predict(self, use_compiled: bool):
+        eager, compiled = _decision_fns(_mlp(), {})
+        fn = compiled if use_compiled else eager
+        rows = _rows(30)
+
+        batch = fn.predict_many(rows)
+
+        assert batch.class_names == ["BUY", "HOLD", "SELL"]
+        for i, row in enumerate(rows):
+            single = eager._predict(dict(zip(FEATURES, row.tolist(), strict=True)))
+            assert batch.signal(i) == single["signal"]
+            assert batch.confidences[i] == pytest.approx(single["confidence"])
+
+    def test_regression_thresholds(self):
+        config = {
+            "output_format": "regression",
+            "cost_model": {"round_trip_cost": 0.01, "min_edge_multiplier": 1.0},
+        }
+        model = nn.Sequential(nn.Linear(1, 1, bias=False)).eval()
+        with torch.no_grad():
+            model[0].weight.fill_(1.0)
+        fn = DecisionFunction(model, ["x"], config, compiled_model=compile_model(model))
+
+        batch = fn.predict_many(np.array([[0.05], [0.0], [-0.05]], dtype=np.float32))
+
+        assert [batch.signal(i) for i in range(3)] == [
+            Signal.BUY,
+            Signal.HOLD,
+            Signal.SELL,
+        ]
+        np.testing.assert_allclose(batch.predicted_returns, [0.05, 0.0, -0.05])
+
+    def test_dataframe_columns_reordered(self):
+        _, fn = _decision_fns(_mlp(), {})
+        rows = _rows(5)
+        frame = pd.DataFrame(rows, columns=FEATURES)[FEATURES[::-1]]
+        np.testing.assert_allclose(
+            fn.predict_many(frame).probabilities, fn.predict_many(rows).probabilities
+        )
+
+    def test_non_signal_outputs_are_hold(self):
+        model = _mlp(out=4)
+        fn = DecisionFunction(model, FEATURES, {}, output_type="regime_classification")
+        batch = fn.predict_many(_rows(3))
+        assert batch.probabilities.shape == (3, 4)
+        assert batch.signal(0, is_signal_output=False) == Signal.HOLD
+
+
+class TestDecidePrecomputed:
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"confidence_threshold": 0.3, "allow_short_from_flat": True},
+            {"output_format": "regression"},
+        ],
+    )
+    def test_matches_single_row_call(self, config: dict):
+        out = 1 if config.get("output_format") == "regression" else 3
+        _, fn = _decision_fns(_mlp(out=out), config)
+        rows = _rows(20)
+        batch = fn.predict_many(rows)
+        index = pd.date_range("2024-01-01", periods=len(rows), freq="1h", tz="UTC")
+
+        for i, row in enumerate(rows):
+            bar = pd.Series({"close": 1.0}, name=index[i])
+            features = dict(zip(FEATURES, row.tolist(), strict=True))
+            for position in PositionStatus:
+                expected = fn(features, position, bar)
+                actual = fn.decide_precomputed(batch, i, position, bar)
+                assert actual.signal == expected.signal
+                assert actual.confidence == pytest.approx(expected.confidence)
+                assert (
+                    actual.reasoning["raw_signal"] == expected.reasoning["raw_signal"]
+                )
+                assert actual.reasoning["nn_probabilities"] == pytest.approx(
+                    expected.reasoning["nn_probabilities"], rel=1e-5, abs=1e-6
+                )
+
+    def test_nan_row_is_hold(self):
+        _, fn = _decision_fns(_mlp(), {})
+        rows = _rows(2)
+        rows[1, 0] = np.nan
+        batch = fn.predict_many(rows)
+        bar = pd.Series({"close": 1.0}, name=pd.Timestamp("2024-01-01"))
+
+        decision = fn.decide_precomputed(batch, 1, PositionStatus.FLAT, bar)
+
+        assert decision.signal == Signal.HOLD
+        assert decision.reasoning == {"error": "nan_confidence"}
+
+
+class _FrameCache:
+    """Stand-in FeatureCache over a ready-made feature frame."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+
+    def get_features_for_timestamp(self, timestamp):
+        if timestamp not in self.frame.index:
+            return None
+        return {k: float(v) for k, v in self.frame.loc[timestamp].items()}
+
+    def get_features_for_timestamps(self, timestamps):
+        positions = self.frame.index.get_indexer(timestamps)
+        found = positions >= 0
+        return self.frame.iloc[positions[found]], found
+
+
+class TestBatchedEnsembleReplay:
+    def _simulate(self, precompute: bool) -> list[tuple]:
+        from ktrdr.backtesting.engine import BacktestConfig
+        from ktrdr.backtesting.ensemble_runner import EnsembleBacktestRunner
+        from ktrdr.backtesting.position_manager import PositionManager
+        from ktrdr.backtesting.regime_router import RegimeRouter
+        from ktrdr.config.ensemble_config import (
+            CompositionConfig,
+            EnsembleConfiguration,
+            ModelReference,
+            RouteRule,
+        )
+
+        models = {"regime": "regime_classification", "signal": "classification"}
+        config = EnsembleConfiguration(
+            name="replay",
+            models={
+                name: ModelReference(name=name, model_path=name, output_type=kind)
+                for name, kind in models.items()
+            },
+            composition=CompositionConfig(
+                type="regime_route",
+                gate_model="regime",
+                regime_threshold=0.3,
+                stability_bars=2,
+                rules={
+                    "trending_up": RouteRule(model="signal"),
+                    "trending_down": RouteRule(model="signal"),
+                    "ranging": RouteRule(model="signal"),
+                    "volatile": RouteRule(action="FLAT"),
+                },
+                on_regime_transition="close_and_switch",
+            ),
+        )
+        runner = EnsembleBacktestRunner(
+            config,
+            BacktestConfig(
+                strategy_config_path="",
+                model_path=None,
+                symbol="EURUSD",
+                timeframe="1h",
+                start_date="2024-01-01",
+                end_date="2024-01-10",
+            ),
+        )
+
+        n = 120
+        index = pd.date_range("2024-01-01", periods=n, freq="1h", tz="UTC")
+        rng = np.random.default_rng(7)
+        frame = pd.DataFrame(rng.normal(size=(n, 4)) * 3, index=index, columns=FEATURES)
+        caches = {"regime": _FrameCache(frame), "signal": _FrameCache(frame.iloc[5:])}
+        fns = {
+            "regime": DecisionFunction(
+                _mlp(out=4), FEATURES, {}, output_type="regime_classification"
+            ),
+            "signal": DecisionFunction(
+                nn.Sequential(nn.Linear(4, 3)).eval(),
+                FEATURES,
+                {
+                    "confidence_threshold": 0.4,
+                    "allow_short_from_flat": True,
+                    "filters": {"min_signal_separation": 0},
+                },
+            ),
+        }
+        router = RegimeRouter(config.composition)
+        manager = PositionManager(initial_capital=100000)
+        precomputed = (
+            runner._precompute_outputs(index, caches, fns) if precompute else None
+        )
+
+        results = []
+        for i, ts in enumerate(index):
+            bar = pd.Series({"close": 1.1 + i * 1e-4}, name=ts)
+            result = runner._run_bar(
+                ts, bar, caches, fns, router, manager, precomputed, bar_offset=i
+            )
+            if result["signal"] != Signal.HOLD:
+                manager.execute_trade(result["signal"], bar["close"], ts, "EURUSD")
+            results.append((result["regime"], result["signal"], result["active_model"]))
+        return results
+
+    def test_batched_outputs_replay_identically(self):
+        assert self._simulate(precompute=True) == self._simulate(precompute=False)
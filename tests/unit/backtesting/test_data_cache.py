@@ -0,0 +1,237 @@
+"""Tests for the worker-local backtest data cache."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from ktrdr.backtesting.data_cache import DataCache, frame_nbytes
+from ktrdr.data.repository import DataRepository
+from ktrdr.errors import DataNotFoundError
+
+
+def write_csv(data_dir, symbol="EURUSD", timeframe="1h", periods=48, close=1.1):
+    index = pd.date_range("2024-01-01", periods=periods, freq="h", tz="UTC")
+    df = pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 0.01,
+            "low": close - 0.01,
+            "close": close,
+            "volume": 1000,
+        },
+        index=index,
+    )
+    df.index.name = "timestamp"
+    path = data_dir / f"{symbol}_{timeframe}.csv"
+    df.to_csv(path)
+    return path
+
+
+def frame(rows=10, value=1.0):
+    return pd.DataFrame({"x": [value] * rows})
+
+
+class CountingRepository(DataRepository):
+    def __init__(self, data_dir):
+        super().__init__(data_dir=str(data_dir))
+        self.reads = 0
+
+    def load_from_cache(self, *args, **kwargs):
+        self.reads += 1
+        return super().load_from_cache(*args, **kwargs)
+
+
+class TestMemoryTier:
+    def test_lru_eviction_within_budget(self):
+        size = frame_nbytes(frame())
+        cache = DataCache(max_bytes=2 * size)
+        cache.put("a", "a", "AAA", frame())
+        cache.put("b", "b", "BBB", frame())
+        assert cache.get("a") is not None  # a is now most recent
+        cache.put("c", "c", "CCC", frame())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_new_version_replaces_series(self):
+        cache = DataCache()
+        cache.put(("s", 1), "s", "EURUSD", frame())
+        cache.put(("s", 2), "s", "EURUSD", frame())
+        assert cache.get(("s", 1)) is None
+        assert cache.stats()["entries"] == 1
+
+    def test_warm_keys_most_recent_last(self):
+        cache = DataCache()
+        cache.put("a", "a", "EURUSD", frame())
+        cache.put("b", "b", "GBPUSD", frame())
+        cache.put("c", "c", "EURUSD", frame())
+        assert cache.warm_keys() == ["symbol:GBPUSD", "symbol:EURUSD"]
+
+
+class TestLoadOhlcv:
+    def test_parses_each_file_version_once(self, tmp_path):
+        path = write_csv(tmp_path)
+        repo = CountingRepository(tmp_path)
+        cache = DataCache()
+        versions: dict = {}
+
+        full = cache.load_ohlcv(repo, "EURUSD", "1h", versions=versions)
+        part = cache.load_ohlcv(repo, "EURUSD", "1h", start_date="2024-01-02")
+        assert repo.reads == 1
+        assert len(full) == 48 and len(part) == 24
+        assert versions == {"1h": repo.get_data_version("EURUSD", "1h")}
+        pd.testing.assert_frame_equal(
+            part, repo.load_from_cache("EURUSD", "1h", start_date="2024-01-02")
+        )
+
+        # Callers get their own copy
+        full["close"] = 0.0
+        assert cache.load_ohlcv(repo, "EURUSD", "1h")["close"].iloc[0] == 1.1
+
+        # Rewriting the file changes its version
+        repo.reads = 0
+        write_csv(tmp_path, periods=72, close=1.2)
+        os.utime(path, ns=(0, 10**18))
+        assert len(cache.load_ohlcv(repo, "EURUSD", "1h")) == 72
+        assert repo.reads == 1
+
+    def test_empty_range_raises_like_repository(self, tmp_path):
+        write_csv(tmp_path)
+        with pytest.raises(DataNotFoundError):
+            DataCache().load_ohlcv(
+                CountingRepository(tmp_path), "EURUSD", "1h", start_date="2030-01-01"
+            )
+
+    def test_disabled_cache_reads_through(self, tmp_path):
+        write_csv(tmp_path)
+        repo = CountingRepository(tmp_path)
+        view = DataCache(max_bytes=0).wrap(repo)
+        view.load_from_cache("EURUSD", "1h")
+        view.load_from_cache("EURUSD", "1h")
+        assert repo.reads == 2
+        assert view.data_dir == repo.data_dir
+
+
+class TestDiskTier:
+    def test_restarted_cache_starts_warm(self, tmp_path):
+        data_dir, cache_dir = tmp_path / "data", tmp_path / "cache"
+        data_dir.mkdir()
+        write_csv(data_dir, symbol="BRK.B")
+        repo = CountingRepository(data_dir)
+        DataCache(disk_dir=cache_dir).load_ohlcv(repo, "BRK.B", "1h")
+
+        restarted = DataCache(disk_dir=cache_dir)
+        assert restarted.warm_keys() == ["symbol:BRK.B"]
+        restarted.load_ohlcv(repo, "BRK.B", "1h")
+        assert repo.reads == 1
+        assert restarted.stats()["disk_hits"] == 1
+
+    def test_disk_budget_evicts_least_recent(self, tmp_path):
+        size = len(pd.DataFrame({"x": range(1000)}).to_json())
+        cache = DataCache(max_bytes=0, disk_dir=tmp_path, max_disk_bytes=3 * size)
+        for symbol in ("A", "B", "C", "D", "E"):
+            cache.put(symbol, symbol, symbol, pd.DataFrame({"x": range(1000)}))
+
+        stats = cache.stats()
+        assert stats["disk_bytes"] <= 3 * size
+        assert len(list(tmp_path.glob("*.pkl"))) == stats["disk_entries"]
+        assert cache.get("A") is None
+        assert cache.get("E") is not None
+
+
+class TestEngineFeatureReuse:
+    def make_engine(self, context_data=None):
+        from unittest.mock import MagicMock
+
+        from ktrdr.backtesting.engine import BacktestConfig, BacktestingEngine
+
+        engine = BacktestingEngine.__new__(BacktestingEngine)
+        engine.config = BacktestConfig(
+            strategy_config_path="",
+            model_path="models/x",
+            symbol="EURUSD",
+            timeframe="1h",
+            start_date="2024-01-01",
+            end_date="2024-02-01",
+        )
+        engine.bundle = MagicMock()
+        engine.bundle.strategy_config.model_dump.return_value = {"indicators": []}
+        engine.bundle.metadata.resolved_features = ["rsi_14_oversold"]
+        engine.bundle.metadata.normalization_params = {
+            "rsi_14_oversold": {"min": 0.0, "max": 1.0}
+        }
+        engine.repository = MagicMock(data_dir="data")
+        engine.feature_cache = MagicMock()
+        engine.feature_cache.precomputed.return_value = (frame(), pd.RangeIndex(10))
+        engine._context_data = context_data
+        engine._data_versions = {"1h": (1, 100)}
+        return engine
+
+    def test_second_engine_reuses_features(self, monkeypatch):
+        import ktrdr.backtesting.engine as engine_module
+
+        cache = DataCache()
+        monkeypatch.setattr(engine_module, "get_data_cache", lambda: cache)
+        data = {"1h": frame()}
+
+        first = self.make_engine()
+        first._compute_features(data)
+        first.feature_cache.compute_all_features.assert_called_once()
+
+        second = self.make_engine()
+        second._compute_features(data)
+        second.feature_cache.compute_all_features.assert_not_called()
+        second.feature_cache.use_precomputed.assert_called_once()
+
+        # A new data file version recomputes
+        third = self.make_engine()
+        third._data_versions = {"1h": (2, 100)}
+        third._compute_features(data)
+        third.feature_cache.compute_all_features.assert_called_once()
+
+    def test_retrained_model_gets_its_own_features(self, monkeypatch):
+        import ktrdr.backtesting.engine as engine_module
+
+        monkeypatch.setattr(engine_module, "get_data_cache", lambda: DataCache())
+        data = {"1h": frame()}
+        first, retrained = self.make_engine(), self.make_engine()
+        retrained.bundle.metadata.normalization_params = {
+            "rsi_14_oversold": {"min": 0.2, "max": 0.9}
+        }
+
+        assert first._feature_cache_key(data) == self.make_engine()._feature_cache_key(
+            data
+        )
+        assert first._feature_cache_key(data) != retrained._feature_cache_key(data)
+
+    def test_context_data_models_are_not_cached(self, monkeypatch):
+        import ktrdr.backtesting.engine as engine_module
+
+        monkeypatch.setattr(engine_module, "get_data_cache", lambda: DataCache())
+        engine = self.make_engine(context_data={"fred": frame()})
+        assert engine._feature_cache_key({"1h": frame()}) is None
+
+
+class TestWorkerAdvertisesCache:
+    @pytest.mark.asyncio
+    async def test_status_and_registration_carry_warm_keys(self, monkeypatch):
+        from unittest.mock import AsyncMock
+
+        import ktrdr.backtesting.backtest_worker as worker_module
+
+        cache = DataCache()
+        cache.put("k", "k", "EURUSD", frame())
+        monkeypatch.setattr(worker_module, "get_data_cache", lambda: cache)
+
+        worker = worker_module.BacktestWorker(
+            worker_port=8001, backend_url="http://localhost:8000"
+        )
+        worker._operations_service.list_operations = AsyncMock(return_value=([], 0, 0))
+
+        status = await worker._worker_status()
+        payload = await worker._build_registration_payload()
+        assert status["warm_keys"] == ["symbol:EURUSD"]
+        assert payload["warm_keys"] == ["symbol:EURUSD"]
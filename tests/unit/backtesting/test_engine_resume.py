@@ -84,6 +84,7 @@ def _make_mock_engine():
 
         engine.repository = MagicMock()
         engine.feature_cache = MagicMock()
+        engine._data_versions = {}
         engine.bundle = MagicMock()
         engine.position_manager = MagicMock()
         engine.position_manager.current_capital = 100000.0
@@ -282,6 +282,7 @@ class TestSimulationLoop:
 
             # Mock feature cache
             engine.feature_cache = MagicMock()
+            engine._data_versions = {}
             # Return features for all timestamps
             engine.feature_cache.get_features_for_timestamp = MagicMock(
                 return_value={"feat_a": 0.5, "feat_b": 0.3}
@@ -415,6 +416,7 @@ class TestSimulationLoopEdgeCases:
             engine.strategy_name = "test_strategy"
             engine.bundle = _make_mock_bundle()
             engine.feature_cache = MagicMock()
+            engine._data_versions = {}
             engine.position_manager = MagicMock()
             engine.performance_tracker = MagicMock()
             engine.repository = MagicMock()
@@ -461,6 +463,7 @@ class TestSimulationLoopTradeExecution:
             engine.bundle = _make_mock_bundle()
 
             engine.feature_cache = MagicMock()
+            engine._data_versions = {}
             engine.feature_cache.get_features_for_timestamp = MagicMock(
                 return_value={"feat_a": 0.5, "feat_b": 0.3}
             )
@@ -595,6 +598,7 @@ class TestResumeUsesFeatureCache:
             engine.config.timeframe = "1h"
             engine.repository = MagicMock()
             engine.feature_cache = MagicMock()  # NEW: uses feature_cache
+            engine._data_versions = {}
             engine.bundle = _make_mock_bundle()
 
             engine.position_manager = MagicMock()
@@ -665,3 +669,105 @@ class TestResetNoOrchestrator:
 
         engine.position_manager.reset.assert_called_once()
         engine.performance_tracker.reset.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Multi-slice backtests
+# ---------------------------------------------------------------------------
+
+
+class TestRunSlices:
+    """run_slices() loads once and simulates each slice independently."""
+
+    SLICES = [
+        ("2024-01-03", "2024-01-04 23:00"),  # bars 48-95, warm-up clips to 50
+        ("2024-01-06", "2024-01-08"),  # bars 120-168
+    ]
+
+    @pytest.fixture
+    def slice_engine(self):
+        """Engine over 200 hourly bars whose model always says BUY."""
+        with patch(
+            "ktrdr.backtesting.engine.BacktestingEngine.__init__",
+            lambda self, config: None,
+        ):
+            from ktrdr.backtesting.engine import BacktestingEngine
+            from ktrdr.decision.base import Position, Signal, TradingDecision
+
+            engine = BacktestingEngine.__new__(BacktestingEngine)
+            engine._is_temporal = False
+            engine._sequence_length = 1
+            engine.config = _make_config(
+                start_date="2024-01-01", end_date="2024-01-09", slices=self.SLICES
+            )
+            engine.strategy_name = "test_strategy"
+            engine.bundle = _make_mock_bundle()
+            engine.bundle.metadata.context_data_config = None
+            engine._context_data = None
+            engine.feature_cache = MagicMock()
+            engine._data_versions = {}
+            engine.feature_cache.get_features_for_timestamp = MagicMock(
+                return_value={"feat_a": 0.5, "feat_b": 0.3}
+            )
+            engine.decide = MagicMock(
+                side_effect=lambda **kwargs: TradingDecision(
+                    signal=Signal.BUY,
+                    confidence=0.8,
+                    timestamp=kwargs["bar"].name,
+                    reasoning={},
+                    current_position=Position.FLAT,
+                )
+            )
+            engine.position_manager = MagicMock()
+            engine.performance_tracker = MagicMock()
+
+            dates = pd.date_range("2024-01-01", periods=200, freq="h")
+            data = pd.DataFrame(
+                {
+                    "open": [1.1 + i * 0.0001 for i in range(200)],
+                    "high": [1.12] * 200,
+                    "low": [1.08] * 200,
+                    "close": [1.1 + i * 0.0001 for i in range(200)],
+                    "volume": [1000] * 200,
+                },
+                index=dates,
+            )
+            engine._load_historical_data = MagicMock(return_value={"1h": data})
+            engine._get_base_timeframe = MagicMock(return_value="1h")
+            return engine
+
+    def test_loads_and_featurizes_once(self, slice_engine):
+        slice_engine.run_slices()
+
+        slice_engine._load_historical_data.assert_called_once()
+        slice_engine.feature_cache.compute_all_features.assert_called_once()
+        assert slice_engine.decide.call_count == 46 + 49
+
+    def test_each_slice_has_independent_state(self, slice_engine):
+        results = slice_engine.run_slices()
+
+        assert len(results.slices) == 2
+        first, second = results.slices
+        assert len(first.equity_curve) == 46
+        assert len(second.equity_curve) == 49
+        assert (first.config.start_date, first.config.end_date) == self.SLICES[0]
+        # Fresh PositionManager per slice: ids restart, trades stay in the slice
+        assert [t.trade_id for t in second.trades] == [1]
+        assert second.trades[0].entry_time == pd.Timestamp("2024-01-06 01:00")
+        assert second.trades[0].exit_time == pd.Timestamp("2024-01-08 00:00")
+
+    def test_to_dict_reports_slices(self, slice_engine):
+        summary = slice_engine.run_slices().to_dict()
+
+        assert summary["slice_count"] == 2
+        assert [s["config"]["start_date"] for s in summary["slices"]] == [
+            "2024-01-03",
+            "2024-01-06",
+        ]
+        assert all("metrics" in s for s in summary["slices"])
+
+    def test_slice_inside_warm_up_raises(self, slice_engine):
+        slice_engine.config.slices = [("2024-01-01", "2024-01-02")]
+
+        with pytest.raises(ValueError, match="Insufficient data for slice"):
+            slice_engine.run_slices()
@@ -0,0 +1,146 @@
+"""Unit tests for the process-wide ModelRegistry."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ktrdr.backtesting.model_bundle import ModelBundle
+from ktrdr.backtesting.model_registry import ModelRegistry, get_model_registry
+
+
+def _make_model_dir(root: Path, name: str = "model") -> Path:
+    model_dir = root / name
+    model_dir.mkdir()
+    (model_dir / "model.pt").write_bytes(b"weights")
+    (model_dir / "metadata_v3.json").write_text("{}")
+    return model_dir
+
+
+@pytest.fixture
+def mock_load():
+    """Patch the uncached load path; each call returns a fresh bundle mock."""
+    with patch.object(
+        ModelBundle, "load", side_effect=lambda path, use_cache=True: MagicMock()
+    ) as mocked:
+        yield mocked
+
+
+class TestModelRegistry:
+    def test_second_get_is_cache_hit(self, tmp_path: Path, mock_load: MagicMock):
+        registry = ModelRegistry()
+        model_dir = _make_model_dir(tmp_path)
+
+        first = registry.get(model_dir)
+        second = registry.get(str(model_dir))
+
+        assert first is second
+        mock_load.assert_called_once_with(model_dir, use_cache=False)
+        assert registry.stats()["hits"] == 1
+        assert registry.stats()["misses"] == 1
+
+    def test_changed_weights_reload(self, tmp_path: Path, mock_load: MagicMock):
+        registry = ModelRegistry()
+        model_dir = _make_model_dir(tmp_path)
+
+        first = registry.get(model_dir)
+        weights = model_dir / "model.pt"
+        weights.write_bytes(b"retrained weights")
+        stat = weights.stat()
+        os.utime(weights, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = registry.get(model_dir)
+
+        assert first is not second
+        assert mock_load.call_count == 2
+        # Stale version replaced, not kept alongside
+        assert registry.stats()["entries"] == 1
+
+    def test_lru_eviction(self, tmp_path: Path, mock_load: MagicMock):
+        registry = ModelRegistry(max_entries=2)
+        a, b, c = (_make_model_dir(tmp_path, n) for n in ("a", "b", "c"))
+
+        registry.get(a)
+        registry.get(b)
+        registry.get(a)  # a is now most recently used
+        registry.get(c)  # evicts b
+
+        assert registry.stats()["evictions"] == 1
+        registry.get(a)
+        assert mock_load.call_count == 3
+        registry.get(b)
+        assert mock_load.call_count == 4
+
+    def test_missing_directory_bypasses_cache(self, tmp_path: Path):
+        registry = ModelRegistry()
+        with pytest.raises(FileNotFoundError):
+            registry.get(tmp_path / "nonexistent")
+        assert registry.stats()["entries"] == 0
+
+    def test_failed_load_is_not_cached(self, tmp_path: Path):
+        registry = ModelRegistry()
+        model_dir = _make_model_dir(tmp_path)
+        with patch.object(ModelBundle, "load", side_effect=RuntimeError("corrupt")):
+            with pytest.raises(RuntimeError):
+                registry.get(model_dir)
+        assert registry.stats()["entries"] == 0
+
+    def test_concurrent_gets_share_one_load(self, tmp_path: Path):
+        registry = ModelRegistry()
+        model_dir = _make_model_dir(tmp_path)
+        calls = []
+
+        def slow_load(path, use_cache=True):
+            calls.append(path)
+            time.sleep(0.05)
+            return MagicMock()
+
+        results = []
+        with patch.object(ModelBundle, "load", side_effect=slow_load):
+            threads = [
+                threading.Thread(target=lambda: results.append(registry.get(model_dir)))
+                for _ in range(5)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_loaded_model_gradients_disabled(
+        self, tmp_path: Path, mock_load: MagicMock
+    ):
+        registry = ModelRegistry()
+        param = MagicMock()
+        bundle = MagicMock()
+        bundle.model.parameters.return_value = [param]
+        mock_load.side_effect = None
+        mock_load.return_value = bundle
+
+        registry.get(_make_model_dir(tmp_path))
+
+        param.requires_grad_.assert_called_once_with(False)
+
+    def test_invalidate(self, tmp_path: Path, mock_load: MagicMock):
+        registry = ModelRegistry()
+        a, b = _make_model_dir(tmp_path, "a"), _make_model_dir(tmp_path, "b")
+        registry.get(a)
+        registry.get(b)
+
+        assert registry.invalidate(a) == 1
+        assert registry.invalidate() == 1
+        assert registry.stats()["entries"] == 0
+
+
+class TestModelBundleLoadUsesRegistry:
+    def test_load_delegates_to_process_registry(self, tmp_path: Path):
+        model_dir = tmp_path / "m"
+        with patch.object(get_model_registry(), "get") as mock_get:
+            ModelBundle.load(model_dir)
+        mock_get.assert_called_once_with(model_dir)
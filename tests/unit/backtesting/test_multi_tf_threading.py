@@ -20,7 +20,7 @@ class TestBacktestingServiceTimeframes:
         worker.endpoint_url = "http://localhost:5003"
 
         registry = MagicMock()
-        registry.select_worker.return_value = worker
+        registry.acquire_worker = AsyncMock(return_value=worker)
         registry.list_workers.return_value = [worker]
         return registry
 
@@ -100,6 +100,7 @@ def _make_engine(data=None, decision_sequence=None):
 
         # Feature cache — returns features for all timestamps
         engine.feature_cache = MagicMock()
+        engine._data_versions = {}
         engine.feature_cache.get_features_for_timestamp = MagicMock(
             return_value={"feat_a": 0.5, "feat_b": 0.3}
         )
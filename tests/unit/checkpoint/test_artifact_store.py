@@ -0,0 +1,192 @@
+"""Unit tests for the chunked checkpoint artifact store."""
+
+import io
+import json
+import os
+
+import pytest
+import torch
+
+from ktrdr.checkpoint.artifact_store import (
+    CHUNKS_DIRNAME,
+    MANIFEST_FILENAME,
+    ChunkedArtifactStore,
+)
+
+
+def serialized_state(size: int = 256) -> tuple[dict, bytes]:
+    """A state dict and its torch.save bytes."""
+    state = {"weight": torch.arange(size, dtype=torch.float32)}
+    buffer = io.BytesIO()
+    torch.save(state, buffer)
+    return state, buffer.getvalue()
+
+
+@pytest.fixture
+def store():
+    """Store with small chunks so tests span several of them."""
+    return ChunkedArtifactStore(chunk_size=16)
+
+
+class TestChunkedArtifactStore:
+    def test_round_trip(self, store, tmp_path):
+        artifacts = {"model.pt": os.urandom(100), "empty.pt": b""}
+
+        stats = store.write(tmp_path / "op_1", artifacts)
+
+        assert store.read(tmp_path / "op_1") == artifacts
+        assert stats.total_bytes == 100
+        assert stats.chunks == stats.chunks_written == 7
+
+    def test_unchanged_chunks_are_reused(self, store, tmp_path):
+        directory = tmp_path / "op_1"
+        best = os.urandom(64)
+        model = bytearray(os.urandom(64))
+        store.write(directory, {"model.pt": bytes(model), "best_model.pt": best})
+
+        model[0:4] = b"\x00\x01\x02\x03"  # only the first chunk changes
+        stats = store.write(
+            directory, {"model.pt": bytes(model), "best_model.pt": best}
+        )
+
+        assert stats.chunks == 8
+        assert stats.chunks_written == 1
+        assert stats.chunks_reused == 7
+        assert stats.chunks_removed == 1
+        assert len(list((directory / CHUNKS_DIRNAME).iterdir())) == 8
+        assert store.read(directory)["model.pt"] == bytes(model)
+
+    def test_identical_artifacts_share_chunks(self, store, tmp_path):
+        data = os.urandom(48)
+
+        stats = store.write(tmp_path / "op_1", {"model.pt": data, "best.pt": data})
+
+        assert stats.chunks == 6
+        assert stats.chunks_written == 3
+
+    def test_zlib_compression(self, tmp_path):
+        store = ChunkedArtifactStore(chunk_size=1024, compression="zlib")
+        artifacts = {"model.pt": b"\x00" * 4096, "noise.pt": os.urandom(1024)}
+
+        stats = store.write(tmp_path / "op_1", artifacts)
+
+        names = {p.name for p in (tmp_path / "op_1" / CHUNKS_DIRNAME).iterdir()}
+        assert any(name.endswith(".zlib") for name in names)
+        # Incompressible chunks are stored raw
+        assert any("." not in name for name in names)
+        assert stats.bytes_written < stats.total_bytes
+        # Any store can read compressed chunks
+        assert ChunkedArtifactStore().read(tmp_path / "op_1") == artifacts
+
+    def test_unavailable_codec_falls_back(self, monkeypatch):
+        monkeypatch.setattr(
+            "ktrdr.checkpoint.artifact_store._load_codec", lambda name: None
+        )
+
+        assert ChunkedArtifactStore(compression="zstd").compression == "none"
+
+    def test_unknown_codec_rejected(self):
+        with pytest.raises(ValueError, match="Compression"):
+            ChunkedArtifactStore(compression="brotli")
+
+    def test_corrupted_chunk_detected(self, store, tmp_path):
+        directory = tmp_path / "op_1"
+        store.write(directory, {"model.pt": os.urandom(32)})
+        chunk = next((directory / CHUNKS_DIRNAME).iterdir())
+        chunk.write_bytes(b"x" * 16)
+
+        with pytest.raises(ValueError, match="does not match"):
+            store.read(directory)
+
+    def test_missing_chunk_detected(self, store, tmp_path):
+        directory = tmp_path / "op_1"
+        store.write(directory, {"model.pt": os.urandom(32)})
+        next((directory / CHUNKS_DIRNAME).iterdir()).unlink()
+
+        with pytest.raises(FileNotFoundError):
+            store.read(directory)
+
+    def test_legacy_flat_layout(self, store, tmp_path):
+        directory = tmp_path / "op_1"
+        directory.mkdir()
+        (directory / "model.pt").write_bytes(b"old_weights")
+
+        assert store.read(directory) == {"model.pt": b"old_weights"}
+
+        # Writing converts the directory to the chunked layout
+        store.write(directory, {"model.pt": b"new_weights"})
+        assert not (directory / "model.pt").exists()
+        manifest = json.loads((directory / MANIFEST_FILENAME).read_text())
+        assert manifest["artifacts"]["model.pt"]["size"] == len(b"new_weights")
+
+
+class TestLazyArtifacts:
+    def test_open_reads_manifest_only(self, store, tmp_path):
+        directory = tmp_path / "op_1"
+        store.write(directory, {"model.pt": os.urandom(40), "best.pt": b"b"})
+        for chunk in (directory / CHUNKS_DIRNAME).iterdir():
+            chunk.unlink()
+
+        artifacts = store.open(directory)
+
+        assert set(artifacts) == {"model.pt", "best.pt"}
+        assert artifacts.size("model.pt") == 40
+        with pytest.raises(FileNotFoundError):
+            artifacts["model.pt"]
+
+    def test_stream_seeks_across_chunks(self, store, tmp_path):
+        data = os.urandom(100)
+        store.write(tmp_path / "op_1", {"model.pt": data})
+
+        with store.open(tmp_path / "op_1").handle("model.pt").open() as stream:
+            stream.seek(30)
+            assert stream.read(20) == data[30:50]
+            stream.seek(-5, io.SEEK_END)
+            assert stream.read() == data[-5:]
+
+    @pytest.mark.parametrize("chunk_size", [64, 1 << 20])
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_torch_load(self, tmp_path, chunk_size, mmap):
+        state, data = serialized_state()
+        store = ChunkedArtifactStore(chunk_size=chunk_size)
+        store.write(tmp_path / "op_1", {"model.pt": data})
+
+        handle = store.open(tmp_path / "op_1").handle("model.pt")
+        # Single uncompressed chunks can be memory-mapped
+        assert (handle.local_path() is not None) == (chunk_size > len(data))
+
+        loaded = handle.torch_load(weights_only=True, mmap=mmap)
+        assert torch.equal(loaded["weight"], state["weight"])
+
+    def test_torch_load_compressed(self, tmp_path):
+        state = {"weight": torch.zeros(4096)}
+        buffer = io.BytesIO()
+        torch.save(state, buffer)
+        store = ChunkedArtifactStore(chunk_size=1 << 20, compression="zlib")
+        store.write(tmp_path / "op_1", {"model.pt": buffer.getvalue()})
+
+        handle = store.open(tmp_path / "op_1").handle("model.pt")
+
+        assert handle.local_path() is None
+        assert torch.equal(handle.torch_load()["weight"], state["weight"])
+
+    def test_mmap_load_verifies_chunk(self, tmp_path):
+        _, data = serialized_state()
+        store = ChunkedArtifactStore(chunk_size=1 << 20)
+        store.write(tmp_path / "op_1", {"model.pt": data})
+        handle = store.open(tmp_path / "op_1").handle("model.pt")
+        handle.local_path().write_bytes(data[:-1] + b"x")
+
+        with pytest.raises(ValueError, match="does not match"):
+            handle.torch_load()
+
+    def test_legacy_file_is_loaded_in_place(self, store, tmp_path):
+        state, data = serialized_state()
+        directory = tmp_path / "op_1"
+        directory.mkdir()
+        (directory / "model.pt").write_bytes(data)
+
+        handle = store.open(directory).handle("model.pt")
+
+        assert handle.local_path() == directory / "model.pt"
+        assert torch.equal(handle.torch_load()["weight"], state["weight"])
@@ -80,7 +80,7 @@ class TestCheckpointServiceSave:
     async def test_save_writes_artifacts_atomically(
         self, service, mock_session, temp_artifacts_dir
     ):
-        """save_checkpoint should write artifacts atomically using temp directory."""
+        """save_checkpoint should write artifacts as chunks behind a manifest."""
         state = {"epoch": 10}
         artifacts = {
             "model.pt": b"model_weights_data",
@@ -96,13 +96,11 @@ class TestCheckpointServiceSave:
 
         # Verify artifacts were written to final location
         artifact_path = temp_artifacts_dir / "op_test_123"
-        assert artifact_path.exists()
-        assert (artifact_path / "model.pt").read_bytes() == b"model_weights_data"
-        assert (artifact_path / "optimizer.pt").read_bytes() == b"optimizer_state_data"
+        assert (artifact_path / "manifest.json").exists()
+        assert service._store.read(artifact_path) == artifacts
 
-        # Verify no temp directory left behind
-        temp_path = temp_artifacts_dir / "op_test_123.tmp"
-        assert not temp_path.exists()
+        # Verify no temp files left behind
+        assert not list(temp_artifacts_dir.rglob("*.tmp"))
 
     @pytest.mark.asyncio
     async def test_save_overwrites_existing_artifacts(
@@ -124,8 +122,9 @@ class TestCheckpointServiceSave:
         )
 
         # Verify new artifacts replaced old
-        assert (artifact_path / "model.pt").read_bytes() == b"new_weights"
-        # Old file should be gone
+        assert service._store.read(artifact_path) == {"model.pt": b"new_weights"}
+        # Old files should be gone
+        assert not (artifact_path / "model.pt").exists()
         assert not (artifact_path / "old_file.pt").exists()
 
     @pytest.mark.asyncio
@@ -0,0 +1,120 @@
+"""Unit tests for BackgroundCheckpointWriter."""
+
+import asyncio
+import threading
+
+import pytest
+
+from ktrdr.checkpoint.checkpoint_writer import BackgroundCheckpointWriter
+
+
+class RecordingService:
+    """Checkpoint service stand-in that records saves."""
+
+    def __init__(self):
+        self.saves = []
+
+    async def save_checkpoint(self, operation_id, checkpoint_type, state, artifacts):
+        self.saves.append((operation_id, checkpoint_type, state, artifacts))
+
+
+class TestBackgroundCheckpointWriter:
+    @pytest.mark.asyncio
+    async def test_saves_on_main_loop(self):
+        service = RecordingService()
+        writer = BackgroundCheckpointWriter(service, asyncio.get_running_loop())
+
+        writer.submit("op_1", "periodic", lambda: ({"epoch": 1}, {"model.pt": b"m"}))
+        assert await writer.drain(timeout=5)
+
+        assert service.saves == [("op_1", "periodic", {"epoch": 1}, {"model.pt": b"m"})]
+        assert writer.stats()["saved"] == 1
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_newest_pending_checkpoint_wins(self):
+        service = RecordingService()
+        writer = BackgroundCheckpointWriter(service, asyncio.get_running_loop())
+        release = threading.Event()
+
+        def slow_build():
+            release.wait(5)
+            return {"epoch": 1}, None
+
+        writer.submit("op_1", "periodic", slow_build)
+        await asyncio.sleep(0.05)  # let the writer pick up epoch 1
+        writer.submit("op_1", "periodic", lambda: ({"epoch": 2}, None))
+        writer.submit("op_1", "periodic", lambda: ({"epoch": 3}, None))
+        release.set()
+        assert await writer.drain(timeout=5)
+
+        assert [save[2]["epoch"] for save in service.saves] == [1, 3]
+        assert writer.stats()["superseded"] == 1
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_can_discard_pending(self):
+        service = RecordingService()
+        writer = BackgroundCheckpointWriter(service, asyncio.get_running_loop())
+        release = threading.Event()
+
+        def slow_build():
+            release.wait(5)
+            return {"epoch": 1}, None
+
+        writer.submit("op_1", "periodic", slow_build)
+        await asyncio.sleep(0.05)
+        writer.submit("op_1", "periodic", lambda: ({"epoch": 2}, None))
+        release.set()
+        await writer.aclose(timeout=5, discard_pending=True)
+
+        assert [save[2]["epoch"] for save in service.saves] == [1]
+        # Closed writers drop new checkpoints
+        writer.submit("op_1", "periodic", lambda: ({"epoch": 3}, None))
+        assert await writer.drain(timeout=1)
+        assert len(service.saves) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_build_is_counted(self):
+        writer = BackgroundCheckpointWriter(
+            RecordingService(), asyncio.get_running_loop()
+        )
+
+        def broken_build():
+            raise RuntimeError("serialization failed")
+
+        writer.submit("op_1", "periodic", broken_build)
+        assert await writer.drain(timeout=5)
+
+        assert writer.stats()["failed"] == 1
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_timed_out_save_is_cancelled_before_drain_returns(self):
+        class HangingService:
+            def __init__(self):
+                self.cancelled = asyncio.Event()
+                self.stopped = False
+
+            async def save_checkpoint(self, **kwargs):
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    self.cancelled.set()
+                    # Cleanup after the cancel request still takes a while
+                    await asyncio.shield(asyncio.sleep(0.2))
+                    self.stopped = True
+                    raise
+
+        service = HangingService()
+        writer = BackgroundCheckpointWriter(
+            service, asyncio.get_running_loop(), save_timeout=0.1
+        )
+        writer.submit("op_1", "periodic", lambda: ({"epoch": 1}, None))
+
+        await asyncio.wait_for(service.cancelled.wait(), 5)
+        assert writer.stats()["busy"]
+        assert await writer.drain(timeout=5)
+        assert service.stopped
+        assert writer.stats()["failed"] == 1
+        await writer.aclose()
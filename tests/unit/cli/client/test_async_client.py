@@ -499,3 +499,44 @@ class TestAsyncCLIClientExecuteOperation:
             assert "adapter" in params
             assert "on_progress" in params
             assert "poll_interval" in params
+
+
+class TestStreamOperationEvents:
+    """Tests for SSE operation event streaming."""
+
+    @pytest.mark.asyncio
+    @patch("ktrdr.cli.client.async_client.resolve_url")
+    async def test_parses_events_and_keepalives(self, mock_resolve):
+        mock_resolve.return_value = "http://localhost:8000/api/v1"
+        body = (
+            'id: 0\nevent: snapshot\ndata: {"operation_id": "op_1", "status": "running"}\n\n'
+            ": keepalive\n\n"
+            'id: 4\nevent: terminal\ndata: {"operation_id": "op_1", "status": "completed"}\n\n'
+        )
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text=body)
+
+        client = AsyncCLIClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        events = [e async for e in client.stream_operation_events(["op_1", "op_2"])]
+
+        assert [e["event"] for e in events] == ["snapshot", "keepalive", "terminal"]
+        assert events[2]["data"]["status"] == "completed"
+        assert requests[0].url.params.get_list("operation_id") == ["op_1", "op_2"]
+
+    @pytest.mark.asyncio
+    @patch("ktrdr.cli.client.async_client.resolve_url")
+    async def test_error_status_raises_api_error(self, mock_resolve):
+        mock_resolve.return_value = "http://localhost:8000/api/v1"
+        client = AsyncCLIClient()
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(404, json={"detail": "Not Found"})
+            )
+        )
+        with pytest.raises(APIError):
+            async for _ in client.stream_operation_events(["op_1"]):
+                pass
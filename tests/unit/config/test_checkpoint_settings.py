@@ -136,6 +136,18 @@ class TestCheckpointSettingsValidation:
                 CheckpointSettings()
             assert "greater than 0" in str(exc_info.value)
 
+    def test_unknown_compression_raises_error(self):
+        """Unknown artifact compression codec should raise validation error."""
+        with patch.dict(os.environ, {"KTRDR_CHECKPOINT_COMPRESSION": "brotli"}):
+            with pytest.raises(ValidationError) as exc_info:
+                CheckpointSettings()
+            assert "Compression must be one of" in str(exc_info.value)
+
+    def test_compression_is_case_insensitive(self):
+        """Compression codec names should be normalized to lower case."""
+        with patch.dict(os.environ, {"KTRDR_CHECKPOINT_COMPRESSION": "ZSTD"}):
+            assert CheckpointSettings().compression == "zstd"
+
     def test_empty_dir_is_allowed(self):
         """Empty directory string should be allowed (may be valid for some configs)."""
         # Note: We don't validate directory existence at config time
@@ -343,3 +343,36 @@ class TestClearSettingsCache:
         # Get new instance - should be different object
         settings2 = get_db_settings()
         assert settings1 is not settings2
+
+
+class TestDatabaseSettingsPool:
+    """Test connection pool and statement cache settings."""
+
+    def setup_method(self):
+        clear_settings_cache()
+
+    def teardown_method(self):
+        clear_settings_cache()
+
+    def test_pool_defaults(self):
+        """Pool defaults should match SQLAlchemy's QueuePool defaults."""
+        settings = DatabaseSettings()
+        assert settings.pool_size == 5
+        assert settings.max_overflow == 10
+        assert settings.statement_cache_size == 100
+
+    def test_pool_from_env(self):
+        """Pool sizing and statement cache should be configurable."""
+        with patch.dict(
+            os.environ,
+            {"KTRDR_DB_POOL_SIZE": "20", "KTRDR_DB_STATEMENT_CACHE_SIZE": "0"},
+        ):
+            settings = DatabaseSettings()
+            assert settings.pool_size == 20
+            assert settings.statement_cache_size == 0
+
+    def test_pool_size_must_be_positive(self):
+        """A zero pool size should be rejected."""
+        with patch.dict(os.environ, {"KTRDR_DB_POOL_SIZE": "0"}):
+            with pytest.raises(ValidationError):
+                DatabaseSettings()
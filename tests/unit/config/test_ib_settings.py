@@ -283,6 +283,19 @@ class TestIBSettingsValidation:
                 IBSettings()
             assert "rate_limit" in str(exc_info.value).lower()
 
+    def test_response_cache_mode_is_validated(self):
+        """KTRDR_IB_RESPONSE_CACHE_MODE must be off, read_write or replay."""
+        with patch.dict(
+            os.environ, {"KTRDR_IB_RESPONSE_CACHE_MODE": "Replay"}, clear=False
+        ):
+            assert IBSettings().response_cache_mode == "replay"
+        with patch.dict(
+            os.environ, {"KTRDR_IB_RESPONSE_CACHE_MODE": "sometimes"}, clear=False
+        ):
+            with pytest.raises(ValidationError) as exc_info:
+                IBSettings()
+            assert "response_cache_mode" in str(exc_info.value).lower()
+
 
 class TestIBSettingsHelperMethods:
     """Test helper methods on IBSettings."""
@@ -0,0 +1,69 @@
+"""Tests for the binary columnar OHLCV wire format."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ktrdr.data.bar_codec import decode_bars, encode_bars
+from ktrdr.errors import DataFormatError
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, 500))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.integers(0, 10_000, 500),
+        },
+        index=pd.date_range("2024-01-01", periods=500, freq="5min", tz="UTC"),
+    )
+
+
+class TestBarCodec:
+    def test_round_trip_is_exact(self, bars):
+        decoded = decode_bars(encode_bars(bars))
+
+        pd.testing.assert_frame_equal(decoded, bars.astype(float), check_freq=False)
+        assert str(decoded.index.tz) == "UTC"
+
+    def test_payload_is_smaller_than_json(self, bars):
+        payload = encode_bars(bars)
+
+        assert len(payload) < len(bars.to_json(orient="index", date_format="iso"))
+
+    def test_naive_and_converted_indexes_are_utc(self, bars):
+        naive = bars.tz_convert(None)
+        eastern = bars.tz_convert("America/New_York")
+
+        for frame in (naive, eastern):
+            decoded = decode_bars(encode_bars(frame))
+            assert decoded.index.equals(bars.index)
+
+    def test_empty_frame(self):
+        empty = pd.DataFrame(
+            {"open": [], "close": []}, index=pd.DatetimeIndex([], tz="UTC")
+        )
+
+        decoded = decode_bars(encode_bars(empty))
+
+        assert decoded.empty
+        assert list(decoded.columns) == ["open", "close"]
+
+    def test_rejects_non_datetime_index(self, bars):
+        with pytest.raises(DataFormatError):
+            encode_bars(bars.reset_index(drop=True))
+
+    def test_rejects_malformed_payloads(self, bars):
+        payload = encode_bars(bars)
+
+        with pytest.raises(DataFormatError):
+            decode_bars(payload[:-8])
+        with pytest.raises(DataFormatError):
+            decode_bars(b"JSON" + payload[4:])
+        with pytest.raises(DataFormatError):
+            decode_bars(b"KT")
@@ -13,6 +13,7 @@ import unittest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pandas as pd
 
 from ktrdr.async_infrastructure.service_adapter import (
@@ -26,6 +27,7 @@ from ktrdr.data.acquisition.external_data_interface import (
     ExternalDataProvider,
 )
 from ktrdr.data.acquisition.ib_data_provider import IbDataProvider
+from ktrdr.data.bar_codec import BAR_CONTENT_TYPE, encode_bars
 
 
 class TestIbDataProviderInitialization(unittest.TestCase):
@@ -158,16 +160,22 @@ class TestIbDataProviderFetchHistoricalData(unittest.TestCase):
                     )
 
                     # Should call host service with correct parameters
-                    mock_post.assert_called_once_with(
-                        "/data/historical",
-                        {
-                            "symbol": "AAPL",
-                            "timeframe": "1h",
-                            "start": start.isoformat(),
-                            "end": end.isoformat(),
-                            "instrument_type": None,
-                        },
+                    mock_post.assert_called_once()
+                    args, kwargs = mock_post.call_args
+                    self.assertEqual(
+                        args,
+                        (
+                            "/data/historical",
+                            {
+                                "symbol": "AAPL",
+                                "timeframe": "1h",
+                                "start": start.isoformat(),
+                                "end": end.isoformat(),
+                                "instrument_type": None,
+                            },
+                        ),
                     )
+                    self.assertIn(BAR_CONTENT_TYPE, kwargs["headers"]["Accept"])
 
                     # Should return DataFrame
                     self.assertIsInstance(result, pd.DataFrame)
@@ -181,6 +189,60 @@ class TestIbDataProviderFetchHistoricalData(unittest.TestCase):
 
         asyncio.run(test_async())
 
+    def test_fetch_historical_data_binary_and_json_responses(self):
+        """Test both wire formats decode to the same DataFrame."""
+        provider = IbDataProvider(host_service_url="http://localhost:5001")
+        bars = pd.DataFrame(
+            {
+                "open": [100.0, 101.0],
+                "high": [102.0, 103.0],
+                "low": [99.0, 100.0],
+                "close": [101.0, 102.0],
+                "volume": [1000.0, 1100.0],
+            },
+            index=pd.DatetimeIndex(["2023-01-01 10:00", "2023-01-01 11:00"], tz="UTC"),
+        )
+        seen_accept = []
+
+        def binary_handler(request: httpx.Request) -> httpx.Response:
+            seen_accept.append(request.headers["accept"])
+            return httpx.Response(
+                200,
+                content=encode_bars(bars),
+                headers={"content-type": BAR_CONTENT_TYPE},
+            )
+
+        def json_handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "data": bars.to_json(orient="index", date_format="iso"),
+                    "rows": 2,
+                },
+            )
+
+        async def fetch(handler):
+            async with provider:
+                provider._http_client = httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                )
+                return await provider.fetch_historical_data(
+                    "AAPL",
+                    "1h",
+                    datetime(2023, 1, 1, tzinfo=timezone.utc),
+                    datetime(2023, 1, 2, tzinfo=timezone.utc),
+                )
+
+        binary = asyncio.run(fetch(binary_handler))
+        pd.testing.assert_frame_equal(binary, bars)
+        self.assertIn(BAR_CONTENT_TYPE, seen_accept[0])
+
+        fallback = asyncio.run(fetch(json_handler))
+        pd.testing.assert_frame_equal(
+            fallback, bars, check_dtype=False, check_freq=False
+        )
+
     def test_fetch_historical_data_failure(self):
         """Test historical data fetch failure raises DataProviderDataError."""
         provider = IbDataProvider()
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
 from datetime import date
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 
 from ktrdr.evolution.config import DateRange, EvolutionConfig
@@ -327,6 +329,74 @@ class TestGenerationHarnessPoll:
         assert results[0]["fitness"] == MINIMUM_FITNESS
 
 
+def _sse_client(
+    operation: dict[str, Any], stream_status: int = 200
+) -> tuple[httpx.AsyncClient, list[str]]:
+    """Real httpx client whose /operations/stream reports ``operation`` terminal.
+
+    When the stream fails, the first status poll still answers "running".
+    """
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/operations/stream"):
+            if stream_status != 200:
+                return httpx.Response(stream_status, json={"detail": "unavailable"})
+            body = (
+                'event: snapshot\ndata: {"status": "running"}\n\n'
+                ": keepalive\n\n"
+                f'event: terminal\ndata: {{"status": "{operation["status"]}"}}\n\n'
+            )
+            return httpx.Response(
+                200, text=body, headers={"content-type": "text/event-stream"}
+            )
+        polls = sum(not path.endswith("/stream") for path in requests)
+        if stream_status != 200 and polls == 1:
+            return httpx.Response(200, json={"data": {"status": "running"}})
+        return httpx.Response(200, json={"success": True, "data": operation})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+class TestGenerationHarnessEventStream:
+    """Tests for waiting on the operations event stream."""
+
+    @pytest.mark.asyncio
+    async def test_waits_on_stream_instead_of_polling(
+        self, tracker: EvolutionTracker
+    ) -> None:
+        """A terminal stream event is followed by a single status fetch."""
+        config = EvolutionConfig(poll_interval=30, fitness_slices=_SINGLE_SLICE)
+        client, requests = _sse_client(_make_completed_operation("op_000"))
+        harness = GenerationHarness(config=config, tracker=tracker, http_client=client)
+
+        op = await asyncio.wait_for(harness._poll_until_terminal("op_000"), 5)
+
+        assert op is not None and op["status"] == "completed"
+        assert requests == [
+            "/api/v1/operations/stream",
+            "/api/v1/operations/op_000",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_when_stream_unavailable(
+        self, config: EvolutionConfig, tracker: EvolutionTracker
+    ) -> None:
+        """A failed stream leaves the wait to the polling loop."""
+        client, requests = _sse_client(
+            _make_failed_operation("op_000"), stream_status=404
+        )
+        harness = GenerationHarness(config=config, tracker=tracker, http_client=client)
+
+        assert await harness._poll_until_terminal("op_000") is None
+        assert requests == [
+            "/api/v1/operations/stream",
+            "/api/v1/operations/op_000",
+            "/api/v1/operations/op_000",
+        ]
+
+
 class TestGenerationHarnessFullRun:
     """Tests for full run_generation flow."""
 
@@ -866,6 +936,10 @@ class TestHarnessAdditionalBacktests:
             seed=42,
             poll_interval=0,
             fitness_slices=list(_THREE_SLICES),
+            # Serial per-slice backtests keep the ordered mock responses
+            # deterministic
+            max_concurrent_backtests=1,
+            batch_fitness_slices=False,
         )
 
     def _single_researcher(self) -> list[Researcher]:
@@ -1206,6 +1280,8 @@ class TestAdditionalBacktestPayload:
                 DateRange(date(2022, 7, 1), date(2023, 12, 31)),
                 DateRange(date(2024, 1, 1), date(2025, 6, 30)),
             ],
+            max_concurrent_backtests=1,
+            batch_fitness_slices=False,
         )
 
     def _single_researcher(self) -> list[Researcher]:
@@ -1291,3 +1367,308 @@ class TestAdditionalBacktestPayload:
 
         bt_json = mock_client.post.call_args_list[1][1]["json"]
         assert bt_json["symbol"] == "EURUSD"
+
+
+class _RoutedClient:
+    """Fake HTTP client that answers by URL, so call order doesn't matter.
+
+    Research operation ``op_research_<n>`` takes ``research_delays[n]``
+    seconds and reports sharpe ``1 + n / 10``. Backtests take
+    ``backtest_delay`` seconds; peak concurrency is recorded for both.
+    """
+
+    def __init__(
+        self,
+        research_delays: list[float],
+        backtest_delay: float = 0.02,
+        workers: int | Exception = 2,
+    ) -> None:
+        self.research_delays = research_delays
+        self.backtest_delay = backtest_delay
+        self.workers = workers
+        self._triggered = 0
+        self._backtests = 0
+        self.active_research = self.peak_research = 0
+        self.active_backtests = self.peak_backtests = 0
+
+    async def post(self, url: str, **kwargs: Any) -> dict[str, Any]:
+        if url.endswith("/agent/trigger"):
+            op_id = f"op_research_{self._triggered}"
+            self._triggered += 1
+            return _make_trigger_response(op_id)
+        self._backtests += 1
+        self.active_backtests += 1
+        self.peak_backtests = max(self.peak_backtests, self.active_backtests)
+        start = kwargs["json"]["start_date"]
+        return _make_backtest_start_response(f"op_bt_{start}_{self._backtests}")
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        if url.endswith("/workers"):
+            if isinstance(self.workers, Exception):
+                raise self.workers
+            return {
+                "success": True,
+                "data": [{"worker_type": "backtesting"}] * self.workers,
+            }
+        op_id = url.rsplit("/", 1)[1]
+        if op_id.startswith("op_bt_"):
+            await asyncio.sleep(self.backtest_delay)
+            self.active_backtests -= 1
+            return _make_backtest_completed(op_id, sharpe=0.5)
+        index = int(op_id.rsplit("_", 1)[1])
+        self.active_research += 1
+        self.peak_research = max(self.peak_research, self.active_research)
+        await asyncio.sleep(self.research_delays[index])
+        self.active_research -= 1
+        return _make_completed_operation(op_id, sharpe=1 + index / 10)
+
+
+class TestConcurrentScoring:
+    """Researchers are scored concurrently; slices fan out up to capacity."""
+
+    def _population(self, size: int) -> list[Researcher]:
+        return [
+            Researcher(id=f"r_g00_{i:03d}", genome=Genome(), generation=0)
+            for i in range(size)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_researchers_polled_concurrently_results_in_order(
+        self, config: EvolutionConfig, tracker: EvolutionTracker
+    ) -> None:
+        # Later researchers finish first
+        client = _RoutedClient(research_delays=[0.06, 0.04, 0.02])
+        harness = GenerationHarness(config=config, tracker=tracker, http_client=client)
+
+        results = await harness.run_generation(0, self._population(3))
+
+        assert client.peak_research == 3
+        assert [r["researcher_id"] for r in results] == [
+            "r_g00_000",
+            "r_g00_001",
+            "r_g00_002",
+        ]
+        sharpes = [r["backtest_result"]["sharpe_ratio"] for r in results]
+        assert sharpes == [1.0, 1.1, 1.2]
+
+    @pytest.mark.asyncio
+    async def test_slices_bounded_by_backtest_workers(
+        self, tracker: EvolutionTracker
+    ) -> None:
+        config = EvolutionConfig(
+            population_size=3,
+            generations=1,
+            poll_interval=0,
+            fitness_slices=list(_THREE_SLICES),
+            batch_fitness_slices=False,
+        )
+        client = _RoutedClient(research_delays=[0.0, 0.0, 0.0], workers=3)
+        harness = GenerationHarness(config=config, tracker=tracker, http_client=client)
+
+        results = await harness.run_generation(0, self._population(3))
+
+        # 3 researchers x 2 extra slices = 6 backtests, at most 3 at a time
+        assert client.peak_backtests == 3
+        assert all(len(r["slice_results"]) == 3 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_backtest_slots_sized_once_under_concurrency(
+        self, tracker: EvolutionTracker
+    ) -> None:
+        config = EvolutionConfig(generations=1, poll_interval=0)
+        client = AsyncMock()
+
+        async def slow_workers(url: str, **kwargs: Any) -> Any:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=[{"worker_type": "backtesting"}] * 2)
+
+        client.get = AsyncMock(side_effect=slow_workers)
+        harness = GenerationHarness(config=config, tracker=tracker, http_client=client)
+
+        slots = await asyncio.gather(*(harness._backtest_slots() for _ in range(5)))
+
+        assert all(s is slots[0] for s in slots)
+        assert client.get.await_count == 1
+        assert slots[0]._value == 2
+
+    @pytest.mark.asyncio
+    async def test_configured_limit_skips_worker_discovery(
+        self, tracker: EvolutionTracker
+    ) -> None:
+        config = EvolutionConfig(
+            generations=1,
+            poll_interval=0,
+            fitness_slices=list(_THREE_SLICES),
+            max_concurrent_backtests=2,
+            batch_fitness_slices=False,
+        )
+        client = _RoutedClient(
+            research_delays=[0.0, 0.0], workers=RuntimeError("not used")
+        )
+        harness = GenerationHarness(config=config, tracker=tracker, http_client=client)
+
+        await harness.run_generation(0, self._population(2))
+
+        assert client.peak_backtests == 2
+
+    @pytest.mark.asyncio
+    async def test_worker_discovery_failure_runs_serially(
+        self, tracker: EvolutionTracker
+    ) -> None:
+        config = EvolutionConfig(
+            generations=1,
+            poll_interval=0,
+            fitness_slices=list(_THREE_SLICES),
+            batch_fitness_slices=False,
+        )
+        client = _RoutedClient(
+            research_delays=[0.0, 0.0], workers=RuntimeError("backend down")
+        )
+        harness = GenerationHarness(config=config, tracker=tracker, http_client=client)
+
+        results = await harness.run_generation(0, self._population(2))
+
+        assert client.peak_backtests == 1
+        assert all(len(r["slice_results"]) == 3 for r in results)
+
+
+def _make_sliced_backtest_completed(
+    op_id: str, sharpes: list[float | None]
+) -> dict[str, Any]:
+    """Completed multi-slice backtest (one entry per slice, None = no metrics)."""
+    return {
+        "operation_id": op_id,
+        "status": "completed",
+        "result_summary": {
+            "slice_count": len(sharpes),
+            "slices": [
+                (
+                    {
+                        "metrics": {
+                            "sharpe_ratio": sharpe,
+                            "max_drawdown": 0.1,
+                            "total_trades": 50,
+                        }
+                    }
+                    if sharpe is not None
+                    else {}
+                )
+                for sharpe in sharpes
+            ],
+        },
+    }
+
+
+class TestBatchedFitnessSlices:
+    """Additional slices run as one multi-slice backtest (the default)."""
+
+    @pytest.fixture
+    def three_slice_config(self) -> EvolutionConfig:
+        return EvolutionConfig(
+            population_size=2,
+            generations=1,
+            poll_interval=0,
+            fitness_slices=list(_THREE_SLICES),
+            max_concurrent_backtests=1,
+        )
+
+    def _single_researcher(self) -> list[Researcher]:
+        return [Researcher(id="r_g00_000", genome=Genome(), generation=0)]
+
+    @pytest.mark.asyncio
+    async def test_one_backtest_covers_all_additional_slices(
+        self, three_slice_config: EvolutionConfig, tmp_run_dir: Path
+    ) -> None:
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[
+                _make_trigger_response("op_research"),
+                _make_backtest_start_response("op_bt"),
+            ]
+        )
+        mock_client.get = AsyncMock(
+            side_effect=[
+                _make_completed_operation("op_research", sharpe=1.0),
+                _make_sliced_backtest_completed("op_bt", [0.8, 0.9]),
+            ]
+        )
+        harness = GenerationHarness(
+            config=three_slice_config,
+            tracker=EvolutionTracker(run_dir=tmp_run_dir),
+            http_client=mock_client,
+        )
+
+        results = await harness.run_generation(0, self._single_researcher())
+
+        assert mock_client.post.await_count == 2
+        payload = mock_client.post.call_args_list[1][1]["json"]
+        assert payload["start_date"] == "2022-07-01"
+        assert payload["end_date"] == "2025-06-30"
+        assert payload["slices"] == [
+            {"start_date": "2022-07-01", "end_date": "2023-12-31"},
+            {"start_date": "2024-01-01", "end_date": "2025-06-30"},
+        ]
+        assert payload["model_path"] == "/models/test"
+        sharpes = [r["sharpe_ratio"] for r in results[0]["slice_results"]]
+        assert sharpes == [1.0, 0.8, 0.9]
+
+    @pytest.mark.asyncio
+    async def test_slice_without_metrics_is_omitted(
+        self, three_slice_config: EvolutionConfig, tmp_run_dir: Path
+    ) -> None:
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[
+                _make_trigger_response("op_research"),
+                _make_backtest_start_response("op_bt"),
+            ]
+        )
+        mock_client.get = AsyncMock(
+            side_effect=[
+                _make_completed_operation("op_research", sharpe=1.0),
+                _make_sliced_backtest_completed("op_bt", [None, 0.9]),
+            ]
+        )
+        harness = GenerationHarness(
+            config=three_slice_config,
+            tracker=EvolutionTracker(run_dir=tmp_run_dir),
+            http_client=mock_client,
+        )
+
+        results = await harness.run_generation(0, self._single_researcher())
+
+        sharpes = [r["sharpe_ratio"] for r in results[0]["slice_results"]]
+        assert sharpes == [1.0, 0.9]
+
+    @pytest.mark.asyncio
+    async def test_failed_batched_backtest_is_retried(
+        self,
+        three_slice_config: EvolutionConfig,
+        tmp_run_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("ktrdr.evolution.harness.asyncio.sleep", AsyncMock())
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[
+                _make_trigger_response("op_research"),
+                _make_backtest_start_response("op_bt_fail"),
+                _make_backtest_start_response("op_bt_retry"),
+            ]
+        )
+        mock_client.get = AsyncMock(
+            side_effect=[
+                _make_completed_operation("op_research"),
+                _make_failed_operation("op_bt_fail"),
+                _make_sliced_backtest_completed("op_bt_retry", [0.8, 0.9]),
+            ]
+        )
+        harness = GenerationHarness(
+            config=three_slice_config,
+            tracker=EvolutionTracker(run_dir=tmp_run_dir),
+            http_client=mock_client,
+        )
+
+        results = await harness.run_generation(0, self._single_researcher())
+
+        assert len(results[0]["slice_results"]) == 3
@@ -0,0 +1,111 @@
+"""Tests for shared primitive computations across indicators."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ktrdr.indicators import INDICATOR_REGISTRY, IndicatorEngine, ensure_all_registered
+from ktrdr.indicators import computation_graph as graph
+from ktrdr.indicators.computation_graph import ComputationGraph
+
+
+@pytest.fixture(scope="module", autouse=True)
+def registered():
+    ensure_all_registered()
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.normal(0, 1, 300))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + rng.uniform(0, 2, 300),
+            "low": close - rng.uniform(0, 2, 300),
+            "close": close,
+            "volume": rng.integers(1, 1000, 300).astype(float),
+        },
+        index=pd.date_range("2024-01-01", periods=300, freq="1h"),
+    )
+
+
+class TestComputationGraph:
+    def test_helpers_match_pandas_without_a_graph(self, ohlcv):
+        pd.testing.assert_series_equal(
+            graph.rolling(ohlcv, "close", 20, "std"),
+            ohlcv["close"].rolling(20).std(),
+        )
+        pd.testing.assert_series_equal(
+            graph.ewm(ohlcv, "close", span=12, adjust=False),
+            ohlcv["close"].ewm(span=12, adjust=False).mean(),
+        )
+
+    def test_primitives_are_computed_once_per_frame(self, ohlcv):
+        computation = ComputationGraph(ohlcv)
+        with computation.activate():
+            first = graph.rolling(ohlcv, "close", 20, "mean")
+            second = graph.rolling(ohlcv, "close", 20, "mean", min_periods=20)
+            graph.rolling(ohlcv, graph.TRUE_RANGE, 14, "mean")
+            graph.ewm(ohlcv, graph.TRUE_RANGE, alpha=1 / 14, adjust=False)
+
+        assert first is second
+        report = computation.report()
+        assert report["primitives_requested"] == 6
+        assert report["primitives_computed"] == 4
+        assert report["by_operation"]["true_range"] == {"requested": 2, "computed": 1}
+
+    def test_other_frames_are_not_memoized(self, ohlcv):
+        computation = ComputationGraph(ohlcv)
+        other = ohlcv.iloc[:100]
+        with computation.activate():
+            result = graph.rolling(other, "close", 5, "max")
+
+        assert len(result) == 100
+        assert computation.report()["primitives_requested"] == 0
+
+
+class TestIndicatorEngineSharing:
+    CONFIG = {
+        "sma_20": {"type": "sma", "period": 20},
+        "bbands_20": {"type": "bbands", "period": 20},
+        "bbwidth_20": {"type": "bollingerbandwidth", "period": 20},
+        "ema_12": {"type": "ema", "period": 12, "adjust": False},
+        "macd": {"type": "macd"},
+        "atr_14": {"type": "atr", "period": 14},
+        "adx_14": {"type": "adx", "period": 14},
+        "atr_14_copy": {"type": "atr", "period": 14},
+    }
+
+    def test_shared_results_match_standalone_computation(self, ohlcv):
+        engine = IndicatorEngine(self.CONFIG)
+        result = engine.compute(ohlcv, set(self.CONFIG))
+
+        for indicator_id, definition in self.CONFIG.items():
+            params = {k: v for k, v in definition.items() if k != "type"}
+            expected = INDICATOR_REGISTRY.get(definition["type"])(**params).compute(
+                ohlcv
+            )
+            if isinstance(expected, pd.DataFrame):
+                for output in expected.columns:
+                    np.testing.assert_array_equal(
+                        result[f"{indicator_id}.{output}"], expected[output]
+                    )
+            else:
+                np.testing.assert_array_equal(result[indicator_id], expected)
+
+    def test_reports_deduplicated_work(self, ohlcv):
+        engine = IndicatorEngine(self.CONFIG)
+        engine.compute_for_timeframe(ohlcv, "1h", set(self.CONFIG))
+
+        report = engine.computation_reports["1h"]
+        assert report is engine.last_computation_report
+        assert report["indicators"] == 8
+        assert report["indicators_reused"] == 1
+        # Shared: SMA/BB/BBWidth middle band, BB std, EMA/MACD fast EMA,
+        # ATR/ADX true range
+        assert report["by_operation"]["rolling_mean"]["computed"] == 2
+        assert report["by_operation"]["rolling_std"]["computed"] == 1
+        assert report["by_operation"]["ewm"] == {"requested": 4, "computed": 3}
+        assert report["by_operation"]["true_range"]["computed"] == 1
+        assert report["primitives_reused"] > 0
@@ -0,0 +1,164 @@
+"""Tests for incremental (per-bar) indicator updates."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ktrdr.config.models import FuzzySetDefinition
+from ktrdr.errors import ConfigurationError
+from ktrdr.fuzzy.engine import FuzzyEngine
+from ktrdr.indicators import (
+    INDICATOR_REGISTRY,
+    IncrementalIndicatorEngine,
+    IndicatorEngine,
+    ensure_all_registered,
+)
+
+INCREMENTAL_CASES = [
+    ("sma", {"period": 20}),
+    ("ema", {"period": 12}),
+    ("ema", {"period": 12, "adjust": False}),
+    ("rsi", {"period": 14}),
+    ("macd", {}),
+    ("atr", {"period": 14}),
+    ("bbands", {"period": 20, "multiplier": 2.0}),
+    ("stochastic", {}),
+    ("stochastic", {"smooth_k": 1}),
+    ("adx", {"period": 14}),
+    ("obv", {}),
+    ("vwap", {"period": 20}),
+    ("vwap", {"period": 0}),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def registered():
+    ensure_all_registered()
+
+
+def _ohlcv(bars: int, seed: int = 11, flat: bool = False) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    high = close + rng.uniform(0, 2, bars)
+    low = close - rng.uniform(0, 2, bars)
+    volume = rng.integers(0, 1000, bars).astype(float)
+    if flat:
+        # Constant prices and zero volume exercise the degenerate branches
+        close[50:80] = high[50:80] = low[50:80] = close[50]
+        volume[50:60] = 0.0
+    index = pd.date_range("2024-01-01", periods=bars, freq="1h")
+    return pd.DataFrame(
+        {"open": close, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    )
+
+
+def _stream(indicator, df: pd.DataFrame) -> list:
+    return [indicator.update(bar) for bar in df.to_dict("records")]
+
+
+class TestIncrementalIndicators:
+    @pytest.mark.parametrize("flat", [False, True])
+    @pytest.mark.parametrize("indicator_type,params", INCREMENTAL_CASES)
+    def test_matches_batch_compute_exactly(self, indicator_type, params, flat):
+        df = _ohlcv(300, flat=flat)
+        indicator = INDICATOR_REGISTRY.get(indicator_type)(**params)
+
+        batch = indicator.compute(df)
+        streamed = _stream(indicator, df)
+
+        if isinstance(batch, pd.DataFrame):
+            for output in batch.columns:
+                values = np.array([row[output] for row in streamed])
+                np.testing.assert_array_equal(values, batch[output].to_numpy(float))
+        else:
+            np.testing.assert_array_equal(
+                np.array(streamed), batch.to_numpy(dtype=float)
+            )
+
+    def test_snapshot_and_restore_resume_the_series(self):
+        df = _ohlcv(120)
+        indicator = INDICATOR_REGISTRY.get("rsi")(period=14)
+        _stream(indicator, df.iloc[:60])
+        snapshot = indicator.snapshot_state()
+
+        first = _stream(indicator, df.iloc[60:])
+        indicator.restore_state(snapshot)
+        second = _stream(indicator, df.iloc[60:])
+
+        assert first == second
+
+    def test_reset_state_starts_a_new_series(self):
+        df = _ohlcv(40)
+        indicator = INDICATOR_REGISTRY.get("sma")(period=5)
+        _stream(indicator, df)
+        indicator.reset_state()
+
+        assert np.isnan(indicator.update(df.iloc[0]))
+
+    def test_unsupported_indicator_raises(self):
+        indicator = INDICATOR_REGISTRY.get("wma")(period=10)
+
+        assert not indicator.supports_incremental()
+        with pytest.raises(NotImplementedError):
+            indicator.update({"close": 1.0})
+
+
+class TestIncrementalIndicatorEngine:
+    INDICATORS = {
+        "rsi_14": {"type": "rsi", "period": 14},
+        "macd_12_26_9": {"type": "macd"},
+        "bbands_20": {"type": "bbands", "period": 20},
+    }
+
+    @pytest.fixture
+    def fuzzy_engine(self):
+        return FuzzyEngine(
+            {
+                "rsi_momentum": FuzzySetDefinition(
+                    indicator="rsi_14", low=[0, 20, 50], high=[50, 80, 100]
+                ),
+                "macd_signal": FuzzySetDefinition(
+                    indicator="macd_12_26_9.signal",
+                    negative=[-5, -2, 0],
+                    positive=[0, 2, 5],
+                ),
+            }
+        )
+
+    def test_values_and_memberships_match_batch_path(self, fuzzy_engine):
+        df = _ohlcv(200)
+        engine = IncrementalIndicatorEngine(self.INDICATORS, fuzzy_engine)
+        engine.warm_up(df.iloc[:-1])
+
+        values, memberships = engine.process_bar(df.iloc[-1])
+
+        batch = IndicatorEngine(self.INDICATORS).apply(df).drop(columns=df.columns)
+        assert values == batch.iloc[-1].to_dict()
+        assert engine.last_timestamp == df.index[-1]
+        expected = {}
+        for fuzzy_set_id, column in [
+            ("rsi_momentum", "rsi_14"),
+            ("macd_signal", "macd_12_26_9.signal"),
+        ]:
+            expected.update(
+                fuzzy_engine.fuzzify(fuzzy_set_id, batch[column]).iloc[-1].to_dict()
+            )
+        assert memberships == expected
+
+    def test_snapshot_and_restore(self):
+        df = _ohlcv(100)
+        engine = IncrementalIndicatorEngine(self.INDICATORS)
+        engine.warm_up(df.iloc[:50])
+        snapshot = engine.snapshot()
+        first = engine.warm_up(df.iloc[50:])
+
+        engine.restore(snapshot)
+        assert engine.last_timestamp == df.index[49]
+        assert engine.warm_up(df.iloc[50:]) == first
+
+    def test_rejects_indicators_without_incremental_support(self):
+        with pytest.raises(ConfigurationError) as exc_info:
+            IncrementalIndicatorEngine({"wma_10": {"type": "wma", "period": 10}})
+
+        assert exc_info.value.error_code == "CONFIG-IncrementalUnsupported"
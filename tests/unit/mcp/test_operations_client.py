@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
 from clients.operations_client import OperationsAPIClient
 
@@ -150,3 +151,57 @@ class TestOperationsAPIClient:
             client.client.request.assert_called_once_with(
                 "GET", "/operations/op_123/results"
             )
+
+
+def _routed_transport(stream_status: int, requests: list) -> httpx.MockTransport:
+    """Stream reports completion; status polls answer running, then completed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/operations/stream":
+            if stream_status != 200:
+                return httpx.Response(stream_status, json={"detail": "down"})
+            return httpx.Response(
+                200, text='event: terminal\ndata: {"status": "completed"}\n\n'
+            )
+        polls = sum(path != "/operations/stream" for path in requests)
+        status = "running" if stream_status != 200 and polls == 1 else "completed"
+        return httpx.Response(200, json={"success": True, "data": {"status": status}})
+
+    return httpx.MockTransport(handler)
+
+
+class TestWaitForOperation:
+    """wait_for_operation follows the SSE stream, polling only as a fallback"""
+
+    @pytest.mark.asyncio
+    async def test_waits_on_event_stream(self):
+        requests: list = []
+        async with OperationsAPIClient("http://localhost:8000", 30.0) as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(
+                base_url="http://localhost:8000",
+                transport=_routed_transport(200, requests),
+            )
+            result = await client.wait_for_operation("op_123", poll_interval=30)
+
+        assert result["data"]["status"] == "completed"
+        assert requests == ["/operations/stream", "/operations/op_123"]
+
+    @pytest.mark.asyncio
+    async def test_polls_when_stream_unavailable(self):
+        requests: list = []
+        async with OperationsAPIClient("http://localhost:8000", 30.0) as client:
+            await client.client.aclose()
+            client.client = httpx.AsyncClient(
+                base_url="http://localhost:8000",
+                transport=_routed_transport(404, requests),
+            )
+            result = await client.wait_for_operation("op_123", poll_interval=0.01)
+
+        assert result["data"]["status"] == "completed"
+        assert requests == [
+            "/operations/stream",
+            "/operations/op_123",
+            "/operations/op_123",
+        ]
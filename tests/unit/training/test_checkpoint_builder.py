@@ -16,6 +16,7 @@ from ktrdr.training.checkpoint_builder import (
     ArtifactValidationError,
     build_training_checkpoint_artifacts,
     build_training_checkpoint_state,
+    snapshot_training_checkpoint_artifacts,
     validate_artifacts,
 )
 from ktrdr.training.model_trainer import TrainingMetrics
@@ -283,6 +284,32 @@ class TestBuildTrainingCheckpointArtifacts:
         )
 
 
+class TestSnapshotTrainingCheckpointArtifacts:
+    """Tests for snapshot_training_checkpoint_artifacts function."""
+
+    def test_snapshot_is_not_affected_by_later_updates(self):
+        """Serializing later should capture the state at snapshot time."""
+        model = nn.Linear(10, 2)
+        optimizer = optim.SGD(model.parameters(), lr=0.1)
+        best_state = model.state_dict().copy()  # aliases live tensors
+        expected = build_training_checkpoint_artifacts(
+            model, optimizer, best_model_state=best_state
+        )
+
+        serialize = snapshot_training_checkpoint_artifacts(
+            model, optimizer, best_model_state=best_state
+        )
+        with torch.no_grad():
+            model.weight.add_(1.0)
+
+        artifacts = serialize()
+        assert artifacts.keys() == expected.keys()
+        for name in ("model.pt", "best_model.pt"):
+            restored = torch.load(io.BytesIO(artifacts[name]), weights_only=True)
+            original = torch.load(io.BytesIO(expected[name]), weights_only=True)
+            assert torch.equal(restored["weight"], original["weight"])
+
+
 class TestValidateArtifacts:
     """Tests for validate_artifacts function."""
 
@@ -331,6 +331,51 @@ class TestRestoreFromCheckpoint:
         assert context.original_request == {"symbol": "BTCUSD", "epochs": 100}
 
 
+class TestRestoreFromStoredArtifacts:
+    """Restore from artifacts opened lazily by the artifact store."""
+
+    @pytest.mark.asyncio
+    async def test_restore_passes_handles(self, tmp_path):
+        """Artifacts should be handed over as handles, not read into bytes."""
+        from ktrdr.checkpoint.artifact_store import ArtifactHandle, ChunkedArtifactStore
+        from ktrdr.checkpoint.checkpoint_service import CheckpointData
+        from ktrdr.training.checkpoint_builder import (
+            build_training_checkpoint_artifacts,
+        )
+        from ktrdr.training.checkpoint_restore import (
+            load_resume_artifact,
+            restore_from_checkpoint,
+        )
+
+        model = nn.Linear(10, 2)
+        optimizer = optim.Adam(model.parameters(), lr=0.001)
+        store = ChunkedArtifactStore(chunk_size=256)
+        store.write(
+            tmp_path / "op_123",
+            build_training_checkpoint_artifacts(model, optimizer),
+        )
+
+        mock_service = AsyncMock()
+        mock_service.load_checkpoint.return_value = CheckpointData(
+            operation_id="op_123",
+            checkpoint_type="periodic",
+            created_at=datetime.now(),
+            state={"epoch": 4},
+            artifacts_path=str(tmp_path / "op_123"),
+            artifacts=store.open(tmp_path / "op_123"),
+        )
+
+        context = await restore_from_checkpoint(mock_service, "op_123")
+
+        assert isinstance(context.model_weights, ArtifactHandle)
+        assert context.scheduler_state is None
+        restored = load_resume_artifact(context.model_weights, weights_only=True)
+        assert torch.equal(restored["weight"], model.state_dict()["weight"])
+        optimizer.load_state_dict(
+            load_resume_artifact(context.optimizer_state, weights_only=False)
+        )
+
+
 class TestValidateTrainingArtifacts:
     """Tests for artifact validation before restore."""
 
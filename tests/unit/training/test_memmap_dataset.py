@@ -0,0 +1,396 @@
+"""Tests for out-of-core memory-mapped training data."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+torch = pytest.importorskip("torch")
+from torch.utils.data import DataLoader  # noqa: E402
+
+from ktrdr.training.exceptions import TrainingDataError  # noqa: E402
+from ktrdr.training.memmap_dataset import (  # noqa: E402
+    ChunkedShuffleDataset,
+    MemmapTrainingStore,
+    write_frames_to_store,
+)
+
+
+class TestMemmapTrainingStore:
+    """Test writing and mapping the on-disk store."""
+
+    def test_round_trip_preserves_values_and_order(self, tmp_path):
+        """Appended frames are readable in order, with NaN scrubbed to 0."""
+        first = pd.DataFrame({"a": [1.0, np.nan, 3.0], "b": [4.0, 5.0, 6.0]})
+        second = pd.DataFrame({"a": [7.0], "b": [8.0]})
+        store = write_frames_to_store(
+            tmp_path / "store",
+            iter([(first, np.array([0, 1, 2])), (second, np.array([1]))]),
+            feature_names=["a", "b"],
+            chunk_rows=2,
+        )
+
+        reopened = MemmapTrainingStore.open(tmp_path / "store")
+        assert reopened.num_rows == 4
+        assert reopened.feature_names == ["a", "b"]
+        np.testing.assert_array_equal(
+            reopened.features,
+            np.array([[1, 4], [0, 5], [3, 6], [7, 8]], dtype=np.float32),
+        )
+        np.testing.assert_array_equal(reopened.labels, [0, 1, 2, 1])
+        assert store.labels.dtype == np.int64
+
+    def test_append_does_not_mutate_input(self, tmp_path):
+        """NaN scrubbing works on chunk copies, not the caller's array."""
+        features = np.array([[np.nan, 1.0]], dtype=np.float32)
+        store = MemmapTrainingStore.create(tmp_path / "s", ["x", "y"])
+        store.append(features, np.array([0]))
+        assert np.isnan(features[0, 0])
+
+    def test_tensors_are_memory_mapped(self, tmp_path):
+        """as_tensors() returns zero-copy tensors over the mapped files."""
+        store = MemmapTrainingStore.create(tmp_path / "s", ["x"], np.float32)
+        store.append(np.ones((10, 1)), np.zeros(10))
+        store.finalize()
+        features, labels = store.as_tensors()
+        assert isinstance(store.features, np.memmap)
+        assert features.shape == (10, 1)
+        assert labels.dtype == torch.float32
+
+    def test_shape_mismatch_raises(self, tmp_path):
+        store = MemmapTrainingStore.create(tmp_path / "s", ["x", "y"])
+        with pytest.raises(TrainingDataError):
+            store.append(np.ones((3, 3)), np.zeros(3))
+        with pytest.raises(TrainingDataError):
+            store.append(np.ones((3, 2)), np.zeros(2))
+
+    def test_read_before_finalize_raises(self, tmp_path):
+        store = MemmapTrainingStore.create(tmp_path / "s", ["x"])
+        with pytest.raises(TrainingDataError):
+            _ = store.features
+
+    def test_weights_round_trip(self, tmp_path):
+        """Per-sample weights are stored alongside rows and reopened."""
+        store = write_frames_to_store(
+            tmp_path / "s",
+            iter(
+                [
+                    (np.ones((2, 1)), np.array([0, 1]), np.array([0.5, 1.0])),
+                    (np.ones((1, 1)), np.array([2]), np.array([0.25])),
+                ]
+            ),
+            feature_names=["x"],
+            with_weights=True,
+        )
+        np.testing.assert_array_equal(store.weights, [0.5, 1.0, 0.25])
+        reopened = MemmapTrainingStore.open(tmp_path / "s")
+        assert reopened.has_weights
+        np.testing.assert_array_equal(reopened.weights, [0.5, 1.0, 0.25])
+
+        unweighted = MemmapTrainingStore.create(tmp_path / "u", ["x"])
+        with pytest.raises(TrainingDataError):
+            unweighted.append(np.ones((1, 1)), np.zeros(1), weights=np.ones(1))
+
+    def test_open_detects_truncated_store(self, tmp_path):
+        store = MemmapTrainingStore.create(tmp_path / "s", ["x"])
+        store.append(np.ones((4, 1)), np.zeros(4))
+        store.finalize()
+        with open(tmp_path / "s" / MemmapTrainingStore.FEATURES_FILE, "r+b") as f:
+            f.truncate(4)
+        with pytest.raises(TrainingDataError):
+            MemmapTrainingStore.open(tmp_path / "s")
+
+
+class TestChunkedShuffleDataset:
+    """Test chunked shuffling iteration."""
+
+    def _dataset(self, rows=103, **kwargs):
+        features = np.arange(rows * 2, dtype=np.float32).reshape(rows, 2)
+        labels = np.arange(rows)
+        return ChunkedShuffleDataset(features, labels, **kwargs)
+
+    def test_each_row_visited_once_per_epoch(self):
+        ds = self._dataset(batch_size=8, chunk_size=20, seed=1)
+        seen = torch.cat([y for _, y in DataLoader(ds, batch_size=None)])
+        assert sorted(seen.tolist()) == list(range(103))
+
+    def test_features_stay_paired_with_labels(self):
+        ds = self._dataset(batch_size=8, chunk_size=20, seed=1)
+        for x, y in ds:
+            assert torch.equal(x[:, 0], (y * 2).float())
+
+    def test_len_matches_number_of_batches(self):
+        ds = self._dataset(batch_size=8, chunk_size=20, seed=1)
+        assert len(ds) == sum(1 for _ in ds)
+
+    def test_shuffle_is_seeded_per_epoch(self):
+        ds = self._dataset(batch_size=8, chunk_size=20, seed=1)
+        first = torch.cat([y for _, y in ds])
+        again = torch.cat([y for _, y in ds])
+        ds.set_epoch(1)
+        other = torch.cat([y for _, y in ds])
+        assert torch.equal(first, again)
+        assert not torch.equal(first, other)
+
+    def test_no_shuffle_preserves_order(self):
+        ds = self._dataset(batch_size=8, chunk_size=20, shuffle=False)
+        assert torch.cat([y for _, y in ds]).tolist() == list(range(103))
+
+    def test_indices_restrict_rows(self):
+        """Only the indexed rows are visited, still paired with labels."""
+        rows = np.r_[0:30, 50:60, 90:103]
+        ds = self._dataset(batch_size=8, chunk_size=20, seed=1, indices=rows)
+        seen = torch.cat([y for _, y in ds])
+        assert sorted(seen.tolist()) == rows.tolist()
+        assert len(ds) == sum(1 for _ in ds)
+        for x, y in ds:
+            assert torch.equal(x[:, 0], (y * 2).float())
+
+    def test_weights_drive_sampling(self):
+        """Rows are drawn in proportion to weight; zero weights never appear."""
+        weights = np.zeros(103)
+        weights[:10] = 1.0
+        weights[60:70] = 3.0
+        ds = self._dataset(batch_size=8, chunk_size=20, seed=1, weights=weights)
+        seen = torch.cat([y for _, y in ds]).numpy()
+        assert len(seen) == 103
+        assert len(ds) == sum(1 for _ in ds)
+        assert set(seen) <= set(range(10)) | set(range(60, 70))
+        assert (seen >= 60).sum() > (seen < 10).sum()
+
+    def test_invalid_indices_and_weights_rejected(self):
+        with pytest.raises(ValueError):
+            self._dataset(indices=np.array([5, 3]), batch_size=8, chunk_size=20)
+        with pytest.raises(ValueError):
+            self._dataset(indices=np.array([200]), batch_size=8, chunk_size=20)
+        with pytest.raises(ValueError):
+            self._dataset(weights=np.ones(5), batch_size=8, chunk_size=20)
+
+    def test_chunk_smaller_than_batch_rejected(self):
+        with pytest.raises(ValueError):
+            self._dataset(batch_size=32, chunk_size=16)
+
+    def test_reads_from_memmap_store(self, tmp_path):
+        store = MemmapTrainingStore.create(tmp_path / "s", ["x"])
+        store.append(np.arange(50, dtype=np.float32).reshape(50, 1), np.arange(50))
+        store.finalize()
+        ds = ChunkedShuffleDataset(
+            store.features, store.labels, batch_size=10, chunk_size=10, seed=0
+        )
+        seen = torch.cat([y for _, y in ds])
+        assert sorted(seen.tolist()) == list(range(50))
+
+
+class TestModelTrainerOutOfCore:
+    """Test ModelTrainer wiring for out-of-core training."""
+
+    def test_trains_from_memmap_store(self, tmp_path):
+        import torch.nn as nn
+
+        from ktrdr.training.model_trainer import ModelTrainer
+
+        rng = np.random.default_rng(0)
+        store = MemmapTrainingStore.create(tmp_path / "s", ["a", "b", "c", "d"])
+        store.append(rng.normal(size=(200, 4)), rng.integers(0, 3, 200))
+        store.finalize()
+        X, y = store.as_tensors()
+
+        trainer = ModelTrainer(
+            {
+                "batch_size": 16,
+                "epochs": 2,
+                "learning_rate": 0.01,
+                "out_of_core": {"enabled": True, "chunk_size": 64, "seed": 0},
+            }
+        )
+        model = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 3))
+        result = trainer.train(model, X[:150], y[:150], X[150:], y[150:])
+
+        assert "error" not in result
+        assert len(trainer.history) == 2
+
+    def test_trains_on_indexed_weighted_split(self, tmp_path):
+        """train_indices and sample_weights are applied by the chunked dataset."""
+        import torch.nn as nn
+
+        from ktrdr.training.model_trainer import ModelTrainer
+
+        rng = np.random.default_rng(0)
+        store = MemmapTrainingStore.create(tmp_path / "s", ["a", "b"])
+        store.append(rng.normal(size=(100, 2)), rng.integers(0, 3, 100))
+        store.finalize()
+        X, y = store.as_tensors()
+        train_idx = np.r_[0:40, 50:70]
+
+        trainer = ModelTrainer(
+            {
+                "batch_size": 8,
+                "epochs": 1,
+                "out_of_core": {"enabled": True, "chunk_size": 16, "seed": 0},
+            }
+        )
+        result = trainer.train(
+            nn.Sequential(nn.Linear(2, 3)),
+            X,
+            y,
+            X[80:],
+            y[80:],
+            sample_weights=torch.rand(len(train_idx)),
+            train_indices=train_idx,
+        )
+
+        assert "error" not in result
+        assert trainer.history[0].train_loss > 0
+
+
+class TestOutOfCoreOrchestration:
+    """Test streaming v3 features into the store and triple-barrier training."""
+
+    def _pipeline(self):
+        from ktrdr.config.models import StrategyConfigurationV3
+        from ktrdr.training.training_pipeline import TrainingPipelineV3
+
+        config = StrategyConfigurationV3(
+            name="ooc",
+            version="3.0",
+            training_data={
+                "symbols": {"mode": "multi_symbol", "list": ["AAA", "BBB"]},
+                "timeframes": {"mode": "single", "timeframe": "1h"},
+                "history_required": 50,
+            },
+            indicators={"rsi_14": {"type": "rsi", "period": 14}},
+            fuzzy_sets={
+                "rsi_momentum": {
+                    "indicator": "rsi_14",
+                    "oversold": [0, 25, 40],
+                    "overbought": [60, 75, 100],
+                }
+            },
+            nn_inputs=[{"fuzzy_set": "rsi_momentum", "timeframes": "all"}],
+            model={"type": "mlp", "hidden_layers": [8]},
+            decisions={"output_format": "classification"},
+            training={"epochs": 1, "batch_size": 16},
+        )
+        return TrainingPipelineV3(config)
+
+    def _ohlcv(self, periods, seed):
+        rng = np.random.default_rng(seed)
+        close = 100 + np.cumsum(rng.normal(scale=0.5, size=periods))
+        return pd.DataFrame(
+            {
+                "open": close,
+                "high": close + 0.5,
+                "low": close - 0.5,
+                "close": close,
+                "volume": 1000.0,
+            },
+            index=pd.date_range("2024-01-01", periods=periods, freq="h"),
+        )
+
+    def _orchestrator(self):
+        from unittest.mock import MagicMock
+
+        from ktrdr.api.services.training.local_orchestrator import (
+            LocalTrainingOrchestrator,
+        )
+
+        orchestrator = LocalTrainingOrchestrator.__new__(LocalTrainingOrchestrator)
+        orchestrator._context = MagicMock(operation_id="op_test")
+        return orchestrator
+
+    def test_streamed_store_matches_in_memory_features(self, tmp_path):
+        """Per-symbol streaming yields the same rows as prepare_features."""
+        pipeline = self._pipeline()
+        all_data = {
+            "AAA": {"1h": self._ohlcv(120, 1)},
+            "BBB": {"1h": self._ohlcv(80, 2)},
+        }
+        expected = pipeline.prepare_features(all_data)
+        feature_names = pipeline.feature_columns(all_data)
+        row_counts = {s: pipeline.feature_row_count(d) for s, d in all_data.items()}
+        assert feature_names == list(expected.columns)
+        assert sum(row_counts.values()) == len(expected)
+
+        feature_range = (100, 150)  # spans the symbol boundary at row 120
+        labels = torch.arange(50)
+        store = self._orchestrator()._write_out_of_core_store(
+            pipeline,
+            all_data,
+            None,
+            row_counts,
+            feature_names,
+            feature_range,
+            labels,
+            None,
+            {"directory": str(tmp_path)},
+        )
+
+        np.testing.assert_allclose(
+            store.features,
+            np.nan_to_num(expected.iloc[100:150].to_numpy(dtype=np.float32)),
+        )
+        np.testing.assert_array_equal(store.labels, np.arange(50))
+        assert store.weights is None
+
+    def test_triple_barrier_trains_out_of_core(self, tmp_path):
+        """Uniqueness weights are stored and used with a purged, indexed split."""
+        import torch.nn as nn
+
+        from ktrdr.training.sample_weights import purged_train_val_split
+        from ktrdr.training.training_pipeline import TrainingPipeline
+
+        pipeline = self._pipeline()
+        all_data = {"AAA": {"1h": self._ohlcv(300, 3)}}
+        labels = TrainingPipeline.create_labels(
+            all_data["AAA"],
+            {
+                "source": "triple_barrier",
+                "max_holding_period": 10,
+                "vol_span": 20,
+                "compute_weights": True,
+            },
+        )
+        weights = TrainingPipeline.get_sample_weights()
+        assert weights is not None and len(weights) == len(labels)
+
+        orchestrator = self._orchestrator()
+        row_counts = {"AAA": pipeline.feature_row_count(all_data["AAA"])}
+        feature_range, label_range = orchestrator._aligned_sample_ranges(
+            row_counts["AAA"], len(labels), "triple_barrier", {}
+        )
+        store = orchestrator._write_out_of_core_store(
+            pipeline,
+            all_data,
+            None,
+            row_counts,
+            pipeline.feature_columns(all_data),
+            feature_range,
+            labels[label_range[0] : label_range[1]],
+            weights[label_range[0] : label_range[1]],
+            {"directory": str(tmp_path)},
+        )
+        np.testing.assert_allclose(
+            store.weights, weights[label_range[0] : label_range[1]].numpy()
+        )
+
+        X, y = store.as_tensors()
+        train_idx, val_idx = purged_train_val_split(
+            pd.Series(range(len(y))),
+            pd.Series([10] * len(y)),
+            val_ratio=0.2,
+        )
+        trainer = TrainingPipeline.train_model(
+            model=nn.Sequential(nn.Linear(X.shape[1], 3)),
+            X_train=X,
+            y_train=y,
+            X_val=orchestrator._select_rows(X, val_idx),
+            y_val=orchestrator._select_rows(y, val_idx),
+            training_config={
+                "epochs": 1,
+                "batch_size": 16,
+                "out_of_core": {"enabled": True, "chunk_size": 32, "seed": 0},
+            },
+            sample_weights=torch.from_numpy(store.weights)[train_idx],
+            train_indices=train_idx,
+        )
+
+        assert trainer["epochs_trained"] == 1
@@ -0,0 +1,125 @@
+"""Unit tests for the SQLite model catalog behind ModelStorage."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+import torch.nn as nn
+
+from ktrdr.training.model_catalog import (
+    CATALOG_FILENAME,
+    ModelCatalog,
+    parse_version_dir,
+)
+from ktrdr.training.model_storage import ModelStorage
+
+
+def write_version(
+    base: Path,
+    strategy: str,
+    name: str,
+    created_at: str,
+    accuracy: float = 0.5,
+    timeframe: str = "1h",
+) -> Path:
+    """Create a version directory with only a metadata.json."""
+    model_dir = base / strategy / name
+    model_dir.mkdir(parents=True)
+    metadata = {
+        "strategy_name": strategy,
+        "symbol": "EURUSD",
+        "timeframe": timeframe,
+        "created_at": created_at,
+        "training_summary": {"best_val_accuracy": accuracy, "epochs": 3},
+    }
+    (model_dir / "metadata.json").write_text(json.dumps(metadata))
+    return model_dir
+
+
+class TestParseVersionDir:
+    def test_universal_and_legacy_names(self):
+        assert parse_version_dir("1h_v7") == ("1h", 7)
+        assert parse_version_dir("EURUSD_1h_v12") == ("EURUSD_1h", 12)
+
+    def test_non_version_names(self):
+        assert parse_version_dir("1h_latest") is None
+        assert parse_version_dir("1h_vx") is None
+
+
+class TestModelCatalog:
+    def test_rebuild_indexes_existing_tree(self, tmp_path):
+        write_version(tmp_path, "alpha", "1h_v1", "2024-01-01T00:00:00")
+        write_version(tmp_path, "alpha", "1h_v2", "2024-02-01T00:00:00", 0.9)
+        write_version(tmp_path, "beta", "4h_v1", "2024-03-01T00:00:00", 0.7, "4h")
+        (tmp_path / "alpha" / "1h_v3").mkdir()  # incomplete save: no metadata
+        (tmp_path / "alpha" / "1h_latest").symlink_to("1h_v2")
+
+        catalog = ModelCatalog(tmp_path)
+        assert not catalog.is_built
+        assert catalog.rebuild() == 3
+        assert catalog.is_built
+
+        newest = catalog.query(limit=1)
+        assert newest[0]["strategy"] == "beta"
+        best_alpha = catalog.query(strategy="alpha", order_by="accuracy")
+        assert [e["version"] for e in best_alpha] == [2, 1]
+        assert best_alpha[0]["metrics"]["epochs"] == 3
+        assert [e["strategy"] for e in catalog.query(timeframe="4h")] == ["beta"]
+        assert catalog.latest_path("alpha", "1h") == tmp_path / "alpha" / "1h_v2"
+
+    def test_rejects_unknown_sort_column(self, tmp_path):
+        with pytest.raises(ValueError):
+            ModelCatalog(tmp_path).query(order_by="path; DROP TABLE models")
+
+
+class TestModelStorageCatalog:
+    def test_existing_tree_is_catalogued_on_first_use(self, tmp_path):
+        write_version(tmp_path, "alpha", "1h_v1", "2024-01-01T00:00:00")
+        write_version(tmp_path, "alpha", "1h_v2", "2024-02-01T00:00:00")
+
+        storage = ModelStorage(str(tmp_path))
+        models = storage.list_models("alpha")
+
+        assert [m["version"] for m in models] == [2, 1]
+        assert (tmp_path / CATALOG_FILENAME).exists()
+        assert storage._find_latest_version("alpha", None, "1h").name == "1h_v2"
+
+    def test_save_and_delete_maintain_catalog(self, tmp_path):
+        storage = ModelStorage(str(tmp_path))
+        model = nn.Sequential(nn.Linear(4, 2))
+        saved = [
+            storage.save_model(
+                model=model,
+                strategy_name="alpha",
+                symbol="EURUSD",
+                timeframe="1h",
+                config={},
+                training_metrics={"best_val_accuracy": accuracy},
+                feature_names=["f1", "f2", "f3", "f4"],
+            )
+            for accuracy in (0.4, 0.6)
+        ]
+
+        catalog = ModelCatalog(tmp_path)
+        assert [e["path"] for e in catalog.query(order_by="version")] == saved[::-1]
+        assert storage.list_models("alpha", order_by="accuracy", limit=1)[0][
+            "accuracy"
+        ] == pytest.approx(0.6)
+
+        # delete_model addresses legacy symbol-specific directories
+        legacy = write_version(tmp_path, "alpha", "EURUSD_1h_v1", "2023-01-01")
+        storage.rebuild_catalog()
+        storage.delete_model("alpha", "EURUSD", "1h", "v1")
+        assert not legacy.exists()
+        assert str(legacy) not in {e["path"] for e in catalog.query()}
+
+    def test_stale_latest_falls_back_to_scan(self, tmp_path):
+        write_version(tmp_path, "alpha", "1h_v1", "2024-01-01T00:00:00")
+        newest = write_version(tmp_path, "alpha", "1h_v2", "2024-02-01T00:00:00")
+        storage = ModelStorage(str(tmp_path))
+        storage.list_models()  # builds the catalog
+
+        shutil.rmtree(newest)  # removed behind the catalog's back
+
+        assert storage._find_latest_version("alpha", None, "1h").name == "1h_v1"
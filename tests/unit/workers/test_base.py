@@ -362,3 +362,56 @@ class TestHealthCheckTracking:
         second_timestamp = worker._last_health_check_received
 
         assert second_timestamp > first_timestamp
+
+
+class TestHeartbeatLoop:
+    """Tests for worker → backend heartbeats."""
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_sent_on_change_and_reregisters_on_404(self, monkeypatch):
+        """Heartbeats go out when status changes; 404 triggers re-registration."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        worker = MockWorker()
+        worker._heartbeat_check_interval = 0.01
+        worker.self_register = AsyncMock()
+        statuses = iter(
+            [{"worker_status": "idle", "current_operation": None}] * 3
+            + [{"worker_status": "busy", "current_operation": "op-1"}] * 100
+        )
+        worker._worker_status = AsyncMock(side_effect=lambda: next(statuses))
+        posted = []
+        codes = iter([200, 404, 200])
+
+        class FakeClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return None
+
+            async def post(self, url, json):
+                posted.append((url, json))
+                return MagicMock(status_code=next(codes, 200))
+
+        monkeypatch.setattr("httpx.AsyncClient", FakeClient)
+        task = asyncio.create_task(worker._heartbeat_loop(interval=60))
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        assert posted[0] == (
+            f"http://backend:8000/api/v1/workers/{worker.worker_id}/heartbeat",
+            {"worker_status": "idle", "current_operation": None},
+        )
+        # idle (200), busy (404 -> re-register), busy again (200), then quiet
+        assert [body["worker_status"] for _, body in posted] == [
+            "idle",
+            "busy",
+            "busy",
+        ]
+        worker.self_register.assert_awaited_once()
+        assert worker._last_health_check_received is not None
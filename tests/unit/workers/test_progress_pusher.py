@@ -0,0 +1,126 @@
+"""Unit tests for OperationProgressPusher (worker → backend progress push)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ktrdr.api.models.operations import (
+    OperationMetadata,
+    OperationProgress,
+    OperationType,
+)
+from ktrdr.api.services.operation_events import OperationEvent
+from ktrdr.api.services.operations_service import OperationsService
+from ktrdr.workers.progress_pusher import OperationProgressPusher
+
+
+@pytest.fixture(autouse=True)
+def _no_duration_metrics(monkeypatch):
+    """Keep completed operations out of the global Prometheus histogram."""
+    monkeypatch.setattr(
+        "ktrdr.api.services.operations_service.record_operation_duration",
+        lambda *args, **kwargs: None,
+    )
+
+
+def _client(status_code: int = 200) -> MagicMock:
+    client = MagicMock()
+    client.post = AsyncMock(return_value=MagicMock(status_code=status_code))
+    return client
+
+
+class TestOperationProgressPusher:
+    @pytest.mark.asyncio
+    async def test_progress_is_coalesced_and_metrics_accumulated(self):
+        pusher = OperationProgressPusher(OperationsService(), "http://backend:8000/")
+        pusher.record(
+            OperationEvent("op_1", "progress", {"status": "running", "progress": 1})
+        )
+        pusher.record(OperationEvent("op_1", "metrics", {"metrics": [1], "cursor": 1}))
+        pusher.record(
+            OperationEvent("op_1", "progress", {"status": "running", "progress": 2})
+        )
+        pusher.record(OperationEvent("op_1", "metrics", {"metrics": [2], "cursor": 2}))
+
+        client = _client()
+        await pusher.flush(client)
+
+        client.post.assert_awaited_once_with(
+            "http://backend:8000/api/v1/operations/op_1/events",
+            json={
+                "status": "running",
+                "progress": 2,
+                "metrics": [1, 2],
+                "metrics_cursor": 2,
+            },
+        )
+        assert pusher.pushes_sent == 1
+
+    @pytest.mark.asyncio
+    async def test_terminal_fields_forwarded(self):
+        pusher = OperationProgressPusher(OperationsService(), "http://backend")
+        pusher.record(
+            OperationEvent(
+                "op_1",
+                "terminal",
+                {"status": "failed", "progress": {}, "error_message": "boom"},
+            )
+        )
+        client = _client()
+        await pusher.flush(client)
+        assert client.post.call_args.kwargs["json"]["error_message"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_failed_push_is_dropped(self):
+        pusher = OperationProgressPusher(OperationsService(), "http://backend")
+        pusher.record(OperationEvent("op_1", "progress", {"status": "running"}))
+        client = _client()
+        client.post.side_effect = RuntimeError("backend down")
+
+        await pusher.flush(client)
+        await pusher.flush(client)
+
+        assert client.post.await_count == 1
+        assert pusher.pushes_failed == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_pushes_service_events(self, monkeypatch):
+        service = OperationsService()
+        posted = []
+
+        class FakeClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return None
+
+            async def post(self, url, json):
+                posted.append((url, json))
+                return MagicMock(status_code=200)
+
+        monkeypatch.setattr(
+            "ktrdr.workers.progress_pusher.httpx.AsyncClient", FakeClient
+        )
+        pusher = OperationProgressPusher(service, "http://backend", interval=0.01)
+        pusher.start()
+        await asyncio.sleep(0)
+
+        operation = await service.create_operation(
+            operation_type=OperationType.TRAINING, metadata=OperationMetadata()
+        )
+        await service.start_operation(operation.operation_id)
+        await service.update_progress(
+            operation.operation_id, OperationProgress(percentage=30.0)
+        )
+        await service.complete_operation(operation.operation_id, {"ok": True})
+        await asyncio.sleep(0.05)
+        await pusher.stop()
+
+        final = [body for _, body in posted if body.get("status") == "completed"]
+        assert final and final[-1]["result_summary"] == {"ok": True}
+        assert service._events.subscriber_count == 0